@@ -1,16 +1,34 @@
-"""Deterministic load/stability harness for radar pipeline."""
+"""Deterministic load/stability harness for radar pipeline.
+
+Single run:  python -m qiki.core.load_harness --scenario multi_target_300 --targets 300
+Suite:       python -m qiki.core.load_harness suite --targets 50,300 --backends unicode,kitty \\
+                 --sqlite off,on --output artifacts/load_suite.json [--baseline artifacts/load_baseline.json]
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
 import os
-from dataclasses import dataclass
+import platform
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
 from statistics import quantiles
+from typing import Any, Callable
 
 from qiki.core.load_scenarios import ScenarioConfig, available_scenarios, build_scenario
 from qiki.services.q_core_agent.core.event_store import EventStore
-from qiki.services.q_core_agent.core.radar_pipeline import RadarPipeline
+from qiki.services.q_core_agent.core.radar_pipeline import RadarPipeline, RadarRenderConfig
+from qiki.services.q_core_agent.core.radar_stage_timers import StageTimers
+
+SUITE_SCHEMA_VERSION = 1
+BACKENDS = ("unicode", "kitty", "sixel")
+# Метрики кейса, которые сравниваются с baseline (больше = хуже).
+COMPARED_METRICS = ("avg_frame_ms", "p95_frame_ms", "max_frame_ms", "mem_peak_kib")
 
 
 @dataclass(frozen=True)
@@ -27,6 +45,13 @@ class LoadSummary:
     sqlite_queue_peak: int
     dropped_events: int
     total_events_written: int
+    backend: str = ""
+    sqlite: bool = False
+    # Поэтапные таймеры кадра из RadarPipeline.snapshot_metrics().stages: ingest, fusion,
+    # fusion_events, trails, plan, situation, situation_events, render, frame (весь кадр).
+    stages_ms: dict[str, dict[str, float]] = field(default_factory=dict)
+    mem_peak_kib: float | None = None
+    mem_retained_kib: float | None = None
 
 
 class _HarnessRuntimeError(RuntimeError):
@@ -53,9 +78,11 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--seed", type=int, default=7)
     parser.add_argument("--fusion", choices=("on", "off"), default="on")
     parser.add_argument("--sqlite", choices=("on", "off"), default="off")
+    parser.add_argument("--backend", choices=BACKENDS, default=None, help="Renderer (default: RADAR_RENDERER)")
     parser.add_argument("--db-path", default="artifacts/load_harness_eventstore.sqlite")
     parser.add_argument("--avg-threshold", type=float, default=80.0)
     parser.add_argument("--max-threshold", type=float, default=250.0)
+    parser.add_argument("--tracemalloc", action="store_true", help="Track Python allocations (slower frames)")
     return parser
 
 
@@ -67,6 +94,10 @@ def run_harness(args: argparse.Namespace) -> LoadSummary:
         "RADAR_FUSION_ENABLED": "1" if args.fusion == "on" else "0",
         "RADAR_EMIT_OBSERVATION_RX": "0",
     }
+    backend_name = getattr(args, "backend", None)
+    if backend_name in ("kitty", "sixel"):
+        # Bitmap-бэкенды меряем без терминала: поддержку форсируем только на время прогона.
+        _env_overrides[f"QIKI_FORCE_{backend_name.upper()}_SUPPORTED"] = "1"
     _saved_env = {key: os.environ.get(key) for key in _env_overrides}
     os.environ.update(_env_overrides)
 
@@ -86,8 +117,18 @@ def run_harness(args: argparse.Namespace) -> LoadSummary:
         flush_ms=flush_ms,
         strict=strict_load,
     )
-    pipeline = RadarPipeline(event_store=store)
+    config = None
+    if backend_name:
+        env_config = RadarRenderConfig.from_env()
+        config = RadarRenderConfig(
+            renderer=str(backend_name), view=env_config.view, fps_max=env_config.fps_max, color=env_config.color
+        )
+    track_memory = bool(getattr(args, "tracemalloc", False))
+    pipeline = RadarPipeline(config, event_store=store)
     queue_peak = 0
+    mem_peak_kib: float | None = None
+    mem_retained_kib: float | None = None
+    started_tracemalloc = False
 
     try:
         frames = build_scenario(
@@ -98,6 +139,14 @@ def run_harness(args: argparse.Namespace) -> LoadSummary:
                 target_count=int(args.targets),
             ),
         )
+        # Харнесс меряет каждый кадр прогона: окно гистограмм вмещает все кадры.
+        pipeline.stage_timers = StageTimers(capacity=max(1, len(frames)), sample_every=1)
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracemalloc = True
+        if track_memory:
+            tracemalloc.reset_peak()
+            mem_baseline = tracemalloc.get_traced_memory()[0]
         for frame in frames:
             pipeline.render_observations(
                 list(frame.observations),
@@ -106,6 +155,10 @@ def run_harness(args: argparse.Namespace) -> LoadSummary:
                 is_fallback=frame.is_fallback,
             )
             queue_peak = max(queue_peak, store.sqlite_queue_depth)
+        if track_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            mem_peak_kib = round(max(0, peak - mem_baseline) / 1024.0, 1)
+            mem_retained_kib = round(max(0, current - mem_baseline) / 1024.0, 1)
 
         perf = pipeline.snapshot_metrics()
         stats = store.stats()
@@ -123,6 +176,11 @@ def run_harness(args: argparse.Namespace) -> LoadSummary:
             sqlite_queue_peak=max(queue_peak, store.sqlite_queue_depth),
             dropped_events=int(perf.dropped_events),
             total_events_written=int(stats.rows),
+            backend=pipeline.active_backend_name,
+            sqlite=backend == "sqlite",
+            stages_ms=dict(perf.stages),
+            mem_peak_kib=mem_peak_kib,
+            mem_retained_kib=mem_retained_kib,
         )
 
         if strict_load:
@@ -139,6 +197,8 @@ def run_harness(args: argparse.Namespace) -> LoadSummary:
 
         return summary
     finally:
+        if started_tracemalloc:
+            tracemalloc.stop()
         pipeline.close()
         for _key, _value in _saved_env.items():
             if _value is None:
@@ -147,7 +207,180 @@ def run_harness(args: argparse.Namespace) -> LoadSummary:
                 os.environ[_key] = _value
 
 
+def _case_key(scenario: str, targets: int, backend: str, sqlite: bool) -> str:
+    return f"{scenario}/t{int(targets)}/{backend}/sqlite-{'on' if sqlite else 'off'}"
+
+
+def run_suite(
+    *,
+    scenarios: tuple[str, ...],
+    target_counts: tuple[int, ...],
+    backends: tuple[str, ...] = ("unicode",),
+    sqlite_modes: tuple[bool, ...] = (False,),
+    duration_s: float = 10.0,
+    seed: int = 7,
+    fusion: bool = True,
+    track_memory: bool = False,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Матрица сценарии × число целей × бэкенды × sqlite on/off; JSON-совместимый отчёт."""
+    cases: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="qiki-load-suite-") as db_dir:
+        for scenario in scenarios:
+            for targets in target_counts:
+                for backend in backends:
+                    for sqlite in sqlite_modes:
+                        key = _case_key(scenario, targets, backend, sqlite)
+                        if progress is not None:
+                            progress(key)
+                        summary = run_harness(
+                            argparse.Namespace(
+                                scenario=scenario,
+                                duration=float(duration_s),
+                                targets=int(targets),
+                                seed=int(seed),
+                                fusion="on" if fusion else "off",
+                                sqlite="on" if sqlite else "off",
+                                backend=backend,
+                                db_path=str(Path(db_dir) / f"case_{len(cases)}.sqlite"),
+                                avg_threshold=float("inf"),
+                                max_threshold=float("inf"),
+                                tracemalloc=track_memory,
+                            )
+                        )
+                        cases.append({"key": key, **summary.__dict__})
+    return {
+        "schema_version": SUITE_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "host": {"python": platform.python_version(), "machine": platform.machine(), "system": platform.system()},
+        "params": {"duration_s": float(duration_s), "seed": int(seed), "fusion": bool(fusion)},
+        "cases": cases,
+    }
+
+
+@dataclass(frozen=True)
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change_pct(self) -> float:
+        if self.baseline <= 0:
+            return float("inf")
+        return (self.current / self.baseline - 1.0) * 100.0
+
+
+def _case_metrics(case: dict[str, Any]) -> dict[str, float]:
+    metrics = {name: float(case[name]) for name in COMPARED_METRICS if case.get(name) is not None}
+    for stage, stats in (case.get("stages_ms") or {}).items():
+        if isinstance(stats, dict) and stats.get("avg_ms") is not None:
+            metrics[f"stage.{stage}.avg_ms"] = float(stats["avg_ms"])
+    return metrics
+
+
+def compare_reports(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance_pct: float = 15.0,
+    min_delta: float = 0.5,
+) -> list[Regression]:
+    """
+    Регрессии относительно baseline: метрика выросла больше чем на `tolerance_pct` процентов
+    и больше чем на `min_delta` в абсолютных единицах (мс/КиБ — отсекает шум на малых значениях).
+    Кейсы, которых нет в baseline, не сравниваются.
+    """
+    baseline_cases = {case.get("key"): case for case in baseline.get("cases", [])}
+    regressions: list[Regression] = []
+    for case in current.get("cases", []):
+        reference = baseline_cases.get(case.get("key"))
+        if reference is None:
+            continue
+        reference_metrics = _case_metrics(reference)
+        for metric, value in _case_metrics(case).items():
+            base_value = reference_metrics.get(metric)
+            if base_value is None:
+                continue
+            if value - base_value > min_delta and value > base_value * (1.0 + tolerance_pct / 100.0):
+                regressions.append(Regression(key=str(case["key"]), metric=metric, baseline=base_value, current=value))
+    return regressions
+
+
+def _csv(value: str) -> list[str]:
+    return [token.strip() for token in str(value).split(",") if token.strip()]
+
+
+def _build_suite_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="qiki-load-harness suite", description="QIKI load benchmark suite")
+    parser.add_argument("--scenarios", default="multi_target_300", help="Comma-separated scenarios")
+    parser.add_argument("--targets", default="50,300", help="Comma-separated target counts")
+    parser.add_argument("--backends", default="unicode", help=f"Comma-separated backends ({', '.join(BACKENDS)})")
+    parser.add_argument("--sqlite", default="off,on", help="Comma-separated sqlite modes (on/off)")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--fusion", choices=("on", "off"), default="on")
+    parser.add_argument("--tracemalloc", action="store_true", help="Track Python allocations (slower frames)")
+    parser.add_argument("--output", default="", help="Write the JSON report to this path")
+    parser.add_argument("--baseline", default="", help="Compare against this JSON report; exit 3 on regressions")
+    parser.add_argument("--tolerance", type=float, default=15.0, help="Allowed slowdown, percent (default: 15)")
+    parser.add_argument("--min-delta", type=float, default=0.5, help="Ignore changes below this (ms/KiB)")
+    return parser
+
+
+def _suite_main(argv: list[str]) -> int:
+    parser = _build_suite_parser()
+    args = parser.parse_args(argv)
+    scenarios = tuple(_csv(args.scenarios))
+    unknown = sorted(set(scenarios) - set(available_scenarios()))
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    backends = tuple(_csv(args.backends))
+    if set(backends) - set(BACKENDS):
+        parser.error(f"backends must be from: {', '.join(BACKENDS)}")
+    sqlite_tokens = tuple(token.lower() for token in _csv(args.sqlite))
+    if not sqlite_tokens or set(sqlite_tokens) - {"on", "off"}:
+        parser.error("sqlite modes must be from: on, off")
+    sqlite_modes = tuple(token == "on" for token in sqlite_tokens)
+
+    report = run_suite(
+        scenarios=scenarios,
+        target_counts=tuple(int(token) for token in _csv(args.targets)),
+        backends=backends,
+        sqlite_modes=sqlite_modes,
+        duration_s=float(args.duration),
+        seed=int(args.seed),
+        fusion=args.fusion == "on",
+        track_memory=bool(args.tracemalloc),
+    )
+    exit_code = 0
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_reports(
+            report, baseline, tolerance_pct=float(args.tolerance), min_delta=float(args.min_delta)
+        )
+        report["comparison"] = {
+            "baseline": str(args.baseline),
+            "tolerance_pct": float(args.tolerance),
+            "regressions": [
+                {**regression.__dict__, "change_pct": round(regression.change_pct, 1)} for regression in regressions
+            ],
+        }
+        exit_code = 3 if regressions else 0
+    text = json.dumps(report, indent=2, ensure_ascii=True)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return exit_code
+
+
 def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "suite":
+        return _suite_main(list(argv[1:]))
     parser = _build_parser()
     args = parser.parse_args(argv)
     try:
@@ -138,8 +138,11 @@ _guard_events_enabled = os.getenv("RADAR_GUARD_EVENTS_ENABLED", "0").strip().low
 _guard_table = load_guard_table() if _guard_events_enabled else None
 _guard_publisher = RadarGuardEventPublisher(NATS_URL, subject=RADAR_GUARD_ALERTS)
 _guard_default_cooldown_s = max(0.1, float(os.getenv("RADAR_GUARD_PUBLISH_INTERVAL_S", "2.0").strip() or "2.0"))
+_guard_track_ttl_s = max(1.0, float(os.getenv("RADAR_GUARD_TRACK_TTL_S", "300").strip() or "300"))
 _guard_cadence = (
-    RadarGuardCadence(_guard_table, default_cooldown_s=_guard_default_cooldown_s) if _guard_table is not None else None
+    RadarGuardCadence(_guard_table, default_cooldown_s=_guard_default_cooldown_s, track_ttl_s=_guard_track_ttl_s)
+    if _guard_table is not None
+    else None
 )
 _lag_monitor = JetStreamLagMonitor(
     nats_url=NATS_URL,
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 import math
+from typing import Hashable
 
-from qiki.services.q_core_agent.core.guard_table import GuardTable
+from qiki.services.q_core_agent.core.guard_table import GuardRule, GuardTable
 from qiki.services.q_core_agent.core.guard_table import GuardEvaluationResult
 from qiki.shared.models.radar import RadarTrackModel
 
@@ -17,33 +19,88 @@ class _GuardKeyState:
     active: bool = False
 
 
+@dataclass
+class _TrackGuardState:
+    last_seen_ts_epoch: float = 0.0
+    rules: dict[str, _GuardKeyState] = field(default_factory=dict)
+
+
 class RadarGuardCadence:
     """Edge-triggered cadence for guard alerts (anti-flap, no-spam).
 
     The cadence operates in simulation time (ts_event) for replay determinism.
     It publishes at most one alert per (rule_id, track_id) while the condition remains active.
     Re-entry alerts are suppressed by rule.cooldown_s (or a default).
+
+    State is kept per track (least recently seen first); a track not updated for
+    `track_ttl_s` of simulation time is considered dead and its state is dropped.
     """
 
-    def __init__(self, table: GuardTable, *, default_cooldown_s: float = 2.0) -> None:
+    def __init__(self, table: GuardTable, *, default_cooldown_s: float = 2.0, track_ttl_s: float = 300.0) -> None:
         self._table = table
         self._default_cooldown_s = max(0.0, float(default_cooldown_s))
-        self._states: dict[str, _GuardKeyState] = {}
+        self._track_ttl_s = max(0.0, float(track_ttl_s))
+        self._tracks: OrderedDict[Hashable, _TrackGuardState] = OrderedDict()
+
+    @property
+    def tracked_count(self) -> int:
+        return len(self._tracks)
+
+    @property
+    def state_count(self) -> int:
+        return sum(len(entry.rules) for entry in self._tracks.values())
 
     @staticmethod
     def _ts_epoch(track: RadarTrackModel) -> float:
         dt = track.ts_event or track.timestamp
         return float(dt.timestamp())
 
+    def _cooldown_s(self, rule: GuardRule) -> float:
+        cooldown_s_raw = getattr(rule, "cooldown_s", None)
+        explicit_cooldown = not hasattr(rule, "model_fields_set") or "cooldown_s" in rule.model_fields_set
+        if explicit_cooldown and isinstance(cooldown_s_raw, (int, float)):
+            cooldown_val = float(cooldown_s_raw)
+            if math.isfinite(cooldown_val):
+                cooldown_s = max(0.0, cooldown_val)
+            else:
+                cooldown_s = self._default_cooldown_s
+        else:
+            cooldown_s = self._default_cooldown_s
+        return cooldown_s
+
+    def _candidates(self, track: RadarTrackModel) -> tuple[tuple[GuardRule, ...], frozenset]:
+        index = getattr(self._table, "candidates", None)
+        if index is not None:
+            return index(track)
+        # Plain rule containers (no index): every rule is a candidate.
+        rules = tuple(self._table.rules)
+        return rules, frozenset(rule.rule_id for rule in rules)
+
     def update(self, track: RadarTrackModel) -> list[GuardEvaluationResult]:
         """Return guard alert evaluations to publish (edge-only)."""
 
         now_ts = self._ts_epoch(track)
         to_publish: list[GuardEvaluationResult] = []
 
-        for rule in self._table.rules:
-            key = f"{rule.rule_id}:{track.track_id}"
-            state = self._states.get(key)
+        track_key = track.track_id
+        entry = self._tracks.get(track_key)
+        if entry is None:
+            entry = self._tracks[track_key] = _TrackGuardState()
+        else:
+            self._tracks.move_to_end(track_key)
+        entry.last_seen_ts_epoch = now_ts
+        states = entry.rules
+
+        candidates, candidate_ids = self._candidates(track)
+        # Rules outside the candidate set cannot match even with hysteresis: clear them.
+        for rule_id, state in states.items():
+            if state.active and rule_id not in candidate_ids:
+                state.active = False
+                state.first_match_ts_epoch = 0.0
+                state.last_match_ts_epoch = 0.0
+
+        for rule in candidates:
+            state = states.get(rule.rule_id)
             is_active = bool(state.active) if state else False
             min_duration_s = max(0.0, float(getattr(rule, "min_duration_s", 0.0) or 0.0))
 
@@ -58,7 +115,7 @@ class RadarGuardCadence:
 
             if state is None:
                 state = _GuardKeyState(first_match_ts_epoch=now_ts, last_match_ts_epoch=now_ts)
-                self._states[key] = state
+                states[rule.rule_id] = state
             else:
                 if min_duration_s and state.last_match_ts_epoch:
                     # Require the condition to hold continuously: if there is a long gap between
@@ -76,16 +133,7 @@ class RadarGuardCadence:
             if min_duration_s and (now_ts - float(state.first_match_ts_epoch or now_ts)) < min_duration_s:
                 continue
 
-            cooldown_s_raw = getattr(rule, "cooldown_s", None)
-            explicit_cooldown = not hasattr(rule, "model_fields_set") or "cooldown_s" in rule.model_fields_set
-            if explicit_cooldown and isinstance(cooldown_s_raw, (int, float)):
-                cooldown_val = float(cooldown_s_raw)
-                if math.isfinite(cooldown_val):
-                    cooldown_s = max(0.0, cooldown_val)
-                else:
-                    cooldown_s = self._default_cooldown_s
-            else:
-                cooldown_s = self._default_cooldown_s
+            cooldown_s = self._cooldown_s(rule)
             if cooldown_s and (now_ts - float(state.last_publish_ts_epoch or 0.0)) < cooldown_s:
                 continue
 
@@ -93,19 +141,13 @@ class RadarGuardCadence:
             state.last_publish_ts_epoch = now_ts
             to_publish.append(rule.build_result(track))
 
-        self._gc(now_ts)
+        self._evict_dead_tracks(now_ts)
         return to_publish
 
-    def _gc(self, now_ts: float) -> None:
-        # Best-effort bound: drop inactive keys after a while to avoid unbounded growth
-        # in long-running stacks with many transient tracks.
-        ttl_s = 300.0
-        for key, state in list(self._states.items()):
-            if state.active:
-                continue
-            last = float(state.last_publish_ts_epoch or 0.0)
-            # If never published, use last_match.
-            if not last:
-                last = float(state.last_match_ts_epoch or 0.0)
-            if last and (now_ts - last) > ttl_s:
-                self._states.pop(key, None)
+    def _evict_dead_tracks(self, now_ts: float) -> None:
+        # Tracks are ordered by last update, so only the stale head is visited.
+        while self._tracks:
+            track_key, entry = next(iter(self._tracks.items()))
+            if (now_ts - entry.last_seen_ts_epoch) <= self._track_ttl_s:
+                break
+            del self._tracks[track_key]
@@ -26,6 +26,10 @@ def _track(*, ts: datetime, range_m: float) -> RadarTrackModel:
     )
 
 
+def _state_keys(cadence: RadarGuardCadence) -> set[str]:
+    return {f"{rule_id}:{track_id}" for track_id, entry in cadence._tracks.items() for rule_id in entry.rules}
+
+
 def test_guard_cadence_edge_only_with_hysteresis_and_cooldown() -> None:
     rule = GuardRule.model_validate(
         {
@@ -212,7 +216,7 @@ def test_guard_cadence_uses_stable_rule_track_dedup_key_and_suppresses_repeat()
     assert cadence.update(t0)
 
     key = f"{rule.rule_id}:{track_id}"
-    assert key in cadence._states
+    assert key in _state_keys(cadence)
 
     # Same rule+track while active must not produce duplicate incidents.
     t1 = _track(ts=base + timedelta(seconds=1), range_m=60.0)
@@ -251,8 +255,8 @@ def test_guard_cadence_track_id_churn_creates_independent_keys() -> None:
 
     key_a = f"{rule.rule_id}:{track_a}"
     key_b = f"{rule.rule_id}:{track_b}"
-    assert key_a in cadence._states
-    assert key_b in cadence._states
+    assert key_a in _state_keys(cadence)
+    assert key_b in _state_keys(cadence)
 
     # Each key stays edge-only independently.
     t_a1 = _track(ts=base + timedelta(seconds=2), range_m=60.0)
@@ -305,8 +309,8 @@ def test_guard_cadence_gc_drops_only_stale_inactive_keys() -> None:
 
     stale_key = f"{rule.rule_id}:{stale_track}"
     active_key = f"{rule.rule_id}:{active_track}"
-    assert stale_key not in cadence._states
-    assert active_key in cadence._states
+    assert stale_key not in _state_keys(cadence)
+    assert active_key in _state_keys(cadence)
 
 
 def test_guard_cadence_cooldown_is_key_scoped_across_tracks() -> None:
@@ -767,7 +771,7 @@ def test_guard_cadence_gc_handles_many_inactive_keys_with_edge_cooldowns() -> No
         t_off.track_id = track_id
         assert cadence.update(t_off) == []
 
-    assert len(cadence._states) == len(track_ids) * 2
+    assert len(_state_keys(cadence)) == len(track_ids) * 2
 
     # Trigger GC after TTL via unrelated non-matching update.
     trigger = _track(ts=base + timedelta(seconds=600), range_m=90.0)
@@ -775,7 +779,7 @@ def test_guard_cadence_gc_handles_many_inactive_keys_with_edge_cooldowns() -> No
     assert cadence.update(trigger) == []
 
     # All previously inactive keys should be dropped regardless of cooldown edge path.
-    assert len(cadence._states) == 0
+    assert len(_state_keys(cadence)) == 0
 
 
 def test_guard_cadence_gc_keeps_recently_reactivated_keys_under_mixed_cooldowns() -> None:
@@ -844,10 +848,10 @@ def test_guard_cadence_gc_keeps_recently_reactivated_keys_under_mixed_cooldowns(
     hot_nonfinite_key = f"{rule_nonfinite.rule_id}:{hot_track}"
 
     # Old inactive keys are removed; recently reactivated keys are preserved.
-    assert stale_zero_key not in cadence._states
-    assert stale_nonfinite_key not in cadence._states
-    assert hot_zero_key in cadence._states
-    assert hot_nonfinite_key in cadence._states
+    assert stale_zero_key not in _state_keys(cadence)
+    assert stale_nonfinite_key not in _state_keys(cadence)
+    assert hot_zero_key in _state_keys(cadence)
+    assert hot_nonfinite_key in _state_keys(cadence)
 
 
 def test_guard_cadence_min_duration_reactivation_after_long_gap_under_churn() -> None:
@@ -952,10 +956,10 @@ def test_guard_cadence_cooldown_timestamp_remains_key_local_after_gc_churn() ->
     stale_nonfinite_key = f"{rule_nonfinite.rule_id}:{stale_track}"
     hot_zero_key = f"{rule_zero.rule_id}:{hot_track}"
     hot_nonfinite_key = f"{rule_nonfinite.rule_id}:{hot_track}"
-    assert stale_zero_key not in cadence._states
-    assert stale_nonfinite_key not in cadence._states
-    assert hot_zero_key in cadence._states
-    assert hot_nonfinite_key in cadence._states
+    assert stale_zero_key not in _state_keys(cadence)
+    assert stale_nonfinite_key not in _state_keys(cadence)
+    assert hot_zero_key in _state_keys(cadence)
+    assert hot_nonfinite_key in _state_keys(cadence)
 
     # Reactivate hot key shortly after deactivation:
     # - zero cooldown rule should emit immediately (key-local no suppression),
@@ -1006,7 +1010,7 @@ def test_guard_cadence_gc_clear_prevents_old_cooldown_leak_at_min_duration_bound
     trigger.track_id = uuid4()
     assert cadence.update(trigger) == []
     key = f"{rule.rule_id}:{track_id}"
-    assert key not in cadence._states
+    assert key not in _state_keys(cadence)
 
     # Re-enter near old cooldown cutoff and require fresh min_duration.
     assert cadence.update(make(base + timedelta(seconds=307), 60.0)) == []
@@ -1062,10 +1066,45 @@ def test_guard_cadence_combined_hysteresis_min_duration_cooldown_with_gc_between
     trigger.track_id = uuid4()
     assert cadence.update(trigger) == []
     key = f"{rule.rule_id}:{track_id}"
-    assert key not in cadence._states
+    assert key not in _state_keys(cadence)
 
     # Cycle 2 after GC: must re-accumulate min_duration.
     assert cadence.update(make(base + timedelta(seconds=311), 60.0)) == []
     assert cadence.update(make(base + timedelta(seconds=312), 60.0)) == []
     # Boundary publish in fresh cycle.
     assert cadence.update(make(base + timedelta(seconds=314), 60.0))
+
+
+def test_guard_cadence_evicts_dead_tracks_even_if_active() -> None:
+    rule = GuardRule.model_validate(
+        {
+            "id": "UNKNOWN_CONTACT_CLOSE",
+            "description": "test",
+            "severity": "critical",
+            "fsm_event": "RADAR_ALERT_UNKNOWN_CLOSE",
+            "min_range_m": 0.0,
+            "max_range_m": 70.0,
+            "cooldown_s": 0.0,
+        }
+    )
+    cadence = RadarGuardCadence(GuardTable(schema_version=1, rules=[rule]), track_ttl_s=5.0)
+    base = datetime(2026, 2, 2, 12, 0, 0, tzinfo=UTC)
+
+    for i in range(100):
+        assert cadence.update(_track(ts=base + timedelta(seconds=i * 0.05), range_m=60.0))
+    assert cadence.tracked_count == 100
+
+    # Only tracks seen within the TTL survive; their active state goes with them once dead.
+    survivor = _track(ts=base + timedelta(seconds=9.725), range_m=60.0)
+    assert cadence.update(survivor)
+    assert cadence.tracked_count == 6
+    assert cadence.state_count == 6
+
+
+def test_guard_table_benchmark_reports_index_and_bounded_state() -> None:
+    from tools.guard_table_bench import run_benchmark
+
+    report = run_benchmark(rules=20, tracks=100, seconds=6, churn=0.5, track_ttl_s=1.0)
+    assert report["evaluate"]["mismatches"] == 0
+    # Without eviction every churned ID would stay: 100 + 5 * ~50.
+    assert report["cadence"]["tracked_after"] < 200
@@ -0,0 +1,324 @@
+"""
+Off-loop ingest stage for operator console NATS subscriptions.
+
+NATS callbacks run on the Textual event loop. Decoding every message there (and
+re-rendering per message) lets a telemetry/track burst starve keyboard and mouse
+handling. The pipeline splits ingest into lanes (one per stream):
+
+- the NATS callback only appends the raw bytes to its lane (O(1), no JSON work);
+- a pump task decodes and validates pending messages in a worker thread;
+- state-type lanes (telemetry, tracks by id, radar frames) are conflated to the
+  latest value per key, event lanes stay FIFO and are bounded;
+- decoded batches are delivered to the UI callbacks at a bounded rate.
+
+Counters (received / conflated / dropped / decode errors / delivered) are exposed
+via `stats()` so consoles can show back-pressure instead of silently lagging.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+ConflateKeyFn = Callable[[dict[str, Any]], Optional[str]]
+ValidateFn = Callable[[Any], bool]
+
+CONFLATE_BY_SUBJECT = "subject"
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() not in {"0", "false", "no", "off"}
+
+
+def ingest_pipeline_enabled() -> bool:
+    return _env_flag("OPERATOR_CONSOLE_INGEST_PIPELINE", "1")
+
+
+def track_conflation_key(data: dict[str, Any]) -> Optional[str]:
+    track_id = data.get("track_id") or data.get("trackId")
+    if track_id is None:
+        return None
+    token = str(track_id).strip()
+    return token or None
+
+
+def is_json_object(data: Any) -> bool:
+    return isinstance(data, dict)
+
+
+@dataclass
+class IngestLaneStats:
+    received: int = 0
+    decoded: int = 0
+    decode_errors: int = 0
+    invalid: int = 0
+    conflated: int = 0
+    dropped: int = 0
+    delivered: int = 0
+    callback_errors: int = 0
+    pending: int = 0
+
+
+@dataclass
+class _RawMessage:
+    raw: bytes
+    subject: Optional[str]
+    received_at: str
+
+
+@dataclass
+class _Lane:
+    stream: str
+    callback: Callable[[dict[str, Any]], Awaitable[None]]
+    conflate: str | ConflateKeyFn | None
+    validate: Optional[ValidateFn]
+    include_subject: bool
+    stats: IngestLaneStats = field(default_factory=IngestLaneStats)
+    # FIFO lanes use `fifo`; subject-conflated lanes keep only the newest raw per subject.
+    fifo: deque[_RawMessage] = field(default_factory=deque)
+    latest_by_subject: dict[str, _RawMessage] = field(default_factory=dict)
+
+    def pending_count(self) -> int:
+        return len(self.fifo) + len(self.latest_by_subject)
+
+    def take(self) -> list[_RawMessage]:
+        items = list(self.fifo)
+        self.fifo.clear()
+        if self.latest_by_subject:
+            items = items + list(self.latest_by_subject.values())
+            self.latest_by_subject = {}
+        return items
+
+
+def _decode_batch(
+    items: list[tuple[bytes, Optional[ValidateFn]]],
+) -> list[tuple[str, Any]]:
+    """Worker-thread side: JSON decode + validation. Returns (status, data) per item."""
+    out: list[tuple[str, Any]] = []
+    for raw, validate in items:
+        try:
+            data = json.loads(raw.decode("utf-8") if isinstance(raw, (bytes, bytearray)) else raw)
+        except Exception:
+            out.append(("decode_error", None))
+            continue
+        try:
+            ok = True if validate is None else bool(validate(data))
+        except Exception:
+            ok = False
+        out.append(("ok", data) if ok else ("invalid", None))
+    return out
+
+
+class IngestPipeline:
+    """Lane-sharded, conflating, rate-bounded ingest between NATS and the UI loop."""
+
+    def __init__(
+        self,
+        *,
+        max_batches_per_s: float = 20.0,
+        max_pending_per_lane: int = 2048,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self._min_interval_s = 1.0 / max(0.1, float(max_batches_per_s))
+        self._max_pending = max(1, int(max_pending_per_lane))
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._lanes: dict[str, _Lane] = {}
+        self._wake: Optional[asyncio.Event] = None
+        self._pump_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.batches_delivered: int = 0
+
+    @classmethod
+    def from_env(cls) -> "IngestPipeline":
+        return cls(
+            max_batches_per_s=float(os.getenv("OPERATOR_CONSOLE_INGEST_RATE_HZ", "20")),
+            max_pending_per_lane=int(os.getenv("OPERATOR_CONSOLE_INGEST_MAX_PENDING", "2048")),
+        )
+
+    def register(
+        self,
+        stream: str,
+        callback: Callable[[dict[str, Any]], Awaitable[None]],
+        *,
+        conflate: str | ConflateKeyFn | None = None,
+        validate: Optional[ValidateFn] = is_json_object,
+        include_subject: bool = False,
+    ) -> None:
+        """
+        Declare a lane.
+
+        `conflate`: None keeps every message (FIFO, bounded); `CONFLATE_BY_SUBJECT` keeps the newest
+        raw message per subject before decoding; a callable maps decoded data to a key (e.g. track id)
+        and keeps the newest per key within a batch.
+        """
+        existing = self._lanes.get(stream)
+        stats = existing.stats if existing is not None else IngestLaneStats()
+        self._lanes[stream] = _Lane(
+            stream=stream,
+            callback=callback,
+            conflate=conflate,
+            validate=validate,
+            include_subject=include_subject,
+            stats=stats,
+        )
+
+    def has_lane(self, stream: str) -> bool:
+        return stream in self._lanes
+
+    def submit(self, stream: str, raw: bytes, *, subject: Optional[str] = None) -> None:
+        """Called from the NATS callback: enqueue raw bytes, never decode here."""
+        lane = self._lanes.get(stream)
+        if lane is None or self._closed:
+            return
+        lane.stats.received += 1
+        item = _RawMessage(raw=raw, subject=subject, received_at=datetime.now().isoformat())
+        if lane.conflate == CONFLATE_BY_SUBJECT:
+            key = subject or ""
+            if key in lane.latest_by_subject:
+                lane.stats.conflated += 1
+            lane.latest_by_subject[key] = item
+        else:
+            if len(lane.fifo) >= self._max_pending:
+                lane.fifo.popleft()
+                lane.stats.dropped += 1
+            lane.fifo.append(item)
+        self._ensure_pump()
+        if self._wake is not None:
+            self._wake.set()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        out: dict[str, dict[str, int]] = {}
+        for stream, lane in self._lanes.items():
+            lane.stats.pending = lane.pending_count()
+            out[stream] = asdict(lane.stats)
+        return out
+
+    def totals(self) -> dict[str, int]:
+        total = IngestLaneStats()
+        for lane_stats in self.stats().values():
+            for name, value in lane_stats.items():
+                setattr(total, name, getattr(total, name) + int(value))
+        return asdict(total)
+
+    async def flush(self) -> int:
+        """Decode and deliver everything pending once; returns the number of delivered messages."""
+        taken: list[tuple[_Lane, list[_RawMessage]]] = []
+        for lane in self._lanes.values():
+            items = lane.take()
+            if items:
+                taken.append((lane, items))
+        if not taken:
+            return 0
+
+        batch = [(item.raw, lane.validate) for lane, items in taken for item in items]
+        loop = asyncio.get_running_loop()
+        decoded = await loop.run_in_executor(self._get_executor(), _decode_batch, batch)
+
+        delivered = 0
+        cursor = 0
+        for lane, items in taken:
+            results = decoded[cursor : cursor + len(items)]
+            cursor += len(items)
+            envelopes = self._lane_envelopes(lane, items, results)
+            for envelope in envelopes:
+                try:
+                    await lane.callback(envelope)
+                except Exception:
+                    lane.stats.callback_errors += 1
+                    logger.debug("operator_ingest_callback_failed stream=%s", lane.stream, exc_info=True)
+                    continue
+                lane.stats.delivered += 1
+                delivered += 1
+            # Yield between lanes so input events interleave with a large batch.
+            await asyncio.sleep(0)
+        self.batches_delivered += 1
+        return delivered
+
+    async def stop(self) -> None:
+        self._closed = True
+        task = self._pump_task
+        self._pump_task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                logger.debug("operator_ingest_pump_stop_failed", exc_info=True)
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _lane_envelopes(
+        self,
+        lane: _Lane,
+        items: list[_RawMessage],
+        results: list[tuple[str, Any]],
+    ) -> list[dict[str, Any]]:
+        key_fn = lane.conflate if callable(lane.conflate) else None
+        # (arrival index, envelope); conflated keys keep only their newest arrival.
+        unkeyed: list[tuple[int, dict[str, Any]]] = []
+        keyed: dict[str, tuple[int, dict[str, Any]]] = {}
+        for seq, (item, (status, data)) in enumerate(zip(items, results)):
+            if status == "decode_error":
+                lane.stats.decode_errors += 1
+                continue
+            if status == "invalid":
+                lane.stats.invalid += 1
+                continue
+            lane.stats.decoded += 1
+            envelope: dict[str, Any] = {"stream": lane.stream, "timestamp": item.received_at}
+            if lane.include_subject:
+                envelope["subject"] = item.subject
+            envelope["data"] = data
+            key = key_fn(data) if key_fn is not None and isinstance(data, dict) else None
+            if key is None:
+                unkeyed.append((seq, envelope))
+                continue
+            if key in keyed:
+                lane.stats.conflated += 1
+            keyed[key] = (seq, envelope)
+        if not keyed:
+            return [envelope for _seq, envelope in unkeyed]
+        merged = unkeyed + list(keyed.values())
+        merged.sort(key=lambda entry: entry[0])
+        return [envelope for _seq, envelope in merged]
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="operator-ingest")
+        return self._executor
+
+    def _ensure_pump(self) -> None:
+        if self._pump_task is not None and not self._pump_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._wake = asyncio.Event()
+        self._pump_task = loop.create_task(self._pump())
+
+    async def _pump(self) -> None:
+        assert self._wake is not None
+        while not self._closed:
+            await self._wake.wait()
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.debug("operator_ingest_flush_failed", exc_info=True)
+            # Bounded delivery rate: messages arriving meanwhile are conflated/batched.
+            await asyncio.sleep(self._min_interval_s)
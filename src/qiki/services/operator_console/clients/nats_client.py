@@ -16,6 +16,11 @@ import nats
 from nats.js import JetStreamContext
 from nats.errors import TimeoutError, NoServersError
 
+from qiki.services.operator_console.clients.ingest_pipeline import (
+    CONFLATE_BY_SUBJECT,
+    IngestPipeline,
+    track_conflation_key,
+)
 from qiki.shared.nats_connect import nats_auth_kwargs
 from qiki.shared.nats_subjects import (
     EVENTS_STREAM_NAME,
@@ -80,6 +85,8 @@ class NATSClient:
         self.decode_errors_qiki_responses: int = 0
         self._decode_error_log_period_s: float = 10.0
         self._decode_error_last_log_ts: dict[str, float] = {}
+        # Optional off-loop ingest stage (decode/validate/conflate); see `enable_ingest_pipeline`.
+        self.ingest: Optional[IngestPipeline] = None
 
     @property
     def connection_state(self) -> str:
@@ -89,6 +96,17 @@ class NATSClient:
     def active_subscriptions(self) -> int:
         return len(self.subscriptions)
 
+    def enable_ingest_pipeline(self, pipeline: IngestPipeline) -> None:
+        """Route telemetry/tracks/events/radar subscriptions through `pipeline` (call before subscribing)."""
+        self.ingest = pipeline
+
+    def _ingest_submit(self, stream: str, msg: Any) -> bool:
+        ingest = self.ingest
+        if ingest is None or not ingest.has_lane(stream):
+            return False
+        ingest.submit(stream, msg.data, subject=getattr(msg, "subject", None))
+        return True
+
     def set_lifecycle_callback(self, callback: Callable[[str], Awaitable[None]] | None) -> None:
         self._lifecycle_callback = callback
 
@@ -135,6 +153,8 @@ class NATSClient:
         if self.nc:
             await self.nc.drain()
             await self.nc.close()
+        if self.ingest is not None:
+            await self.ingest.stop()
         self._connection_state = "lost"
 
     async def subscribe_radar_sr(self, callback: Callable[[Dict], Awaitable[None]]) -> None:
@@ -148,9 +168,14 @@ class NATSClient:
             raise RuntimeError("Not connected to JetStream")
 
         self.callbacks["RADAR_SR"] = callback
+        if self.ingest is not None:
+            self.ingest.register("RADAR_SR", callback, conflate=CONFLATE_BY_SUBJECT)
 
         async def message_handler(msg):
             """Handle incoming radar messages."""
+            if self._ingest_submit("RADAR_SR", msg):
+                await _safe_ack(msg, context="RADAR_SR")
+                return
             try:
                 data = json.loads(msg.data.decode())
                 await callback({"stream": "RADAR_SR", "timestamp": datetime.now().isoformat(), "data": data})
@@ -180,9 +205,14 @@ class NATSClient:
             raise RuntimeError("Not connected to JetStream")
 
         self.callbacks["RADAR_LR"] = callback
+        if self.ingest is not None:
+            self.ingest.register("RADAR_LR", callback, conflate=CONFLATE_BY_SUBJECT)
 
         async def message_handler(msg):
             """Handle incoming radar messages."""
+            if self._ingest_submit("RADAR_LR", msg):
+                await _safe_ack(msg, context="RADAR_LR")
+                return
             try:
                 data = json.loads(msg.data.decode())
                 await callback({"stream": "RADAR_LR", "timestamp": datetime.now().isoformat(), "data": data})
@@ -212,9 +242,14 @@ class NATSClient:
             raise RuntimeError("Not connected to JetStream")
 
         self.callbacks["TRACKS"] = callback
+        if self.ingest is not None:
+            self.ingest.register("TRACKS", callback, conflate=track_conflation_key)
 
         async def message_handler(msg):
             """Handle incoming track messages."""
+            if self._ingest_submit("TRACKS", msg):
+                await _safe_ack(msg, context="TRACKS")
+                return
             try:
                 data = json.loads(msg.data.decode())
                 await callback({"stream": "TRACKS", "timestamp": datetime.now().isoformat(), "data": data})
@@ -245,8 +280,12 @@ class NATSClient:
         """Subscribe to system telemetry (core NATS, not JetStream by default)."""
         if not self.nc:
             raise RuntimeError("Not connected to NATS")
+        if self.ingest is not None:
+            self.ingest.register("SYSTEM_TELEMETRY", callback, conflate=CONFLATE_BY_SUBJECT)
 
         async def message_handler(msg):
+            if self._ingest_submit("SYSTEM_TELEMETRY", msg):
+                return
             try:
                 data = json.loads(msg.data.decode())
                 await callback(
@@ -275,8 +314,13 @@ class NATSClient:
         """Subscribe to system events wildcard (core NATS)."""
         if not self.nc:
             raise RuntimeError("Not connected to NATS")
+        if self.ingest is not None:
+            # Events are not state: never conflated, only bounded (drops are counted).
+            self.ingest.register("EVENTS", callback, validate=None, include_subject=True)
 
         async def message_handler(msg):
+            if self._ingest_submit("EVENTS", msg):
+                return
             try:
                 data = json.loads(msg.data.decode())
                 await callback(
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+import time
+from typing import Any, Iterator, Mapping, Optional
+
+
+_SortKey = tuple[int, float, float, str]
+
+
+def track_sort_key(track_id: str, payload: Mapping[str, Any], seen: float) -> _SortKey:
+    """Radar table order: known range ascending, then freshest first; tracks without range go last."""
+    range_m = payload.get("range_m")
+    if isinstance(range_m, (int, float)) and not isinstance(range_m, bool):
+        return (0, float(range_m), -float(seen), str(track_id))
+    return (1, float("inf"), -float(seen), str(track_id))
+
+
+class TrackRegistry:
+    """
+    Live radar tracks kept in range order.
+
+    The ORION radar screen asks for "the N nearest tracks" several times per refresh
+    (table, PPI, click picking, selection cycling). Instead of copying and sorting the
+    whole track dict on every call, the registry keeps a sorted key index that is
+    updated incrementally on ingest (O(log n) search + list insert).
+
+    Expiry is opt-in (`expire_s <= 0` keeps last-known tracks forever, matching the
+    console's "show last known + age" policy); when enabled, tracks not seen for
+    `expire_s` seconds are dropped by `expire()`.
+    """
+
+    def __init__(self, *, expire_s: float = 0.0) -> None:
+        self._expire_s = float(expire_s)
+        self._by_id: dict[str, tuple[dict[str, Any], float]] = {}
+        self._key_by_id: dict[str, _SortKey] = {}
+        self._order: list[tuple[_SortKey, str]] = []
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every mutation (cheap dirty-check for renderers)."""
+        return self._version
+
+    @property
+    def expire_s(self) -> float:
+        return self._expire_s
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, track_id: object) -> bool:
+        return track_id in self._by_id
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_id)
+
+    def __getitem__(self, track_id: str) -> tuple[dict[str, Any], float]:
+        return self._by_id[track_id]
+
+    def get(self, track_id: str) -> Optional[tuple[dict[str, Any], float]]:
+        return self._by_id.get(track_id)
+
+    def items(self) -> Iterator[tuple[str, tuple[dict[str, Any], float]]]:
+        return iter(self._by_id.items())
+
+    def as_dict(self) -> dict[str, tuple[dict[str, Any], float]]:
+        return dict(self._by_id)
+
+    def upsert(self, track_id: str, payload: dict[str, Any], seen: Optional[float] = None) -> None:
+        tid = str(track_id)
+        seen_f = time.time() if seen is None else float(seen)
+        self._unindex(tid)
+        key = track_sort_key(tid, payload, seen_f)
+        self._by_id[tid] = (payload, seen_f)
+        self._key_by_id[tid] = key
+        insort(self._order, (key, tid))
+        self._version += 1
+
+    def remove(self, track_id: str) -> bool:
+        tid = str(track_id)
+        if tid not in self._by_id:
+            return False
+        self._unindex(tid)
+        del self._by_id[tid]
+        self._version += 1
+        return True
+
+    def replace(self, tracks: Mapping[str, tuple[dict[str, Any], float]]) -> None:
+        """Reset contents from a `{track_id: (payload, seen_epoch)}` mapping."""
+        self._by_id = {str(tid): (payload, float(seen)) for tid, (payload, seen) in tracks.items()}
+        self._key_by_id = {tid: track_sort_key(tid, payload, seen) for tid, (payload, seen) in self._by_id.items()}
+        self._order = sorted((key, tid) for tid, key in self._key_by_id.items())
+        self._version += 1
+
+    def clear(self) -> None:
+        self.replace({})
+
+    def expire(self, *, now_epoch: Optional[float] = None) -> list[str]:
+        """Drop tracks older than `expire_s`; returns the removed track ids."""
+        if self._expire_s <= 0 or not self._by_id:
+            return []
+        now = time.time() if now_epoch is None else float(now_epoch)
+        cutoff = now - self._expire_s
+        dead = [tid for tid, (_payload, seen) in self._by_id.items() if seen < cutoff]
+        if not dead:
+            return []
+        dead_set = set(dead)
+        for tid in dead:
+            del self._by_id[tid]
+            del self._key_by_id[tid]
+        self._order = [entry for entry in self._order if entry[1] not in dead_set]
+        self._version += 1
+        return dead
+
+    def rank(self, track_id: str) -> Optional[int]:
+        """Position of a track in range order (0 = nearest), or None if unknown."""
+        key = self._key_by_id.get(str(track_id))
+        if key is None:
+            return None
+        return bisect_left(self._order, (key, str(track_id)))
+
+    def top(self, limit: Optional[int] = None) -> list[tuple[str, dict[str, Any], float]]:
+        """The `limit` nearest tracks as `(track_id, payload, seen_epoch)`."""
+        entries = self._order if limit is None else self._order[: max(0, int(limit))]
+        by_id = self._by_id
+        return [(tid, by_id[tid][0], by_id[tid][1]) for _key, tid in entries]
+
+    def _unindex(self, tid: str) -> None:
+        key = self._key_by_id.pop(tid, None)
+        if key is None:
+            return
+        idx = bisect_left(self._order, (key, tid))
+        if idx < len(self._order) and self._order[idx] == (key, tid):
+            del self._order[idx]
@@ -26,9 +26,11 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, DataTable, Input, RichLog, Static
 from textual import events
 
+from qiki.services.operator_console.clients.ingest_pipeline import IngestPipeline, ingest_pipeline_enabled
 from qiki.services.operator_console.clients.nats_client import NATSClient
 from qiki.services.operator_console.core.incident_rules import FileRulesRepository, IncidentRulesConfig
 from qiki.services.operator_console.core.incidents import IncidentStore
+from qiki.services.operator_console.core.track_registry import TrackRegistry
 from qiki.services.operator_console.ui import i18n as I18N
 from qiki.services.operator_console.ui.profile_panel import ProfilePanel
 from qiki.shared.models.core import CommandMessage, MessageMetadata
@@ -607,22 +609,118 @@ class BootScreen(ModalScreen[bool]):
             return
 
 
+_DEFAULT_FRESHNESS_THRESHOLDS = FreshnessThresholds(fresh_max_s=60.0, stale_max_s=600.0)
+_FRESHNESS_THRESHOLDS_BY_TYPE: dict[str, FreshnessThresholds] = {
+    "telemetry": FreshnessThresholds(fresh_max_s=30.0, stale_max_s=300.0),
+    "mission": FreshnessThresholds(fresh_max_s=300.0, stale_max_s=3600.0),
+    "task": FreshnessThresholds(fresh_max_s=300.0, stale_max_s=3600.0),
+    "power": FreshnessThresholds(fresh_max_s=60.0, stale_max_s=900.0),
+}
+
+
+@dataclass(slots=True)
+class SnapshotSubscription:
+    """Panel view over a set of snapshot types (empty = all types)."""
+
+    types: tuple[str, ...]
+    seen_token: Optional[tuple[Any, ...]] = None
+
+
 class SnapshotStore:
-    """Last-known snapshots per type (and optional per key), with freshness."""
+    """
+    Last-known snapshots per type (and optional per key), with freshness.
+
+    Versioned: every `put` bumps a global version and the per-type version, and the newest
+    event is maintained incrementally, so aggregate queries do not rescan all types.
+    Renderers `subscribe` to the types they read and call `consume_change` from periodic
+    refreshes; it reports a change only when new data arrived in those types or when the
+    rendered age/freshness of one of them moved.
+    """
 
     def __init__(self) -> None:
         self._last_by_type: dict[str, EventEnvelope] = {}
         self._last_by_type_by_key: dict[str, dict[str, EventEnvelope]] = {}
+        self._version = 0
+        self._version_by_type: dict[str, int] = {}
+        self._newest: Optional[EventEnvelope] = None
+        self._subscriptions: dict[str, SnapshotSubscription] = {}
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def version_of(self, type_name: str) -> int:
+        """Store version of the last `put` for a type (0 = never seen)."""
+        return self._version_by_type.get((type_name or "").strip().lower(), 0)
 
     def put(self, env: EventEnvelope, *, key: Optional[str] = None) -> None:
         t = (env.type or "").strip().lower() or I18N.UNKNOWN
+        prev = self._last_by_type.get(t)
         self._last_by_type[t] = env
+        self._version += 1
+        self._version_by_type[t] = self._version
+        newest = self._newest
+        if newest is None or float(env.ts_epoch) > float(newest.ts_epoch):
+            self._newest = env
+        elif prev is newest and float(env.ts_epoch) < float(newest.ts_epoch):
+            # The newest envelope was replaced by an older one (out-of-order source): rescan once.
+            self._newest = max(self._last_by_type.values(), key=lambda e: float(e.ts_epoch))
         k = key if key is not None else (env.subject or env.event_id or "")
         if not k:
             return
         bucket = self._last_by_type_by_key.setdefault(t, {})
         bucket[k] = env
 
+    def subscribe(self, subscriber: str, types: tuple[str, ...] | list[str] = ()) -> None:
+        """Register (or re-register) a renderer interested in `types` (empty = every type)."""
+        norm = tuple(sorted({(t or "").strip().lower() for t in types if (t or "").strip()}))
+        current = self._subscriptions.get(subscriber)
+        if current is not None and current.types == norm:
+            return
+        self._subscriptions[subscriber] = SnapshotSubscription(types=norm)
+
+    def consume_change(
+        self,
+        subscriber: str,
+        *,
+        now_epoch: Optional[float] = None,
+        extra: tuple[Any, ...] = (),
+    ) -> bool:
+        """
+        True when a subscriber has something new to render since its last call.
+
+        `extra` lets the caller fold in UI state that also affects its output (density,
+        filters, connectivity). Unknown subscribers always report a change.
+        """
+        sub = self._subscriptions.get(subscriber)
+        if sub is None:
+            return True
+        now = time.time() if now_epoch is None else float(now_epoch)
+        if sub.types:
+            version = max((self._version_by_type.get(t, 0) for t in sub.types), default=0)
+            view = tuple(self._age_view(t, now) for t in sub.types)
+        else:
+            version = self._version
+            newest = self._newest
+            view = (
+                ()
+                if newest is None
+                else (I18N.fmt_age_compact(max(0.0, now - float(newest.ts_epoch))),)
+                + tuple(self._age_view(t, now) for t in self._last_by_type)
+            )
+        token = (version, view, extra)
+        if token == sub.seen_token:
+            return False
+        sub.seen_token = token
+        return True
+
+    def _age_view(self, type_name: str, now: float) -> tuple[Optional[str], str]:
+        env = self._last_by_type.get(type_name)
+        if env is None:
+            return (None, I18N.NA)
+        age = max(0.0, now - float(env.ts_epoch))
+        return (self.freshness_for_age(type_name, age), I18N.fmt_age_compact(age))
+
     def get_last(self, type_name: str) -> Optional[EventEnvelope]:
         t = (type_name or "").strip().lower()
         if not t:
@@ -644,9 +742,9 @@ class SnapshotStore:
         return max(0.0, now - float(env.ts_epoch))
 
     def last_ts_epoch(self) -> Optional[float]:
-        if not self._last_by_type:
+        if self._newest is None:
             return None
-        return max((float(env.ts_epoch) for env in self._last_by_type.values()), default=None)
+        return float(self._newest.ts_epoch)
 
     def last_by_type_values(self) -> tuple[EventEnvelope, ...]:
         return tuple(self._last_by_type.values())
@@ -659,20 +757,12 @@ class SnapshotStore:
         return max(0.0, now - float(ts))
 
     def get_last_event(self) -> Optional[EventEnvelope]:
-        if not self._last_by_type:
-            return None
-        return max(self._last_by_type.values(), key=lambda e: float(e.ts_epoch), default=None)
+        return self._newest
 
     @staticmethod
     def _thresholds_for_type(type_name: str) -> FreshnessThresholds:
         t = (type_name or "").strip().lower()
-        if t in {"telemetry"}:
-            return FreshnessThresholds(fresh_max_s=30.0, stale_max_s=300.0)
-        if t in {"mission", "task"}:
-            return FreshnessThresholds(fresh_max_s=300.0, stale_max_s=3600.0)
-        if t in {"power"}:
-            return FreshnessThresholds(fresh_max_s=60.0, stale_max_s=900.0)
-        return FreshnessThresholds(fresh_max_s=60.0, stale_max_s=600.0)
+        return _FRESHNESS_THRESHOLDS_BY_TYPE.get(t, _DEFAULT_FRESHNESS_THRESHOLDS)
 
     @classmethod
     def freshness_for_age(cls, type_name: str, age_s: Optional[float]) -> Optional[str]:
@@ -1706,7 +1796,9 @@ class OrionApp(App):
         self._density: str = "wide"
         self._sensors_compact_override: Optional[bool] = None
         self._power_compact_override: Optional[bool] = None
-        self._tracks_by_id: dict[str, tuple[dict[str, Any], float]] = {}
+        # Range-ordered live tracks (see `_active_tracks_sorted`). Expiry is opt-in: by default the
+        # console keeps last-known tracks and marks them stale via `_track_ttl_sec`.
+        self._track_registry = TrackRegistry(expire_s=float(os.getenv("OPERATOR_CONSOLE_TRACK_EXPIRE_SEC", "0")))
         self._last_event: Optional[dict[str, Any]] = None
         self._events_live: bool = True
         self._events_unread_count: int = 0
@@ -1730,8 +1822,15 @@ class OrionApp(App):
         self._mission_by_key: dict[str, dict[str, Any]] = {}
         # Keep a stable rendered row order per table id to avoid cursor jumps.
         self._datatable_row_keys: dict[str, list[str]] = {}
+        # Last rendered cells per table/row key so refreshes only touch rows that changed.
+        self._datatable_row_cells: dict[str, dict[str, tuple[Any, ...]]] = {}
         self._selection_by_app: dict[str, SelectionContext] = {}
         self._snapshots = SnapshotStore()
+        # Periodic panel refreshes are no-ops unless their snapshot types (or visible ages) moved.
+        self._snapshots.subscribe("summary", ("telemetry", "bios"))
+        self._snapshots.subscribe("diagnostics")
+        self._snapshots.subscribe("thermal", ("telemetry",))
+        self._snapshots.subscribe("mission", ("mission", "task"))
 
         # Secret entry mode (avoid modal dialogs; use the main input as a password field).
         self._secret_entry_mode: str | None = None
@@ -2401,18 +2500,17 @@ class OrionApp(App):
         if self.active_screen == ctx.app_id:
             self._refresh_inspector()
 
-    def _active_tracks_sorted(self) -> list[tuple[str, dict[str, Any], float]]:
-        items = list(self._tracks_by_id.items())
+    @property
+    def _tracks_by_id(self) -> TrackRegistry:
+        return self._track_registry
 
-        def sort_key(item: tuple[str, tuple[dict[str, Any], float]]) -> tuple[int, float, float]:
-            _tid, (payload, seen) = item
-            range_m = payload.get("range_m")
-            if isinstance(range_m, (int, float)):
-                return (0, float(range_m), -seen)
-            return (1, float("inf"), -seen)
+    @_tracks_by_id.setter
+    def _tracks_by_id(self, tracks: dict[str, tuple[dict[str, Any], float]]) -> None:
+        self._track_registry.replace(tracks)
 
-        items_sorted = sorted(items, key=sort_key)[: max(1, self._max_track_rows)]
-        return [(tid, payload, seen) for tid, (payload, seen) in items_sorted]
+    def _active_tracks_sorted(self) -> list[tuple[str, dict[str, Any], float]]:
+        self._track_registry.expire()
+        return self._track_registry.top(max(1, self._max_track_rows))
 
     def _render_tracks_table(self) -> None:
         try:
@@ -2898,6 +2996,10 @@ class OrionApp(App):
             return
 
         candidates: list[tuple[str, dict[str, Any]]] = [(str(tid), payload) for tid, payload, _seen in items]
+        # Reuse the projection of the frame on screen (ignored by the helper if the viewport changed).
+        pick_index = None
+        if self._radar_renderer_effective == "unicode":
+            pick_index = getattr(self._ppi_renderer, "pick_index", None)
         picked = pick_nearest_track_id(
             candidates,
             click_cell_x=int(x),
@@ -2911,6 +3013,7 @@ class OrionApp(App):
             pan_v_m=self._radar_pan_v_m,
             iso_yaw_deg=self._radar_iso_yaw_deg,
             iso_pitch_deg=self._radar_iso_pitch_deg,
+            index=pick_index,
         )
         if picked is None:
             return
@@ -2941,19 +3044,25 @@ class OrionApp(App):
             self._refresh_inspector()
 
     def _refresh_summary(self) -> None:
-        if self.active_screen == "summary":
+        if self.active_screen == "summary" and self._snapshots.consume_change(
+            "summary",
+            extra=(self.nats_connected, self._density, self._events_filter_text),
+        ):
             self._render_summary_table()
 
     def _refresh_diagnostics(self) -> None:
-        if self.active_screen == "diagnostics":
+        if self.active_screen == "diagnostics" and self._snapshots.consume_change(
+            "diagnostics",
+            extra=(self.nats_connected, self._events_filter_type, self._events_filter_text),
+        ):
             self._render_diagnostics_table()
 
     def _refresh_thermal(self) -> None:
-        if self.active_screen == "thermal":
+        if self.active_screen == "thermal" and self._snapshots.consume_change("thermal", extra=(self._density,)):
             self._render_thermal_table()
 
     def _refresh_mission(self) -> None:
-        if self.active_screen == "mission":
+        if self.active_screen == "mission" and self._snapshots.consume_change("mission"):
             self._render_mission_table()
 
     @staticmethod
@@ -3300,6 +3409,10 @@ class OrionApp(App):
         Contract:
         - Each row tuple MUST be: (row_key, col0, col1, ...).
         - Column count must match the DataTable's existing columns.
+
+        Row-level diff: rows that disappeared are removed, new rows are appended (when the
+        surviving rows keep their order) and only cells that changed are rewritten. Any other
+        reordering falls back to a full rebuild.
         """
 
         table_id = str(getattr(table, "id", "") or "")
@@ -3307,12 +3420,15 @@ class OrionApp(App):
             table_id = str(id(table))
 
         desired_keys: list[str] = []
+        desired_cells: dict[str, tuple[Any, ...]] = {}
         for row in rows:
             if not row:
                 continue
             desired_keys.append(str(row[0]))
+            desired_cells[str(row[0])] = tuple(row[1:])
 
         prev_keys = self._datatable_row_keys.get(table_id)
+        prev_cells = self._datatable_row_cells.get(table_id) or {}
         cursor_key: str | None = None
         if prev_keys is not None:
             try:
@@ -3323,6 +3439,7 @@ class OrionApp(App):
                 cursor_key = None
 
         def rebuild() -> None:
+            self._datatable_row_cells.pop(table_id, None)
             try:
                 table.clear()
             except Exception:
@@ -3338,6 +3455,7 @@ class OrionApp(App):
                     # If adding fails (bad columns), bail out without crashing the UI loop.
                     return
             self._datatable_row_keys[table_id] = desired_keys
+            self._datatable_row_cells[table_id] = desired_cells
 
             # Preserve cursor only if it was previously set and still exists.
             if cursor_key is not None and cursor_key in desired_keys:
@@ -3350,23 +3468,47 @@ class OrionApp(App):
                         exc=exc,
                     )
 
-        if prev_keys != desired_keys:
+        # Tables may be re-seeded behind our back (`_seed_*`); only diff against a table we still own.
+        if prev_keys is None or getattr(table, "row_count", len(prev_keys)) != len(prev_keys):
+            rebuild()
+            return
+
+        desired_set = set(desired_keys)
+        kept_keys = [key for key in prev_keys if key in desired_set]
+        if desired_keys[: len(kept_keys)] != kept_keys:
             rebuild()
             return
 
-        # Fast path: same row keys → update cells in place.
         try:
-            for row in rows:
-                if not row:
+            for key in prev_keys:
+                if key not in desired_set:
+                    table.remove_row(key)
+            for row_key in kept_keys:
+                cells = desired_cells[row_key]
+                old_cells = prev_cells.get(row_key)
+                if old_cells == cells:
                     continue
-                row_key = str(row[0])
-                cells = list(row[1:])
                 row_index = table.get_row_index(row_key)
                 for col_index, value in enumerate(cells):
+                    if old_cells is not None and col_index < len(old_cells) and old_cells[col_index] == value:
+                        continue
                     table.update_cell_at(Coordinate(row_index, col_index), value)
+            for row_key in desired_keys[len(kept_keys) :]:
+                table.add_row(*desired_cells[row_key], key=row_key)
             self._datatable_row_keys[table_id] = desired_keys
+            self._datatable_row_cells[table_id] = desired_cells
         except Exception:
             rebuild()
+            return
+
+        if cursor_key is not None and cursor_key not in desired_set and desired_keys:
+            # The row under the cursor was removed; keep the cursor within the table.
+            try:
+                cr = getattr(table, "cursor_row", 0)
+                if isinstance(cr, int) and cr >= len(desired_keys):
+                    table.move_cursor(row=len(desired_keys) - 1, column=0, animate=False, scroll=False)
+            except Exception:
+                logger.debug("orion_exception_swallowed", exc_info=True)
 
     def _render_summary_table(self) -> None:
         try:
@@ -6341,6 +6483,9 @@ class OrionApp(App):
         self._boot_nats_init_done = False
         self._boot_nats_error = ""
         self.nats_client = NATSClient()
+        if ingest_pipeline_enabled():
+            # Decode/validate off the UI loop; telemetry and per-track updates are conflated to latest.
+            self.nats_client.enable_ingest_pipeline(IngestPipeline.from_env())
         try:
             await self.nats_client.connect()
             self.nats_connected = True
@@ -6887,7 +7032,12 @@ class OrionApp(App):
         updated = time.strftime("%H:%M:%S")
         track_id_raw = payload.get("track_id") or payload.get("trackId") or I18N.UNKNOWN
         track_id = str(track_id_raw)
-        self._tracks_by_id[track_id] = (payload, time.time())
+        row_limit = max(1, self._max_track_rows)
+        prev_rank = self._track_registry.rank(track_id)
+        self._track_registry.upsert(track_id, payload, time.time())
+        rank = self._track_registry.rank(track_id)
+        # Far tracks outside the visible window do not change the table/PPI; leave them to the 1 s refresh.
+        visible = (prev_rank is not None and prev_rank < row_limit) or (rank is not None and rank < row_limit)
         if "radar" not in self._selection_by_app:
             self._set_selection(
                 SelectionContext(
@@ -6900,10 +7050,11 @@ class OrionApp(App):
                     ids=(track_id,),
                 )
             )
-        self._render_tracks_table()
-        self._render_radar_ppi()
-        if self.active_screen == "radar":
-            self._refresh_inspector()
+        if visible:
+            self._render_tracks_table()
+            self._render_radar_ppi()
+            if self.active_screen == "radar":
+                self._refresh_inspector()
         self._log_msg(f"{I18N.bidi('Track update', 'Обновление трека')} ({updated}): {track_id}")
 
     async def handle_event_data(self, data: dict) -> None:
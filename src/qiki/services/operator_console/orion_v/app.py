@@ -16,6 +16,7 @@ from textual.containers import Container
 from textual.css.query import NoMatches
 from textual.widgets import Button, Input, Static
 
+from qiki.services.operator_console.clients.ingest_pipeline import IngestPipeline, ingest_pipeline_enabled
 from qiki.services.operator_console.clients.nats_client import NATSClient
 from qiki.services.operator_console.orion_v.cockpit_playable_view_model import (
     build_cockpit_event_history_item,
@@ -319,6 +320,9 @@ class OrionVApp(App[None]):
         self._audit_store = BoundedEventsStore(max_events=int(os.getenv("ORIONV_MAX_AUDIT_EVENTS", "1000")))
         self._nats_client = NATSClient(url=self._nats_url)
         self._nats_client.set_lifecycle_callback(self._on_nats_lifecycle_state)
+        if ingest_pipeline_enabled():
+            # Декод/валидация вне UI-цикла, конфляция телеметрии/треков, доставка пачками.
+            self._nats_client.enable_ingest_pipeline(IngestPipeline.from_env())
         self._subscriptions_started = False
         self._subscribed_keys: set[str] = set()
         self._selected_incident_id: str | None = None
@@ -2325,11 +2329,24 @@ class OrionVApp(App[None]):
                 "memory_mb": float(mem_mb),
                 "active_subscriptions": int(self._nats_client.active_subscriptions),
                 "nats_state": self._nats_state,
+                **self._ingest_metrics(),
                 "replay_mode": bool(self._replay_mode),
             }
         )
         self._request_refresh_ui()
 
+    def _ingest_metrics(self) -> dict[str, int]:
+        ingest = getattr(self._nats_client, "ingest", None)
+        if ingest is None:
+            return {}
+        totals = ingest.totals()
+        return {
+            "ingest_pending": int(totals["pending"]),
+            "ingest_conflated": int(totals["conflated"]),
+            "ingest_dropped": int(totals["dropped"]),
+            "ingest_decode_errors": int(totals["decode_errors"] + totals["invalid"]),
+        }
+
     @staticmethod
     def _one_line(text: str, limit: int) -> str:
         """Статусные каналы — однострочники (инцидент 2026-07-08: 4000-токенный
@@ -37,4 +37,9 @@ class OrionVSystemHealthScreen(Static):
             f"{tr('active_subscriptions')}: {m.get('active_subscriptions', 0)}",
             f"{tr('replay_mode')}: {bool(m.get('replay_mode', False))}",
         ]
+        if "ingest_pending" in m:
+            body.append(
+                f"Приём NATS: очередь {m.get('ingest_pending', 0)}, слито {m.get('ingest_conflated', 0)}, "
+                f"сброшено {m.get('ingest_dropped', 0)}, ошибок {m.get('ingest_decode_errors', 0)}"
+            )
         self.update("\n".join(body))
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 import math
-from typing import Any
+from typing import Any, Iterable, Sequence
 
+import numpy as np
 from rich.style import Style
-from rich.text import Text
+from rich.text import Span, Text
 
 from qiki.shared.radar_coords import polar_to_xyz_m
 from qiki.services.operator_console.radar.projection import project_xyz_to_uv_m
@@ -113,17 +114,408 @@ def _dot_bit(local_x: int, local_y: int) -> int:
     return 64 if local_x == 0 else 128
 
 
+_VIEWS = frozenset({"top", "side", "front", "iso"})
+
+# Cell style slots of the dot canvas (0 = unstyled). Per cell, the highest priority wins.
+_STYLES: tuple[Style | None, ...] = (
+    None,
+    Style(color="#20663a", dim=True),  # overlay (center mark, range rings)
+    Style(color="#ffffff", bold=True),  # selected track
+    Style(color="#a0a0a0", dim=True),  # velocity vector
+    Style(color="#00ff66"),  # friend
+    Style(color="#ff3355", bold=True),  # foe
+    Style(color="#ffb000", bold=True),  # unknown
+    Style(color="#00b7ff"),  # no IFF
+)
+_SLOT_OVERLAY = 1
+_SLOT_SELECTED = 2
+_SLOT_VECTOR = 3
+_SLOT_BY_IFF = {"friend": 4, "foe": 5, "unknown": 6}
+_SLOT_TRACK_DEFAULT = 7
+
+_PRIORITY_OVERLAY = 10
+_PRIORITY_VECTOR = 20
+_PRIORITY_TRACK = 50
+_PRIORITY_SELECTED = 100
+
+_VECTOR_SECONDS = 8.0
+_VECTOR_MAX_STEPS = 250
+_PICK_BUCKET_PX = 12
+_MAX_CACHED_BACKGROUNDS = 8
+
+# Braille dot bit weights indexed [local_y][local_x] (same layout as `_dot_bit`).
+_DOT_WEIGHTS = ((1, 8), (2, 16), (4, 32), (64, 128))
+
+
+@dataclass(frozen=True, slots=True)
+class PpiGeometry:
+    """Normalized PPI viewport (cells, view plane, zoom, pan), shared by rendering and picking."""
+
+    width_cells: int
+    height_cells: int
+    effective_range_m: float
+    zoom: float
+    view: str
+    pan_u_m: float
+    pan_v_m: float
+    iso_yaw_deg: float
+    iso_pitch_deg: float
+
+    @classmethod
+    def from_params(
+        cls,
+        *,
+        width_cells: int,
+        height_cells: int,
+        max_range_m: float,
+        view: str = "top",
+        zoom: float = 1.0,
+        pan_u_m: float = 0.0,
+        pan_v_m: float = 0.0,
+        iso_yaw_deg: float = 45.0,
+        iso_pitch_deg: float = 35.0,
+    ) -> "PpiGeometry":
+        view_norm = (view or "").strip().lower()
+        if view_norm not in _VIEWS:
+            view_norm = "top"
+        try:
+            zoom_f = float(zoom)
+        except Exception:
+            zoom_f = 1.0
+        zoom_f = max(0.1, min(100.0, zoom_f))
+        try:
+            pan_u, pan_v = float(pan_u_m), float(pan_v_m)
+        except Exception:
+            logger.debug("exception_swallowed", exc_info=True)
+            pan_u, pan_v = 0.0, 0.0
+        return cls(
+            width_cells=max(10, int(width_cells)),
+            height_cells=max(6, int(height_cells)),
+            effective_range_m=max(1.0, max(1.0, float(max_range_m)) / zoom_f),
+            zoom=zoom_f,
+            view=view_norm,
+            pan_u_m=pan_u,
+            pan_v_m=pan_v,
+            iso_yaw_deg=float(iso_yaw_deg),
+            iso_pitch_deg=float(iso_pitch_deg),
+        )
+
+    @property
+    def width_px(self) -> int:
+        return self.width_cells * 2
+
+    @property
+    def height_px(self) -> int:
+        return self.height_cells * 4
+
+    def uv_rows(self) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
+        """Rows of the (linear) world -> view-plane projection, taken from `project_xyz_to_uv_m`."""
+        cols = [
+            project_xyz_to_uv_m(
+                x_m=ex,
+                y_m=ey,
+                z_m=ez,
+                view=self.view,
+                iso_yaw_deg=self.iso_yaw_deg,
+                iso_pitch_deg=self.iso_pitch_deg,
+            )
+            for ex, ey, ez in ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+        ]
+        return (
+            (cols[0][0], cols[1][0], cols[2][0]),
+            (cols[0][1], cols[1][1], cols[2][1]),
+        )
+
+
+def _track_xyz_m(payload: dict[str, Any]) -> tuple[float, float, float] | None:
+    """Track position: `position.{x,y,z}` first, polar `range_m` + `bearing_deg` fallback."""
+    x_m: float | None = None
+    y_m: float | None = None
+    z_m: float | None = None
+
+    pos = payload.get("position")
+    if isinstance(pos, dict):
+        x_m = _to_float_maybe(pos.get("x"))
+        y_m = _to_float_maybe(pos.get("y"))
+        if "z" in pos:
+            z_m = _to_float_maybe(pos.get("z"))
+
+    if x_m is None or y_m is None:
+        r_f = _to_float_maybe(payload.get("range_m"))
+        b_f = _to_float_maybe(payload.get("bearing_deg"))
+        if r_f is None or b_f is None:
+            return None
+        e_f = _to_float_maybe(payload.get("elev_deg", 0.0))
+        if e_f is None:
+            e_f = 0.0
+        xyz = polar_to_xyz_m(range_m=float(r_f), bearing_deg=float(b_f), elev_deg=float(e_f))
+        x_m, y_m, z_m = float(xyz.x_m), float(xyz.y_m), float(xyz.z_m)
+
+    if z_m is None:
+        z_m = 0.0
+    if not (math.isfinite(x_m) and math.isfinite(y_m) and math.isfinite(z_m)):
+        return None
+    return (float(x_m), float(y_m), float(z_m))
+
+
+def _collect_tracks(
+    tracks: Iterable[Any],
+) -> tuple[list[str | None], list[dict[str, Any]], list[tuple[float, float, float]]]:
+    """Split `(track_id, payload)` tuples or bare payloads into ids, payloads and world points."""
+    ids: list[str | None] = []
+    payloads: list[dict[str, Any]] = []
+    points: list[tuple[float, float, float]] = []
+    for item in tracks:
+        track_id: str | None = None
+        payload: dict[str, Any] | None = None
+        if isinstance(item, tuple) and len(item) == 2 and isinstance(item[1], dict):
+            track_id = None if item[0] is None else str(item[0])
+            payload = item[1]
+        elif isinstance(item, dict):
+            payload = item
+        if payload is None:
+            continue
+        xyz = _track_xyz_m(payload)
+        if xyz is None:
+            continue
+        ids.append(track_id)
+        payloads.append(payload)
+        points.append(xyz)
+    return ids, payloads, points
+
+
+def _project_uv(geometry: PpiGeometry, points: Sequence[tuple[float, float, float]]) -> tuple[Any, Any]:
+    """View-plane coordinates (meters, pan applied) as NumPy arrays."""
+    (ux, uy, uz), (vx, vy, vz) = geometry.uv_rows()
+    pan_u, pan_v = geometry.pan_u_m, geometry.pan_v_m
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    x, y, z = pts[:, 0], pts[:, 1], pts[:, 2]
+    return (x * ux + y * uy + z * uz - pan_u, x * vx + y * vy + z * vz - pan_v)
+
+
+def _uv_to_px(geometry: PpiGeometry, u: Any, v: Any) -> tuple[Any, Any]:
+    """Map view-plane meters to Braille pixels (square viewport, clamped to the edge)."""
+    width_px = geometry.width_px
+    height_px = geometry.height_px
+    center_x = width_px // 2
+    center_y = height_px // 2
+    scale_x = width_px / 2 - 1
+    scale_y = height_px / 2 - 1
+    range_m = geometry.effective_range_m
+    px = np.rint(center_x + np.clip(u / range_m, -1.0, 1.0) * scale_x).astype(np.int64)
+    py = np.rint(center_y - np.clip(v / range_m, -1.0, 1.0) * scale_y).astype(np.int64)
+    return px, py
+
+
+class _DotCanvas:
+    """Braille dot bitmap with per-cell style slot and priority.
+
+    Whole point batches are plotted with fancy indexing and the bitmap is packed into
+    codepoints with one weighted reduction.
+    """
+
+    __slots__ = ("width_cells", "height_cells", "dots", "styles", "priorities", "overrides")
+
+    def __init__(self, width_cells: int, height_cells: int) -> None:
+        self.width_cells = int(width_cells)
+        self.height_cells = int(height_cells)
+        self.overrides: dict[tuple[int, int], str] = {}
+        self.dots = np.zeros((self.height_cells * 4, self.width_cells * 2), dtype=bool)
+        self.styles = np.zeros((self.height_cells, self.width_cells), dtype=np.int8)
+        self.priorities = np.full((self.height_cells, self.width_cells), -1, dtype=np.int16)
+
+    def copy(self) -> "_DotCanvas":
+        out = _DotCanvas.__new__(_DotCanvas)
+        out.width_cells = self.width_cells
+        out.height_cells = self.height_cells
+        out.dots = self.dots.copy()
+        out.styles = self.styles.copy()
+        out.priorities = self.priorities.copy()
+        out.overrides = dict(self.overrides)
+        return out
+
+    def plot(self, px: Any, py: Any, style: int | Sequence[int], priority: int | Sequence[int]) -> None:
+        """Set dots at pixel coordinates; per cell the highest-priority (then latest) point sets the style."""
+        xs = np.asarray(px, dtype=np.int64).reshape(-1)
+        ys = np.asarray(py, dtype=np.int64).reshape(-1)
+        if xs.size == 0:
+            return
+        slots = np.broadcast_to(np.asarray(style, dtype=np.int8), xs.shape)
+        prios = np.broadcast_to(np.asarray(priority, dtype=np.int16), xs.shape)
+        inside = (xs >= 0) & (ys >= 0) & (xs < self.width_cells * 2) & (ys < self.height_cells * 4)
+        if not inside.all():
+            xs, ys, slots, prios = xs[inside], ys[inside], slots[inside], prios[inside]
+            if xs.size == 0:
+                return
+        self.dots[ys, xs] = True
+
+        cells = (ys >> 2) * self.width_cells + (xs >> 1)
+        # Winner per cell = max priority, latest point among equals (same as plotting one by one).
+        order = np.lexsort((np.arange(cells.size), prios))[::-1]
+        uniq, first = np.unique(cells[order], return_index=True)
+        pick = order[first]
+        cand_prio = prios[pick]
+        flat_prio = self.priorities.reshape(-1)
+        win = cand_prio >= flat_prio[uniq]
+        flat_prio[uniq[win]] = cand_prio[win]
+        self.styles.reshape(-1)[uniq[win]] = slots[pick][win]
+
+    def override(self, cell_x: int, cell_y: int, ch: str, *, style: int, priority: int) -> None:
+        """Replace a whole cell with a text character (labels)."""
+        if cell_x < 0 or cell_y < 0 or cell_x >= self.width_cells or cell_y >= self.height_cells:
+            return
+        if priority < int(self.priorities[cell_y, cell_x]):
+            return
+        self.priorities[cell_y, cell_x] = priority
+        self.styles[cell_y, cell_x] = style
+        self.overrides[(cell_x, cell_y)] = (ch or " ")[:1]
+
+    def render(self, *, rich: bool) -> tuple[str, list[Span]]:
+        """Return the text block and (when `rich`) style spans merged per run of equal cells."""
+        h, w = self.height_cells, self.width_cells
+        weights = np.asarray(_DOT_WEIGHTS, dtype=np.uint16)
+        bits = (self.dots.reshape(h, 4, w, 2) * weights[None, :, None, :]).sum(axis=(1, 3))
+        codes = np.full((h, w + 1), 0x0A, dtype="<u4")
+        codes[:, :w] = np.where(bits > 0, 0x2800 + bits, 0x20)
+        for (x, y), ch in self.overrides.items():
+            codes[y, x] = ord(ch)
+        out = codes.tobytes().decode("utf-32-le")[:-1]
+        if not rich:
+            return out, []
+
+        # Runs of equal style slots per row (spaces are never styled); zero padding splits rows.
+        row_w = w + 2
+        padded = np.zeros((h, row_w), dtype=np.int16)
+        padded[:, 1:-1] = np.where(codes[:, :w] != 0x20, self.styles, 0)
+        flat = padded.reshape(-1)
+        edges = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+        spans: list[Span] = []
+        for k in np.flatnonzero(flat[edges] != 0).tolist():
+            start = int(edges[k])
+            end = int(edges[k + 1])
+            row = start // row_w
+            shift = row * (w + 1) - row * row_w - 1
+            spans.append(Span(start + shift, end + shift, _STYLES[int(flat[start])]))
+        return out, spans
+
+
+def _overlay_canvas(width_cells: int, height_cells: int) -> _DotCanvas:
+    """Baseline overlays (center mark, range rings 25/50/75/100%); they depend only on the size."""
+    canvas = _DotCanvas(width_cells, height_cells)
+    width_px = width_cells * 2
+    height_px = height_cells * 4
+    center_x = width_px // 2
+    center_y = height_px // 2
+    xs = [center_x, center_x + 1, center_x - 1, center_x, center_x]
+    ys = [center_y, center_y, center_y, center_y + 1, center_y - 1]
+    base_radius_px = max(2.0, min(width_px, height_px) / 2 - 1.0)
+    steps = max(36, int(base_radius_px * 3))
+    for ratio in (0.25, 0.5, 0.75, 1.0):
+        radius = base_radius_px * ratio
+        for i in range(steps):
+            ang = 2 * math.pi * i / steps
+            xs.append(int(round(center_x + radius * math.sin(ang))))
+            ys.append(int(round(center_y - radius * math.cos(ang))))
+    canvas.plot(xs, ys, _SLOT_OVERLAY, _PRIORITY_OVERLAY)
+    return canvas
+
+
+class PpiPickIndex:
+    """Projected track pixels bucketed on a coarse grid for PPI click picking.
+
+    `BraillePpiRenderer.render_tracks` builds one as a by-product (pixels are already projected
+    there), so a click only scans the buckets around the cursor instead of re-projecting every track.
+    """
+
+    __slots__ = ("geometry", "_bucket_px", "_buckets")
+
+    def __init__(
+        self,
+        geometry: PpiGeometry,
+        track_ids: Sequence[str | None],
+        px: Any,
+        py: Any,
+        *,
+        bucket_px: int = _PICK_BUCKET_PX,
+    ) -> None:
+        self.geometry = geometry
+        self._bucket_px = max(1, int(bucket_px))
+        xs = px.tolist() if hasattr(px, "tolist") else list(px)
+        ys = py.tolist() if hasattr(py, "tolist") else list(py)
+        buckets: dict[tuple[int, int], list[tuple[int, str, int, int]]] = {}
+        for order, (track_id, x, y) in enumerate(zip(track_ids, xs, ys)):
+            if track_id is None:
+                continue
+            key = (x // self._bucket_px, y // self._bucket_px)
+            buckets.setdefault(key, []).append((order, track_id, x, y))
+        self._buckets = buckets
+
+    @classmethod
+    def from_tracks(cls, geometry: PpiGeometry, tracks: Iterable[Any]) -> "PpiPickIndex":
+        ids, _payloads, points = _collect_tracks(tracks)
+        u, v = _project_uv(geometry, points)
+        px, py = _uv_to_px(geometry, u, v)
+        return cls(geometry, ids, px, py)
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def nearest(
+        self,
+        *,
+        click_cell_x: int,
+        click_cell_y: int,
+        pick_radius_cells: float | None = None,
+    ) -> str | None:
+        # Click in cell coords -> approximate pixel coords (center of the cell).
+        click_px_x = int(click_cell_x) * 2 + 1
+        click_px_y = int(click_cell_y) * 4 + 2
+
+        # Radius threshold in pixels (heuristic; good enough for TUI selection).
+        base_cells = 2.5 if pick_radius_cells is None else float(pick_radius_cells)
+        # Higher zoom => tighter picking radius for precision.
+        scaled_cells = base_cells / math.sqrt(max(0.1, float(self.geometry.zoom)))
+        scaled_cells = max(0.8, min(3.5, float(scaled_cells)))
+        pick_radius_px = max(2.0, float(scaled_cells) * 3.0)
+        pick_radius_sq = pick_radius_px * pick_radius_px
+
+        reach = int(math.ceil(pick_radius_px))
+        size = self._bucket_px
+        best: tuple[tuple[float, int], str] | None = None
+        for bx in range((click_px_x - reach) // size, (click_px_x + reach) // size + 1):
+            for by in range((click_px_y - reach) // size, (click_px_y + reach) // size + 1):
+                for order, track_id, x, y in self._buckets.get((bx, by), ()):
+                    dx = float(click_px_x - x)
+                    dy = float(click_px_y - y)
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq > pick_radius_sq:
+                        continue
+                    # Ties go to the earlier track (input order), like a linear scan.
+                    rank = (dist_sq, order)
+                    if best is None or rank < best[0]:
+                        best = (rank, track_id)
+        return None if best is None else best[1]
+
+
 @dataclass(slots=True)
 class BraillePpiRenderer:
-    """Unicode high-density radar PPI renderer (no external deps).
+    """Unicode high-density radar PPI renderer (NumPy optional).
 
     Input tracks are dict payloads (as stored in ORION's `_tracks_by_id`).
     Primary signal is `position.{x,y,z}` (3D truth). Fallback is polar `range_m` + `bearing_deg`.
+
+    The overlay layer is drawn once per size and copied per frame; track dots are plotted as a
+    batch and packed into Braille codepoints in bulk. The projected pixels of the last frame are
+    kept in `pick_index` so mouse picking does not re-project tracks.
     """
 
     width_cells: int
     height_cells: int
     max_range_m: float
+    pick_index: PpiPickIndex | None = field(default=None, init=False, repr=False, compare=False)
+    _backgrounds: dict[tuple[int, int, bool], _DotCanvas] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @staticmethod
     def _iff_kind(payload: dict[str, Any]) -> str | None:
@@ -150,16 +542,15 @@ class BraillePpiRenderer:
                 return "unknown"
         return None
 
+    @classmethod
+    def _track_style_slot(cls, payload: dict[str, Any]) -> int:
+        return _SLOT_BY_IFF.get(cls._iff_kind(payload) or "", _SLOT_TRACK_DEFAULT)
+
     @classmethod
     def _track_style(cls, payload: dict[str, Any]) -> Style:
-        kind = cls._iff_kind(payload)
-        if kind == "friend":
-            return Style(color="#00ff66")
-        if kind == "foe":
-            return Style(color="#ff3355", bold=True)
-        if kind == "unknown":
-            return Style(color="#ffb000", bold=True)
-        return Style(color="#00b7ff")
+        style = _STYLES[cls._track_style_slot(payload)]
+        assert style is not None
+        return style
 
     @staticmethod
     def _velocity_xyz_mps(payload: dict[str, Any]) -> tuple[float, float, float] | None:
@@ -219,6 +610,16 @@ class BraillePpiRenderer:
         base = label[-4:] if label else ""
         return f"{base} {vz_token}".strip() if vz_token else base
 
+    def _background(self, width_cells: int, height_cells: int) -> _DotCanvas:
+        key = (width_cells, height_cells)
+        cached = self._backgrounds.get(key)
+        if cached is None:
+            if len(self._backgrounds) >= _MAX_CACHED_BACKGROUNDS:
+                self._backgrounds.clear()
+            cached = _overlay_canvas(width_cells, height_cells)
+            self._backgrounds[key] = cached
+        return cached.copy()
+
     def render_tracks(
         self,
         tracks: list[dict[str, Any]] | list[tuple[str, dict[str, Any]]],
@@ -235,230 +636,112 @@ class BraillePpiRenderer:
         iso_yaw_deg: float = 45.0,
         iso_pitch_deg: float = 35.0,
     ) -> str | Text:
-        width_cells = max(10, int(self.width_cells))
-        height_cells = max(6, int(self.height_cells))
-        max_range_m = max(1.0, float(self.max_range_m))
-        view_norm = (view or "").strip().lower()
-        if view_norm not in {"top", "side", "front", "iso"}:
-            view_norm = "top"
-        try:
-            zoom_f = float(zoom)
-        except Exception:
-            zoom_f = 1.0
-        zoom_f = max(0.1, min(100.0, zoom_f))
-        effective_range_m = max(1.0, max_range_m / zoom_f)
-
-        # Braille “pixel” grid resolution per terminal cell.
-        width_px = width_cells * 2
-        height_px = height_cells * 4
-
-        center_px_x = width_px // 2
-        center_px_y = height_px // 2
-
-        # Accumulate braille bitmasks per cell.
-        cell_bits: list[list[int]] = [[0 for _ in range(width_cells)] for _ in range(height_cells)]
-        cell_styles: list[list[Style | None]] = [[None for _ in range(width_cells)] for _ in range(height_cells)]
-        cell_priorities: list[list[int]] = [[-1 for _ in range(width_cells)] for _ in range(height_cells)]
-        cell_overrides: list[list[str | None]] = [[None for _ in range(width_cells)] for _ in range(height_cells)]
-
-        selected_id = str(selected_track_id) if selected_track_id is not None else None
-        overlay_style = Style(color="#20663a", dim=True)
-        selected_style = Style(color="#ffffff", bold=True)
-        vector_style = Style(color="#a0a0a0", dim=True)
-
-        def plot_px(px: int, py: int, *, style: Style | None = None, priority: int = 0) -> None:
-            if px < 0 or py < 0 or px >= width_px or py >= height_px:
-                return
-            cell_x = px // 2
-            cell_y = py // 4
-            local_x = px % 2
-            local_y = py % 4
-            cell_bits[cell_y][cell_x] |= _dot_bit(local_x, local_y)
-            if style is not None and priority >= cell_priorities[cell_y][cell_x]:
-                cell_priorities[cell_y][cell_x] = int(priority)
-                cell_styles[cell_y][cell_x] = style
-
-        def override_cell(cell_x: int, cell_y: int, ch: str, *, style: Style | None = None, priority: int = 0) -> None:
-            if cell_x < 0 or cell_y < 0 or cell_x >= width_cells or cell_y >= height_cells:
-                return
-            if priority >= cell_priorities[cell_y][cell_x]:
-                cell_priorities[cell_y][cell_x] = int(priority)
-                cell_overrides[cell_y][cell_x] = (ch or " ")[:1]
-                if style is not None:
-                    cell_styles[cell_y][cell_x] = style
-
+        geometry = PpiGeometry.from_params(
+            width_cells=self.width_cells,
+            height_cells=self.height_cells,
+            max_range_m=self.max_range_m,
+            view=view,
+            zoom=zoom,
+            pan_u_m=pan_u_m,
+            pan_v_m=pan_v_m,
+            iso_yaw_deg=iso_yaw_deg,
+            iso_pitch_deg=iso_pitch_deg,
+        )
+        width_cells = geometry.width_cells
+        height_cells = geometry.height_cells
         if draw_overlays:
-            # Baseline overlays (always visible; no-mocks).
-            # - Center mark
-            # - Range rings (25/50/75/100%)
-            plot_px(center_px_x, center_px_y, style=overlay_style, priority=10)
-            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                plot_px(center_px_x + dx, center_px_y + dy, style=overlay_style, priority=10)
-
-            ring_radii = [0.25, 0.5, 0.75, 1.0]
-            base_radius_px = max(2.0, min(width_px, height_px) / 2 - 1.0)
-            steps = max(36, int(base_radius_px * 3))
-            for ratio in ring_radii:
-                radius = base_radius_px * ratio
-                for i in range(steps):
-                    ang = 2 * math.pi * i / steps
-                    x = int(round(center_px_x + radius * math.sin(ang)))
-                    y = int(round(center_px_y - radius * math.cos(ang)))
-                    plot_px(x, y, style=overlay_style, priority=10)
-
-        labels_enabled = bool(draw_labels) and float(zoom_f) >= 2.0
-        vectors_enabled = bool(draw_vectors)
-        vector_seconds = 8.0
-
-        for item in tracks:
-            track_id: str | None = None
-            payload: dict[str, Any] | None = None
-            if isinstance(item, tuple) and len(item) == 2 and isinstance(item[0], str) and isinstance(item[1], dict):
-                track_id = item[0]
-                payload = item[1]
-            elif isinstance(item, dict):
-                payload = item
-            if payload is None:
-                continue
+            canvas = self._background(width_cells, height_cells)
+        else:
+            canvas = _DotCanvas(width_cells, height_cells)
 
-            x_m: float | None = None
-            y_m: float | None = None
-            z_m: float | None = None
-
-            pos = payload.get("position")
-            if isinstance(pos, dict):
-                x_m = _to_float_maybe(pos.get("x"))
-                y_m = _to_float_maybe(pos.get("y"))
-                if x_m is None or y_m is None:
-                    z_m = None
-                if "z" in pos:
-                    z_m = _to_float_maybe(pos.get("z"))
-
-            if x_m is None or y_m is None:
-                r = payload.get("range_m")
-                b = payload.get("bearing_deg")
-                e = payload.get("elev_deg", 0.0)
-                r_f = _to_float_maybe(r)
-                b_f = _to_float_maybe(b)
-                if r_f is None or b_f is None:
-                    continue
-                e_f = _to_float_maybe(e)
-                if e_f is None:
-                    e_f = 0.0
-                xyz = polar_to_xyz_m(
-                    range_m=float(r_f),
-                    bearing_deg=float(b_f),
-                    elev_deg=float(e_f),
-                )
-                x_m = float(xyz.x_m)
-                y_m = float(xyz.y_m)
-                z_m = float(xyz.z_m)
-
-            if z_m is None:
-                z_m = 0.0
-
-            u_m, v_m = project_xyz_to_uv_m(
-                x_m=float(x_m),
-                y_m=float(y_m),
-                z_m=float(z_m),
-                view=view_norm,
-                iso_yaw_deg=float(iso_yaw_deg),
-                iso_pitch_deg=float(iso_pitch_deg),
-            )
+        ids, payloads, points = _collect_tracks(tracks)
+        u, v = _project_uv(geometry, points)
+        px, py = _uv_to_px(geometry, u, v)
 
-            # Pan is in meters in the selected view plane.
-            try:
-                u_m -= float(pan_u_m)
-                v_m -= float(pan_v_m)
-            except Exception:
-                logger.debug("exception_swallowed", exc_info=True)
-
-            # Map meters to pixels (square viewport, clamped).
-            nx = max(-1.0, min(1.0, u_m / effective_range_m))
-            ny = max(-1.0, min(1.0, v_m / effective_range_m))
-
-            px = int(round(center_px_x + nx * (width_px / 2 - 1)))
-            py = int(round(center_px_y - ny * (height_px / 2 - 1)))
-            if selected_id is not None and track_id is not None and str(track_id) == selected_id:
-                style = selected_style
-                priority = 100
+        selected_id = str(selected_track_id) if selected_track_id is not None else None
+        slots: list[int] = []
+        priorities: list[int] = []
+        for track_id, payload in zip(ids, payloads):
+            if selected_id is not None and track_id == selected_id:
+                slots.append(_SLOT_SELECTED)
+                priorities.append(_PRIORITY_SELECTED)
             else:
-                style = self._track_style(payload)
-                priority = 50
-            plot_px(px, py, style=style, priority=priority)
-
-            if vectors_enabled:
-                vel = self._velocity_xyz_mps(payload)
-                if vel is not None:
-                    vx, vy, vz = vel
-                    du_mps, dv_mps = project_xyz_to_uv_m(
-                        x_m=float(vx),
-                        y_m=float(vy),
-                        z_m=float(vz),
-                        view=view_norm,
-                        iso_yaw_deg=float(iso_yaw_deg),
-                        iso_pitch_deg=float(iso_pitch_deg),
-                    )
-                    u2_m = float(u_m) + float(du_mps) * float(vector_seconds)
-                    v2_m = float(v_m) + float(dv_mps) * float(vector_seconds)
-                    nx2 = max(-1.0, min(1.0, u2_m / effective_range_m))
-                    ny2 = max(-1.0, min(1.0, v2_m / effective_range_m))
-                    px2 = int(round(center_px_x + nx2 * (width_px / 2 - 1)))
-                    py2 = int(round(center_px_y - ny2 * (height_px / 2 - 1)))
-                    dx = px2 - px
-                    dy = py2 - py
-                    steps = max(0, min(250, int(max(abs(dx), abs(dy)))))
-                    if steps >= 2:
-                        for i in range(1, steps + 1):
-                            x = int(round(px + dx * i / steps))
-                            y = int(round(py + dy * i / steps))
-                            plot_px(x, y, style=vector_style, priority=20)
-
-            if labels_enabled:
-                z_label_m = radar_z_m_if_present(payload)
-                vz_mps = radar_vz_mps_if_present(payload)
+                slots.append(self._track_style_slot(payload))
+                priorities.append(_PRIORITY_TRACK)
+        canvas.plot(px, py, slots, priorities)
+        self.pick_index = PpiPickIndex(geometry, ids, px, py)
+
+        if draw_vectors and payloads:
+            self._plot_vectors(canvas, geometry, payloads, u, v, px, py)
+
+        if bool(draw_labels) and geometry.zoom >= 2.0:
+            px_list = px.tolist() if hasattr(px, "tolist") else px
+            py_list = py.tolist() if hasattr(py, "tolist") else py
+            for i, (track_id, payload) in enumerate(zip(ids, payloads)):
                 label = self._label_text(
                     track_id=track_id,
-                    view_norm=view_norm,
-                    z_m=z_label_m,
-                    vz_mps=vz_mps,
+                    view_norm=geometry.view,
+                    z_m=radar_z_m_if_present(payload),
+                    vz_mps=radar_vz_mps_if_present(payload),
                 )
-                if label:
-                    cell_x = px // 2
-                    cell_y = py // 4
-                    start_x = cell_x + 1
-                    for i, ch in enumerate(label):
-                        override_cell(start_x + i, cell_y, ch, style=style, priority=priority)
-
-        # Render to lines.
-        lines: list[str] = []
-        for y, row in enumerate(cell_bits):
-            chars: list[str] = []
-            for x, bits in enumerate(row):
-                override = cell_overrides[y][x]
-                if override is not None:
-                    chars.append(override)
-                else:
-                    chars.append(chr(0x2800 + bits) if bits else " ")
-            lines.append("".join(chars))
-        out = "\n".join(lines)
+                if not label:
+                    continue
+                start_x = px_list[i] // 2 + 1
+                cell_y = py_list[i] // 4
+                for offset, ch in enumerate(label):
+                    canvas.override(start_x + offset, cell_y, ch, style=slots[i], priority=priorities[i])
+
+        out, spans = canvas.render(rich=rich)
         if not rich:
             return out
+        return Text(out, spans=spans)
 
-        text = Text(out)
-        stride = width_cells + 1
-        for y in range(height_cells):
-            base = y * stride
-            for x in range(width_cells):
-                cell_style = cell_styles[y][x]
-                if cell_style is None:
-                    continue
-                ch = lines[y][x]
-                if ch == " ":
-                    continue
-                i = base + x
-                text.stylize(cell_style, i, i + 1)
-        return text
+    def _plot_vectors(
+        self,
+        canvas: _DotCanvas,
+        geometry: PpiGeometry,
+        payloads: list[dict[str, Any]],
+        u: Any,
+        v: Any,
+        px: Any,
+        py: Any,
+    ) -> None:
+        """Velocity leaders: straight lines to the projected position `_VECTOR_SECONDS` ahead."""
+        (ux, uy, uz), (vx_row, vy_row, vz_row) = geometry.uv_rows()
+        rows: list[int] = []
+        du: list[float] = []
+        dv: list[float] = []
+        for i, payload in enumerate(payloads):
+            vel = self._velocity_xyz_mps(payload)
+            if vel is None or not all(math.isfinite(c) for c in vel):
+                continue
+            vx, vy, vz = vel
+            rows.append(i)
+            du.append(vx * ux + vy * uy + vz * uz)
+            dv.append(vx * vx_row + vy * vy_row + vz * vz_row)
+        if not rows:
+            return
+
+        idx = np.asarray(rows, dtype=np.int64)
+        px2, py2 = _uv_to_px(
+            geometry,
+            u[idx] + np.asarray(du) * _VECTOR_SECONDS,
+            v[idx] + np.asarray(dv) * _VECTOR_SECONDS,
+        )
+        x0 = px[idx]
+        y0 = py[idx]
+        dx = px2 - x0
+        dy = py2 - y0
+        steps = np.minimum(np.maximum(np.abs(dx), np.abs(dy)), _VECTOR_MAX_STEPS)
+        keep = steps >= 2
+        if not keep.any():
+            return
+        x0, y0, dx, dy, steps = x0[keep], y0[keep], dx[keep], dy[keep], steps[keep]
+        owner = np.repeat(np.arange(steps.size), steps)
+        step_i = np.arange(owner.size) - np.repeat(np.cumsum(steps) - steps, steps) + 1
+        xs = np.rint(x0[owner] + dx[owner] * step_i / steps[owner]).astype(np.int64)
+        ys = np.rint(y0[owner] + dy[owner] * step_i / steps[owner]).astype(np.int64)
+        canvas.plot(xs, ys, _SLOT_VECTOR, _PRIORITY_VECTOR)
 
 
 def pick_nearest_track_id(
@@ -476,112 +759,29 @@ def pick_nearest_track_id(
     pick_radius_cells: float | None = None,
     iso_yaw_deg: float = 45.0,
     iso_pitch_deg: float = 35.0,
+    index: PpiPickIndex | None = None,
 ) -> str | None:
     """Pick nearest track by click position in the PPI widget cell space.
 
-    This is a pure helper for ORION mouse selection (no terminal I/O).
+    This is a pure helper for ORION mouse selection (no terminal I/O). Pass the renderer's
+    `pick_index` to reuse the last frame's projection; it is ignored when the viewport differs.
     """
 
-    width_cells = max(10, int(width_cells))
-    height_cells = max(6, int(height_cells))
-    max_range_m = max(1.0, float(max_range_m))
-    view_norm = (view or "").strip().lower()
-    if view_norm not in {"top", "side", "front", "iso"}:
-        view_norm = "top"
-    try:
-        zoom_f = float(zoom)
-    except Exception:
-        zoom_f = 1.0
-    zoom_f = max(0.1, min(100.0, zoom_f))
-    effective_range_m = max(1.0, max_range_m / zoom_f)
-
-    width_px = width_cells * 2
-    height_px = height_cells * 4
-    center_px_x = width_px // 2
-    center_px_y = height_px // 2
-
-    # Click in cell coords -> approximate pixel coords (center of the cell).
-    click_px_x = int(click_cell_x) * 2 + 1
-    click_px_y = int(click_cell_y) * 4 + 2
-
-    # Radius threshold in pixels (heuristic; good enough for TUI selection).
-    base_cells = 2.5 if pick_radius_cells is None else float(pick_radius_cells)
-    # Higher zoom => tighter picking radius for precision.
-    scaled_cells = base_cells / math.sqrt(max(0.1, float(zoom_f)))
-    scaled_cells = max(0.8, min(3.5, float(scaled_cells)))
-    pick_radius_px = max(2.0, float(scaled_cells) * 3.0)
-    pick_radius_sq = pick_radius_px * pick_radius_px
-
-    best_id: str | None = None
-    best_dist_sq: float | None = None
-
-    for track_id, payload in tracks:
-        if not isinstance(payload, dict):
-            continue
-
-        x_m: float | None = None
-        y_m: float | None = None
-        z_m: float | None = None
-
-        pos = payload.get("position")
-        if isinstance(pos, dict):
-            x_m = _to_float_maybe(pos.get("x"))
-            y_m = _to_float_maybe(pos.get("y"))
-            if x_m is None or y_m is None:
-                z_m = None
-            if "z" in pos:
-                z_m = _to_float_maybe(pos.get("z"))
-
-        if x_m is None or y_m is None:
-            r = payload.get("range_m")
-            b = payload.get("bearing_deg")
-            e = payload.get("elev_deg", 0.0)
-            r_f = _to_float_maybe(r)
-            b_f = _to_float_maybe(b)
-            if r_f is None or b_f is None:
-                continue
-            e_f = _to_float_maybe(e)
-            if e_f is None:
-                e_f = 0.0
-            xyz = polar_to_xyz_m(
-                range_m=float(r_f),
-                bearing_deg=float(b_f),
-                elev_deg=float(e_f),
-            )
-            x_m = float(xyz.x_m)
-            y_m = float(xyz.y_m)
-            z_m = float(xyz.z_m)
-
-        if z_m is None:
-            z_m = 0.0
-
-        u_m, v_m = project_xyz_to_uv_m(
-            x_m=float(x_m),
-            y_m=float(y_m),
-            z_m=float(z_m),
-            view=view_norm,
-            iso_yaw_deg=float(iso_yaw_deg),
-            iso_pitch_deg=float(iso_pitch_deg),
-        )
-
-        try:
-            u_m -= float(pan_u_m)
-            v_m -= float(pan_v_m)
-        except Exception:
-            logger.debug("exception_swallowed", exc_info=True)
-
-        nx = max(-1.0, min(1.0, u_m / effective_range_m))
-        ny = max(-1.0, min(1.0, v_m / effective_range_m))
-        px = int(round(center_px_x + nx * (width_px / 2 - 1)))
-        py = int(round(center_px_y - ny * (height_px / 2 - 1)))
-
-        dx = float(click_px_x - px)
-        dy = float(click_px_y - py)
-        dist_sq = dx * dx + dy * dy
-        if dist_sq > pick_radius_sq:
-            continue
-        if best_dist_sq is None or dist_sq < best_dist_sq:
-            best_dist_sq = dist_sq
-            best_id = str(track_id)
-
-    return best_id
+    geometry = PpiGeometry.from_params(
+        width_cells=width_cells,
+        height_cells=height_cells,
+        max_range_m=max_range_m,
+        view=view,
+        zoom=zoom,
+        pan_u_m=pan_u_m,
+        pan_v_m=pan_v_m,
+        iso_yaw_deg=iso_yaw_deg,
+        iso_pitch_deg=iso_pitch_deg,
+    )
+    if index is None or index.geometry != geometry:
+        index = PpiPickIndex.from_tracks(geometry, tracks)
+    return index.nearest(
+        click_cell_x=click_cell_x,
+        click_cell_y=click_cell_y,
+        pick_radius_cells=pick_radius_cells,
+    )
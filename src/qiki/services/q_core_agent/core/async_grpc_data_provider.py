@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import grpc
+
+from qiki.services.q_core_agent.core.agent_logger import logger
+from qiki.services.q_core_agent.core.bios_http_client import fetch_bios_status_async
+from qiki.services.q_core_agent.core.grpc_data_provider import GrpcDataProvider, GrpcSensorDataError, GrpcTimeout
+from qiki.services.q_core_agent.core.grpc_streams import StreamConsumer
+from qiki.shared.converters.radar_proto_pydantic import proto_frame_to_model
+from qiki.shared.models.core import BiosStatus, SensorData, SensorTypeEnum
+from generated.q_sim_api_pb2_grpc import QSimAPIServiceStub
+from generated.q_sim_api_pb2 import GetRadarFrameRequest, GetSensorDataRequest, HealthCheckRequest
+
+
+def _deadline_from_env(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+class AsyncGrpcDataProvider(GrpcDataProvider):
+    """
+    grpc.aio провайдер для асинхронного тика (StateStore режим).
+
+    `prefetch()` запрашивает сенсорную ротацию, радарный кадр (GetRadarFrame) и статус BIOS
+    конкурентно, каждый со своим дедлайном, поэтому фаза сбора данных длится ≈ max(вызовов),
+    а не их сумму, и event loop не блокируется. Синхронные методы IDataProvider затем
+    отдают уже полученные значения — код агента не меняется.
+
+    С `streaming=True` (QIKI_GRPC_STREAMING=1) сенсоры и радар приходят push-потоками
+    StreamSensorData/StreamRadarFrames с конфляцией до последнего значения на клиенте;
+    тик забирает накопленное без RPC и ждёт только если с прошлого тика ничего не пришло.
+    Упавший поток на этот тик подменяется unary-опросом и переоткрывается.
+
+    Команды актуаторов остаются на синхронном канале родителя: агент отправляет их из
+    синхронного `_make_decision` и должен получить отказ/ошибку немедленно (SAFE-ветка).
+    """
+
+    def __init__(
+        self,
+        grpc_server_address: str = "q-sim-service:50051",
+        *,
+        sensor_reads: Optional[int] = None,
+        sensor_deadline_s: Optional[float] = None,
+        radar_deadline_s: Optional[float] = None,
+        bios_deadline_s: Optional[float] = None,
+        streaming: Optional[bool] = None,
+        stream_credits: Optional[int] = None,
+        aio_stub: Any = None,
+    ) -> None:
+        # No blocking HealthCheck here: the sync channel only carries actuator commands and
+        # connects lazily; reachability is checked by `connect()` on the event loop.
+        self.server_address = grpc_server_address
+        self.channel = grpc.insecure_channel(grpc_server_address) if aio_stub is None else None
+        self.stub = QSimAPIServiceStub(self.channel) if self.channel is not None else None
+        self._aio_channel: Optional[grpc.aio.Channel] = None
+        self._aio_stub = aio_stub
+
+        # The agent reads at most `_SENSOR_ROTATION_READS` (3) per tick and stops at RADAR; the
+        # last slot is reserved for the GetRadarFrame result, hence 2 rotation reads by default.
+        self.sensor_reads = max(1, int(sensor_reads if sensor_reads is not None else 2))
+        self.sensor_deadline_s = (
+            float(sensor_deadline_s)
+            if sensor_deadline_s is not None
+            else _deadline_from_env("QIKI_GRPC_SENSOR_DEADLINE_SEC", 10.0)
+        )
+        self.radar_deadline_s = (
+            float(radar_deadline_s)
+            if radar_deadline_s is not None
+            else _deadline_from_env("QIKI_GRPC_RADAR_DEADLINE_SEC", 2.0)
+        )
+        self.bios_deadline_s = (
+            float(bios_deadline_s) if bios_deadline_s is not None else _deadline_from_env("QIKI_BIOS_DEADLINE_SEC", 2.0)
+        )
+
+        if streaming is None:
+            streaming = os.getenv("QIKI_GRPC_STREAMING", "false").strip().lower() in {"1", "true", "yes", "on"}
+        self.streaming = bool(streaming)
+        if stream_credits is None:
+            try:
+                stream_credits = int(os.getenv("QIKI_GRPC_STREAM_CREDITS", "0"))
+            except ValueError:
+                stream_credits = 0
+        self.stream_credits = max(0, int(stream_credits))
+        self._sensor_stream: Optional[StreamConsumer] = None
+        self._radar_stream: Optional[StreamConsumer] = None
+
+        self._sensor_queue: Deque[SensorData] = deque()
+        self._sensor_error: Optional[GrpcSensorDataError] = None
+        self._bios_status: Optional[BiosStatus] = None
+        self.last_fetch_ms: Dict[str, float] = {}
+
+    async def connect(self) -> None:
+        """Create the grpc.aio channel on the running loop and check reachability (fail-fast)."""
+        if self._aio_stub is not None:
+            return
+        self._aio_channel = grpc.aio.insecure_channel(self.server_address)
+        self._aio_stub = QSimAPIServiceStub(self._aio_channel)
+        try:
+            response = await self._aio_stub.HealthCheck(HealthCheckRequest(), timeout=5.0)
+        except grpc.RpcError as e:
+            logger.error(f"Failed to connect to Q-Sim Service at {self.server_address}: {e}")
+            raise ConnectionError(f"Cannot connect to Q-Sim Service: {e}")
+        logger.info(f"Connected to Q-Sim Service (grpc.aio) at {self.server_address}: {response.message}")
+
+    async def close(self) -> None:
+        for consumer in (self._sensor_stream, self._radar_stream):
+            if consumer is not None:
+                await consumer.stop()
+        if self._aio_channel is not None:
+            await self._aio_channel.close()
+            self._aio_channel = None
+            self._aio_stub = None
+
+    async def prefetch(self) -> None:
+        """Fetch everything the next tick reads, concurrently and each within its own deadline."""
+        if self._aio_stub is None:
+            await self.connect()
+        streams_ok = self._ensure_streams()
+
+        readings, frame, bios = await asyncio.gather(
+            self._timed("sensor", self._stream_sensor_readings() if streams_ok else self._fetch_sensor_rotation()),
+            self._timed("radar", self._stream_radar_frame() if streams_ok else self._fetch_radar_frame()),
+            self._timed("bios", fetch_bios_status_async(deadline_s=self.bios_deadline_s)),
+        )
+
+        queue: Deque[SensorData] = deque(readings)
+        # The RADAR slot is filled from GetRadarFrame only if the rotation did not reach the radar
+        # itself — the agent stops reading at the first RADAR sample.
+        if frame is not None and not any(r.sensor_type == SensorTypeEnum.RADAR for r in readings):
+            queue.append(frame)
+        self._sensor_queue = queue
+        self._bios_status = bios
+
+    def _ensure_streams(self) -> bool:
+        """True if both push streams are live; a dead stream is reopened and this tick polls."""
+        if not self.streaming:
+            return False
+        if self._sensor_stream is None:
+            self._sensor_stream = StreamConsumer(
+                "sensor",
+                self._aio_stub.StreamSensorData,
+                key=lambda update: int(update.reading.sensor_type),
+                credits=self.stream_credits,
+            )
+            self._radar_stream = StreamConsumer(
+                "radar",
+                self._aio_stub.StreamRadarFrames,
+                key=lambda _update: None,
+                credits=self.stream_credits,
+            )
+            self._sensor_stream.start()
+            self._radar_stream.start()
+            return True
+        healthy = True
+        for consumer in (self._sensor_stream, self._radar_stream):
+            if consumer.running:
+                continue
+            healthy = False
+            error = consumer.error
+            if isinstance(error, grpc.RpcError) and self._classify_rpc_error(error) == "rpc_unimplemented":
+                logger.warning("Q-Sim has no push streams (UNIMPLEMENTED); polling from now on")
+                self.streaming = False
+                return False
+            consumer.start()
+        return healthy
+
+    async def _stream_sensor_readings(self) -> List[SensorData]:
+        """Latest pushed sample per sensor type; waits (up to the sensor deadline) only if none arrived."""
+        self._sensor_error = None
+        assert self._sensor_stream is not None
+        if not await self._sensor_stream.mailbox.wait(self.sensor_deadline_s):
+            details = f"no pushed sensor update within {self.sensor_deadline_s:.2f}s"
+            if self._allow_grpc_fallback():
+                logger.warning("gRPC sensor stream idle, returning explicit fallback payload: %s", details)
+                return [self._fallback_sensor_data(reason="timeout", details=details)]
+            self._sensor_error = GrpcTimeout(f"gRPC sensor timeout: {details}")
+            return []
+        readings: List[SensorData] = []
+        for update in self._sensor_stream.drain():
+            try:
+                readings.append(self._sensor_data_from_reading(update.reading))
+            except GrpcSensorDataError as exc:
+                if self._sensor_error is None:
+                    self._sensor_error = exc
+        if readings:
+            self._sensor_error = None
+        # The agent stops reading at the first RADAR sample: pushed radar goes last.
+        readings.sort(key=lambda r: r.sensor_type == SensorTypeEnum.RADAR)
+        return readings
+
+    async def _stream_radar_frame(self) -> Optional[SensorData]:
+        assert self._radar_stream is not None
+        updates = self._radar_stream.drain()
+        if not updates:
+            return None
+        return self._radar_sensor_data(updates[-1].frame, source="grpc_stream_radar_frames")
+
+    async def _timed(self, name: str, coro):
+        started = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            self.last_fetch_ms[name] = round((time.perf_counter() - started) * 1000.0, 2)
+
+    async def _fetch_sensor_rotation(self) -> List[SensorData]:
+        """Up to `sensor_reads` rotation samples under one shared deadline; stops at RADAR."""
+        self._sensor_error = None
+        readings: List[SensorData] = []
+        deadline = time.monotonic() + self.sensor_deadline_s
+        for attempt in range(self.sensor_reads):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                try:
+                    response = await self._aio_stub.GetSensorData(GetSensorDataRequest(), timeout=remaining)
+                except grpc.RpcError as e:
+                    sensor_data = self._sensor_data_from_rpc_error(e)
+                else:
+                    sensor_data = self._sensor_data_from_reading(response.reading)
+            except GrpcSensorDataError as exc:
+                if attempt == 0:
+                    # Same contract as the sync provider: the first read fails fast and the
+                    # agent switches to SAFE (SENSORS_UNAVAILABLE) when it reads the queue.
+                    self._sensor_error = exc
+                    return []
+                logger.warning(f"Sensor rotation read {attempt + 1} failed: {exc}")
+                break
+            readings.append(sensor_data)
+            if sensor_data.sensor_type == SensorTypeEnum.RADAR:
+                break
+        return readings
+
+    async def _fetch_radar_frame(self) -> Optional[SensorData]:
+        try:
+            response = await self._aio_stub.GetRadarFrame(GetRadarFrameRequest(), timeout=self.radar_deadline_s)
+        except grpc.RpcError as e:
+            reason = self._classify_rpc_error(e)
+            if reason == "rpc_failed_precondition":
+                # Sim stopped / radar unpowered: no frame is the truth, not an error.
+                logger.debug("Radar frame unavailable: %s", e)
+            else:
+                logger.warning("gRPC radar frame read failed (%s): %s", reason, e)
+            return None
+        return self._radar_sensor_data(response.frame, source="grpc_get_radar_frame")
+
+    @staticmethod
+    def _radar_sensor_data(proto_frame, *, source: str) -> Optional[SensorData]:
+        try:
+            frame = proto_frame_to_model(proto_frame)
+            return SensorData(
+                sensor_id=str(frame.sensor_id),
+                sensor_type=SensorTypeEnum.RADAR,
+                timestamp=frame.timestamp,
+                radar_frame=frame,
+                metadata={"source": source},
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Invalid gRPC radar frame payload, ignored: %s", exc)
+            return None
+
+    def get_bios_status(self) -> BiosStatus:
+        if self._bios_status is None:
+            return super().get_bios_status()
+        return self._bios_status
+
+    def get_sensor_data(self) -> Optional[SensorData]:
+        """Next prefetched sample; None once this tick's samples are consumed."""
+        if self._sensor_error is not None:
+            error, self._sensor_error = self._sensor_error, None
+            raise error
+        if not self._sensor_queue:
+            return None
+        return self._sensor_queue.popleft()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import threading
@@ -103,3 +104,17 @@ def fetch_bios_status() -> BiosStatus:
     - Otherwise: return cached value immediately and refresh in background at most once per TTL.
     """
     return _CACHE.get()
+
+
+async def fetch_bios_status_async(*, deadline_s: Optional[float] = None) -> BiosStatus:
+    """Async variant for the async tick: same cache policy, run off-loop and bounded by `deadline_s`.
+
+    With BIOS_CACHE_TTL_SEC <= 0 the blocking HTTP fetch runs in a worker thread, so it overlaps
+    with the gRPC calls instead of freezing the event loop. A missed deadline yields the
+    "unavailable" status (no-mocks), the worker finishes in the background.
+    """
+    try:
+        return await asyncio.wait_for(asyncio.to_thread(fetch_bios_status), timeout=deadline_s)
+    except asyncio.TimeoutError:
+        logger.warning("BIOS status deadline exceeded (%.3fs)", float(deadline_s or 0.0))
+        return _unavailable_status()
@@ -129,6 +129,17 @@ class _SQLiteEventWriter:
         except queue.Full:
             return False
 
+    def append_rows(self, rows: Iterable[tuple]) -> int:
+        """Enqueue rows in order until the queue is full; returns how many were enqueued."""
+        enqueued = 0
+        for row in rows:
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                break
+            enqueued += 1
+        return enqueued
+
     def flush(self) -> None:
         self._queue.join()
 
@@ -292,8 +303,25 @@ class EventStore:
         self._maybe_run_retention(event.ts)
         return event
 
-    def append_new(
-        self,
+    def append_many(self, events: Iterable[SystemEvent]) -> list[SystemEvent]:
+        """
+        Batched `append`: validate and store a frame's events under one lock acquisition,
+        enqueue their SQLite rows together and run the retention check once.
+        Returns the events that passed validation, in order.
+        """
+        if not self.enabled:
+            return []
+        with self._events_lock:
+            accepted = [event for event in events if self._validate_event_contract(event)]
+            self._events.extend(accepted)
+        if not accepted:
+            return accepted
+        self._append_sqlite_many(accepted)
+        self._maybe_run_retention(accepted[-1].ts)
+        return accepted
+
+    @staticmethod
+    def new_event(
         *,
         subsystem: str,
         event_type: str,
@@ -302,7 +330,8 @@ class EventStore:
         reason: str = "",
         tick_id: Optional[str] = None,
         ts: float | None = None,
-    ) -> Optional[SystemEvent]:
+    ) -> SystemEvent:
+        """Build a SystemEvent the way `append_new` does, without storing it (see `append_many`)."""
         normalized_truth_state = _truth_state_from_any(truth_state)
         resolved_reason = str(reason or "").strip()
         if (
@@ -320,7 +349,30 @@ class EventStore:
             truth_state=normalized_truth_state,
             reason=resolved_reason,
         )
-        return self.append(event)
+        return event
+
+    def append_new(
+        self,
+        *,
+        subsystem: str,
+        event_type: str,
+        payload: dict[str, Any],
+        truth_state: TruthState | str = TruthState.OK,
+        reason: str = "",
+        tick_id: Optional[str] = None,
+        ts: float | None = None,
+    ) -> Optional[SystemEvent]:
+        return self.append(
+            self.new_event(
+                subsystem=subsystem,
+                event_type=event_type,
+                payload=payload,
+                truth_state=truth_state,
+                reason=reason,
+                tick_id=tick_id,
+                ts=ts,
+            )
+        )
 
     def recent(self, n: int = 20) -> list[SystemEvent]:
         limit = max(0, int(n))
@@ -518,20 +570,22 @@ class EventStore:
         )
         self._sqlite_writer.start()
 
-    def _append_sqlite(self, event: SystemEvent) -> None:
+    def _sqlite_writer_ready(self) -> bool:
         if self._sqlite_writer is None:
-            return
+            return False
         if self._sqlite_writer.last_error is not None:
             if self.strict:
                 raise RuntimeError(f"eventstore sqlite writer failed: {self._sqlite_writer.last_error}")
-            return
+            return False
+        return True
 
+    def _sqlite_row(self, event: SystemEvent) -> tuple:
         session_id = ""
         if isinstance(event.payload, dict):
             maybe = event.payload.get("session_id")
             if maybe is not None:
                 session_id = str(maybe)
-        row = (
+        return (
             str(event.event_id),
             float(event.ts),
             str(event.subsystem),
@@ -541,12 +595,29 @@ class EventStore:
             json.dumps(event.payload, ensure_ascii=True),
             int(self._db_schema_version),
         )
-        enqueued = self._sqlite_writer.append_row(row)
+
+    def _append_sqlite(self, event: SystemEvent) -> None:
+        if not self._sqlite_writer_ready():
+            return
+        assert self._sqlite_writer is not None
+        enqueued = self._sqlite_writer.append_row(self._sqlite_row(event))
         if enqueued:
             self._maybe_emit_write_lag()
             return
+        self._record_sqlite_drop(1)
+
+    def _append_sqlite_many(self, events: list[SystemEvent]) -> None:
+        if not self._sqlite_writer_ready():
+            return
+        assert self._sqlite_writer is not None
+        enqueued = self._sqlite_writer.append_rows([self._sqlite_row(event) for event in events])
+        if enqueued == len(events):
+            self._maybe_emit_write_lag()
+            return
+        self._record_sqlite_drop(len(events) - enqueued)
 
-        self._sqlite_dropped += 1
+    def _record_sqlite_drop(self, count: int) -> None:
+        self._sqlite_dropped += int(count)
         if self.strict:
             raise RuntimeError("eventstore queue overflow")
         now = time.time()
@@ -155,28 +155,36 @@ class GrpcDataProvider(IDataProvider):
         try:
             response = self.stub.GetSensorData(GetSensorDataRequest(), timeout=10.0)
         except grpc.RpcError as e:
-            reason = self._classify_rpc_error(e)
-            details = str(e)
-            if self._allow_grpc_fallback():
-                logger.warning(
-                    "gRPC sensor read failed (%s), returning explicit fallback payload: %s",
-                    reason,
-                    details,
-                )
-                return self._fallback_sensor_data(reason=reason, details=details)
-            if reason == "timeout":
-                logger.error("gRPC sensor read timeout; fail-fast without fallback: %s", details)
-                raise GrpcTimeout(f"gRPC sensor timeout: {details}") from e
-            logger.error("gRPC sensor data unavailable; fail-fast without fallback: %s", details)
-            raise GrpcDataUnavailable(f"gRPC sensor unavailable ({reason}): {details}") from e
-
-        reading = response.reading
+            return self._sensor_data_from_rpc_error(e)
+        return self._sensor_data_from_reading(response.reading)
+
+    @classmethod
+    def _sensor_data_from_rpc_error(cls, error: grpc.RpcError) -> SensorData:
+        """Explicit fallback payload if allowed, otherwise a classified fail-fast error."""
+        reason = cls._classify_rpc_error(error)
+        details = str(error)
+        if cls._allow_grpc_fallback():
+            logger.warning(
+                "gRPC sensor read failed (%s), returning explicit fallback payload: %s",
+                reason,
+                details,
+            )
+            return cls._fallback_sensor_data(reason=reason, details=details)
+        if reason == "timeout":
+            logger.error("gRPC sensor read timeout; fail-fast without fallback: %s", details)
+            raise GrpcTimeout(f"gRPC sensor timeout: {details}") from error
+        logger.error("gRPC sensor data unavailable; fail-fast without fallback: %s", details)
+        raise GrpcDataUnavailable(f"gRPC sensor unavailable ({reason}): {details}") from error
+
+    @classmethod
+    def _sensor_data_from_reading(cls, reading) -> SensorData:
+        """Validate and convert a proto SensorReading (shared by the sync and grpc.aio providers)."""
         sensor_id = getattr(getattr(reading, "sensor_id", None), "value", "")
         if not sensor_id:
             details = "missing sensor_id in GetSensorData response"
-            if self._allow_grpc_fallback():
+            if cls._allow_grpc_fallback():
                 logger.warning("Invalid gRPC sensor payload, returning explicit fallback payload: %s", details)
-                return self._fallback_sensor_data(reason="invalid_payload", details=details)
+                return cls._fallback_sensor_data(reason="invalid_payload", details=details)
             logger.error("Invalid gRPC sensor payload; fail-fast without fallback: %s", details)
             raise GrpcInvalidPayload(details)
 
@@ -184,12 +192,12 @@ class GrpcDataProvider(IDataProvider):
             sensor_data = proto_sensor_reading_to_pydantic_sensor_data(reading)
         except Exception as exc:
             details = str(exc)
-            if self._allow_grpc_fallback():
+            if cls._allow_grpc_fallback():
                 logger.warning(
                     "gRPC sensor payload conversion failed, returning explicit fallback payload: %s",
                     details,
                 )
-                return self._fallback_sensor_data(reason="invalid_payload", details=details)
+                return cls._fallback_sensor_data(reason="invalid_payload", details=details)
             logger.error("gRPC sensor payload conversion failed; fail-fast without fallback: %s", details)
             raise GrpcInvalidPayload(f"invalid gRPC sensor payload: {details}") from exc
 
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Hashable, List, Optional
+
+import grpc
+
+from qiki.services.q_core_agent.core.agent_logger import logger
+from generated.q_sim_api_pb2 import StreamRequest
+
+
+class ConflatingMailbox:
+    """
+    Client-side conflation of a push stream: the latest value per key, in arrival order.
+
+    The tick drains whatever arrived since the previous tick; values replaced before the drain
+    are counted in `conflated` (the server's own `conflated` counter is added on top).
+    """
+
+    def __init__(self) -> None:
+        self._pending: OrderedDict[Hashable, Any] = OrderedDict()
+        self._ready = asyncio.Event()
+        self.received = 0
+        self.conflated = 0
+
+    def put(self, key: Hashable, value: Any, *, server_conflated: int = 0) -> None:
+        self.received += 1
+        self.conflated += int(server_conflated)
+        if key in self._pending:
+            self.conflated += 1
+        self._pending[key] = value
+        self._ready.set()
+
+    def drain(self) -> List[Any]:
+        values = list(self._pending.values())
+        self._pending.clear()
+        self._ready.clear()
+        return values
+
+    async def wait(self, timeout: float) -> bool:
+        """True once at least one value is pending (immediately if already so)."""
+        if self._pending:
+            return True
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return bool(self._pending)
+
+
+class StreamConsumer:
+    """
+    Background reader of one QSimAPIService push stream (StreamSensorData/StreamRadarFrames).
+
+    `credits == 0` — plain server push; `credits > 0` — credit window: the server sends at most
+    `credits` updates ahead of the consumer and conflates the rest on its side; `drain()` grants
+    back as many credits as messages were received since the previous grant.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        open_stream: Callable[[AsyncIterator[StreamRequest]], Any],
+        *,
+        key: Callable[[Any], Hashable],
+        credits: int = 0,
+    ) -> None:
+        self.name = name
+        self._open_stream = open_stream
+        self._key = key
+        self.credits = max(0, int(credits))
+        self.mailbox = ConflatingMailbox()
+        self.error: Optional[BaseException] = None
+        self._grants: asyncio.Queue[int] = asyncio.Queue()
+        self._received_since_grant = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.error = None
+        self._received_since_grant = 0
+        self._grants = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(), name=f"grpc-stream-{self.name}")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def drain(self) -> List[Any]:
+        values = self.mailbox.drain()
+        if self.credits and self._received_since_grant:
+            self._grants.put_nowait(self._received_since_grant)
+            self._received_since_grant = 0
+        return values
+
+    async def _requests(self) -> AsyncIterator[StreamRequest]:
+        yield StreamRequest(credits=self.credits)
+        if not self.credits:
+            return
+        while True:
+            yield StreamRequest(credits=await self._grants.get())
+
+    async def _run(self) -> None:
+        try:
+            async for update in self._open_stream(self._requests()):
+                self._received_since_grant += 1
+                self.mailbox.put(self._key(update), update, server_conflated=update.conflated)
+            self.error = ConnectionError(f"{self.name} stream closed by server")
+        except asyncio.CancelledError:
+            raise
+        except grpc.RpcError as exc:
+            self.error = exc
+        except Exception as exc:  # noqa: BLE001
+            self.error = exc
+        logger.warning("gRPC %s stream stopped: %s", self.name, self.error)
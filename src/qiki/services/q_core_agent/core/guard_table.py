@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import math
+from bisect import bisect_right
 from dataclasses import dataclass
 from importlib import resources
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import yaml
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from qiki.shared.models.radar import (
     FriendFoeEnum,
@@ -22,6 +24,7 @@ DEFAULT_RESOURCE_PACKAGE = "qiki.resources.radar"
 DEFAULT_RESOURCE_NAME = "guard_rules.yaml"
 
 _SEVERITY_ORDER = {"info": 0, "warning": 1, "critical": 2}
+_GUARDED_TRACK_STATUSES = frozenset({RadarTrackStatusEnum.TRACKED, RadarTrackStatusEnum.COASTING})
 
 
 class GuardEvaluationResult(BaseModel):
@@ -84,10 +87,7 @@ class GuardRule(BaseModel):
     def matches(self, track: RadarTrackModel, *, active: bool = False, hysteresis_m: Optional[float] = None) -> bool:
         # P0 trust: guard rules operate on stabilized tracks only.
         # NEW/UNSPECIFIED tracks are too noisy and cause operator-facing flapping.
-        if track.status not in {
-            RadarTrackStatusEnum.TRACKED,
-            RadarTrackStatusEnum.COASTING,
-        }:
+        if track.status not in _GUARDED_TRACK_STATUSES:
             return False
 
         if self.iff is not None and track.iff != self.iff:
@@ -122,6 +122,20 @@ class GuardRule(BaseModel):
 
         return True
 
+    def accepts_identity(self, iff: FriendFoeEnum, transponder_on: bool, mode: TransponderModeEnum) -> bool:
+        """IFF/transponder part of `matches` (used to bucket rules in the index)."""
+        if self.iff is not None and iff != self.iff:
+            return False
+        if self.require_transponder_on is not None and bool(transponder_on) != self.require_transponder_on:
+            return False
+        return not self.allowed_transponder_modes or mode in self.allowed_transponder_modes
+
+    def range_envelope(self) -> Tuple[float, float]:
+        """Widest range interval the rule can match in, hysteresis expansion included."""
+        h = float(self.hysteresis_m)
+        hi = float(self.max_range_m) + h if self.max_range_m is not None else math.inf
+        return float(self.min_range_m) - h, hi
+
     def build_result(self, track: RadarTrackModel) -> GuardEvaluationResult:
         return GuardEvaluationResult(
             rule_id=self.rule_id,
@@ -142,14 +156,74 @@ class GuardRule(BaseModel):
         return self.build_result(track)
 
 
+class _RangeBucket:
+    """Stabbing index over the range envelopes of rules sharing one IFF/transponder identity.
+
+    Envelope bounds split the range axis into segments; each segment keeps the rules whose
+    envelope touches it (closed on both ends — a superset, `GuardRule.matches` stays exact).
+    """
+
+    __slots__ = ("bounds", "segments")
+
+    def __init__(self, rules: Sequence[GuardRule]) -> None:
+        envelopes = [rule.range_envelope() for rule in rules]
+        self.bounds: List[float] = sorted({b for envelope in envelopes for b in envelope if math.isfinite(b)})
+        edges = [-math.inf, *self.bounds, math.inf]
+        self.segments: List[Tuple[Tuple[GuardRule, ...], frozenset]] = []
+        for start, end in zip(edges, edges[1:]):
+            hits = tuple(rule for rule, (lo, hi) in zip(rules, envelopes) if lo <= end and hi >= start)
+            self.segments.append((hits, frozenset(rule.rule_id for rule in hits)))
+
+    def lookup(self, range_m: float) -> Tuple[Tuple[GuardRule, ...], frozenset]:
+        return self.segments[bisect_right(self.bounds, range_m)]
+
+
+_NO_CANDIDATES: Tuple[Tuple[GuardRule, ...], frozenset] = ((), frozenset())
+
+
 class GuardTable(BaseModel):
-    """Collection of guard rules loaded from configuration."""
+    """Collection of guard rules loaded from configuration.
+
+    Evaluation goes through an index: rules are bucketed by the track identity they accept
+    (IFF, transponder on/off, transponder mode) and, inside a bucket, by range envelope, so a
+    track is only checked against the rules that can match it. The index is built lazily and
+    rebuilt when `rules` is reassigned or grows/shrinks; call `rebuild_index()` after editing
+    rule fields in place.
+    """
 
     schema_version: int
     rules: List[GuardRule] = Field(default_factory=list)
 
+    _index_key: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+    _buckets: Dict[Tuple[int, bool, int], _RangeBucket] = PrivateAttr(default_factory=dict)
+
+    def rebuild_index(self) -> None:
+        self._buckets = {}
+        self._index_key = (id(self.rules), len(self.rules))
+
+    def candidates(self, track: RadarTrackModel) -> Tuple[Tuple[GuardRule, ...], frozenset]:
+        """Rules that may match `track` (in table order) and the set of their ids."""
+        if track.status not in _GUARDED_TRACK_STATUSES:
+            return _NO_CANDIDATES
+        if self._index_key != (id(self.rules), len(self.rules)):
+            self.rebuild_index()
+        identity = (int(track.iff), bool(track.transponder_on), int(track.transponder_mode))
+        bucket = self._buckets.get(identity)
+        if bucket is None:
+            iff, transponder_on, mode = identity
+            accepted = [
+                rule
+                for rule in self.rules
+                if rule.accepts_identity(FriendFoeEnum(iff), transponder_on, TransponderModeEnum(mode))
+            ]
+            bucket = self._buckets[identity] = _RangeBucket(accepted)
+        return bucket.lookup(float(track.range_m))
+
+    def candidate_rules(self, track: RadarTrackModel) -> Tuple[GuardRule, ...]:
+        return self.candidates(track)[0]
+
     def evaluate_track(self, track: RadarTrackModel) -> List[GuardEvaluationResult]:
-        return [result for rule in self.rules if (result := rule.evaluate(track))]
+        return [result for rule in self.candidate_rules(track) if (result := rule.evaluate(track))]
 
     def evaluate_tracks(self, tracks: Iterable[RadarTrackModel]) -> List[GuardEvaluationResult]:
         results: List[GuardEvaluationResult] = []
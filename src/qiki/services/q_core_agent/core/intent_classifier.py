@@ -0,0 +1,62 @@
+"""Single-pass phrase matcher for the ORION intents classifier."""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Mapping
+
+
+def normalize_intent_text(text: str | None) -> str:
+    """Lowercase and collapse whitespace — the one normalisation every intent predicate shares."""
+    return " ".join((text or "").strip().lower().split())
+
+
+def _trie_pattern(node: dict[str, dict]) -> str:
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # A phrase ends here but longer ones continue: greedy optional keeps the longest match.
+    return f"(?:{body})?" if "" in node else body
+
+
+class PhraseMatcher:
+    """
+    Substring matcher over a fixed set of labelled phrases, compiled into one trie-shaped regex.
+
+    `labels(text)` returns the labels of *every* phrase occurring in `text`, overlapping ones
+    included, in a single scan: at each position the trie regex takes the longest phrase, and
+    every phrase that is a prefix of it carries its labels (two phrases can only match at the
+    same position if one is a prefix of the other).
+    """
+
+    def __init__(self, phrases: Mapping[str, Iterable[str]]) -> None:
+        by_phrase: dict[str, set[str]] = {}
+        for label, items in phrases.items():
+            for phrase in items:
+                if phrase:
+                    by_phrase.setdefault(phrase, set()).add(label)
+        self._labels: dict[str, frozenset[str]] = {}
+        for phrase in by_phrase:
+            closure: set[str] = set()
+            for end in range(1, len(phrase) + 1):
+                closure |= by_phrase.get(phrase[:end], set())
+            self._labels[phrase] = frozenset(closure)
+
+        trie: dict[str, dict] = {}
+        for phrase in by_phrase:
+            node = trie
+            for ch in phrase:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+        self._pattern = re.compile(f"(?=({_trie_pattern(trie)}))") if trie else None
+
+    def labels(self, text: str) -> frozenset[str]:
+        if self._pattern is None:
+            return frozenset()
+        found: set[str] = set()
+        for match in self._pattern.finditer(text):
+            phrase = match.group(1)
+            if phrase:
+                found |= self._labels[phrase]
+        return frozenset(found)
@@ -1,24 +1,34 @@
-"""Prometheus metrics for the Q-Core agent world model."""
+"""Prometheus metrics for the Q-Core agent world model, the ORION intents service and the radar pipeline."""
 
 from __future__ import annotations
 
+import logging
+import os
+import threading
 from typing import Iterable
 
 try:  # pragma: no cover - optional dependency
-    from prometheus_client import Counter, Gauge  # type: ignore
+    from prometheus_client import Counter, Gauge, Histogram, start_http_server  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover
+    start_http_server = None  # type: ignore[assignment]
 
     class _NoOpMetric:
+        def labels(self, *_args, **_kwargs) -> "_NoOpMetric":
+            return self
+
         def set(self, *_args, **_kwargs) -> None:
             return None
 
         def inc(self, *_args, **_kwargs) -> None:
             return None
 
+        def observe(self, *_args, **_kwargs) -> None:
+            return None
+
     def _noop_metric_factory(*_args, **_kwargs) -> _NoOpMetric:
         return _NoOpMetric()
 
-    Counter = Gauge = _noop_metric_factory  # type: ignore
+    Counter = Gauge = Histogram = _noop_metric_factory  # type: ignore
 
 from qiki.services.q_core_agent.core.guard_table import GuardEvaluationResult
 
@@ -61,3 +71,82 @@ def publish_world_model_metrics(
     _WORLD_MODEL_WARNING_GUARDS.set(max(warning, 0))
     if new_warning_events > 0:
         _WORLD_MODEL_WARNING_TOTAL.inc(new_warning_events)
+
+
+_INTENT_LATENCY_SECONDS = Histogram(
+    "qiki_intents_latency_seconds",
+    "ORION intent handling latency by intent and phase (refresh = agent snapshot, build = response)",
+    ["intent", "phase"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+_INTENT_SNAPSHOT_REFRESH_TOTAL = Counter(
+    "qiki_intents_snapshot_refresh_total",
+    "Agent snapshot requests by outcome (fresh = cache hit, joined = shared in-flight refresh, refreshed)",
+    ["outcome"],
+)
+
+
+def observe_intent_latency(intent: str, *, refresh_s: float, build_s: float) -> None:
+    """Record one handled intent split into snapshot-refresh and response-build time."""
+
+    _INTENT_LATENCY_SECONDS.labels(intent=intent, phase="refresh").observe(max(refresh_s, 0.0))
+    _INTENT_LATENCY_SECONDS.labels(intent=intent, phase="build").observe(max(build_s, 0.0))
+    _INTENT_LATENCY_SECONDS.labels(intent=intent, phase="total").observe(max(refresh_s + build_s, 0.0))
+
+
+def count_snapshot_refresh(outcome: str) -> None:
+    _INTENT_SNAPSHOT_REFRESH_TOTAL.labels(outcome=outcome).inc()
+
+
+# Radar pipeline stage timers (radar_stage_timers): one process-wide histogram labelled by stage,
+# fed by every RadarPipeline of the process.
+_RADAR_STAGE_DURATION_MS = Histogram(
+    "qiki_radar_stage_duration_ms",
+    "Radar pipeline stage duration per sampled frame, milliseconds",
+    ["stage"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0),
+)
+_RADAR_STAGE_FRAMES_SAMPLED_TOTAL = Counter(
+    "qiki_radar_stage_frames_sampled_total",
+    "Frames timed by the radar pipeline stage timers",
+)
+
+
+def observe_radar_stage(stage: str, value_ms: float) -> None:
+    _RADAR_STAGE_DURATION_MS.labels(stage=stage).observe(max(value_ms, 0.0))
+
+
+def count_radar_stage_frame_sampled() -> None:
+    _RADAR_STAGE_FRAMES_SAMPLED_TOTAL.inc()
+
+
+_logger = logging.getLogger(__name__)
+_radar_metrics_server_lock = threading.Lock()
+_radar_metrics_server_requested = False
+
+
+def ensure_radar_metrics_server() -> None:
+    """
+    Start the prometheus_client /metrics exporter on RADAR_METRICS_PORT (RADAR_METRICS_HOST,
+    default 127.0.0.1) once per process. Later calls are no-ops, also after a failed attempt,
+    so every RadarPipeline may call it; a bad or busy port is logged, not raised.
+    """
+
+    global _radar_metrics_server_requested
+    raw_port = os.getenv("RADAR_METRICS_PORT", "").strip()
+    if not raw_port:
+        return
+    with _radar_metrics_server_lock:
+        if _radar_metrics_server_requested:
+            return
+        _radar_metrics_server_requested = True
+        if start_http_server is None:
+            _logger.warning("RADAR_METRICS_PORT=%s set but prometheus_client is not installed", raw_port)
+            return
+        host = os.getenv("RADAR_METRICS_HOST", "127.0.0.1")
+        try:
+            start_http_server(int(raw_port), addr=host)
+        except (OSError, ValueError) as exc:
+            _logger.warning("Radar metrics exporter not started on %s:%s: %s", host, raw_port, exc)
+            return
+        _logger.info("Radar metrics exporter listening on %s:%s", host, raw_port)
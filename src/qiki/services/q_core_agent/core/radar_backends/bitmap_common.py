@@ -2,13 +2,112 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+import hashlib
 from io import BytesIO
+import os
+from typing import Any, Callable
 
 from .base import RadarScene
 from .geometry import project_point
 from qiki.services.q_core_agent.core.radar_render_policy import RadarRenderPlan
 from qiki.services.q_core_agent.core.radar_view_state import RadarViewState
 
+_BG = (10, 12, 16, 255)
+_FG = (190, 210, 230, 255)
+_GRID = (80, 90, 110, 255)
+
+
+def _load_pil():
+    try:
+        from PIL import Image, ImageDraw
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError("Pillow is required for bitmap radar backends") from exc
+    return Image, ImageDraw
+
+
+def _static_layer(width: int, height: int, *, draw_grid: bool, draw_rings: bool):
+    """Background fill + range ring + grid cross; depends only on size and overlay flags."""
+    Image, ImageDraw = _load_pil()
+    image = Image.new("RGBA", (width, height), color=_BG)
+    draw = ImageDraw.Draw(image)
+    cx, cy = width // 2, height // 2
+    radius = min(cx, cy) - 8
+    if draw_rings:
+        draw.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), outline=_FG, width=1)
+    if draw_grid:
+        draw.line((cx, cy - radius, cx, cy + radius), fill=_GRID, width=1)
+        draw.line((cx - radius, cy, cx + radius, cy), fill=_GRID, width=1)
+    return image
+
+
+@dataclass
+class BitmapCacheStats:
+    frames: int = 0
+    background_builds: int = 0
+    encodes: int = 0
+    encode_skips: int = 0
+
+
+class BitmapRenderCache:
+    """
+    Per-backend bitmap cache.
+
+    - the static layer (background, ring, grid) is drawn once per size/scale and overlay flags;
+    - each frame pastes it into one reusable RGBA buffer before the dynamic layer is drawn;
+    - encoders are memoized on a digest of the frame pixels, so an unchanged frame is not
+      re-encoded to PNG/SIXEL (`skip_unchanged=False` disables the memo).
+
+    The buffer returned by `frame()` is overwritten on the next frame: encode it before rendering again.
+    """
+
+    def __init__(self, *, skip_unchanged: bool = True, max_backgrounds: int = 8) -> None:
+        self.skip_unchanged = bool(skip_unchanged)
+        self._max_backgrounds = max(1, int(max_backgrounds))
+        self._backgrounds: dict[tuple[int, int, bool, bool], Any] = {}
+        self._buffer: Any = None
+        self._encoded: dict[str, tuple[bytes, Any]] = {}
+        self.stats = BitmapCacheStats()
+
+    @classmethod
+    def from_env(cls) -> "BitmapRenderCache":
+        raw = os.getenv("RADAR_BITMAP_SKIP_UNCHANGED", "1").strip().lower()
+        return cls(skip_unchanged=raw not in {"0", "false", "no", "off"})
+
+    def frame(self, width: int, height: int, *, draw_grid: bool, draw_rings: bool):
+        key = (int(width), int(height), bool(draw_grid), bool(draw_rings))
+        background = self._backgrounds.get(key)
+        if background is None:
+            if len(self._backgrounds) >= self._max_backgrounds:
+                self._backgrounds.clear()
+            background = _static_layer(key[0], key[1], draw_grid=key[2], draw_rings=key[3])
+            self._backgrounds[key] = background
+            self.stats.background_builds += 1
+        if self._buffer is None or self._buffer.size != background.size:
+            self._buffer = background.copy()
+        else:
+            self._buffer.paste(background, (0, 0))
+        self.stats.frames += 1
+        return self._buffer
+
+    def encode(self, image, encoder: Callable[[Any], Any], *, name: str) -> Any:
+        """Run `encoder(image)` unless the previous frame for `name` had identical pixels."""
+        if not self.skip_unchanged:
+            self.stats.encodes += 1
+            return encoder(image)
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{image.mode}:{image.width}x{image.height}".encode("ascii"))
+        hasher.update(image.tobytes())
+        digest = hasher.digest()
+        cached = self._encoded.get(name)
+        if cached is not None and cached[0] == digest:
+            self.stats.encode_skips += 1
+            return cached[1]
+        encoded = encoder(image)
+        self._encoded[name] = (digest, encoded)
+        self.stats.encodes += 1
+        return encoded
+
 
 def scene_to_image(
     scene: RadarScene,
@@ -18,22 +117,18 @@ def scene_to_image(
     height: int = 120,
     color: bool = True,
     render_plan: RadarRenderPlan | None = None,
+    cache: BitmapRenderCache | None = None,
 ):
-    try:
-        from PIL import Image, ImageDraw
-    except Exception as exc:  # noqa: BLE001
-        raise RuntimeError("Pillow is required for bitmap radar backends") from exc
+    """Render a radar scene to an RGBA image; with `cache`, the static layer and buffer are reused."""
+    _Image, ImageDraw = _load_pil()
 
-    bg = (10, 12, 16, 255)
-    fg = (190, 210, 230, 255)
+    fg = _FG
     accent = (120, 230, 190, 255) if color else fg
     warn = (235, 120, 120, 255) if color else fg
 
     bitmap_scale = render_plan.bitmap_scale if render_plan is not None else 1.0
     width = max(80, int(width * bitmap_scale))
     height = max(40, int(height * bitmap_scale))
-    image = Image.new("RGBA", (width, height), color=bg)
-    draw = ImageDraw.Draw(image)
     cx, cy = width // 2, height // 2
     radius = min(cx, cy) - 8
     draw_grid = view_state.overlays_enabled
@@ -47,11 +142,11 @@ def scene_to_image(
         draw_vectors = render_plan.draw_vectors
         draw_labels = render_plan.draw_labels
         draw_trails = render_plan.draw_trails
-    if draw_rings:
-        draw.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), outline=fg, width=1)
-    if draw_grid:
-        draw.line((cx, cy - radius, cx, cy + radius), fill=(80, 90, 110, 255), width=1)
-        draw.line((cx - radius, cy, cx + radius, cy), fill=(80, 90, 110, 255), width=1)
+    if cache is not None:
+        image = cache.frame(width, height, draw_grid=draw_grid, draw_rings=draw_rings)
+    else:
+        image = _static_layer(width, height, draw_grid=draw_grid, draw_rings=draw_rings)
+    draw = ImageDraw.Draw(image)
 
     if not scene.ok:
         draw.text((12, cy - 6), f"NO DATA: {scene.reason or 'NO_DATA'}", fill=warn)
@@ -111,13 +206,13 @@ def scene_to_image(
     return image
 
 
-def image_to_png_bytes(image) -> bytes:
+def _encode_png(image) -> bytes:
     buf = BytesIO()
     image.save(buf, format="PNG")
     return buf.getvalue()
 
 
-def image_to_sixel_text(image) -> str:
+def _encode_sixel(image) -> str:
     buf = BytesIO()
     try:
         image.save(buf, format="SIXEL")
@@ -125,3 +220,15 @@ def image_to_sixel_text(image) -> str:
         raise RuntimeError("SIXEL encoder is unavailable in current Pillow build") from exc
     data = buf.getvalue()
     return data.decode("latin1", errors="ignore")
+
+
+def image_to_png_bytes(image, *, cache: BitmapRenderCache | None = None) -> bytes:
+    if cache is None:
+        return _encode_png(image)
+    return cache.encode(image, _encode_png, name="png")
+
+
+def image_to_sixel_text(image, *, cache: BitmapRenderCache | None = None) -> str:
+    if cache is None:
+        return _encode_sixel(image)
+    return cache.encode(image, _encode_sixel, name="sixel")
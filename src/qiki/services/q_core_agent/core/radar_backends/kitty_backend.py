@@ -6,7 +6,7 @@ import base64
 import os
 
 from .base import RadarBackend, RadarScene, RenderOutput
-from .bitmap_common import image_to_png_bytes, scene_to_image
+from .bitmap_common import BitmapRenderCache, image_to_png_bytes, scene_to_image
 from qiki.services.q_core_agent.core.radar_render_policy import RadarRenderPlan
 from qiki.services.q_core_agent.core.radar_view_state import RadarViewState
 
@@ -14,6 +14,9 @@ from qiki.services.q_core_agent.core.radar_view_state import RadarViewState
 class KittyRadarBackend(RadarBackend):
     name = "kitty"
 
+    def __init__(self, *, render_cache: BitmapRenderCache | None = None) -> None:
+        self.render_cache = render_cache if render_cache is not None else BitmapRenderCache.from_env()
+
     def is_supported(self) -> bool:
         if os.getenv("QIKI_FORCE_KITTY_SUPPORTED", "").strip() == "1":
             return True
@@ -39,8 +42,14 @@ class KittyRadarBackend(RadarBackend):
     ) -> RenderOutput:
         if not self.is_supported():
             raise RuntimeError("Kitty backend is unsupported in this terminal")
-        image = scene_to_image(scene, view_state=view_state, color=color, render_plan=render_plan)
-        png_bytes = image_to_png_bytes(image)
+        image = scene_to_image(
+            scene,
+            view_state=view_state,
+            color=color,
+            render_plan=render_plan,
+            cache=self.render_cache,
+        )
+        png_bytes = image_to_png_bytes(image, cache=self.render_cache)
         payload = base64.b64encode(png_bytes).decode("ascii")
         # Kitty graphics protocol transfer (direct payload in single chunk).
         escape = f"\x1b_Gf=100,t=d,m=0;{payload}\x1b\\"
@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 
 from .base import RadarBackend, RadarScene, RenderOutput
-from .bitmap_common import image_to_sixel_text, scene_to_image
+from .bitmap_common import BitmapRenderCache, image_to_sixel_text, scene_to_image
 from qiki.services.q_core_agent.core.radar_render_policy import RadarRenderPlan
 from qiki.services.q_core_agent.core.radar_view_state import RadarViewState
 
@@ -13,6 +13,9 @@ from qiki.services.q_core_agent.core.radar_view_state import RadarViewState
 class SixelRadarBackend(RadarBackend):
     name = "sixel"
 
+    def __init__(self, *, render_cache: BitmapRenderCache | None = None) -> None:
+        self.render_cache = render_cache if render_cache is not None else BitmapRenderCache.from_env()
+
     def is_supported(self) -> bool:
         if os.getenv("QIKI_FORCE_SIXEL_SUPPORTED", "").strip() == "1":
             return True
@@ -34,8 +37,14 @@ class SixelRadarBackend(RadarBackend):
     ) -> RenderOutput:
         if not self.is_supported():
             raise RuntimeError("SIXEL backend is unsupported in this terminal")
-        image = scene_to_image(scene, view_state=view_state, color=color, render_plan=render_plan)
-        sixel = image_to_sixel_text(image)
+        image = scene_to_image(
+            scene,
+            view_state=view_state,
+            color=color,
+            render_plan=render_plan,
+            cache=self.render_cache,
+        )
+        sixel = image_to_sixel_text(image, cache=self.render_cache)
         lines = [
             "[SIXEL BITMAP FRAME]",
             sixel,
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from dataclasses import replace
 from collections.abc import Callable
 from typing import Any
@@ -30,6 +31,8 @@ from .radar_plugins import (
 )
 from .radar_replay import RadarReplayEngine, TimelineState, load_trace, load_trace_from_db
 from .radar_render_policy import DegradationState, RadarRenderPlan, RadarRenderPolicy
+from .metrics import ensure_radar_metrics_server
+from .radar_stage_timers import StageTimers
 from .radar_situation_engine import Situation, SituationSeverity, SituationStatus
 from .radar_trail_store import RadarTrailStore
 from .radar_view_state import RadarViewState
@@ -78,6 +81,8 @@ class PerformanceMetrics:
     fusion_rebuilds: int
     situation_events: int
     targets_count: int
+    # Per-stage window stats (count/avg/p50/p95/p99/max, ms) from the sampled frames.
+    stages: dict[str, dict[str, float]] = field(default_factory=dict)
 
     @property
     def avg_frame_ms(self) -> float:
@@ -222,12 +227,18 @@ class RadarPipeline:
                 payload=self._replay_init_payload,
             )
         self._tracks_by_source: dict[str, list[SourceTrack]] = {}
-        self._last_fused_signatures: dict[str, tuple[object, ...]] = {}
-        self._last_cluster_signatures: set[tuple[object, ...]] = set()
-        self._perf_frame_times_ms: list[float] = []
+        self._last_fused_digests: dict[str, int] = {}
+        self._last_cluster_digests: set[int] = set()
+        try:
+            perf_window = max(1, int(os.getenv("RADAR_PERF_WINDOW", "4096")))
+        except ValueError:
+            perf_window = 4096
+        self._perf_frame_times_ms: deque[float] = deque(maxlen=perf_window)
         self._perf_fusion_rebuilds = 0
         self._perf_situation_events = 0
         self._perf_targets_count = 0
+        self.stage_timers = StageTimers.from_env()
+        ensure_radar_metrics_server()
 
     def close(self) -> None:
         if self.event_store is not None:
@@ -458,7 +469,19 @@ class RadarPipeline:
         return self.backend_plugin.select_backend(self.config.renderer)
 
     def render_scene(self, scene: RadarScene, *, view_state: RadarViewState | None = None) -> RenderOutput:
+        timers = self.stage_timers
+        if timers.in_frame:
+            return self._render_scene(scene, view_state=view_state)
+        frame_start = timers.begin_frame()
+        try:
+            return self._render_scene(scene, view_state=view_state)
+        finally:
+            timers.end_frame(frame_start)
+
+    def _render_scene(self, scene: RadarScene, *, view_state: RadarViewState | None = None) -> RenderOutput:
+        timers = self.stage_timers
         active_view_state = view_state or self.view_state
+        started = timers.start()
         self.trail_store.update_from_scene(scene)
         scene_with_trails = RadarScene(
             ok=scene.ok,
@@ -468,7 +491,11 @@ class RadarPipeline:
             points=scene.points,
             trails={k: v for k, v in self.trail_store.get_all().items()},
         )
+        timers.stop("trails", started)
+        started = timers.start()
         plan = self.build_render_plan(scene_with_trails, view_state=active_view_state)
+        timers.stop("plan", started)
+        started = timers.start()
         if self.situation_engine is not None:
             situations, deltas = self.situation_engine.evaluate(
                 scene_with_trails,
@@ -488,7 +515,11 @@ class RadarPipeline:
         active_view_state = self._apply_alert_selection(active_view_state, situations)
         self.view_state = active_view_state
         self.last_situations = tuple(situations)
+        timers.stop("situation", started)
+        started = timers.start()
         self._append_situation_events(scene_with_trails, deltas)
+        timers.stop("situation_events", started)
+        started = timers.start()
         render_start = self._clock.now()
         try:
             if self._active_backend.name == "unicode":
@@ -510,6 +541,7 @@ class RadarPipeline:
             self._update_adaptive_state(
                 frame_time_ms=self._last_frame_time_ms, targets_count=len(scene_with_trails.points)
             )
+            timers.stop("render", started)
             self._append_render_tick_event(scene_with_trails, output)
             return output
         except Exception as exc:  # noqa: BLE001
@@ -536,6 +568,7 @@ class RadarPipeline:
                 plan=plan,
                 stats=plan.stats,
             )
+            timers.stop("render", started)
             self._append_render_tick_event(scene_with_trails, output)
             return output
 
@@ -634,21 +667,32 @@ class RadarPipeline:
         reason: str = "OK",
         is_fallback: bool = False,
     ) -> RenderOutput:
-        tracks_by_source = self.ingest_observations(observations)
-        scene, fused_tracks, clusters = self.fusion_plugin.fuse(
-            tracks_by_source,
-            now=self._clock.now(),
-            truth_state=truth_state,
-            reason=reason,
-            is_fallback=is_fallback,
-        )
-        if self.fusion_config.enabled:
-            self._append_fusion_events(
-                scene_truth_state=truth_state,
-                fused_tracks=fused_tracks,
-                clusters=clusters,
+        timers = self.stage_timers
+        frame_start = timers.begin_frame()
+        try:
+            started = timers.start()
+            tracks_by_source = self.ingest_observations(observations)
+            timers.stop("ingest", started)
+            started = timers.start()
+            scene, fused_tracks, clusters = self.fusion_plugin.fuse(
+                tracks_by_source,
+                now=self._clock.now(),
+                truth_state=truth_state,
+                reason=reason,
+                is_fallback=is_fallback,
             )
-        return self.render_scene(scene, view_state=view_state)
+            timers.stop("fusion", started)
+            if self.fusion_config.enabled:
+                started = timers.start()
+                self._append_fusion_events(
+                    scene_truth_state=truth_state,
+                    fused_tracks=fused_tracks,
+                    clusters=clusters,
+                )
+                timers.stop("fusion_events", started)
+            return self._render_scene(scene, view_state=view_state)
+        finally:
+            timers.end_frame(frame_start)
 
     def snapshot_metrics(self) -> PerformanceMetrics:
         queue_depth = 0
@@ -663,6 +707,7 @@ class RadarPipeline:
             fusion_rebuilds=int(self._perf_fusion_rebuilds),
             situation_events=int(self._perf_situation_events),
             targets_count=int(self._perf_targets_count),
+            stages=self.stage_timers.snapshot(),
         )
 
     def _append_fusion_events(
@@ -675,75 +720,71 @@ class RadarPipeline:
         if self.event_store is None:
             return
         truth_state = self._normalize_truth_state(scene_truth_state)
-        current_cluster_signatures: set[tuple[object, ...]] = set()
+        new_event = self.event_store.new_event
+        events = []
+        current_cluster_digests: set[int] = set()
         for cluster in clusters:
-            signature = (
-                tuple(f"{contributor.source_id}:{contributor.source_track_id}" for contributor in cluster.contributors),
-                int(cluster.support_ok),
-                round(float(cluster.spread_pos), 2),
-            )
-            current_cluster_signatures.add(signature)
-            if signature in self._last_cluster_signatures:
+            digest = _cluster_digest(cluster)
+            current_cluster_digests.add(digest)
+            if digest in self._last_cluster_digests:
                 continue
-            self.event_store.append_new(
-                subsystem="FUSION",
-                event_type="FUSION_CLUSTER_BUILT",
-                payload={
-                    "cluster_size": len(cluster.contributors),
-                    "sources": sorted({contributor.source_id for contributor in cluster.contributors}),
-                    "spread": float(cluster.spread_pos),
-                    "support_ok": bool(cluster.support_ok),
-                },
-                truth_state=truth_state,
-                reason="CLUSTER_BUILT",
+            events.append(
+                new_event(
+                    subsystem="FUSION",
+                    event_type="FUSION_CLUSTER_BUILT",
+                    payload={
+                        "cluster_size": len(cluster.contributors),
+                        "sources": sorted({contributor.source_id for contributor in cluster.contributors}),
+                        "spread": float(cluster.spread_pos),
+                        "support_ok": bool(cluster.support_ok),
+                    },
+                    truth_state=truth_state,
+                    reason="CLUSTER_BUILT",
+                )
             )
-        self._last_cluster_signatures = current_cluster_signatures
+        self._last_cluster_digests = current_cluster_digests
 
-        next_signatures: dict[str, tuple[object, ...]] = {}
+        # Updated in place: only changed tracks are rewritten, vanished ones are dropped below.
+        digests = self._last_fused_digests
         for track in fused_tracks:
-            signature = (
-                round(float(track.pos_xy[0]), 2),
-                round(float(track.pos_xy[1]), 2),
-                None if track.vel_xy is None else round(float(track.vel_xy[0]), 2),
-                None if track.vel_xy is None else round(float(track.vel_xy[1]), 2),
-                round(float(track.trust), 3),
-                tuple(sorted(track.flags)),
-                tuple(
-                    sorted(
-                        f"{contributor.source_id}:{contributor.source_track_id}" for contributor in track.contributors
-                    )
-                ),
-            )
-            next_signatures[track.fused_id] = signature
-            if self._last_fused_signatures.get(track.fused_id) == signature:
+            digest = _fused_track_digest(track)
+            if digests.get(track.fused_id) == digest:
                 continue
+            digests[track.fused_id] = digest
             self._perf_fusion_rebuilds += 1
-            self.event_store.append_new(
-                subsystem="FUSION",
-                event_type="FUSED_TRACK_UPDATED",
-                payload={
-                    "fused_id": track.fused_id,
-                    "contributors": [
-                        {
-                            "source_id": contributor.source_id,
-                            "source_track_id": contributor.source_track_id,
-                            "trust": float(contributor.trust),
-                            "quality": float(contributor.quality),
-                            "dt": float(contributor.dt),
-                        }
-                        for contributor in track.contributors
-                    ],
-                    "trust": float(track.trust),
-                    "flags": sorted(track.flags),
-                    "pos": [float(track.pos_xy[0]), float(track.pos_xy[1])],
-                    "vel": (None if track.vel_xy is None else [float(track.vel_xy[0]), float(track.vel_xy[1])]),
-                    "support_ok": len({contributor.source_id for contributor in track.contributors})
-                    >= int(self.fusion_config.min_support),
-                },
-                truth_state=truth_state,
-                reason="TRACK_FUSED",
+            events.append(
+                new_event(
+                    subsystem="FUSION",
+                    event_type="FUSED_TRACK_UPDATED",
+                    payload={
+                        "fused_id": track.fused_id,
+                        "contributors": [
+                            {
+                                "source_id": contributor.source_id,
+                                "source_track_id": contributor.source_track_id,
+                                "trust": float(contributor.trust),
+                                "quality": float(contributor.quality),
+                                "dt": float(contributor.dt),
+                            }
+                            for contributor in track.contributors
+                        ],
+                        "trust": float(track.trust),
+                        "flags": sorted(track.flags),
+                        "pos": [float(track.pos_xy[0]), float(track.pos_xy[1])],
+                        "vel": (None if track.vel_xy is None else [float(track.vel_xy[0]), float(track.vel_xy[1])]),
+                        "support_ok": len({contributor.source_id for contributor in track.contributors})
+                        >= int(self.fusion_config.min_support),
+                    },
+                    truth_state=truth_state,
+                    reason="TRACK_FUSED",
+                )
             )
-        self._last_fused_signatures = next_signatures
+        if len(digests) > len(fused_tracks):
+            live = {track.fused_id for track in fused_tracks}
+            for fused_id in [fused_id for fused_id in digests if fused_id not in live]:
+                del digests[fused_id]
+        if events:
+            self.event_store.append_many(events)
 
     def _apply_alert_selection(self, view_state: RadarViewState, situations: list[Situation]) -> RadarViewState:
         def _severity_rank_local(s: Situation) -> int:
@@ -836,6 +877,8 @@ class RadarPipeline:
                 "adaptive_level": int(self._adaptive_state.level),
                 "effective_frame_budget_ms": float(self._last_effective_policy.frame_budget_ms),
                 "effective_clutter_max": int(self._last_effective_policy.clutter_targets_max),
+                # Stages timed so far in this frame; empty when the frame is not sampled.
+                "stage_ms": self.stage_timers.current_frame(),
             },
             truth_state=truth_state,
             reason=",".join(reasons) if reasons else "OK",
@@ -854,6 +897,32 @@ class RadarPipeline:
         return TruthState.INVALID
 
 
+def _fused_track_digest(track: FusedTrack) -> int:
+    """Hash of the quantised track state (0.01 m, 0.01 m/s, 0.001 trust); equal digest = no event."""
+    vel = track.vel_xy
+    return hash(
+        (
+            round(track.pos_xy[0] * 100.0),
+            round(track.pos_xy[1] * 100.0),
+            None if vel is None else round(vel[0] * 100.0),
+            None if vel is None else round(vel[1] * 100.0),
+            round(track.trust * 1000.0),
+            frozenset(track.flags),
+            frozenset((contributor.source_id, contributor.source_track_id) for contributor in track.contributors),
+        )
+    )
+
+
+def _cluster_digest(cluster: FusionCluster) -> int:
+    return hash(
+        (
+            tuple((contributor.source_id, contributor.source_track_id) for contributor in cluster.contributors),
+            bool(cluster.support_ok),
+            round(cluster.spread_pos * 100.0),
+        )
+    )
+
+
 def render_radar_scene(scene: RadarScene, *, pipeline: RadarPipeline | None = None) -> RenderOutput:
     active = pipeline or RadarPipeline()
     return active.render_scene(scene)
@@ -0,0 +1,458 @@
+"""Host for several independent RadarPipeline sessions on a pool of worker processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import struct
+import time
+import traceback
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict, dataclass, field
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from statistics import quantiles
+from typing import Any
+
+from .event_store import EventStore
+from .radar_clock import ReplayClock
+from .radar_ingestion import Observation
+from .radar_pipeline import RadarPipeline, RadarRenderConfig
+
+# One observation row in a session's shared-memory scene buffer:
+# source index, track index, t, x, y, vx, vy, quality, err_radius, flags (bit0 vel, bit1 err_radius).
+_ROW = struct.Struct("<IId6dB")
+_HAS_VEL = 1
+_HAS_ERR = 2
+
+
+class RadarPipelineHostError(RuntimeError):
+    pass
+
+
+class RadarPipelineStepError(RadarPipelineHostError):
+    """Some sessions of a `step()` failed; `results` holds the sessions that rendered normally."""
+
+    def __init__(self, errors: Mapping[str, str], results: Mapping[str, HostFrameResult]) -> None:
+        super().__init__("\n".join(f"session {sid} failed:\n{error}" for sid, error in errors.items()))
+        self.errors = dict(errors)
+        self.results = dict(results)
+
+
+@dataclass(frozen=True)
+class HostFrameResult:
+    session_id: str
+    backend: str
+    targets_count: int
+    frame_ms: float
+    # Wall time the worker spent on this session's frame (decode + render_observations).
+    worker_ms: float
+    lines: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class HostMetrics:
+    processes: int
+    steps: int
+    frames: int
+    step_avg_ms: float
+    step_p95_ms: float
+    frames_per_s: float
+    # Per-session PerformanceMetrics (without the raw frame-time window) plus avg/max frame ms.
+    sessions: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Per-stage totals over all sessions: count, weighted avg_ms, max of p95_ms/max_ms.
+    stages: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+class _SessionEncoder:
+    """Host side of one session: writes observations into shared memory, interning ids."""
+
+    def __init__(self, session_id: str, capacity: int) -> None:
+        self.session_id = session_id
+        self.capacity = max(1, int(capacity))
+        self.shm = SharedMemory(create=True, size=self.capacity * _ROW.size)
+        self._sources: dict[str, int] = {}
+        self._tracks: dict[str, int] = {}
+
+    def encode(self, observations: Sequence[Observation]) -> tuple[int, list[str], list[str]]:
+        """Write rows 0..n-1; the caller has checked `len(observations) <= capacity`."""
+        new_sources: list[str] = []
+        new_tracks: list[str] = []
+        buf = self.shm.buf
+        for row, obs in enumerate(observations):
+            source_idx = self._sources.get(obs.source_id)
+            if source_idx is None:
+                source_idx = self._sources[obs.source_id] = len(self._sources)
+                new_sources.append(obs.source_id)
+            track_idx = self._tracks.get(obs.track_key)
+            if track_idx is None:
+                track_idx = self._tracks[obs.track_key] = len(self._tracks)
+                new_tracks.append(obs.track_key)
+            vel = obs.vel_xy
+            flags = (_HAS_VEL if vel is not None else 0) | (_HAS_ERR if obs.err_radius is not None else 0)
+            _ROW.pack_into(
+                buf,
+                row * _ROW.size,
+                source_idx,
+                track_idx,
+                float(obs.t),
+                float(obs.pos_xy[0]),
+                float(obs.pos_xy[1]),
+                0.0 if vel is None else float(vel[0]),
+                0.0 if vel is None else float(vel[1]),
+                float(obs.quality),
+                0.0 if obs.err_radius is None else float(obs.err_radius),
+                flags,
+            )
+        return len(observations), new_sources, new_tracks
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+
+class _WorkerSession:
+    """Worker side of one session: its own pipeline, event store and replay clock."""
+
+    def __init__(self, session_id: str, shm_name: str, config: RadarRenderConfig, event_store_maxlen: int) -> None:
+        self.session_id = session_id
+        self.shm = SharedMemory(name=shm_name)
+        self.clock = ReplayClock()
+        self.pipeline = RadarPipeline(config, event_store=EventStore(maxlen=event_store_maxlen), clock=self.clock)
+        self.sources: list[str] = []
+        self.tracks: list[str] = []
+
+    def decode(self, count: int) -> list[Observation]:
+        buf = self.shm.buf
+        sources = self.sources
+        tracks = self.tracks
+        observations: list[Observation] = []
+        for source_idx, track_idx, t, x, y, vx, vy, quality, err, flags in _ROW.iter_unpack(buf[: count * _ROW.size]):
+            observations.append(
+                Observation(
+                    source_id=sources[source_idx],
+                    t=t,
+                    track_key=tracks[track_idx],
+                    pos_xy=(x, y),
+                    vel_xy=(vx, vy) if flags & _HAS_VEL else None,
+                    quality=quality,
+                    err_radius=err if flags & _HAS_ERR else None,
+                )
+            )
+        return observations
+
+    def learn_ids(self, request: dict[str, Any]) -> None:
+        self.sources.extend(request["new_sources"])
+        self.tracks.extend(request["new_tracks"])
+
+    def frame(self, request: dict[str, Any], *, return_lines: bool) -> HostFrameResult:
+        started = time.perf_counter()
+        observations = self.decode(int(request["count"]))
+        now = request.get("now")
+        if now is None:
+            now = max((obs.t for obs in observations), default=self.clock.now())
+        self.clock.set(float(now))
+        output = self.pipeline.render_observations(
+            observations,
+            truth_state=request.get("truth_state", "OK"),
+            reason=request.get("reason", "OK"),
+        )
+        stats = output.stats
+        return HostFrameResult(
+            session_id=self.session_id,
+            backend=output.backend,
+            targets_count=0 if stats is None else int(stats.targets_count),
+            frame_ms=0.0 if stats is None else float(stats.frame_time_ms),
+            worker_ms=(time.perf_counter() - started) * 1000.0,
+            lines=tuple(output.lines) if return_lines else (),
+        )
+
+    def metrics(self) -> dict[str, Any]:
+        snapshot = self.pipeline.snapshot_metrics()
+        data = asdict(snapshot)
+        data.pop("frame_times_ms")
+        data["frames"] = len(snapshot.frame_times_ms)
+        data["avg_frame_ms"] = round(snapshot.avg_frame_ms, 4)
+        data["max_frame_ms"] = round(snapshot.max_frame_ms, 4)
+        data["events"] = len(self.pipeline.event_store.snapshot()) if self.pipeline.event_store is not None else 0
+        return data
+
+    def close(self) -> None:
+        self.pipeline.close()
+        self.shm.close()
+
+
+def _worker_main(
+    conn: Connection,
+    sessions: list[tuple[str, str]],
+    config: RadarRenderConfig,
+    env: dict[str, str],
+    event_store_maxlen: int,
+    return_lines: bool,
+) -> None:
+    os.environ.update(env)
+    hosted: dict[str, _WorkerSession] = {}
+    try:
+        for session_id, shm_name in sessions:
+            hosted[session_id] = _WorkerSession(session_id, shm_name, config, event_store_maxlen)
+        conn.send(("ready", None))
+        while True:
+            kind, body = conn.recv()
+            if kind == "close":
+                break
+            try:
+                if kind == "frame":
+                    reply = _worker_frames(hosted, body, return_lines=return_lines)
+                elif kind == "metrics":
+                    reply = {sid: session.metrics() for sid, session in hosted.items()}
+                else:
+                    raise RadarPipelineHostError(f"unknown worker command: {kind}")
+            except Exception:  # noqa: BLE001 - reported to the host, the worker stays up
+                conn.send(("error", traceback.format_exc()))
+                continue
+            conn.send(("ok", reply))
+    except Exception:  # noqa: BLE001
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        for session in hosted.values():
+            session.close()
+        conn.close()
+
+
+def _worker_frames(
+    hosted: Mapping[str, _WorkerSession], batch: Mapping[str, dict[str, Any]], *, return_lines: bool
+) -> dict[str, dict[str, Any]]:
+    # The host has already interned every new id of the batch: apply all id deltas before any
+    # frame runs, so a failing session never leaves its own or a later session's id table behind.
+    for session_id, request in batch.items():
+        hosted[session_id].learn_ids(request)
+    results: dict[str, HostFrameResult] = {}
+    errors: dict[str, str] = {}
+    for session_id, request in batch.items():
+        try:
+            results[session_id] = hosted[session_id].frame(request, return_lines=return_lines)
+        except Exception:  # noqa: BLE001 - reported per session, the other sessions still render
+            errors[session_id] = traceback.format_exc()
+    return {"results": results, "errors": errors}
+
+
+class RadarPipelineHost:
+    """
+    Runs one RadarPipeline per session on a pool of `processes` worker processes.
+
+    Sessions are pinned to workers (session i -> worker i % processes), because a pipeline is
+    stateful (fusion, trails, situations, event store). Each session has a shared-memory scene
+    buffer of `capacity` observation rows; per frame only row counts and newly seen
+    source/track ids cross the pipe. `step()` hands every worker its sessions' frames at once
+    and waits for all replies, so fusion and rendering of different sessions run on separate
+    cores. Observation `covariance`/`metadata` are not transferred.
+
+        with RadarPipelineHost(["a", "b"], processes=2) as host:
+            results = host.step({"a": observations_a, "b": observations_b})
+            metrics = host.metrics()
+    """
+
+    def __init__(
+        self,
+        session_ids: Iterable[str],
+        *,
+        processes: int | None = None,
+        config: RadarRenderConfig | None = None,
+        capacity: int = 4096,
+        env: Mapping[str, str] | None = None,
+        event_store_maxlen: int = 1000,
+        return_lines: bool = False,
+        start_method: str | None = None,
+    ) -> None:
+        self.session_ids = list(dict.fromkeys(str(sid) for sid in session_ids))
+        if not self.session_ids:
+            raise RadarPipelineHostError("at least one session is required")
+        workers = processes if processes is not None else (os.cpu_count() or 1)
+        self.processes = max(1, min(int(workers), len(self.session_ids)))
+        self.config = config or RadarRenderConfig.from_env()
+        self.capacity = max(1, int(capacity))
+        self.env = dict(env or {})
+        self.event_store_maxlen = max(1, int(event_store_maxlen))
+        self.return_lines = bool(return_lines)
+        self._ctx = multiprocessing.get_context(start_method)
+        self._encoders: dict[str, _SessionEncoder] = {}
+        self._worker_of: dict[str, int] = {}
+        self._conns: list[Connection] = []
+        self._procs: list[Any] = []
+        self._step_ms: deque[float] = deque(maxlen=4096)
+        self._frames = 0
+        self._busy_s = 0.0
+        self._started = False
+
+    def __enter__(self) -> "RadarPipelineHost":
+        self.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        assignments: list[list[tuple[str, str]]] = [[] for _ in range(self.processes)]
+        try:
+            for index, session_id in enumerate(self.session_ids):
+                encoder = self._encoders[session_id] = _SessionEncoder(session_id, self.capacity)
+                worker = index % self.processes
+                self._worker_of[session_id] = worker
+                assignments[worker].append((session_id, encoder.shm.name))
+            for worker, sessions in enumerate(assignments):
+                parent, child = self._ctx.Pipe()
+                proc = self._ctx.Process(
+                    target=_worker_main,
+                    args=(child, sessions, self.config, self.env, self.event_store_maxlen, self.return_lines),
+                    name=f"radar-pipeline-host-{worker}",
+                    daemon=True,
+                )
+                proc.start()
+                child.close()
+                self._conns.append(parent)
+                self._procs.append(proc)
+            for conn in self._conns:
+                self._receive(conn)
+        except Exception:
+            self.close()
+            raise
+
+    def step(
+        self,
+        frames: Mapping[str, Sequence[Observation]],
+        *,
+        now: float | Mapping[str, float] | None = None,
+        truth_state: str = "OK",
+        reason: str = "OK",
+    ) -> dict[str, HostFrameResult]:
+        """
+        Render one frame for every session in `frames` (sessions left out are not advanced).
+        `now` sets the session clocks (one value or per session); default is the newest obs.t.
+
+        Sessions fail independently: if some frames raise, RadarPipelineStepError carries their
+        tracebacks and the results of the sessions that rendered; failed sessions stay usable.
+        """
+        if not self._started:
+            self.start()
+        started = time.perf_counter()
+        # Validate the whole step first: encoding interns ids the worker must receive.
+        for session_id, observations in frames.items():
+            encoder = self._encoders.get(session_id)
+            if encoder is None:
+                raise RadarPipelineHostError(f"unknown session: {session_id}")
+            if len(observations) > encoder.capacity:
+                raise RadarPipelineHostError(
+                    f"session {session_id}: {len(observations)} observations exceed capacity {encoder.capacity}"
+                )
+        batches: dict[int, dict[str, dict[str, Any]]] = {}
+        for session_id, observations in frames.items():
+            count, new_sources, new_tracks = self._encoders[session_id].encode(observations)
+            session_now = now.get(session_id) if isinstance(now, Mapping) else now
+            batches.setdefault(self._worker_of[session_id], {})[session_id] = {
+                "count": count,
+                "new_sources": new_sources,
+                "new_tracks": new_tracks,
+                "now": session_now,
+                "truth_state": truth_state,
+                "reason": reason,
+            }
+        for worker, batch in batches.items():
+            self._conns[worker].send(("frame", batch))
+        results: dict[str, HostFrameResult] = {}
+        failed: dict[str, str] = {}
+        errors: list[str] = []
+        for worker in batches:
+            try:
+                reply = self._receive(self._conns[worker])
+            except RadarPipelineHostError as exc:
+                errors.append(str(exc))
+                continue
+            results.update(reply["results"])
+            failed.update(reply["errors"])
+        elapsed = time.perf_counter() - started
+        if errors:
+            raise RadarPipelineHostError("\n".join(errors))
+        self._step_ms.append(elapsed * 1000.0)
+        self._busy_s += elapsed
+        self._frames += len(results)
+        if failed:
+            raise RadarPipelineStepError(failed, results)
+        return results
+
+    def metrics(self) -> HostMetrics:
+        sessions: dict[str, dict[str, Any]] = {}
+        if self._started:
+            for conn in self._conns:
+                conn.send(("metrics", None))
+            for conn in self._conns:
+                sessions.update(self._receive(conn))
+        step_ms = list(self._step_ms)
+        if len(step_ms) >= 2:
+            p95 = quantiles(step_ms, n=100, method="inclusive")[94]
+        else:
+            p95 = step_ms[0] if step_ms else 0.0
+        return HostMetrics(
+            processes=self.processes,
+            steps=len(step_ms),
+            frames=self._frames,
+            step_avg_ms=round(sum(step_ms) / len(step_ms), 4) if step_ms else 0.0,
+            step_p95_ms=round(p95, 4),
+            frames_per_s=round(self._frames / self._busy_s, 2) if self._busy_s > 0 else 0.0,
+            sessions={sid: sessions[sid] for sid in self.session_ids if sid in sessions},
+            stages=_aggregate_stages(session.get("stages", {}) for session in sessions.values()),
+        )
+
+    def close(self) -> None:
+        for conn in self._conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5.0)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(timeout=1.0)
+        for conn in self._conns:
+            conn.close()
+        for encoder in self._encoders.values():
+            encoder.close()
+        self._conns.clear()
+        self._procs.clear()
+        self._encoders.clear()
+        self._started = False
+
+    @staticmethod
+    def _receive(conn: Connection) -> Any:
+        try:
+            kind, body = conn.recv()
+        except EOFError as exc:
+            raise RadarPipelineHostError("radar pipeline worker exited") from exc
+        if kind == "error":
+            raise RadarPipelineHostError(f"radar pipeline worker failed:\n{body}")
+        return body
+
+
+def _aggregate_stages(per_session: Iterable[Mapping[str, Mapping[str, float]]]) -> dict[str, dict[str, float]]:
+    totals: dict[str, dict[str, float]] = {}
+    for stages in per_session:
+        for stage, stats in stages.items():
+            count = float(stats.get("count", 0))
+            entry = totals.setdefault(stage, {"count": 0.0, "total_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += count
+            entry["total_ms"] += count * float(stats.get("avg_ms", 0.0))
+            entry["p95_ms"] = max(entry["p95_ms"], float(stats.get("p95_ms", 0.0)))
+            entry["max_ms"] = max(entry["max_ms"], float(stats.get("max_ms", 0.0)))
+    return {
+        stage: {
+            "count": int(entry["count"]),
+            "avg_ms": round(entry["total_ms"] / entry["count"], 4) if entry["count"] else 0.0,
+            "p95_ms": round(entry["p95_ms"], 4),
+            "max_ms": round(entry["max_ms"], 4),
+        }
+        for stage, entry in totals.items()
+    }
@@ -0,0 +1,137 @@
+"""
+Per-stage frame timers for the radar pipeline: bounded ring-buffer histograms and sampling.
+
+Every sampled stage duration is also observed in the process-wide Prometheus histogram
+(`metrics.observe_radar_stage`), which prometheus_client exports thread-safely.
+"""
+
+from __future__ import annotations
+
+import os
+from statistics import quantiles
+from time import perf_counter
+
+from .metrics import count_radar_stage_frame_sampled, observe_radar_stage
+
+
+class StageHistogram:
+    """Durations of one stage: the last `capacity` samples (ring buffer, for percentiles) plus lifetime count/sum/max."""
+
+    __slots__ = ("_ring", "_next", "_filled", "count", "total_ms", "max_ms")
+
+    def __init__(self, capacity: int) -> None:
+        self._ring = [0.0] * max(1, int(capacity))
+        self._next = 0
+        self._filled = False
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        ring = self._ring
+        ring[self._next] = value_ms
+        self._next += 1
+        if self._next == len(ring):
+            self._next = 0
+            self._filled = True
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def window(self) -> list[float]:
+        if self._filled:
+            return self._ring[self._next :] + self._ring[: self._next]
+        return self._ring[: self._next]
+
+    def stats(self) -> dict[str, float]:
+        window = self.window()
+        if not window:
+            return {"count": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        if len(window) < 2:
+            p50 = p95 = p99 = window[0]
+        else:
+            cuts = quantiles(window, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        return {
+            "count": self.count,
+            "avg_ms": round(sum(window) / len(window), 4),
+            "p50_ms": round(p50, 4),
+            "p95_ms": round(p95, 4),
+            "p99_ms": round(p99, 4),
+            "max_ms": round(max(window), 4),
+        }
+
+
+class StageTimers:
+    """
+    Frame-scoped stage timers.
+
+    A frame is either sampled (every stage is timed) or not (start/stop are no-ops), so the
+    cost of instrumentation is paid on `1 / sample_every` of frames only. `sample_every=0`
+    disables timing entirely.
+    """
+
+    def __init__(self, *, capacity: int = 512, sample_every: int = 1) -> None:
+        self.capacity = max(1, int(capacity))
+        self.sample_every = max(0, int(sample_every))
+        self.histograms: dict[str, StageHistogram] = {}
+        self.frames_seen = 0
+        self.frames_sampled = 0
+        self.sampling = False
+        self.in_frame = False
+        self._frame_stages: dict[str, float] = {}
+
+    @classmethod
+    def from_env(cls) -> "StageTimers":
+        enabled = os.getenv("RADAR_STAGE_TIMERS", "1").strip().lower() not in {"0", "false", "no", "off"}
+        try:
+            sample_every = max(0, int(os.getenv("RADAR_STAGE_SAMPLE_EVERY", "1")))
+        except ValueError:
+            sample_every = 1
+        try:
+            capacity = max(1, int(os.getenv("RADAR_STAGE_WINDOW", "512")))
+        except ValueError:
+            capacity = 512
+        return cls(capacity=capacity, sample_every=sample_every if enabled else 0)
+
+    def begin_frame(self) -> float:
+        """Open a frame; returns its start time if the frame is sampled, else 0.0."""
+        self.in_frame = True
+        self.frames_seen += 1
+        self.sampling = bool(self.sample_every) and self.frames_seen % self.sample_every == 0
+        if not self.sampling:
+            return 0.0
+        self.frames_sampled += 1
+        count_radar_stage_frame_sampled()
+        self._frame_stages = {}
+        return perf_counter()
+
+    def end_frame(self, started: float) -> None:
+        if started:
+            self.stop("frame", started)
+        self.in_frame = False
+        self.sampling = False
+
+    def start(self) -> float:
+        return perf_counter() if self.sampling else 0.0
+
+    def stop(self, stage: str, started: float) -> None:
+        if not started:
+            return
+        value_ms = (perf_counter() - started) * 1000.0
+        self._frame_stages[stage] = self._frame_stages.get(stage, 0.0) + value_ms
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = StageHistogram(self.capacity)
+        histogram.record(value_ms)
+        observe_radar_stage(stage, value_ms)
+
+    def current_frame(self) -> dict[str, float]:
+        """Stage durations recorded so far in the current sampled frame (empty if not sampled)."""
+        if not self.sampling:
+            return {}
+        return {stage: round(value, 4) for stage, value in self._frame_stages.items()}
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        return {stage: histogram.stats() for stage, histogram in self.histograms.items()}
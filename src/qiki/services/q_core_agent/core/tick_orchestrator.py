@@ -46,6 +46,14 @@ class TickOrchestrator:
         logger.info("--- Async Tick Start ---", extra={"tick_id": self.agent.tick_id})
 
         try:
+            # Phase 0: Fetch — grpc.aio провайдер собирает сенсоры/радар/BIOS конкурентно,
+            # дальше синхронные вызовы провайдера не ходят в сеть и не блокируют loop.
+            fetch_start = time.time()
+            prefetch = getattr(data_provider, "prefetch", None)
+            if prefetch is not None:
+                await prefetch()
+            fetch_duration = time.time() - fetch_start
+
             # Phase 1: Update Context (без FSM из провайдера)
             update_context_start = time.time()
             self.agent._update_context_without_fsm(data_provider)
@@ -86,6 +94,7 @@ class TickOrchestrator:
                     "tick_duration_ms": round(tick_duration * 1000, 2),
                     "errors_count": self.errors_count,
                     "phase_durations_ms": {
+                        "fetch": round(fetch_duration * 1000, 2),
                         "update_context": round(update_context_duration * 1000, 2),
                         "handle_bios": round(handle_bios_duration * 1000, 2),
                         "handle_fsm": round(handle_fsm_duration * 1000, 2),
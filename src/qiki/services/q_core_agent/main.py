@@ -10,6 +10,7 @@ from qiki.services.q_core_agent.core.agent_logger import setup_logging, logger
 from qiki.services.q_core_agent.core.agent import QCoreAgent
 from qiki.services.q_core_agent.core.interfaces import MockDataProvider
 from qiki.services.q_core_agent.core.grpc_data_provider import GrpcDataProvider
+from qiki.services.q_core_agent.core.async_grpc_data_provider import AsyncGrpcDataProvider
 from qiki.services.q_core_agent.core.tick_orchestrator import TickOrchestrator
 from qiki.services.q_core_agent.state.store import create_initialized_store
 from qiki.services.q_core_agent.state.conv import dto_to_protobuf_json
@@ -142,8 +143,19 @@ _MOCK_DATA_PROVIDER = MockDataProvider(
 )
 
 
+def _grpc_data_provider(config: QCoreAgentConfig, *, use_statestore: bool):
+    """StateStore (async) режим по умолчанию берёт grpc.aio провайдер; QIKI_ASYNC_GRPC_PROVIDER=false — legacy."""
+    use_async = os.environ.get("QIKI_ASYNC_GRPC_PROVIDER", "true").lower() == "true"
+    if use_statestore and use_async:
+        return AsyncGrpcDataProvider(config.grpc_server_address)
+    return GrpcDataProvider(config.grpc_server_address)
+
+
 async def run_with_statestore(agent, orchestrator, data_provider, config: QCoreAgentConfig):
     """Async версия основного цикла с StateStore"""
+    connect = getattr(data_provider, "connect", None)
+    if connect is not None:
+        await connect()
     try:
         while True:
             await orchestrator.run_tick_async(data_provider)
@@ -156,7 +168,8 @@ async def run_with_statestore(agent, orchestrator, data_provider, config: QCoreA
             logger.info(f"BIOS: {_safe_model_dump_json(data_provider.get_bios_status())}")
             logger.info(f"FSM: {json.dumps(dto_to_protobuf_json(current_state))}")
             logger.info(f"Proposals: {[_safe_model_dump_json(p) for p in data_provider.get_proposals()]}")
-            logger.info(f"Sensor: {_safe_model_dump_json(data_provider.get_sensor_data())}")
+            # Последний принятый тиком сэмпл: лишнее чтение провайдера съело бы сэмпл ротации.
+            logger.info(f"Sensor: {_safe_model_dump_json(agent.context.latest_sensor_data)}")
 
             await asyncio.sleep(config.tick_interval)
     except KeyboardInterrupt:
@@ -222,7 +235,7 @@ def main():
                     logger.info("Mock run stopped by user.")
         elif args.grpc:
             logger.info("Running in GRPC mode (connecting to Q-Sim Service via gRPC).")
-            data_provider = GrpcDataProvider(config.grpc_server_address)
+            data_provider = _grpc_data_provider(config, use_statestore=use_statestore)
 
             if use_statestore:
                 # Async режим с StateStore
@@ -242,7 +255,7 @@ def main():
                     logger.info("gRPC run stopped by user.")
         else:
             logger.info("Running in GRPC mode (default, no direct Q-Sim import).")
-            data_provider = GrpcDataProvider(config.grpc_server_address)
+            data_provider = _grpc_data_provider(config, use_statestore=use_statestore)
 
             if use_statestore:
                 # Async режим с StateStore
@@ -6,6 +6,7 @@ import os
 import math
 import re
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any
@@ -14,6 +15,8 @@ from uuid import UUID, uuid4
 from qiki.services.q_core_agent.core.agent import QCoreAgent
 from qiki.services.q_core_agent.core.agent_logger import logger, setup_logging
 from qiki.services.q_core_agent.core.grpc_data_provider import GrpcDataProvider
+from qiki.services.q_core_agent.core.intent_classifier import PhraseMatcher, normalize_intent_text
+from qiki.services.q_core_agent.core.metrics import count_snapshot_refresh, observe_intent_latency
 from qiki.shared.config_models import QCoreAgentConfig, load_config
 from qiki.shared.models.core import Proposal, SensorTypeEnum
 from qiki.services.q_core_agent.core.body_structure import FACE_IDS, KNOWN_MOUNT_CLASSES
@@ -640,31 +643,132 @@ def _build_invalid_request_response(*, raw_request_id: str | None, mode: QikiMod
     )
 
 
+_PROTOCOL_QUESTION_RE = re.compile(r"\b(расскажи|что такое|как|почему|можно ли)\b")
+_PROTOCOL_PREFIXES = ("dock", "undock", "стыков", "расстыков", "стыковка", "разстыковка")
+_PROTOCOL_IMPERATIVE_RE = re.compile(r"\b(выполни|начни|сделай|произведи)\b.{0,30}\bстыковк")
+_PROTOCOL_TRIGGERS = ("состыкуйся",)
+_RELEASE_DOCK_TRIGGERS = (
+    "release dock",
+    "undock",
+    "release docking",
+    "отстыков",
+    "расстыков",
+    "отстыковаться",
+    # B4-ru: живые русские формы («отстыкуйся», «отстыкуй нас», «расстыкуйся»)
+    "отстыкуй",
+    "расстыкуй",
+)
+_ATTACH_NEGATION_RE = re.compile(r"\b(не|нельзя|можно ли|почему|зачем)\b")
+_ATTACH_VERBS = (
+    "установи", "установить", "поставь", "смонтируй", "attach", "install",
+    "пристыкуй", "пристыковать", "приладь", "приладить", "воткни", "воткнуть",
+    "закрепи", "закрепить", "подключи", "подключить", "прикрути", "прикрутить",
+    "навесь", "навесить",
+)
+_ATTACH_OBJECTS = ("модул", "сенсор", "датчик", "антенн", "зонд", "научн", "module", "sensor", "antenna", "probe", "science", "rcs")
+_CARGO_LIST_TRIGGERS = (
+    "доложи отсек",
+    "доложи грузовой отсек",
+    "какие модули",
+    "список модулей",
+    "что в отсеке",
+    "cargo list",
+    "list modules",
+)
+_STATION_APPROACH_TRIGGERS = (
+    "approach station",
+    "station approach",
+    "approach target",
+    "station intercept",
+    "approach dock",
+    "сближение со станцией",
+    "сближение со шлюзом",
+    "подход к станции",
+    "подойти к станции",
+    "подход к шлюзу",
+)
+_STATION_HAIL_TRIGGERS = (
+    "hail station",
+    "contact station",
+    "open station channel",
+    "station channel",
+    "station contact",
+    "связь со станцией",
+    "вызвать станцию",
+    "связаться со станцией",
+    "открыть канал станции",
+    "канал связи со станцией",
+)
+_DOCKING_CORRIDOR_TRIGGERS = (
+    "docking corridor",
+    "enter docking corridor",
+    "request docking corridor",
+    "approach docking corridor",
+    "коридор стыковки",
+    "войти в коридор стыковки",
+    "запросить коридор стыковки",
+    "коридор сближения",
+)
+_ATTITUDE_STABILIZE_TRIGGERS = (
+    "stabilize attitude",
+    "attitude hold",
+    "hold attitude",
+    "stabilize orientation",
+    "attitude stabilization",
+    "стабилизировать ориентацию",
+    "стабилизировать курс",
+    "удерживать ориентацию",
+    "стабилизация ориентации",
+)
+_SAFE_OBSERVATION_TRIGGERS = (
+    "safe observation",
+    "stabilize observation",
+    "safe stabilize observation",
+    "safe observation mode",
+    "подготовь безопасную стабилизацию наблюдения",
+    "безопасная стабилизация наблюдения",
+    "стабилизируй наблюдение безопасно",
+    "режим безопасного наблюдения",
+)
+_SLOW_OBSERVATION_TRIGGERS = (
+    "slow observation",
+    "slow observe",
+    "slow scan",
+    "careful observation",
+    "prepare slow observation",
+    "подготовь медленное наблюдение",
+    "медленное наблюдение",
+    "режим медленного наблюдения",
+    "медленный обзор",
+)
+_HOSTILE_ATTACK_TRIGGERS = (
+    "attack object",
+    "attack target",
+    "engage target",
+    "engage hostile",
+    "fire on",
+    "атакуй объект",
+    "атаковать объект",
+    "атакуй цель",
+    "огонь по",
+    "атаковать цель",
+)
+
+
 def _is_protocol_blocked_command(text: str) -> bool:
-    low = " ".join((text or "").strip().lower().split())
+    low = normalize_intent_text(text)
     # Вопрос о стыковке — беседа, не команда (B5-фикс: без ложных блоков)
-    if "?" in low or re.search(r"\b(расскажи|что такое|как|почему|можно ли)\b", low):
+    if "?" in low or _PROTOCOL_QUESTION_RE.search(low):
         return False
-    if low.startswith(("dock", "undock", "стыков", "расстыков", "стыковка", "разстыковка")):
+    if low.startswith(_PROTOCOL_PREFIXES):
         return True
     # Императив стыковки в любом месте фразы («выполни стыковку», «состыкуйся»)
-    return bool(re.search(r"\b(выполни|начни|сделай|произведи)\b.{0,30}\bстыковк", low)) or "состыкуйся" in low
+    return bool(_PROTOCOL_IMPERATIVE_RE.search(low)) or any(trigger in low for trigger in _PROTOCOL_TRIGGERS)
 
 
 def _is_release_dock_command(text: str) -> bool:
-    low = " ".join((text or "").strip().lower().split())
-    triggers = (
-        "release dock",
-        "undock",
-        "release docking",
-        "отстыков",
-        "расстыков",
-        "отстыковаться",
-        # B4-ru: живые русские формы («отстыкуйся», «отстыкуй нас», «расстыкуйся»)
-        "отстыкуй",
-        "расстыкуй",
-    )
-    return any(trigger in low for trigger in triggers)
+    low = normalize_intent_text(text)
+    return any(trigger in low for trigger in _RELEASE_DOCK_TRIGGERS)
 
 
 def _is_attach_module_command(text: str) -> bool:
@@ -674,146 +778,110 @@ def _is_attach_module_command(text: str) -> bool:
     «воткни»…) — фиксированный словарь policy, не LLM (CaMeL цел). Глагол
     БЕЗ объекта установки — не команда (беседа).
     """
-    low = " ".join((text or "").strip().lower().split())
+    low = normalize_intent_text(text)
     # Отрицание/вопрос — беседа, не команда (ревью: кандидат на риторический
     # вопрос запрещён; «не надо…» не должно готовить установку).
-    if "?" in low or re.search(r"\b(не|нельзя|можно ли|почему|зачем)\b", low):
+    if "?" in low or _ATTACH_NEGATION_RE.search(low):
         return False
-    verbs = (
-        "установи", "установить", "поставь", "смонтируй", "attach", "install",
-        "пристыкуй", "пристыковать", "приладь", "приладить", "воткни", "воткнуть",
-        "закрепи", "закрепить", "подключи", "подключить", "прикрути", "прикрутить",
-        "навесь", "навесить",
-    )
-    objects = ("модул", "сенсор", "датчик", "антенн", "зонд", "научн", "module", "sensor", "antenna", "probe", "science", "rcs")
-    return any(verb in low for verb in verbs) and any(obj in low for obj in objects)
+    return any(verb in low for verb in _ATTACH_VERBS) and any(obj in low for obj in _ATTACH_OBJECTS)
 
 
 def _is_cargo_list_command(text: str) -> bool:
-    low = " ".join((text or "").strip().lower().split())
-    triggers = (
-        "доложи отсек",
-        "доложи грузовой отсек",
-        "какие модули",
-        "список модулей",
-        "что в отсеке",
-        "cargo list",
-        "list modules",
-    )
-    return any(trigger in low for trigger in triggers)
+    low = normalize_intent_text(text)
+    return any(trigger in low for trigger in _CARGO_LIST_TRIGGERS)
 
 
 def _is_station_approach_command(text: str) -> bool:
-    low = " ".join((text or "").strip().lower().split())
-    triggers = (
-        "approach station",
-        "station approach",
-        "approach target",
-        "station intercept",
-        "approach dock",
-        "сближение со станцией",
-        "сближение со шлюзом",
-        "подход к станции",
-        "подойти к станции",
-        "подход к шлюзу",
-    )
-    return any(trigger in low for trigger in triggers)
+    low = normalize_intent_text(text)
+    return any(trigger in low for trigger in _STATION_APPROACH_TRIGGERS)
 
 
 def _is_station_hail_command(text: str) -> bool:
-    low = " ".join((text or "").strip().lower().split())
-    triggers = (
-        "hail station",
-        "contact station",
-        "open station channel",
-        "station channel",
-        "station contact",
-        "связь со станцией",
-        "вызвать станцию",
-        "связаться со станцией",
-        "открыть канал станции",
-        "канал связи со станцией",
-    )
-    return any(trigger in low for trigger in triggers)
+    low = normalize_intent_text(text)
+    return any(trigger in low for trigger in _STATION_HAIL_TRIGGERS)
 
 
 def _is_docking_corridor_command(text: str) -> bool:
-    low = " ".join((text or "").strip().lower().split())
-    triggers = (
-        "docking corridor",
-        "enter docking corridor",
-        "request docking corridor",
-        "approach docking corridor",
-        "коридор стыковки",
-        "войти в коридор стыковки",
-        "запросить коридор стыковки",
-        "коридор сближения",
-    )
-    return any(trigger in low for trigger in triggers)
+    low = normalize_intent_text(text)
+    return any(trigger in low for trigger in _DOCKING_CORRIDOR_TRIGGERS)
 
 
 def _is_attitude_stabilize_command(text: str) -> bool:
-    low = " ".join((text or "").strip().lower().split())
-    triggers = (
-        "stabilize attitude",
-        "attitude hold",
-        "hold attitude",
-        "stabilize orientation",
-        "attitude stabilization",
-        "стабилизировать ориентацию",
-        "стабилизировать курс",
-        "удерживать ориентацию",
-        "стабилизация ориентации",
-    )
-    return any(trigger in low for trigger in triggers)
+    low = normalize_intent_text(text)
+    return any(trigger in low for trigger in _ATTITUDE_STABILIZE_TRIGGERS)
 
 
 def _is_safe_observation_command(text: str) -> bool:
-    low = " ".join((text or "").strip().lower().split())
-    triggers = (
-        "safe observation",
-        "stabilize observation",
-        "safe stabilize observation",
-        "safe observation mode",
-        "подготовь безопасную стабилизацию наблюдения",
-        "безопасная стабилизация наблюдения",
-        "стабилизируй наблюдение безопасно",
-        "режим безопасного наблюдения",
-    )
-    return any(trigger in low for trigger in triggers)
+    low = normalize_intent_text(text)
+    return any(trigger in low for trigger in _SAFE_OBSERVATION_TRIGGERS)
 
 
 def _is_slow_observation_command(text: str) -> bool:
-    low = " ".join((text or "").strip().lower().split())
-    triggers = (
-        "slow observation",
-        "slow observe",
-        "slow scan",
-        "careful observation",
-        "prepare slow observation",
-        "подготовь медленное наблюдение",
-        "медленное наблюдение",
-        "режим медленного наблюдения",
-        "медленный обзор",
-    )
-    return any(trigger in low for trigger in triggers)
+    low = normalize_intent_text(text)
+    return any(trigger in low for trigger in _SLOW_OBSERVATION_TRIGGERS)
 
 
 def _is_hostile_attack_command(text: str) -> bool:
-    low = " ".join((text or "").strip().lower().split())
-    triggers = (
-        "attack object",
-        "attack target",
-        "engage target",
-        "engage hostile",
-        "fire on",
-        "атакуй объект",
-        "атаковать объект",
-        "атакуй цель",
-        "огонь по",
-        "атаковать цель",
-    )
-    return any(trigger in low for trigger in triggers)
+    low = normalize_intent_text(text)
+    return any(trigger in low for trigger in _HOSTILE_ATTACK_TRIGGERS)
+
+
+_INTENT_PHRASES = PhraseMatcher(
+    {
+        "slow_observation": _SLOW_OBSERVATION_TRIGGERS,
+        "safe_observation": _SAFE_OBSERVATION_TRIGGERS,
+        "release_dock": _RELEASE_DOCK_TRIGGERS,
+        "cargo_list": _CARGO_LIST_TRIGGERS,
+        "attach_verb": _ATTACH_VERBS,
+        "attach_object": _ATTACH_OBJECTS,
+        "hostile_attack": _HOSTILE_ATTACK_TRIGGERS,
+        "protocol_blocked": _PROTOCOL_TRIGGERS,
+        "station_hail": _STATION_HAIL_TRIGGERS,
+        "docking_corridor": _DOCKING_CORRIDOR_TRIGGERS,
+        "attitude_stabilize": _ATTITUDE_STABILIZE_TRIGGERS,
+        "station_approach": _STATION_APPROACH_TRIGGERS,
+    }
+)
+# Порядок = порядок ветвей диспетчера: первая сработавшая команда побеждает.
+_INTENT_ORDER = (
+    "slow_observation",
+    "safe_observation",
+    "release_dock",
+    "cargo_list",
+    "attach_module",
+    "hostile_attack",
+    "protocol_blocked",
+    "station_hail",
+    "docking_corridor",
+    "attitude_stabilize",
+    "station_approach",
+)
+
+
+@dataclass(frozen=True)
+class _IntentMatch:
+    intent: str | None
+    designator: str | None = None
+
+
+def _classify_intent(text: str) -> _IntentMatch:
+    """Все `_is_*_command` за один проход: одна нормализация и один скомпилированный regex по словарям триггеров.
+
+    Результат совпадает с цепочкой предикатов в порядке диспетчера; `intent=None` — свободный ответ.
+    """
+    low = normalize_intent_text(text)
+    labels = set(_INTENT_PHRASES.labels(low))
+    if "attach_verb" in labels and "attach_object" in labels:
+        if "?" not in low and not _ATTACH_NEGATION_RE.search(low):
+            labels.add("attach_module")
+    if "?" in low or _PROTOCOL_QUESTION_RE.search(low):
+        labels.discard("protocol_blocked")
+    elif low.startswith(_PROTOCOL_PREFIXES) or _PROTOCOL_IMPERATIVE_RE.search(low):
+        labels.add("protocol_blocked")
+    for intent in _INTENT_ORDER:
+        if intent in labels:
+            return _IntentMatch(intent=intent, designator=_extract_target_designator(text))
+    return _IntentMatch(intent=None)
 
 
 def _extract_target_designator(text: str) -> str | None:
@@ -4352,6 +4420,82 @@ async def _refresh_agent_snapshot_async(
     await asyncio.to_thread(_refresh_agent_snapshot, agent=agent, data_provider=data_provider)
 
 
+def _snapshot_max_age_s() -> float:
+    raw = os.getenv("QIKI_INTENTS_SNAPSHOT_MAX_AGE_SEC", "0.5")
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("QIKI_INTENTS_SNAPSHOT_MAX_AGE_SEC invalid=%r, fallback to 0.5", raw)
+        return 0.5
+
+
+def _intents_max_in_flight() -> int:
+    raw = os.getenv("QIKI_INTENTS_MAX_IN_FLIGHT", "8")
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("QIKI_INTENTS_MAX_IN_FLIGHT invalid=%r, fallback to 8", raw)
+        return 8
+
+
+class _AgentSnapshotCache:
+    """Staleness budget + single-flight поверх `_refresh_agent_snapshot_async`.
+
+    Snapshot моложе `max_age_s` переиспользуется; конкурентные запросы, которым
+    нужен refresh, ждут один общий in-flight refresh, а не встают в очередь за
+    lock каждый со своим gRPC+HTTP. lock по-прежнему сериализует мутации
+    agent.context с остальными писателями (fallback-ingest warmup).
+    """
+
+    def __init__(
+        self,
+        *,
+        agent: QCoreAgent,
+        data_provider: GrpcDataProvider,
+        lock: asyncio.Lock | None = None,
+        max_age_s: float = 0.5,
+    ) -> None:
+        self.agent = agent
+        self.data_provider = data_provider
+        self.lock = lock
+        self.max_age_s = float(max_age_s)
+        self._refreshed_mono: float | None = None
+        self._in_flight: asyncio.Future[None] | None = None
+
+    async def refresh(self, *, max_age_s: float | None = None) -> None:
+        """`max_age_s=0` forces a new refresh (still shared with concurrent callers)."""
+        budget = self.max_age_s if max_age_s is None else float(max_age_s)
+        if budget > 0.0 and self._refreshed_mono is not None and time.monotonic() - self._refreshed_mono <= budget:
+            count_snapshot_refresh("fresh")
+            return
+        if self._in_flight is not None and not self._in_flight.done():
+            count_snapshot_refresh("joined")
+            await asyncio.shield(self._in_flight)
+            return
+        count_snapshot_refresh("refreshed")
+        self._in_flight = asyncio.ensure_future(self._refresh())
+        await asyncio.shield(self._in_flight)
+
+    async def _refresh(self) -> None:
+        await _refresh_agent_snapshot_async(agent=self.agent, data_provider=self.data_provider, lock=self.lock)
+        self._refreshed_mono = time.monotonic()
+
+
+@dataclass
+class _IntentTiming:
+    """Per-request latency split for `observe_intent_latency`."""
+
+    intent: str = "free_reply"
+    refresh_s: float = 0.0
+
+    async def refresh(self, awaitable: Any) -> None:
+        started = time.perf_counter()
+        try:
+            await awaitable
+        finally:
+            self.refresh_s += time.perf_counter() - started
+
+
 async def _refresh_agent_snapshot_until_target_track(
     *,
     agent: QCoreAgent,
@@ -4366,6 +4510,7 @@ async def _refresh_agent_snapshot_until_target_track(
     step_s: float = 0.2,
     label_settle_s: float = 1.0,
     lock: asyncio.Lock | None = None,
+    cache: _AgentSnapshotCache | None = None,
 ) -> None:
     """Best-effort warmup for observation commands that need live radar truth."""
     if not target_designator:
@@ -4401,7 +4546,11 @@ async def _refresh_agent_snapshot_until_target_track(
     last_error: Exception | None = None
     while time.monotonic() < deadline:
         try:
-            await _refresh_agent_snapshot_async(agent=agent, data_provider=data_provider, lock=lock)
+            if cache is not None:
+                # Каждый шаг warmup требует нового чтения, но конкурентные операторы делят один refresh.
+                await cache.refresh(max_age_s=0.0)
+            else:
+                await _refresh_agent_snapshot_async(agent=agent, data_provider=data_provider, lock=lock)
             matched_track, selection_source = _select_target_track_for_resume(
                 agent.context.world_snapshot,
                 target_designator=target_designator,
@@ -4636,6 +4785,12 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
     mode = QikiMode(os.getenv("QIKI_MODE", QikiMode.FACTORY.value))
 
     snapshot_lock = asyncio.Lock()
+    snapshot_cache = _AgentSnapshotCache(
+        agent=agent,
+        data_provider=data_provider,
+        lock=snapshot_lock,
+        max_age_s=_snapshot_max_age_s(),
+    )
     latest_observation_objectives: dict[str, dict[str, Any]] = {}
     latest_telemetry_snapshot: dict[str, Any] = {}
 
@@ -4699,7 +4854,26 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
     await nc.subscribe(OPERATOR_ACTIONS, cb=operator_actions_handler)
     await nc.subscribe(SYSTEM_TELEMETRY, cb=telemetry_handler)
 
+    # nats-py awaits the callbacks of one subscription strictly one by one, so `handler` only
+    # hands a request off to its own task: concurrent operators then share one snapshot refresh
+    # (single-flight) instead of queueing behind each other. The semaphore bounds the number of
+    # requests in flight; once it is exhausted the subscription waits (backpressure).
+    intent_slots = asyncio.Semaphore(_intents_max_in_flight())
+    intent_tasks: set[asyncio.Task[None]] = set()
+
+    def intent_done(task: asyncio.Task[None]) -> None:
+        intent_tasks.discard(task)
+        intent_slots.release()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("QIKI intent request failed", exc_info=task.exception())
+
     async def handler(msg) -> None:
+        await intent_slots.acquire()
+        task = asyncio.create_task(handle_intent(msg))
+        intent_tasks.add(task)
+        task.add_done_callback(intent_done)
+
+    async def handle_intent(msg) -> None:
         payload: Any
         try:
             payload = json.loads(msg.data.decode("utf-8"))
@@ -4717,10 +4891,22 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        # Best-effort: refresh context right before answering.
+        timing = _IntentTiming()
+        started = time.perf_counter()
+        try:
+            await dispatch(req, req_version, timing)
+        finally:
+            observe_intent_latency(
+                timing.intent,
+                refresh_s=timing.refresh_s,
+                build_s=time.perf_counter() - started - timing.refresh_s,
+            )
+
+    async def dispatch(req: QikiChatRequestV1, req_version: int, timing: _IntentTiming) -> None:
+        # Best-effort: refresh context right before answering (staleness budget + single-flight).
         # 0.8: блокирующий sync gRPC+HTTP уходит в поток — loop NATS не встаёт.
         try:
-            await _refresh_agent_snapshot_async(agent=agent, data_provider=data_provider, lock=snapshot_lock)
+            await timing.refresh(snapshot_cache.refresh())
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to refresh agent snapshot: %s", exc)
 
@@ -4729,14 +4915,19 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
             telemetry_snapshot=latest_telemetry_snapshot,
         )
 
-        if _is_slow_observation_command(req.input.text):
-            target_designator = _extract_target_designator(req.input.text)
-            await _refresh_agent_snapshot_until_target_track(
-                agent=agent,
-                data_provider=data_provider,
-                target_designator=target_designator,
-                require_fresh_radar=True,
-                lock=snapshot_lock,
+        match = _classify_intent(req.input.text)
+        if match.intent == "slow_observation":
+            timing.intent = match.intent
+            target_designator = match.designator
+            await timing.refresh(
+                _refresh_agent_snapshot_until_target_track(
+                    agent=agent,
+                    data_provider=data_provider,
+                    target_designator=target_designator,
+                    require_fresh_radar=True,
+                    lock=snapshot_lock,
+                    cache=snapshot_cache,
+                )
             )
             reasoning_snapshot = _current_reasoning_snapshot(
                 agent=agent,
@@ -4768,38 +4959,42 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        if _is_safe_observation_command(req.input.text):
-            target_designator = _extract_target_designator(req.input.text)
+        if match.intent == "safe_observation":
+            timing.intent = match.intent
+            target_designator = match.designator
             resumable_objective = _find_resumable_observation_objective(
                 latest_observation_objectives,
                 target_designator=target_designator,
             )
-            await _refresh_agent_snapshot_until_target_track(
-                agent=agent,
-                data_provider=data_provider,
-                target_designator=target_designator,
-                objective_id=(
-                    str(resumable_objective.get("objective_id") or "").strip()
-                    if isinstance(resumable_objective, dict)
-                    else None
-                ),
-                preferred_track_id=(
-                    str(resumable_objective.get("track_id") or "").strip()
-                    if isinstance(resumable_objective, dict)
-                    else None
-                ),
-                preferred_public_track_id=(
-                    str(resumable_objective.get("public_track_id") or "").strip()
-                    if isinstance(resumable_objective, dict)
-                    else None
-                ),
-                previous_track_label=(
-                    str(resumable_objective.get("track_label") or "").strip()
-                    if isinstance(resumable_objective, dict)
-                    else None
-                ),
-                require_fresh_radar=True,
-                lock=snapshot_lock,
+            await timing.refresh(
+                _refresh_agent_snapshot_until_target_track(
+                    agent=agent,
+                    data_provider=data_provider,
+                    target_designator=target_designator,
+                    objective_id=(
+                        str(resumable_objective.get("objective_id") or "").strip()
+                        if isinstance(resumable_objective, dict)
+                        else None
+                    ),
+                    preferred_track_id=(
+                        str(resumable_objective.get("track_id") or "").strip()
+                        if isinstance(resumable_objective, dict)
+                        else None
+                    ),
+                    preferred_public_track_id=(
+                        str(resumable_objective.get("public_track_id") or "").strip()
+                        if isinstance(resumable_objective, dict)
+                        else None
+                    ),
+                    previous_track_label=(
+                        str(resumable_objective.get("track_label") or "").strip()
+                        if isinstance(resumable_objective, dict)
+                        else None
+                    ),
+                    require_fresh_radar=True,
+                    lock=snapshot_lock,
+                    cache=snapshot_cache,
+                )
             )
             reasoning_snapshot = _current_reasoning_snapshot(
                 agent=agent,
@@ -4833,7 +5028,8 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        if _is_release_dock_command(req.input.text):
+        if match.intent == "release_dock":
+            timing.intent = match.intent
             resp = _build_release_dock_response(
                 req=req,
                 mode=mode,
@@ -4842,12 +5038,14 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        if _is_cargo_list_command(req.input.text):
+        if match.intent == "cargo_list":
+            timing.intent = match.intent
             resp = _build_cargo_list_response(req=req, mode=mode)
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        if _is_attach_module_command(req.input.text):
+        if match.intent == "attach_module":
+            timing.intent = match.intent
             resp = _build_attach_module_response(req=req, mode=mode)
             # Срез 4: отказ/переспрос получает человеческое «почему» от провайдера
             # (решение/коды/proposals не меняются — пояснение только данные).
@@ -4855,7 +5053,8 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        if _is_hostile_attack_command(req.input.text):
+        if match.intent == "hostile_attack":
+            timing.intent = match.intent
             resp = _build_hostile_attack_block_response(
                 req=req,
                 mode=mode,
@@ -4865,12 +5064,14 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        if _is_protocol_blocked_command(req.input.text):
+        if match.intent == "protocol_blocked":
+            timing.intent = match.intent
             resp = _build_protocol_block_response(req=req, mode=mode)
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        if _is_station_hail_command(req.input.text):
+        if match.intent == "station_hail":
+            timing.intent = match.intent
             resp = _build_station_hail_response(
                 req=req,
                 mode=mode,
@@ -4879,7 +5080,8 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        if _is_docking_corridor_command(req.input.text):
+        if match.intent == "docking_corridor":
+            timing.intent = match.intent
             resp = _build_docking_corridor_response(
                 req=req,
                 mode=mode,
@@ -4888,7 +5090,8 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        if _is_attitude_stabilize_command(req.input.text):
+        if match.intent == "attitude_stabilize":
+            timing.intent = match.intent
             resp = _build_attitude_stabilize_response(
                 req=req,
                 mode=mode,
@@ -4898,7 +5101,8 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
 
-        if _is_station_approach_command(req.input.text):
+        if match.intent == "station_approach":
+            timing.intent = match.intent
             resp = _build_station_approach_response(
                 req=req,
                 mode=mode,
@@ -4912,6 +5116,7 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
         # Срез В1: беседа видит борт — reasoning_snapshot идёт детерминированной
         # сводкой (_vision_note) в context_note; вынесено в _build_llm_free_reply.
         if llm_dialog_enabled():
+            timing.intent = "llm_free_reply"
             resp = await _build_llm_free_reply(req, mode=mode, reasoning_snapshot=reasoning_snapshot)
             await nc.publish(responses_subject, _encode_chat_response(resp, request_version=req_version))
             return
@@ -4941,8 +5146,12 @@ async def _run_orion_intents_loop(*, agent: QCoreAgent, data_provider: GrpcDataP
     await nc.subscribe(intents_subject, cb=handler)
     logger.info("Subscribed QIKI intents: %s -> %s", intents_subject, responses_subject)
 
-    while True:
-        await asyncio.sleep(3600)
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        for task in list(intent_tasks):
+            task.cancel()
 
 
 async def main_async() -> None:
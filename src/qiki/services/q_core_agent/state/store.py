@@ -4,10 +4,11 @@ Single Source of Truth (SSOT) для FSM состояния в Q-Core проце
 """
 
 import asyncio
-from typing import Optional, List, Any, Dict
+from collections import deque
+from typing import Optional, List, Any, Deque, Dict, Union
 import logging
 import time
-from dataclasses import replace
+from dataclasses import dataclass, replace
 
 from qiki.services.q_core_agent.state.types import FsmSnapshotDTO, initial_snapshot
 
@@ -27,14 +28,159 @@ class StateVersionError(StateStoreError):
     pass
 
 
+SUBSCRIBE_ALL = "all"
+SUBSCRIBE_LATEST = "latest"
+
+
+@dataclass(frozen=True)
+class StateGap:
+    """Маркер пропуска в режиме "all": столько переходов вытеснено из переполненного ящика."""
+
+    missed: int
+    first_missed_version: int
+    last_missed_version: int
+
+
+class _Subscription:
+    """Общая часть ящиков подписчиков: ожидание, счётчики доставки/потерь, лаг по версиям."""
+
+    mode = ""
+
+    def __init__(self, subscriber_id: str) -> None:
+        self.subscriber_id = subscriber_id
+        self._ready = asyncio.Event()
+        self.delivered = 0
+        self.dropped = 0
+        self.last_taken_version = -1
+
+    def qsize(self) -> int:
+        raise NotImplementedError
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def get_nowait(self) -> Any:
+        raise NotImplementedError
+
+    async def get(self) -> Any:
+        while self.empty():
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
+
+    def _taken(self, snap: FsmSnapshotDTO) -> FsmSnapshotDTO:
+        self.delivered += 1
+        self.last_taken_version = snap.version
+        if self.empty():
+            self._ready.clear()
+        return snap
+
+    def _oldest_pending_version(self) -> Optional[int]:
+        raise NotImplementedError
+
+    def lag_versions(self, current_version: int) -> int:
+        """Сколько версий стора подписчик ещё не прочитал (0 — всё прочитано)."""
+        oldest = self._oldest_pending_version()
+        if oldest is None:
+            return 0
+        return max(0, current_version - oldest + 1)
+
+    def stats(self, current_version: int) -> Dict[str, Any]:
+        return {
+            "subscriber_id": self.subscriber_id,
+            "mode": self.mode,
+            "pending": self.qsize(),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "last_taken_version": self.last_taken_version,
+            "lag_versions": self.lag_versions(current_version),
+        }
+
+
+class LatestSnapshotMailbox(_Subscription):
+    """Режим "latest": один слот, новое состояние вытесняет непрочитанное (конфляция)."""
+
+    mode = SUBSCRIBE_LATEST
+
+    def __init__(self, subscriber_id: str) -> None:
+        super().__init__(subscriber_id)
+        self._slot: Optional[FsmSnapshotDTO] = None
+
+    def qsize(self) -> int:
+        return 0 if self._slot is None else 1
+
+    def _oldest_pending_version(self) -> Optional[int]:
+        return None if self._slot is None else self._slot.version
+
+    def put_nowait(self, snap: FsmSnapshotDTO) -> None:
+        if self._slot is not None:
+            self.dropped += 1
+        self._slot = snap
+        self._ready.set()
+
+    def get_nowait(self) -> FsmSnapshotDTO:
+        if self._slot is None:
+            raise asyncio.QueueEmpty
+        snap, self._slot = self._slot, None
+        return self._taken(snap)
+
+
+class TransitionMailbox(_Subscription):
+    """
+    Режим "all": каждый переход по порядку, в пределах `capacity`.
+
+    При переполнении вытесняются самые старые переходы, а перед оставшимися выдаётся
+    `StateGap` — подписчик видит, что и сколько пропустил, а не теряет переходы молча.
+    """
+
+    mode = SUBSCRIBE_ALL
+
+    def __init__(self, subscriber_id: str, capacity: int) -> None:
+        super().__init__(subscriber_id)
+        self.capacity = max(1, int(capacity))
+        self._items: Deque[FsmSnapshotDTO] = deque()
+        self._gap: Optional[StateGap] = None
+
+    def qsize(self) -> int:
+        return len(self._items) + (1 if self._gap is not None else 0)
+
+    def _oldest_pending_version(self) -> Optional[int]:
+        if self._gap is not None:
+            return self._gap.first_missed_version
+        return self._items[0].version if self._items else None
+
+    def put_nowait(self, snap: FsmSnapshotDTO) -> None:
+        if len(self._items) >= self.capacity:
+            evicted = self._items.popleft()
+            self.dropped += 1
+            if self._gap is None:
+                self._gap = StateGap(1, evicted.version, evicted.version)
+            else:
+                self._gap = StateGap(self._gap.missed + 1, self._gap.first_missed_version, evicted.version)
+        self._items.append(snap)
+        self._ready.set()
+
+    def get_nowait(self) -> Union[FsmSnapshotDTO, StateGap]:
+        if self._gap is not None:
+            gap, self._gap = self._gap, None
+            if self.empty():
+                self._ready.clear()
+            return gap
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._taken(self._items.popleft())
+
+
 class AsyncStateStore:
     """
     Async-only StateStore для FSM состояния.
 
     Ключевые принципы:
-    - Только один писатель (FSMHandler)
-    - Множественные читатели (логи, gRPC, CLI)
-    - Pub/Sub через asyncio.Queue для подписчиков
+    - Только один писатель (FSMHandler); запись сериализуется `_lock`
+    - Множественные читатели (логи, gRPC, CLI): чтение без блокировки — снапшот
+      иммутабелен и заменяется одной ссылкой
+    - Pub/Sub: ящик подписчика в режиме "all" (все переходы, с маркером пропуска)
+      или "latest" (только последнее состояние); курсор версий `wait_for_change`
     - Версионирование и защита от дублирования
     - Иммутабельные DTO снапшоты
     """
@@ -42,38 +188,65 @@ class AsyncStateStore:
     def __init__(self, initial_state: Optional[FsmSnapshotDTO] = None):
         self._lock = asyncio.Lock()
         self._snap: Optional[FsmSnapshotDTO] = initial_state
-        self._subscribers: List[asyncio.Queue] = []
+        self._changed = asyncio.Event()
+        self._subscribers: List[Any] = []
         self._subscriber_ids: Dict[int, str] = {}  # для отладки
         self._metrics: Dict[str, Any] = {
             "total_sets": 0,
             "total_gets": 0,
             "version_conflicts": 0,
             "subscriber_count": 0,
+            "dropped_updates": 0,
             "last_update_ts": 0.0,
             "creation_ts": time.time(),
         }
 
+    @property
+    def current(self) -> Optional[FsmSnapshotDTO]:
+        """Текущий снапшот без ожидания и блокировки (для синхронных читателей)."""
+        return self._snap
+
     async def get(self) -> Optional[FsmSnapshotDTO]:
         """
         Получить текущий снапшот состояния.
         Возвращает immutable DTO или None если состояние не инициализировано.
         """
-        async with self._lock:
-            self._metrics["total_gets"] += 1
-            # DTO уже immutable, можно возвращать как есть
-            return self._snap
+        # Без блокировки: DTO immutable, запись меняет ссылку атомарно
+        self._metrics["total_gets"] += 1
+        return self._snap
 
     async def get_with_meta(self) -> tuple[Optional[FsmSnapshotDTO], Dict[str, Any]]:
         """Получить состояние с метаинформацией"""
-        async with self._lock:
-            self._metrics["total_gets"] += 1
-            meta = {
-                "store_metrics": dict(self._metrics),
-                "subscriber_count": len(self._subscribers),
-                "has_state": self._snap is not None,
-                "current_version": self._snap.version if self._snap else -1,
-            }
-            return self._snap, meta
+        snap = self._snap
+        self._metrics["total_gets"] += 1
+        meta = {
+            "store_metrics": dict(self._metrics),
+            "subscriber_count": len(self._subscribers),
+            "has_state": snap is not None,
+            "current_version": snap.version if snap else -1,
+        }
+        return snap, meta
+
+    async def wait_for_change(self, after_version: int, timeout: Optional[float] = None) -> Optional[FsmSnapshotDTO]:
+        """
+        Курсор версий: вернуть снапшот с версией > `after_version`, дождавшись его при необходимости.
+
+        Возвращает сразу, если стор уже впереди курсора; промежуточные версии не выдаются
+        (читатель сам решает, когда прийти за следующей). None — таймаут без изменений.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snap = self._snap
+            if snap is not None and snap.version > after_version:
+                return snap
+            changed = self._changed
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
 
     async def set(self, new_snap: FsmSnapshotDTO, enforce_version: bool = False) -> FsmSnapshotDTO:
         """
@@ -104,12 +277,7 @@ class AsyncStateStore:
                 # Создаём новый снапшот с корректной версией
                 new_snap = replace(new_snap, version=self._snap.version + 1)
 
-            self._snap = new_snap
-            self._metrics["total_sets"] += 1
-            self._metrics["last_update_ts"] = time.time()
-
-            # Уведомляем подписчиков
-            await self._notify_subscribers(new_snap)
+            self._publish(new_snap)
 
             logger.debug(
                 f"StateStore updated: version={new_snap.version}, "
@@ -118,14 +286,39 @@ class AsyncStateStore:
 
             return self._snap
 
-    async def subscribe(self, subscriber_id: str = "unknown") -> asyncio.Queue:
+    def _publish(self, new_snap: FsmSnapshotDTO) -> None:
+        self._snap = new_snap
+        self._metrics["total_sets"] += 1
+        self._metrics["last_update_ts"] = time.time()
+        # Будим ожидающих wait_for_change: каждая запись — новое событие
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        self._notify_subscribers_nowait(new_snap)
+
+    async def subscribe(
+        self,
+        subscriber_id: str = "unknown",
+        mode: str = SUBSCRIBE_ALL,
+        capacity: Optional[int] = None,
+    ) -> _Subscription:
         """
         Подписаться на изменения состояния.
 
+        Args:
+            subscriber_id: Имя подписчика (логи, метрики)
+            mode: SUBSCRIBE_ALL — все переходы (до `capacity`, дальше StateGap),
+                SUBSCRIBE_LATEST — только последнее состояние
+            capacity: Ёмкость ящика в режиме "all" (по умолчанию MAX_QUEUE_SIZE)
+
         Returns:
-            asyncio.Queue с FsmSnapshotDTO объектами при изменениях
+            Ящик с `get()`/`get_nowait()`: FsmSnapshotDTO (и StateGap в режиме "all")
         """
-        queue = asyncio.Queue(maxsize=64)
+        if mode == SUBSCRIBE_LATEST:
+            queue: _Subscription = LatestSnapshotMailbox(subscriber_id)
+        elif mode == SUBSCRIBE_ALL:
+            queue = TransitionMailbox(subscriber_id, MAX_QUEUE_SIZE if capacity is None else capacity)
+        else:
+            raise StateStoreError(f"Неизвестный режим подписки: {mode}")
 
         async with self._lock:
             self._subscribers.append(queue)
@@ -135,16 +328,13 @@ class AsyncStateStore:
 
             # Отправляем текущее состояние новому подписчику
             if self._snap is not None:
-                try:
-                    queue.put_nowait(self._snap)
-                except asyncio.QueueFull:
-                    logger.warning(f"Queue full for new subscriber {subscriber_id}")
+                queue.put_nowait(self._snap)
 
             logger.debug(f"New subscriber: {subscriber_id}, total: {len(self._subscribers)}")
 
         return queue
 
-    async def unsubscribe(self, queue: asyncio.Queue):
+    async def unsubscribe(self, queue: _Subscription):
         """Отписаться от уведомлений"""
         async with self._lock:
             if queue in self._subscribers:
@@ -154,24 +344,30 @@ class AsyncStateStore:
                 self._metrics["subscriber_count"] = len(self._subscribers)
                 logger.debug(f"Unsubscribed: {subscriber_id}, remaining: {len(self._subscribers)}")
 
-    async def _notify_subscribers(self, snap: FsmSnapshotDTO):
-        """Уведомить всех подписчиков о новом состоянии"""
+    def _notify_subscribers_nowait(self, snap: FsmSnapshotDTO):
+        """Уведомить всех подписчиков о новом состоянии (без ожидания: ящики не блокируют)"""
         dead_queues = []
 
         for queue in self._subscribers:
+            dropped_before = getattr(queue, "dropped", 0)
             try:
                 queue.put_nowait(snap)
             except asyncio.QueueFull:
-                # Очередь переполнена - логируем но не блокируем
+                # Внешняя очередь переполнена - логируем но не блокируем
                 queue_id = id(queue)
                 subscriber_id = self._subscriber_ids.get(queue_id, "unknown")
                 logger.warning(f"Subscriber {subscriber_id} queue full, skipping update")
+                self._metrics["dropped_updates"] += 1
             except Exception as e:
                 # Очередь мертва - помечаем для удаления
                 queue_id = id(queue)
                 subscriber_id = self._subscriber_ids.get(queue_id, "unknown")
                 logger.warning(f"Dead subscriber {subscriber_id}: {e}")
                 dead_queues.append(queue)
+            else:
+                dropped = getattr(queue, "dropped", 0)
+                if isinstance(dropped, int) and dropped > dropped_before:
+                    self._metrics["dropped_updates"] += dropped - dropped_before
 
         # Удаляем мертвые очереди
         for dead_queue in dead_queues:
@@ -189,29 +385,28 @@ class AsyncStateStore:
         """Инициализировать начальным состоянием если пусто"""
         async with self._lock:
             if self._snap is None:
-                self._snap = initial_snapshot()
-                self._metrics["total_sets"] += 1
-                self._metrics["last_update_ts"] = time.time()
-
-                # Уведомляем подписчиков
-                await self._notify_subscribers(self._snap)
+                self._publish(initial_snapshot())
 
                 logger.info("StateStore initialized with COLD_START state")
 
             return self._snap
 
     async def get_metrics(self) -> Dict[str, Any]:
-        """Получить метрики работы StateStore"""
-        async with self._lock:
-            uptime = time.time() - self._metrics["creation_ts"]
-            current_state_name = self._snap.state.name if self._snap else "UNINITIALIZED"
-            return {
-                **self._metrics,
-                "uptime_seconds": uptime,
-                "current_version": self._snap.version if self._snap else -1,
-                "current_state": current_state_name,
-                "active_subscribers": len(self._subscribers),
-            }
+        """Получить метрики работы StateStore (включая лаг и потери по каждому подписчику)"""
+        snap = self._snap
+        uptime = time.time() - self._metrics["creation_ts"]
+        current_state_name = snap.state.name if snap else "UNINITIALIZED"
+        current_version = snap.version if snap else -1
+        return {
+            **self._metrics,
+            "uptime_seconds": uptime,
+            "current_version": current_version,
+            "current_state": current_state_name,
+            "active_subscribers": len(self._subscribers),
+            "subscribers": [
+                queue.stats(current_version) for queue in self._subscribers if isinstance(queue, _Subscription)
+            ],
+        }
 
     async def health_check(self) -> Dict[str, Any]:
         """Проверка здоровья StateStore"""
@@ -227,6 +422,9 @@ class AsyncStateStore:
         if len(self._subscribers) > 100:
             health["issues"].append("Много подписчиков, возможна утечка")
 
+        if metrics["dropped_updates"]:
+            health["issues"].append("Подписчики не успевают читать переходы (есть вытесненные обновления)")
+
         if self._snap is None:
             health["healthy"] = False
             health["issues"].append("StateStore не инициализирован")
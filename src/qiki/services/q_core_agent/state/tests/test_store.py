@@ -8,7 +8,10 @@ import asyncio
 from unittest.mock import Mock
 
 from qiki.services.q_core_agent.state.store import (
+    SUBSCRIBE_ALL,
+    SUBSCRIBE_LATEST,
     AsyncStateStore,
+    StateGap,
     StateStoreError,
     StateVersionError,
     create_initialized_store,
@@ -213,6 +216,72 @@ class TestAsyncStateStorePubSub:
         # После очистки мёртвых очередей активных подписчиков должно быть меньше
 
 
+class TestAsyncStateStoreSubscriptionModes:
+    """Тесты режимов подписки и курсора версий"""
+
+    @pytest.mark.asyncio
+    async def test_latest_mode_conflates_to_last_state(self, empty_store):
+        """Медленный подписчик "latest" получает только последнее состояние"""
+        mailbox = await empty_store.subscribe("latest_test", mode=SUBSCRIBE_LATEST)
+        for i in range(5):
+            await empty_store.set(FsmSnapshotDTO(version=i + 1, state=FsmState.IDLE, reason=f"L_{i}"))
+
+        received = await asyncio.wait_for(mailbox.get(), timeout=1.0)
+        assert received.version == 5
+        assert mailbox.empty()
+
+        stats = (await empty_store.get_metrics())["subscribers"][0]
+        assert stats["mode"] == SUBSCRIBE_LATEST
+        assert stats["dropped"] == 4
+        assert stats["lag_versions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_all_mode_reports_gap_before_retained_transitions(self, empty_store):
+        """Переполнение в режиме "all" не молчит: сначала StateGap, затем оставшиеся переходы"""
+        mailbox = await empty_store.subscribe("all_test", mode=SUBSCRIBE_ALL, capacity=3)
+        for i in range(6):
+            await empty_store.set(FsmSnapshotDTO(version=i + 1, state=FsmState.IDLE, reason=f"A_{i}"))
+
+        metrics = await empty_store.get_metrics()
+        assert metrics["dropped_updates"] == 3
+        assert metrics["subscribers"][0]["lag_versions"] == 6
+
+        gap = mailbox.get_nowait()
+        assert gap == StateGap(missed=3, first_missed_version=1, last_missed_version=3)
+        assert [(await mailbox.get()).version for _ in range(3)] == [4, 5, 6]
+        assert mailbox.empty()
+        assert (await empty_store.health_check())["issues"]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change_is_a_version_cursor(self, empty_store):
+        """wait_for_change возвращает первое состояние новее курсора"""
+        assert await empty_store.wait_for_change(-1, timeout=0.01) is None
+
+        waiter = asyncio.create_task(empty_store.wait_for_change(-1))
+        await asyncio.sleep(0)
+        await empty_store.set(FsmSnapshotDTO(version=1, state=FsmState.IDLE, reason="W_1"))
+        first = await asyncio.wait_for(waiter, timeout=1.0)
+        assert first.version == 1
+
+        await empty_store.set(FsmSnapshotDTO(version=2, state=FsmState.IDLE, reason="W_2"))
+        # Стор уже впереди курсора: ответ без ожидания
+        assert (await empty_store.wait_for_change(first.version, timeout=0)).version == 2
+        assert await empty_store.wait_for_change(2, timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_writer_lock(self, initialized_store):
+        """Чтение снапшота не блокируется удержанием lock писателем"""
+        async with initialized_store._lock:
+            snap = await asyncio.wait_for(initialized_store.get(), timeout=0.1)
+            assert snap is initialized_store.current
+            assert (await asyncio.wait_for(initialized_store.get_metrics(), timeout=0.1))["current_version"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_subscription_mode_rejected(self, empty_store):
+        with pytest.raises(StateStoreError):
+            await empty_store.subscribe("bad_mode", mode="sometimes")
+
+
 class TestAsyncStateStoreConcurrency:
     """Тесты конкурентного доступа к StateStore"""
 
@@ -0,0 +1,159 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import grpc
+import pytest
+
+from generated.q_sim_api_pb2 import GetRadarFrameResponse, GetSensorDataResponse
+from qiki.services.q_core_agent.core import bios_http_client
+from qiki.services.q_core_agent.core.async_grpc_data_provider import AsyncGrpcDataProvider
+from qiki.services.q_core_agent.core.grpc_data_provider import GrpcTimeout
+from qiki.shared.converters.protobuf_pydantic import pydantic_sensor_data_to_proto_sensor_reading
+from qiki.shared.converters.radar_proto_pydantic import model_frame_to_proto
+from qiki.shared.models.core import BiosStatus, SensorData, SensorTypeEnum
+from qiki.shared.models.radar import RadarFrameModel
+
+
+class _DummyRpcError(grpc.RpcError):
+    def __init__(self, status_code: grpc.StatusCode, details: str):
+        super().__init__()
+        self._status_code = status_code
+        self._details = details
+
+    def code(self):
+        return self._status_code
+
+    def __str__(self) -> str:
+        return self._details
+
+
+_RADAR_SENSOR_ID = "00000000-0000-0000-0000-0000000000aa"
+
+
+def _reading(sensor_type: SensorTypeEnum) -> GetSensorDataResponse:
+    sensor_id = _RADAR_SENSOR_ID if sensor_type == SensorTypeEnum.RADAR else str(uuid4())
+    data = SensorData(sensor_id=sensor_id, sensor_type=sensor_type, vector_data=[1.0, 2.0, 3.0])
+    return GetSensorDataResponse(reading=pydantic_sensor_data_to_proto_sensor_reading(data))
+
+
+class _SlowStub:
+    """grpc.aio-like stub: every call sleeps `delay_s` and records the timeout it got."""
+
+    def __init__(self, delay_s: float, rotation=(SensorTypeEnum.LIDAR, SensorTypeEnum.IMU), sensor_error=None):
+        self.delay_s = delay_s
+        self.rotation = list(rotation)
+        self.sensor_error = sensor_error
+        self.timeouts: dict[str, float] = {}
+
+    async def GetSensorData(self, _request, timeout=None):
+        self.timeouts.setdefault("sensor", timeout)
+        await asyncio.sleep(self.delay_s)
+        if self.sensor_error is not None:
+            raise self.sensor_error
+        return _reading(self.rotation.pop(0))
+
+    async def GetRadarFrame(self, _request, timeout=None):
+        self.timeouts["radar"] = timeout
+        await asyncio.sleep(self.delay_s)
+        return GetRadarFrameResponse(frame=model_frame_to_proto(RadarFrameModel(sensor_id=uuid4())))
+
+
+@pytest.fixture
+def slow_bios(monkeypatch: pytest.MonkeyPatch):
+    def _install(delay_s: float) -> None:
+        def _fetch() -> BiosStatus:
+            time.sleep(delay_s)
+            return BiosStatus(bios_version="1.0", firmware_version="1.0", post_results=[])
+
+        monkeypatch.setattr(bios_http_client, "fetch_bios_status", _fetch)
+
+    return _install
+
+
+def test_prefetch_runs_calls_concurrently(slow_bios) -> None:
+    slow_bios(0.2)
+    stub = _SlowStub(delay_s=0.1)
+    provider = AsyncGrpcDataProvider("dummy:50051", aio_stub=stub, radar_deadline_s=1.5)
+
+    started = time.perf_counter()
+    asyncio.run(provider.prefetch())
+    elapsed = time.perf_counter() - started
+
+    # Sum would be 0.1 + 0.1 (rotation) + 0.1 (radar) + 0.2 (bios) = 0.5 s; max is 0.2 s.
+    assert elapsed < 0.4
+    assert stub.timeouts["radar"] == pytest.approx(1.5)
+    assert provider.get_bios_status().bios_version == "1.0"
+    types = [provider.get_sensor_data().sensor_type for _ in range(3)]
+    assert types == [SensorTypeEnum.LIDAR, SensorTypeEnum.IMU, SensorTypeEnum.RADAR]
+    assert provider.get_sensor_data() is None
+    assert set(provider.last_fetch_ms) == {"sensor", "radar", "bios"}
+
+
+def test_rotation_radar_sample_replaces_radar_frame(slow_bios) -> None:
+    slow_bios(0.0)
+    stub = _SlowStub(delay_s=0.0, rotation=(SensorTypeEnum.RADAR,))
+    provider = AsyncGrpcDataProvider("dummy:50051", aio_stub=stub)
+
+    asyncio.run(provider.prefetch())
+
+    assert provider.get_sensor_data().sensor_id == _RADAR_SENSOR_ID
+    assert provider.get_sensor_data() is None
+
+
+def test_bios_deadline_yields_unavailable_status(slow_bios) -> None:
+    slow_bios(0.5)
+    provider = AsyncGrpcDataProvider("dummy:50051", aio_stub=_SlowStub(delay_s=0.0), bios_deadline_s=0.05)
+
+    async def _tick_fetch() -> float:
+        # Timed inside the loop: asyncio.run() itself waits for the abandoned worker thread.
+        started = time.perf_counter()
+        await provider.prefetch()
+        return time.perf_counter() - started
+
+    assert asyncio.run(_tick_fetch()) < 0.4
+    assert provider.get_bios_status().bios_version == "unavailable"
+
+
+def test_sensor_timeout_fails_fast_on_first_read(monkeypatch: pytest.MonkeyPatch, slow_bios) -> None:
+    slow_bios(0.0)
+    monkeypatch.setenv("QIKI_ALLOW_GRPC_FALLBACK", "false")
+    stub = _SlowStub(delay_s=0.0, sensor_error=_DummyRpcError(grpc.StatusCode.DEADLINE_EXCEEDED, "deadline"))
+    provider = AsyncGrpcDataProvider("dummy:50051", aio_stub=stub)
+
+    asyncio.run(provider.prefetch())
+
+    with pytest.raises(GrpcTimeout):
+        provider.get_sensor_data()
+
+
+def test_async_tick_awaits_prefetch_before_context_update(monkeypatch: pytest.MonkeyPatch) -> None:
+    from qiki.services.q_core_agent.core.tick_orchestrator import TickOrchestrator
+
+    calls: list[str] = []
+
+    def _record(name: str):
+        return lambda *_args, **_kwargs: calls.append(name)
+
+    agent = SimpleNamespace(
+        tick_id=0,
+        context=SimpleNamespace(bios_status=None, fsm_state=None, proposals=[]),
+        _update_context_without_fsm=_record("update_context"),
+        _handle_bios=_record("handle_bios"),
+        _evaluate_proposals=_record("evaluate_proposals"),
+        _make_decision=_record("make_decision"),
+        _switch_to_safe_mode=_record("safe_mode"),
+    )
+
+    class _Provider:
+        async def prefetch(self) -> None:
+            calls.append("prefetch")
+
+    monkeypatch.setenv("QIKI_USE_STATESTORE", "true")
+    orchestrator = TickOrchestrator(agent, SimpleNamespace(recovery_delay=0), state_store=object())
+    monkeypatch.setattr(orchestrator, "_handle_fsm_with_state_store", lambda: asyncio.sleep(0))
+
+    asyncio.run(orchestrator.run_tick_async(_Provider()))
+
+    assert calls == ["prefetch", "update_context", "handle_bios", "evaluate_proposals", "make_decision"]
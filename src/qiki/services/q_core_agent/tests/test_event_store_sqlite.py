@@ -227,3 +227,30 @@ def test_eventstore_strict_rejects_invalid_envelope(tmp_path: Path) -> None:
     with pytest.raises(RuntimeError, match="invalid event envelope"):
         store.append(bad_event)
     store.close()
+
+
+def test_append_many_validates_batch_and_persists_rows_in_order(tmp_path: Path) -> None:
+    store = EventStore(backend="sqlite", db_path=str(tmp_path / "batch.sqlite"), flush_ms=5, strict=False)
+    now = time.time()
+    events = [
+        EventStore.new_event(subsystem="FUSION", event_type="BATCH", payload={"i": i}, ts=now + i * 0.001)
+        for i in range(3)
+    ]
+    bad_event = SystemEvent(
+        event_id="bad-batch",
+        ts=now,
+        subsystem="TEST",
+        event_type="BAD",
+        payload=[],  # type: ignore[arg-type]
+        tick_id=None,
+        truth_state=TruthState.OK,
+        reason="",
+    )
+    accepted = store.append_many([events[0], bad_event, events[1], events[2]])
+
+    assert [event.payload["i"] for event in accepted] == [0, 1, 2]
+    assert [event.payload["i"] for event in store.filter(subsystem="FUSION", event_type="BATCH")] == [0, 1, 2]
+    assert store.filter(subsystem="EVENTSTORE", event_type="EVENTSTORE_DROP")
+    rows = store.query(types={"BATCH"}, order="asc")
+    assert [row.payload["i"] for row in rows] == [0, 1, 2]
+    store.close()
@@ -6,7 +6,8 @@ from pathlib import Path
 
 import pytest
 
-from qiki.core.load_harness import run_harness
+from qiki.core import load_harness
+from qiki.core.load_harness import compare_reports, main, run_harness, run_suite
 from qiki.core.load_scenarios import ScenarioConfig, build_scenario
 from qiki.services.q_core_agent.core.event_store import EventStore
 from qiki.services.q_core_agent.core.radar_clock import ReplayClock
@@ -189,3 +190,88 @@ def test_load_strict_failure_still_closes_pipeline(monkeypatch: pytest.MonkeyPat
             )
         )
     assert called["count"] == 1
+
+
+@pytest.mark.load
+def test_load_suite_matrix_reports_stages_and_memory() -> None:
+    report = run_suite(
+        scenarios=("single_target_stable",),
+        target_counts=(1, 5),
+        backends=("unicode", "kitty"),
+        sqlite_modes=(False, True),
+        duration_s=1.0,
+        track_memory=True,
+    )
+    keys = [case["key"] for case in report["cases"]]
+    assert len(keys) == len(set(keys)) == 8
+    assert "single_target_stable/t5/kitty/sqlite-on" in keys
+    for case in report["cases"]:
+        assert case["frames"] > 0
+        assert {"ingest", "fusion", "fusion_events", "plan", "render", "frame"} <= set(case["stages_ms"])
+        assert case["stages_ms"]["frame"]["count"] == case["frames"]
+        assert case["mem_peak_kib"] is not None
+    assert {case["backend"] for case in report["cases"]} == {"unicode", "kitty"}
+    json.dumps(report)
+
+
+def test_load_suite_compare_flags_only_real_regressions() -> None:
+    def _report(avg: float, fusion_avg: float) -> dict:
+        case = {"key": "s/t1/unicode/sqlite-off", "avg_frame_ms": avg, "stages_ms": {"fusion": {"avg_ms": fusion_avg}}}
+        return {"cases": [case, {"key": "only-in-current", "avg_frame_ms": 99.0}]}
+
+    baseline = _report(10.0, 4.0)
+    assert compare_reports(_report(11.0, 4.2), baseline, tolerance_pct=15.0) == []
+    # +0.3 ms is +30%, but below the absolute noise floor.
+    assert compare_reports(_report(10.0, 4.3), baseline, tolerance_pct=15.0, min_delta=0.5) == []
+    regressions = compare_reports(_report(13.0, 6.0), baseline, tolerance_pct=15.0)
+    assert [(r.metric, r.baseline, r.current) for r in regressions] == [
+        ("avg_frame_ms", 10.0, 13.0),
+        ("stage.fusion.avg_ms", 4.0, 6.0),
+    ]
+    assert round(regressions[0].change_pct) == 30
+
+
+@pytest.mark.parametrize("sqlite", ["onn", "yes", "1", ","])
+def test_load_suite_cli_rejects_unknown_sqlite_modes(sqlite: str, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        main(["suite", "--sqlite", sqlite])
+    assert excinfo.value.code == 2
+    assert "sqlite modes must be from: on, off" in capsys.readouterr().err
+
+
+def test_load_suite_cli_exits_nonzero_on_regression(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _report(avg: float) -> dict:
+        case = {
+            "key": "single_target_stable/t1/unicode/sqlite-off",
+            "avg_frame_ms": avg,
+            "p95_frame_ms": 12.0,
+            "max_frame_ms": 20.0,
+            "stages_ms": {"fusion": {"avg_ms": 4.0}},
+        }
+        return {"cases": [case]}
+
+    suite_calls: list[dict] = []
+
+    def _run_suite(**kwargs: object) -> dict:
+        suite_calls.append(kwargs)
+        return _report(10.0)
+
+    # The CLI is checked against constructed reports: real timings would make the verdict flaky.
+    monkeypatch.setattr(load_harness, "run_suite", _run_suite)
+    baseline_path = tmp_path / "baseline.json"
+    argv = ["suite", "--scenarios", "single_target_stable", "--targets", "1", "--sqlite", "off", "--duration", "1"]
+    assert main([*argv, "--output", str(baseline_path)]) == 0
+    assert json.loads(baseline_path.read_text(encoding="utf-8")) == _report(10.0)
+    assert suite_calls[0]["sqlite_modes"] == (False,)
+    assert suite_calls[0]["target_counts"] == (1,)
+
+    capsys.readouterr()
+    assert main([*argv, "--baseline", str(baseline_path), "--min-delta", "0"]) == 0
+    assert json.loads(capsys.readouterr().out)["comparison"]["regressions"] == []
+
+    baseline_path.write_text(json.dumps(_report(5.0)), encoding="utf-8")
+    assert main([*argv, "--baseline", str(baseline_path), "--min-delta", "0"]) == 3
+    report = json.loads(capsys.readouterr().out)
+    assert [r["metric"] for r in report["comparison"]["regressions"]] == ["avg_frame_ms"]
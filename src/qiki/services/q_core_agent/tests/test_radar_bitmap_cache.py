@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from qiki.services.q_core_agent.core.radar_backends.base import RadarPoint, RadarScene  # noqa: E402
+from qiki.services.q_core_agent.core.radar_backends.bitmap_common import (  # noqa: E402
+    BitmapRenderCache,
+    image_to_png_bytes,
+    scene_to_image,
+)
+from qiki.services.q_core_agent.core.radar_backends.kitty_backend import KittyRadarBackend  # noqa: E402
+from qiki.services.q_core_agent.core.radar_view_state import RadarViewState  # noqa: E402
+
+
+def _scene(shift: float = 0.0) -> RadarScene:
+    return RadarScene(
+        ok=True,
+        reason="OK",
+        truth_state="OK",
+        is_fallback=False,
+        points=[
+            RadarPoint(x=10.0 + shift, y=5.0, z=0.0, vr_mps=1.0, metadata={"target_id": "A"}),
+            RadarPoint(x=-20.0, y=-8.0, z=3.0, vr_mps=-1.0, metadata={"target_id": "B"}),
+        ],
+    )
+
+
+def test_cached_frame_matches_uncached_render() -> None:
+    cache = BitmapRenderCache()
+    state = RadarViewState(selected_target_id="A")
+    for shift in (0.0, 7.0, 0.0):
+        fresh = scene_to_image(_scene(shift), view_state=state)
+        cached = scene_to_image(_scene(shift), view_state=state, cache=cache)
+        assert cached.tobytes() == fresh.tobytes()
+    # One static layer, one reused buffer.
+    assert cache.stats.background_builds == 1
+    assert cache.stats.frames == 3
+
+
+def test_unchanged_frame_skips_encoding() -> None:
+    cache = BitmapRenderCache()
+    state = RadarViewState()
+    first = image_to_png_bytes(scene_to_image(_scene(), view_state=state, cache=cache), cache=cache)
+    again = image_to_png_bytes(scene_to_image(_scene(), view_state=state, cache=cache), cache=cache)
+    moved = image_to_png_bytes(scene_to_image(_scene(3.0), view_state=state, cache=cache), cache=cache)
+    assert again == first
+    assert moved != first
+    assert (cache.stats.encodes, cache.stats.encode_skips) == (2, 1)
+
+    no_skip = BitmapRenderCache(skip_unchanged=False)
+    for _ in range(2):
+        image_to_png_bytes(scene_to_image(_scene(), view_state=state, cache=no_skip), cache=no_skip)
+    assert (no_skip.stats.encodes, no_skip.stats.encode_skips) == (2, 0)
+
+
+def test_skip_unchanged_can_be_disabled_via_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RADAR_BITMAP_SKIP_UNCHANGED", "0")
+    assert KittyRadarBackend().render_cache.skip_unchanged is False
+    monkeypatch.delenv("RADAR_BITMAP_SKIP_UNCHANGED")
+    assert KittyRadarBackend().render_cache.skip_unchanged is True
+
+
+def test_bitmap_benchmark_feeds_adaptive_state() -> None:
+    from tools.radar_bitmap_render_bench import run_backend
+
+    report = run_backend("kitty", targets=5, frames=4, static_every=2)
+    assert report["active_backend"] == "kitty"
+    assert report["frames"] == 4
+    assert report["ema_frame_ms"] > 0.0
+    assert report["cache"]["encode_skips"] == 2
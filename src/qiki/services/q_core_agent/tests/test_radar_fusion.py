@@ -176,3 +176,47 @@ def test_pipeline_fusion_enabled_reduces_target_count_and_emits_deduped_events(m
     cluster_events = store.filter(subsystem="FUSION", event_type="FUSION_CLUSTER_BUILT")
     assert len(fused_updates) == 1
     assert len(cluster_events) == 1
+
+
+def test_pipeline_fusion_events_are_dirty_checked_and_batched(monkeypatch) -> None:
+    monkeypatch.setenv("RADAR_FUSION_ENABLED", "1")
+    monkeypatch.setenv("RADAR_FUSION_CONFIRM_FRAMES", "1")
+    monkeypatch.setenv("RADAR_FUSION_COOLDOWN_S", "0")
+    store = EventStore(maxlen=200, enabled=True)
+    batches: list[int] = []
+    append_many = store.append_many
+
+    def _spy(events):
+        events = list(events)
+        batches.append(len(events))
+        return append_many(events)
+
+    store.append_many = _spy  # type: ignore[method-assign]
+    pipeline = RadarPipeline(
+        RadarRenderConfig(renderer="unicode", view="top", fps_max=10, color=False),
+        event_store=store,
+    )
+    observations = [
+        Observation("radar-a", 100.0, "trk-a", (12.0, 5.0), (1.0, 0.0), 0.8),
+        Observation("radar-b", 100.0, "trk-b", (11.8, 5.2), (1.1, 0.0), 0.7),
+    ]
+    pipeline.render_observations(observations)
+    # Sub-quantum jitter (< 0.005 m after fusion) does not produce a new event.
+    jittered = [
+        Observation("radar-a", 100.0, "trk-a", (12.0001, 5.0), (1.0, 0.0), 0.8),
+        Observation("radar-b", 100.0, "trk-b", (11.8, 5.2), (1.1, 0.0), 0.7),
+    ]
+    pipeline.render_observations(jittered)
+    moved = [
+        Observation("radar-a", 100.0, "trk-a", (14.0, 5.0), (1.0, 0.0), 0.8),
+        Observation("radar-b", 100.0, "trk-b", (13.8, 5.2), (1.1, 0.0), 0.7),
+    ]
+    pipeline.render_observations(moved)
+
+    fused_updates = store.filter(subsystem="FUSION", event_type="FUSED_TRACK_UPDATED")
+    assert len(fused_updates) == 2
+    assert fused_updates[-1].payload["pos"][0] > 13.0
+    # One batch per frame with events (first frame: cluster + track), no call for the quiet frame.
+    assert batches[0] == 2
+    assert len(batches) == 2
+    assert set(pipeline._last_fused_digests) == {fused_updates[-1].payload["fused_id"]}
@@ -388,3 +388,33 @@ async def test_fsm_handler_warning_spoof_moves_to_active():
     new_state = await handler.process_fsm_dto(initial_state)
 
     assert new_state.state == FsmState.ACTIVE
+
+
+def test_guard_table_index_matches_full_scan() -> None:
+    from tools.guard_table_bench import evaluate_unindexed, make_rules, make_tracks
+
+    table = GuardTable(schema_version=1, rules=make_rules(60, max_range_m=5000.0))
+    tracks = make_tracks(400, max_range_m=5000.0)
+    expected = [(r.rule_id, r.track_id) for r in evaluate_unindexed(table, tracks)]
+    assert expected
+    assert [(r.rule_id, r.track_id) for r in table.evaluate_tracks(tracks)] == expected
+
+
+def test_guard_table_index_follows_rule_list_changes() -> None:
+    table = _default_guard_table()
+    track = _build_track(range_m=200.0)
+    assert table.evaluate_track(track) == []
+
+    table.rules.append(
+        GuardRule.model_validate(
+            {
+                "id": "UNKNOWN_FAR",
+                "description": "Unknown contact within 500m.",
+                "severity": "warning",
+                "fsm_event": "RADAR_ALERT_UNKNOWN_FAR",
+                "max_range_m": 500.0,
+            }
+        )
+    )
+    assert [r.rule_id for r in table.evaluate_track(track)] == ["UNKNOWN_FAR"]
+    assert table.candidate_rules(_build_track(status=RadarTrackStatusEnum.NEW)) == ()
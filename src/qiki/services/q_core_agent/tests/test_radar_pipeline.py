@@ -375,6 +375,98 @@ def test_render_tick_telemetry_can_be_disabled(monkeypatch: pytest.MonkeyPatch)
     assert not ticks
 
 
+def _stage_sample(name: str, labels: dict[str, str] | None = None) -> float:
+    from prometheus_client import REGISTRY
+
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+def test_stage_timers_feed_snapshot_tick_payload_and_prometheus_registry() -> None:
+    pytest.importorskip("prometheus_client")
+    render_before = _stage_sample("qiki_radar_stage_duration_ms_count", {"stage": "render"})
+    frames_before = _stage_sample("qiki_radar_stage_frames_sampled_total")
+    store = EventStore(maxlen=50, enabled=True)
+    pipeline = RadarPipeline(
+        RadarRenderConfig(renderer="unicode", view="top", fps_max=10, color=False),
+        event_store=store,
+    )
+    for _ in range(3):
+        pipeline.render_scene(RadarScene(ok=True, reason="OK", truth_state="OK", is_fallback=False, points=[]))
+
+    stages = pipeline.snapshot_metrics().stages
+    for stage in ("trails", "plan", "situation", "render", "frame"):
+        assert stages[stage]["count"] == 3
+        assert stages[stage]["p99_ms"] >= stages[stage]["p50_ms"] >= 0.0
+    assert "ingest" not in stages  # render_scene alone skips ingest/fusion
+
+    tick = store.filter(subsystem="RADAR", event_type="RADAR_RENDER_TICK")[-1]
+    assert set(tick.payload["stage_ms"]) >= {"plan", "situation", "render"}
+
+    # Process-wide registry: other pipelines of the test run feed it too, so compare deltas.
+    assert _stage_sample("qiki_radar_stage_duration_ms_count", {"stage": "render"}) - render_before == 3
+    assert _stage_sample("qiki_radar_stage_frames_sampled_total") - frames_before == 3
+
+
+def test_stage_timers_sampling_and_bounded_windows(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RADAR_STAGE_SAMPLE_EVERY", "4")
+    monkeypatch.setenv("RADAR_STAGE_WINDOW", "2")
+    monkeypatch.setenv("RADAR_PERF_WINDOW", "5")
+    store = EventStore(maxlen=100, enabled=True)
+    pipeline = RadarPipeline(
+        RadarRenderConfig(renderer="unicode", view="top", fps_max=10, color=False),
+        event_store=store,
+    )
+    for _ in range(12):
+        pipeline.render_observations([])
+
+    metrics = pipeline.snapshot_metrics()
+    assert len(metrics.frame_times_ms) == 5
+    assert pipeline.stage_timers.frames_sampled == 3
+    assert metrics.stages["ingest"]["count"] == 3
+    assert len(pipeline.stage_timers.histograms["ingest"].window()) == 2
+    ticks = store.filter(subsystem="RADAR", event_type="RADAR_RENDER_TICK")
+    sampled = [tick for tick in ticks if tick.payload["stage_ms"]]
+    assert len(sampled) == 3
+    assert "fusion" in sampled[0].payload["stage_ms"]
+
+
+def test_stage_timers_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RADAR_STAGE_TIMERS", "0")
+    pipeline = RadarPipeline(RadarRenderConfig(renderer="unicode", view="top", fps_max=10, color=False))
+    pipeline.render_observations([])
+    assert pipeline.snapshot_metrics().stages == {}
+
+
+def test_stage_metrics_exporter_binds_once_per_process(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    from qiki.services.q_core_agent.core import metrics
+
+    calls: list[tuple[int, str]] = []
+
+    def fake_start_http_server(port: int, addr: str = "0.0.0.0") -> None:
+        calls.append((port, addr))
+        if port == 1:
+            raise OSError("Address already in use")
+
+    monkeypatch.setattr(metrics, "start_http_server", fake_start_http_server)
+    monkeypatch.setattr(metrics, "_radar_metrics_server_requested", False)
+    monkeypatch.setenv("RADAR_METRICS_PORT", "9109")
+    for _ in range(3):
+        RadarPipeline(RadarRenderConfig(renderer="unicode", view="top", fps_max=10, color=False)).close()
+    assert calls == [(9109, "127.0.0.1")]
+
+    for bad_port, expected_calls in (("not-a-port", 1), ("1", 2)):
+        monkeypatch.setattr(metrics, "_radar_metrics_server_requested", False)
+        monkeypatch.setenv("RADAR_METRICS_PORT", bad_port)
+        caplog.clear()
+        with caplog.at_level("WARNING", logger=metrics.__name__):
+            RadarPipeline(RadarRenderConfig(renderer="unicode", view="top", fps_max=10, color=False))
+            RadarPipeline(RadarRenderConfig(renderer="unicode", view="top", fps_max=10, color=False))
+        assert len(calls) == expected_calls
+        assert len([r for r in caplog.records if "not started" in r.getMessage()]) == 1
+
+
 def test_alert_selection_order_is_severity_then_recency_then_id() -> None:
     pipeline = RadarPipeline(
         RadarRenderConfig(renderer="unicode", view="top", fps_max=10, color=False),
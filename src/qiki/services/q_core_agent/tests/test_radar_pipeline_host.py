@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from qiki.services.q_core_agent.core.event_store import EventStore
+from qiki.services.q_core_agent.core.radar_clock import ReplayClock
+from qiki.services.q_core_agent.core.radar_ingestion import Observation
+from qiki.services.q_core_agent.core.radar_pipeline import RadarPipeline, RadarRenderConfig
+from qiki.services.q_core_agent.core.radar_pipeline_host import (
+    RadarPipelineHost,
+    RadarPipelineHostError,
+    RadarPipelineStepError,
+)
+
+
+def make_frames(frames: int, *, targets: int, phase: float = 0.0) -> list[list[Observation]]:
+    """Two sources per target on slow circles, 0.1 s apart; `phase` makes sessions differ."""
+    result: list[list[Observation]] = []
+    for frame in range(int(frames)):
+        t = 1000.0 + frame * 0.1
+        observations: list[Observation] = []
+        for i in range(int(targets)):
+            angle = phase + i * 0.7 + frame * 0.01
+            radius = 200.0 + 25.0 * i
+            pos = (radius * math.cos(angle), radius * math.sin(angle))
+            for source_id, offset in (("radar", 0.0), ("lidar", 0.4)):
+                observations.append(
+                    Observation(
+                        source_id=source_id,
+                        t=t,
+                        track_key=f"T{i:03d}",
+                        pos_xy=(pos[0] + offset, pos[1] - offset),
+                        vel_xy=(1.0, 0.0),
+                        quality=0.8,
+                    )
+                )
+        result.append(observations)
+    return result
+
+
+def _config() -> RadarRenderConfig:
+    return RadarRenderConfig(renderer="unicode", view="top", fps_max=10, color=False)
+
+
+def test_host_sessions_match_in_process_pipelines() -> None:
+    scenarios = {"alpha": make_frames(5, targets=3), "beta": make_frames(5, targets=6, phase=1.0)}
+    clocks = {sid: ReplayClock() for sid in scenarios}
+    local = {sid: RadarPipeline(_config(), event_store=EventStore(), clock=clocks[sid]) for sid in scenarios}
+
+    with RadarPipelineHost(list(scenarios), processes=2, config=_config(), return_lines=True) as host:
+        for index in range(5):
+            results = host.step({sid: frames[index] for sid, frames in scenarios.items()})
+            for sid, frames in scenarios.items():
+                clocks[sid].set(frames[index][0].t)
+                expected = local[sid].render_observations(frames[index])
+                assert results[sid].session_id == sid
+                assert results[sid].backend == expected.backend
+                assert results[sid].targets_count == expected.stats.targets_count
+                assert results[sid].lines == tuple(expected.lines)
+        metrics = host.metrics()
+
+    assert metrics.processes == 2
+    assert metrics.steps == 5
+    assert metrics.frames == 10
+    assert set(metrics.sessions) == {"alpha", "beta"}
+    assert metrics.sessions["beta"]["frames"] == 5
+    for sid, pipeline in local.items():
+        expected_metrics = pipeline.snapshot_metrics()
+        session = metrics.sessions[sid]
+        assert session["targets_count"] == expected_metrics.targets_count
+        assert session["fusion_rebuilds"] == expected_metrics.fusion_rebuilds
+        assert session["situation_events"] == expected_metrics.situation_events
+        assert session["dropped_events"] == expected_metrics.dropped_events == 0
+        assert session["events"] == len(pipeline.event_store.snapshot())
+        assert set(session["stages"]) == set(expected_metrics.stages)
+    assert metrics.stages["frame"]["count"] == 10
+
+
+def test_host_transfers_optional_fields_and_partial_steps() -> None:
+    observations = [
+        Observation("radar", 10.0, "a", (100.0, 5.0), None, 0.9, err_radius=2.5),
+        Observation("radar", 10.0, "b", (-50.0, 20.0), (1.0, -1.0), 0.7),
+    ]
+    with RadarPipelineHost(["one", "two"], processes=1, config=_config()) as host:
+        results = host.step({"one": observations})
+        assert set(results) == {"one"}
+        assert results["one"].targets_count == 2
+        metrics = host.metrics()
+    assert metrics.sessions["two"]["frames"] == 0
+
+
+def test_host_rejects_unknown_session_and_capacity_overflow() -> None:
+    frame = make_frames(1, targets=3)[0]
+    with RadarPipelineHost(["only"], processes=1, config=_config(), capacity=4) as host:
+        with pytest.raises(RadarPipelineHostError, match="unknown session"):
+            host.step({"other": frame})
+        with pytest.raises(RadarPipelineHostError, match="exceed capacity"):
+            host.step({"only": frame})
+        assert host.step({"only": frame[:4]})["only"].targets_count >= 1
+
+
+def test_failing_session_keeps_its_ids_and_spares_the_healthy_one() -> None:
+    # Frame 1 brings new track ids to both sessions (and fails for "bad"); frame 2 reuses them.
+    scenarios = {"bad": make_frames(3, targets=5), "good": make_frames(3, targets=4, phase=1.0)}
+    scenarios["bad"][0] = make_frames(1, targets=2)[0]
+    scenarios["good"][0] = make_frames(1, targets=2, phase=1.0)[0]
+    clocks = {sid: ReplayClock() for sid in scenarios}
+    local = {sid: RadarPipeline(_config(), event_store=EventStore(), clock=clocks[sid]) for sid in scenarios}
+
+    def expected(sid: str, index: int):
+        clocks[sid].set(scenarios[sid][index][0].t)
+        return local[sid].render_observations(scenarios[sid][index])
+
+    with RadarPipelineHost(list(scenarios), processes=1, config=_config(), return_lines=True) as host:
+        host.step({sid: frames[0] for sid, frames in scenarios.items()})
+        for sid in scenarios:
+            expected(sid, 0)
+
+        with pytest.raises(RadarPipelineStepError) as failure:
+            host.step({sid: frames[1] for sid, frames in scenarios.items()}, now={"bad": "not-a-time"})
+        assert set(failure.value.errors) == {"bad"}
+        assert "not-a-time" in failure.value.errors["bad"]
+        assert failure.value.results["good"].lines == tuple(expected("good", 1).lines)
+
+        results = host.step({sid: frames[2] for sid, frames in scenarios.items()})
+        for sid in scenarios:
+            assert results[sid].lines == tuple(expected(sid, 2).lines)
+        assert host.metrics().frames == 5
@@ -0,0 +1,172 @@
+"""Headless faster-than-real-time batch run of the Q-Sim world with a compact decimated trace.
+
+    python -m qiki.services.q_sim_service.batch --duration 3600 --dt 0.1 --sample-every 1 \\
+        --trace artifacts/qsim_batch.jsonl.gz
+
+Trace format (JSON Lines, gzip if the path ends with .gz): a header object
+`{"kind": "qsim_batch_trace", "schema_version": 1, "dt": ..., "sample_every_s": ..., "fields": [...]}`
+followed by one JSON array per sample, values in `fields` order.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import math
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, Any, Callable
+
+TRACE_SCHEMA_VERSION = 1
+
+# (name, extractor over WorldModel.state_snapshot()); the trace stores values in this order.
+_FIELDS: tuple[tuple[str, Callable[[dict[str, Any]], Any]], ...] = (
+    ("x_m", lambda s: s["position"]["x"]),
+    ("y_m", lambda s: s["position"]["y"]),
+    ("z_m", lambda s: s["position"]["z"]),
+    ("speed_m_s", lambda s: s["speed_m_s"]),
+    ("heading_deg", lambda s: s["heading"]),
+    ("soc_pct", lambda s: s["power"]["soc_pct"]),
+    ("power_in_w", lambda s: s["power"]["power_in_w"]),
+    ("power_out_w", lambda s: s["power"]["power_out_w"]),
+    ("bus_v", lambda s: s["power"]["bus_v"]),
+    ("load_shedding", lambda s: s["power"]["load_shedding"]),
+    ("fuel_pct", lambda s: s["propulsion"]["fuel_pct"]),
+    ("rcs_active", lambda s: s["propulsion"]["rcs"]["active"]),
+    ("temp_core_c", lambda s: s["temp_core_c"]),
+    ("thermal_max_c", lambda s: max((n["temp_c"] for n in s["thermal"]["nodes"]), default=None)),
+    ("thermal_tripped", lambda s: sum(1 for n in s["thermal"]["nodes"] if n["tripped"])),
+    ("cpu_usage_pct", lambda s: s["cpu_usage"]),
+)
+TRACE_FIELDS: tuple[str, ...] = ("sim_time_s",) + tuple(name for name, _ in _FIELDS)
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    duration_s: float
+    dt: float
+    steps: int
+    samples: int
+    sim_s: float
+    wall_s: float
+    sim_s_per_wall_s: float
+    trace_path: str | None = None
+    trace_bytes: int | None = None
+
+
+def sample_state(sim_time_s: float, state: dict[str, Any]) -> list[Any]:
+    """One trace row: sim time plus the TRACE_FIELDS values (floats rounded to 6 places)."""
+    row: list[Any] = [round(float(sim_time_s), 6)]
+    for _, extract in _FIELDS:
+        try:
+            value = extract(state)
+        except (KeyError, TypeError):
+            value = None
+        row.append(round(value, 6) if isinstance(value, float) else value)
+    return row
+
+
+def open_trace(path: str | Path) -> IO[str]:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.suffix == ".gz":
+        return gzip.open(target, "wt", encoding="utf-8", compresslevel=6)
+    return target.open("w", encoding="utf-8")
+
+
+def read_trace(path: str | Path) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Header and samples (as field -> value dicts) of a trace written by `run_batch`."""
+    target = Path(path)
+    opener = gzip.open if target.suffix == ".gz" else open
+    with opener(target, "rt", encoding="utf-8") as fh:
+        header = json.loads(fh.readline())
+        fields = header["fields"]
+        rows = [dict(zip(fields, json.loads(line))) for line in fh if line.strip()]
+    return header, rows
+
+
+def run_batch(
+    world_model: Any,
+    duration_s: float,
+    dt: float,
+    *,
+    sample_every_s: float = 1.0,
+    trace: IO[str] | None = None,
+    on_sample: Callable[[list[Any]], None] | None = None,
+) -> BatchReport:
+    """
+    Step `world_model` for `duration_s` sim-seconds in `dt` steps, back to back, and sample
+    `state_snapshot()` every `sample_every_s` (rounded to whole steps; <= 0 samples every step).
+    If `duration_s` is not a multiple of `dt`, the last step is shortened so the run ends
+    exactly at `duration_s`. Only the world is advanced: no sensor readings, radar frames or
+    publishing.
+    """
+    dt = float(dt)
+    if dt <= 0.0 or not math.isfinite(dt):
+        raise ValueError("dt must be a positive number")
+    steps = max(0, int(math.ceil(float(duration_s) / dt - 1e-9)))
+    last_dt = float(duration_s) - (steps - 1) * dt
+    if abs(last_dt - dt) <= 1e-9 * dt:
+        last_dt = dt
+    every = 1 if sample_every_s <= 0 else max(1, int(round(float(sample_every_s) / dt)))
+    if trace is not None:
+        header = {
+            "kind": "qsim_batch_trace",
+            "schema_version": TRACE_SCHEMA_VERSION,
+            "dt": dt,
+            "sample_every_s": every * dt,
+            "sim_time_start_s": world_model.sim_time_s(),
+            "fields": list(TRACE_FIELDS),
+        }
+        trace.write(json.dumps(header, separators=(",", ":")) + "\n")
+
+    step = world_model.step
+    samples = 0
+    started = time.perf_counter()
+    for index in range(1, steps + 1):
+        step(dt if index != steps else last_dt)
+        if index % every and index != steps:
+            continue
+        row = sample_state(world_model.sim_time_s(), world_model.state_snapshot())
+        samples += 1
+        if trace is not None:
+            trace.write(json.dumps(row, separators=(",", ":")) + "\n")
+        if on_sample is not None:
+            on_sample(row)
+    wall_s = time.perf_counter() - started
+    sim_s = (steps - 1) * dt + last_dt if steps else 0.0
+    return BatchReport(
+        duration_s=float(duration_s),
+        dt=dt,
+        steps=steps,
+        samples=samples,
+        sim_s=round(sim_s, 6),
+        wall_s=round(wall_s, 6),
+        sim_s_per_wall_s=round(sim_s / wall_s, 2) if wall_s > 0 else 0.0,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    from qiki.services.q_sim_service.service import QSimService
+    from qiki.shared.config_models import QSimServiceConfig, load_config
+
+    parser = argparse.ArgumentParser(prog="qsim-batch", description="Headless batch run of the Q-Sim world")
+    parser.add_argument("--duration", type=float, required=True, help="Simulated seconds")
+    parser.add_argument("--dt", type=float, default=None, help="Step, seconds (default: sim_tick_interval)")
+    parser.add_argument("--sample-every", type=float, default=1.0, help="Trace cadence, sim-seconds (default: 1)")
+    parser.add_argument("--trace", default=None, help="Trace output (.jsonl or .jsonl.gz); omit for report only")
+    parser.add_argument("--config", default=str(Path(__file__).resolve().parent / "config.yaml"))
+    args = parser.parse_args(argv)
+
+    service = QSimService(load_config(Path(args.config), QSimServiceConfig))
+    report = service.run_batch(args.duration, args.dt, sample_every_s=args.sample_every, trace_path=args.trace)
+    json.dump(asdict(report), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
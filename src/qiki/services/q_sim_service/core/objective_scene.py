@@ -7,16 +7,21 @@ proximity sensors observe this scene; they do not create the scene truth.
 """
 
 import math
+import random
 from dataclasses import dataclass, field, replace
 from typing import Any, Mapping
 
+import numpy as np
+
 from qiki.shared.models.radar import RadarDetectionModel, RangeBand, TransponderModeEnum
 from qiki.shared.radar_coords import xyz_to_polar
 from qiki.shared.objective_world import (
     ObjectiveWorldField,
     ObjectiveWorldState,
     ObjectiveWorldZone,
+    ObjectTable,
     WorldObjectState,
+    WorldVector3,
     vector3_mapping,
     vector3_norm,
     vector3_sub,
@@ -47,7 +52,7 @@ class ObjectiveScene:
 
     scene_id: str = DEFAULT_SCENE_ID
     sr_threshold_m: float = 5000.0
-    objects: tuple[WorldObjectState, ...] = field(default_factory=tuple)
+    objects: tuple[WorldObjectState, ...] | ObjectTable = field(default_factory=tuple)
     zones: tuple[ObjectiveWorldZone, ...] = field(default_factory=tuple)
     fields: tuple[ObjectiveWorldField, ...] = field(default_factory=tuple)
     sim_time_s: float = 0.0
@@ -132,12 +137,61 @@ class ObjectiveScene:
         )
         return cls(scene_id=DEFAULT_SCENE_ID, sr_threshold_m=threshold, objects=objects, zones=zones, fields=fields)
 
+    @classmethod
+    def synthetic(
+        cls,
+        targets: int,
+        *,
+        seed: int = 0,
+        sr_threshold_m: float = 5000.0,
+        extent_m: float | None = None,
+    ) -> "ObjectiveScene":
+        """Deterministic load-test scene: `targets` radar-visible drifting objects in both range bands.
+
+        Objects are scattered over a `extent_m` (default 3 x SR threshold) sphere around the
+        origin; roughly a quarter of them squawk a visible transponder id.
+        """
+
+        threshold = max(1.0, _finite_float(sr_threshold_m, 5000.0))
+        extent = max(1.0, _finite_float(extent_m, threshold * 3.0))
+        rnd = random.Random(int(seed))
+        objects: list[WorldObjectState] = []
+        for i in range(max(0, int(targets))):
+            object_type = rnd.choice(("SHIP", "DEBRIS", "ASTEROID", "STATION"))
+            squawk = object_type in ("SHIP", "STATION") and rnd.random() < 0.5
+            radius_m = extent * rnd.random() ** (1.0 / 3.0)
+            bearing = rnd.uniform(0.0, 2.0 * math.pi)
+            elevation = math.asin(rnd.uniform(-1.0, 1.0))
+            objects.append(
+                WorldObjectState(
+                    world_object_id=f"OBJ-LOAD-{i:06d}",
+                    object_type=object_type,
+                    position_xyz_m={
+                        "x": radius_m * math.cos(elevation) * math.sin(bearing),
+                        "y": radius_m * math.cos(elevation) * math.cos(bearing),
+                        "z": radius_m * math.sin(elevation),
+                    },
+                    velocity_xyz_m_s=[rnd.uniform(-20.0, 20.0), rnd.uniform(-20.0, 20.0), rnd.uniform(-2.0, 2.0)],
+                    radar_cross_section_dbsm=rnd.uniform(-10.0, 20.0),
+                    transponder_mode="ON" if squawk else "OFF",
+                    visible_transponder_id=f"XPDR-{i:06d}" if squawk else None,
+                    observable_profile={"radar_visible": True},
+                    evidence=("layer=06.objective_world", "synthetic_load_target"),
+                )
+            )
+        return cls(
+            scene_id=f"SCENE-RADAR-LOAD-{int(seed)}",
+            sr_threshold_m=threshold,
+            objects=ObjectTable(objects),
+        )
+
     def step(self, delta_time_s: float) -> None:
         dt = max(0.0, _finite_float(delta_time_s, 0.0))
         if dt <= 0.0:
             return
         self.sim_time_s += dt
-        self.objects = tuple(obj.advance(dt) for obj in self.objects)
+        # Vectorised position update; objects are materialised only when read.
+        self.objects = ObjectTable.of(self.objects).advance(dt)
 
     def _objects_for_threshold(
         self,
@@ -145,7 +199,7 @@ class ObjectiveScene:
         sr_threshold_m: float | None,
         transponder_mode: str | None,
         visible_transponder_id: str | None,
-    ) -> tuple[WorldObjectState, ...]:
+    ) -> tuple[WorldObjectState, ...] | ObjectTable:
         threshold = max(1.0, _finite_float(sr_threshold_m, self.sr_threshold_m))
         if abs(threshold - self.sr_threshold_m) < 1e-9 and transponder_mode is None and visible_transponder_id is None:
             return self.objects
@@ -274,23 +328,92 @@ def build_radar_detections_from_objective_world(
     validate Layer-06 behavior without importing generated protobuf modules.
     QSimService keeps a service-local compatibility wrapper because its SR
     station beacon must still honor q-sim's XPDR runtime settings.
+
+    An ObjectiveWorldState is projected in bulk straight from its ObjectTable
+    (range/bearing/elevation/vr/SNR over arrays), so thousands of contacts per
+    frame stay cheap; a plain mapping goes object by object.
     """
 
+    observer_velocity_xyz_m_s = observer_velocity_xyz_m_s if isinstance(observer_velocity_xyz_m_s, Mapping) else {}
+    sr_threshold = max(1.0, _finite_float(sr_threshold_m, 5000.0))
     if isinstance(scene, ObjectiveWorldState):
-        scene_id = scene.scene_id
-        source_world_snapshot_id = scene.world_snapshot_id
-        objects = [obj.to_mapping(include_hidden_truth=False) for obj in scene.objects]
+        table = scene.object_table()
+        rows = table.observable_rows("radar")
+        targets = [
+            (
+                template.world_object_id,
+                template.transponder_mode,
+                template.visible_transponder_id,
+                template.radar_cross_section_dbsm,
+            )
+            for template in (table.template(row) for row in rows)
+        ]
+        measured = _radar_geometry_from_table(
+            table,
+            rows,
+            [target[3] for target in targets],
+            observer_position_xyz_m=observer_position_xyz_m,
+            observer_velocity_xyz_m_s=observer_velocity_xyz_m_s,
+        )
     elif isinstance(scene, Mapping):
-        scene_id = str(scene.get("scene_id") or "")
-        source_world_snapshot_id = str(scene.get("world_snapshot_id") or "") or None
         raw_objects = scene.get("objects")
         objects = list(raw_objects) if isinstance(raw_objects, list) else []
+        targets, measured = _radar_geometry_from_mappings(
+            objects,
+            observer_position_xyz_m=observer_position_xyz_m,
+            observer_velocity_xyz_m_s=observer_velocity_xyz_m_s,
+        )
     else:
         return []
 
-    observer_velocity_xyz_m_s = observer_velocity_xyz_m_s if isinstance(observer_velocity_xyz_m_s, Mapping) else {}
-    sr_threshold = max(1.0, _finite_float(sr_threshold_m, 5000.0))
-    detections: list[RadarDetectionModel] = []
+    keyed: list[tuple[tuple[int, float, str], RadarDetectionModel]] = []
+    for (world_object_id, mode_value, visible_id, rcs_dbsm), (range_m, bearing_deg, elev_deg, vr_mps, snr_db) in zip(
+        targets, measured
+    ):
+        if range_m <= 0.01:
+            continue
+        range_band = RangeBand.RR_SR if range_m <= sr_threshold else RangeBand.RR_LR
+        mode = _radar_mode_from_value(transponder_mode_override if transponder_mode_override is not None else mode_value)
+        transponder_id = str(visible_id or "") or None
+        if transponder_id_override and world_object_id != "OBJ-STATION-01":
+            transponder_id = str(transponder_id_override)
+        transponder_on = bool(transponder_id and mode in {TransponderModeEnum.ON, TransponderModeEnum.SPOOF})
+        if range_band == RangeBand.RR_LR:
+            transponder_on = False
+            mode = TransponderModeEnum.OFF
+            transponder_id = None
+            id_present = None
+        else:
+            id_present = bool(transponder_id)
+        detection = RadarDetectionModel(
+            range_m=float(range_m),
+            bearing_deg=float(bearing_deg),
+            elev_deg=float(elev_deg),
+            vr_mps=float(vr_mps),
+            snr_db=float(snr_db),
+            rcs_dbsm=float(rcs_dbsm),
+            transponder_on=transponder_on,
+            transponder_mode=mode,
+            transponder_id=transponder_id,
+            range_band=range_band,
+            id_present=id_present,
+        )
+        # RadarDetectionModel is the wire contract (no objective-world lineage fields);
+        # the world object id only fixes the order of equal-range detections.
+        keyed.append(((0 if range_band == RangeBand.RR_LR else 1, detection.range_m, world_object_id), detection))
+    keyed.sort(key=lambda item: item[0])
+    detections = [detection for _, detection in keyed]
+    return detections
+
+
+def _radar_geometry_from_mappings(
+    objects: list[Any],
+    *,
+    observer_position_xyz_m: Mapping[str, Any],
+    observer_velocity_xyz_m_s: Mapping[str, Any],
+) -> tuple[list[tuple[str, Any, Any, float]], list[tuple[float, float, float, float, float]]]:
+    targets: list[tuple[str, Any, Any, float]] = []
+    measured: list[tuple[float, float, float, float, float]] = []
     for obj in objects:
         if not isinstance(obj, Mapping):
             continue
@@ -308,56 +431,49 @@ def build_radar_detections_from_objective_world(
             "z": _finite_float(obj_pos.get("z")) - _finite_float(observer_position_xyz_m.get("z")),
         }
         range_m, bearing_deg, elev_deg = xyz_to_polar(x_m=rel["x"], y_m=rel["y"], z_m=rel["z"])
-        if range_m <= 0.01:
-            continue
         rel_vel = {
             "x": _finite_float(obj_vel.get("x")) - _finite_float(observer_velocity_xyz_m_s.get("x")),
             "y": _finite_float(obj_vel.get("y")) - _finite_float(observer_velocity_xyz_m_s.get("y")),
             "z": _finite_float(obj_vel.get("z")) - _finite_float(observer_velocity_xyz_m_s.get("z")),
         }
         vr_mps = (rel["x"] * rel_vel["x"] + rel["y"] * rel_vel["y"] + rel["z"] * rel_vel["z"]) / max(range_m, 1e-9)
-        range_band = RangeBand.RR_SR if range_m <= sr_threshold else RangeBand.RR_LR
-
-        visible_id = obj.get("visible_transponder_id")
-        mode = _radar_mode_from_value(transponder_mode_override if transponder_mode_override is not None else obj.get("transponder_mode"))
-        transponder_id = str(visible_id or "") or None
-        if transponder_id_override and str(obj.get("world_object_id") or "") != "OBJ-STATION-01":
-            transponder_id = str(transponder_id_override)
-        transponder_on = bool(transponder_id and mode in {TransponderModeEnum.ON, TransponderModeEnum.SPOOF})
-        if range_band == RangeBand.RR_LR:
-            transponder_on = False
-            mode = TransponderModeEnum.OFF
-            transponder_id = None
-            id_present = None
-        else:
-            id_present = bool(transponder_id)
-
         rcs_dbsm = _finite_float(obj.get("radar_cross_section_dbsm"), 0.0)
-        snr_db = max(1.0, 34.0 + (rcs_dbsm * 0.2) - 20.0 * math.log10(max(1.0, range_m) / 100.0))
-        world_object_id = str(obj.get("world_object_id") or "")
-        detections.append(
-            RadarDetectionModel(
-                range_m=float(range_m),
-                bearing_deg=float(bearing_deg),
-                elev_deg=float(elev_deg),
-                vr_mps=float(vr_mps),
-                snr_db=float(snr_db),
-                rcs_dbsm=float(rcs_dbsm),
-                transponder_on=transponder_on,
-                transponder_mode=mode,
-                transponder_id=transponder_id,
-                range_band=range_band,
-                id_present=id_present,
-                world_object_id=world_object_id or None,
-                objective_scene_id=scene_id or None,
-                objective_object_type=str(obj.get("object_type") or "unknown"),
-                source_world_snapshot_id=source_world_snapshot_id,
-                source_path=f"ObjectiveWorldState.objects[{world_object_id}]" if world_object_id else "ObjectiveWorldState.objects",
-                metadata={"objective_world_observation": True, "private_truth_redacted": True},
-            )
+        targets.append(
+            (str(obj.get("world_object_id") or ""), obj.get("transponder_mode"), obj.get("visible_transponder_id"), rcs_dbsm)
         )
-    detections.sort(key=lambda det: (0 if det.range_band == RangeBand.RR_LR else 1, det.range_m, det.world_object_id or ""))
-    return detections
+        measured.append((range_m, bearing_deg, elev_deg, vr_mps, _radar_snr_db(rcs_dbsm, range_m)))
+    return targets, measured
+
+
+def _radar_snr_db(rcs_dbsm: float, range_m: float) -> float:
+    return max(1.0, 34.0 + (rcs_dbsm * 0.2) - 20.0 * math.log10(max(1.0, range_m) / 100.0))
+
+
+def _radar_geometry_from_table(
+    table: ObjectTable,
+    rows: tuple[int, ...],
+    rcs_dbsm: list[float],
+    *,
+    observer_position_xyz_m: Mapping[str, Any],
+    observer_velocity_xyz_m_s: Mapping[str, Any],
+) -> list[tuple[float, float, float, float, float]]:
+    """`(range, bearing, elevation, vr, snr)` per table row seen from the observer (Phase1 polar contract)."""
+
+    origin = WorldVector3.from_value(observer_position_xyz_m)
+    motion = WorldVector3.from_value(observer_velocity_xyz_m_s)
+    picked = np.asarray(rows, dtype=np.intp)
+    rel = table.positions[picked] - np.array([origin.x, origin.y, origin.z])
+    rel_vel = table.velocities[picked] - np.array([motion.x, motion.y, motion.z])
+    x, y, z = rel[:, 0], rel[:, 1], rel[:, 2]
+    horiz = np.sqrt(x * x + y * y)
+    range_m = np.sqrt(x * x + y * y + z * z)
+    bearing_deg = np.degrees(np.arctan2(x, y)) % 360.0
+    elev_deg = np.degrees(np.arctan2(z, np.maximum(horiz, 1e-9)))
+    vr_mps = (rel * rel_vel).sum(axis=1) / np.maximum(range_m, 1e-9)
+    snr_db = np.maximum(
+        1.0, 34.0 + np.asarray(rcs_dbsm, dtype=float) * 0.2 - 20.0 * np.log10(np.maximum(range_m, 1.0) / 100.0)
+    )
+    return list(zip(range_m.tolist(), bearing_deg.tolist(), elev_deg.tolist(), vr_mps.tolist(), snr_db.tolist()))
 
 
 def _radar_mode_from_value(value: TransponderModeEnum | str | int | None) -> TransponderModeEnum:
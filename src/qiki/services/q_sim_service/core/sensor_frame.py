@@ -28,7 +28,11 @@ def build_truthful_sensor_frame(world_model: Any, *, now_ts: float | None = None
     """
 
     now = float(now_ts if now_ts is not None else _world_now(world_model))
-    state = world_model.get_state() if hasattr(world_model, "get_state") else {}
+    if callable(getattr(world_model, "state_snapshot", None)):
+        # Read-only snapshot shared with the other consumers of this tick (no rebuild/copy).
+        state = world_model.state_snapshot()
+    else:
+        state = world_model.get_state() if hasattr(world_model, "get_state") else {}
     state = state if isinstance(state, Mapping) else {}
     sensor_plane = _mapping(_get(state, "sensor_plane"))
     objective_world = _mapping(state.get("objective_world"))
@@ -0,0 +1,38 @@
+"""
+Read-only WorldModel state snapshots
+====================================
+`WorldModel.state_snapshot()` hands one shared state tree to every consumer of a tick
+(sensor data, radar frame, telemetry payload). The top level is a `FrozenDict`: a real
+`dict` (so `isinstance(..., dict)` checks and `json.dumps` keep working) that raises
+`TypeError` on mutation.
+
+The per-plane blocks underneath stay plain dicts/lists and are read-only by contract:
+pydantic validation and serialization take their fast paths only for exact `dict`/`list`,
+and the telemetry payload validates every block on each publish. Callers that need to
+modify the state use `WorldModel.get_state()`, which builds a private copy.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, NoReturn
+
+
+def _read_only(*_args: Any, **_kwargs: Any) -> NoReturn:
+    raise TypeError("WorldModel state snapshot is read-only (use get_state() for a mutable copy)")
+
+
+class FrozenDict(dict):
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
@@ -0,0 +1,121 @@
+"""
+Binary WorldModel checkpoint container.
+
+Layout: fixed header (magic, format version, meta length), UTF-8 JSON meta, zlib-compressed
+JSON field set, HMAC-SHA256 tag over everything before it.
+
+The payload is plain JSON (never code), and a checkpoint is only decoded after its tag checks
+out against the operator's key, so a file dropped into the checkpoint directory by someone
+without the key is rejected before any of it is parsed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import stat
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Mapping
+
+CHECKPOINT_MAGIC = b"QSIMWMCK"
+CHECKPOINT_FORMAT_VERSION = 2
+CHECKPOINT_SUFFIX = ".qsimckpt"
+CHECKPOINT_MIN_KEY_BYTES = 16
+
+_HEADER = struct.Struct("<8sHI")
+_TAG_SIZE = hashlib.sha256().digest_size
+_MAX_PAYLOAD_BYTES = 64 * 1024 * 1024
+
+
+class WorldCheckpointError(ValueError):
+    """Malformed, corrupted, unsigned, foreign or incompatible WorldModel checkpoint."""
+
+
+def encode_checkpoint(meta: Mapping[str, Any], fields: Mapping[str, Any], *, key: bytes) -> bytes:
+    _check_key(key)
+    meta_bytes = _dumps(dict(meta))
+    payload = zlib.compress(_dumps(dict(fields)), 1)
+    body = _HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_FORMAT_VERSION, len(meta_bytes)) + meta_bytes + payload
+    return body + _tag(key, body)
+
+
+def read_checkpoint_meta(data: bytes, *, key: bytes) -> dict[str, Any]:
+    """Verified header + meta only (the payload is not decompressed)."""
+    meta, _ = _split(data, key)
+    return meta
+
+
+def decode_checkpoint(data: bytes, *, key: bytes) -> tuple[dict[str, Any], dict[str, Any]]:
+    meta, payload = _split(data, key)
+    try:
+        inflater = zlib.decompressobj()
+        raw = inflater.decompress(payload, _MAX_PAYLOAD_BYTES)
+        if inflater.unconsumed_tail or not inflater.eof:
+            raise ValueError("payload is truncated or larger than the limit")
+        fields = json.loads(raw.decode("utf-8"))
+    except (ValueError, zlib.error) as exc:
+        raise WorldCheckpointError(f"checkpoint payload is unreadable: {exc}") from exc
+    if not isinstance(fields, dict):
+        raise WorldCheckpointError("checkpoint payload is not a field mapping")
+    return meta, fields
+
+
+def ensure_private_dir(path: Path) -> Path:
+    """
+    Create `path` (0700) if needed and check that only the current user can write into it.
+
+    Raises WorldCheckpointError for a symlink, a non-directory, a foreign owner or group/world
+    permission bits.
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise WorldCheckpointError(f"checkpoint dir {path} is not a directory")
+    if st.st_uid != os.getuid():
+        raise WorldCheckpointError(f"checkpoint dir {path} is not owned by the current user")
+    if st.st_mode & 0o077:
+        raise WorldCheckpointError(f"checkpoint dir {path} is accessible to other users (mode {st.st_mode & 0o777:o})")
+    return path
+
+
+def _dumps(value: dict[str, Any]) -> bytes:
+    # json round-trips floats exactly (repr), so a restored world continues bit-for-bit.
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _check_key(key: bytes) -> None:
+    if not isinstance(key, (bytes, bytearray)) or len(key) < CHECKPOINT_MIN_KEY_BYTES:
+        raise WorldCheckpointError(f"checkpoint key must be at least {CHECKPOINT_MIN_KEY_BYTES} bytes")
+
+
+def _tag(key: bytes, body: bytes) -> bytes:
+    return hmac.new(bytes(key), body, hashlib.sha256).digest()
+
+
+def _split(data: bytes, key: bytes) -> tuple[dict[str, Any], bytes]:
+    _check_key(key)
+    view = memoryview(data)
+    if len(view) < _HEADER.size + _TAG_SIZE:
+        raise WorldCheckpointError("checkpoint is truncated")
+    magic, version, meta_len = _HEADER.unpack_from(view)
+    if magic != CHECKPOINT_MAGIC:
+        raise WorldCheckpointError("not a WorldModel checkpoint")
+    if version != CHECKPOINT_FORMAT_VERSION:
+        raise WorldCheckpointError(f"unsupported checkpoint format version {version}")
+    body_end = len(view) - _TAG_SIZE
+    if not hmac.compare_digest(_tag(key, view[:body_end]), bytes(view[body_end:])):
+        raise WorldCheckpointError("checkpoint signature mismatch (corrupted or signed with another key)")
+    meta_end = _HEADER.size + meta_len
+    if meta_end > body_end:
+        raise WorldCheckpointError("checkpoint is truncated")
+    try:
+        meta = json.loads(bytes(view[_HEADER.size : meta_end]).decode("utf-8"))
+    except ValueError as exc:
+        raise WorldCheckpointError(f"checkpoint meta is unreadable: {exc}") from exc
+    if not isinstance(meta, dict):
+        raise WorldCheckpointError("checkpoint meta is not an object")
+    return meta, bytes(view[meta_end:body_end])
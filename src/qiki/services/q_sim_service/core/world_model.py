@@ -1,18 +1,32 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from itertools import combinations
 from pathlib import Path
-from typing import Any, Dict, Sequence
+from typing import Any, Dict, Mapping, Sequence
 
+import hashlib
+import json
 import math
 import time
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - NumPy is required; degraded environments fall back to Euler with a warning.
+    np = None  # type: ignore[assignment]
+
 from qiki.services.q_sim_service.logger import logger
 from generated.actuator_raw_out_pb2 import ActuatorCommand
 from generated.common_types_pb2 import Vector3
 
-from qiki.services.q_sim_service.core.mcqpu_telemetry import MCQPUTelemetry
+from qiki.services.q_sim_service.core.mcqpu_telemetry import MCQPUTelemetry, MCQPUTelemetryState
+from qiki.services.q_sim_service.core.state_snapshot import FrozenDict
+from qiki.services.q_sim_service.core.thermal_network import ThermalNetwork
+from qiki.services.q_sim_service.core.world_checkpoint import (
+    WorldCheckpointError,
+    decode_checkpoint,
+    encode_checkpoint,
+)
 from qiki.shared.config.loaders import ThrusterConfig, load_thrusters_config
 from qiki.shared.models.thermal import (
     ThermalTelemetryRecord,  # noqa: F401  (re-exported for q_sim consumers/tests)
@@ -1037,6 +1051,137 @@ def bayonet_bridge_from_runtime_state(
     )
 
 
+# WorldModel checkpoint schema (see WorldModel.snapshot). Bump the version on any change to the
+# field set or to a field's encoding: restore() rejects every other version.
+WORLD_CHECKPOINT_SCHEMA_VERSION = 1
+_WORLD_CHECKPOINT_KIND = "qsim_world_model"
+
+# Runtime simulation truth, per plane. Everything else is derived from bot_config and rebuilt by
+# the constructor of the restoring model (pinned by the bot_config fingerprint in the meta).
+_WORLD_CHECKPOINT_FIELDS: dict[str, tuple[str, ...]] = {
+    "clock": ("_sim_time_s", "_sim_epoch_start_ts"),
+    "core": (
+        "position",
+        "heading",
+        "roll_rad",
+        "pitch_rad",
+        "yaw_rad",
+        "speed",
+        "hull_integrity",
+        "radiation_usvh",
+        "temp_external_c",
+        "temp_core_c",
+        "battery_level",
+    ),
+    "thermal": ("_thermal_nodes", "_thermal_trip_state"),
+    "power": (
+        "power_in_w",
+        "power_out_w",
+        "power_bus_v",
+        "power_bus_a",
+        "power_load_shedding",
+        "power_shed_loads",
+        "power_shed_reasons",
+        "power_pdu_throttled",
+        "power_throttled_loads",
+        "power_faults",
+        "power_loads_w",
+        "power_sources_w",
+        "radar_allowed",
+        "transponder_allowed",
+        "_soc_shed_state",
+        "_supercap_energy_wh",
+        "supercap_soc_pct",
+        "supercap_charge_w",
+        "supercap_discharge_w",
+        "battery_charge_w",
+        "battery_discharge_w",
+        "battery_spill_w",
+        "battery_unserved_w",
+    ),
+    "dock": (
+        "dock_connected",
+        "_dock_since_s",
+        "dock_soft_start_pct",
+        "dock_power_w",
+        "dock_v",
+        "dock_a",
+        "dock_temp_c",
+    ),
+    "docking": ("docking_port", "docking_connected", "docking_state"),
+    "sensors": (
+        "_imu_ok",
+        "_imu_roll_rate_rps",
+        "_imu_pitch_rate_rps",
+        "_imu_yaw_rate_rps",
+        "_radiation_dose_total_usv",
+    ),
+    "nbl": ("nbl_active", "nbl_allowed", "nbl_power_w", "nbl_budget_w", "_nbl_max_power_w"),
+    "rcs": (
+        "_rcs_propellant_kg",
+        "_rcs_cmd_axis",
+        "_rcs_cmd_pct",
+        "_rcs_cmd_time_left_s",
+        "_rcs_fuel_rate_gs",
+        "_rcs_thruster_state",
+        "_rcs_net_force_n",
+        "_rcs_net_torque_nm",
+        "_rcs_last_axis",
+        "rcs_active",
+        "rcs_power_w",
+        "rcs_propellant_kg",
+        "rcs_throttled",
+    ),
+    "mcqpu": ("_mcqpu_state", "cpu_usage", "memory_usage"),
+    "runtime_inputs": ("_radar_enabled", "_sensor_queue_depth", "_actuator_queue_depth", "_transponder_active"),
+}
+
+
+def _bot_config_fingerprint(bot_config: dict | None) -> str:
+    raw = json.dumps(bot_config, sort_keys=True, separators=(",", ":"), default=str)
+    return "sha256:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _checkpoint_kind(value: Any) -> type | None:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return bool
+    if isinstance(value, (int, float)):
+        return float
+    if isinstance(value, (list, tuple)):
+        return list
+    return type(value)
+
+
+def _checkpoint_value(name: str, saved: Any, current: Any) -> Any:
+    """`saved` coerced to the type of the live field `current`; None is accepted on either side."""
+    if saved is None or current is None:
+        return saved
+    kind = _checkpoint_kind(current)
+    if _checkpoint_kind(saved) is not kind or (type(current) is int and type(saved) is not int):
+        raise WorldCheckpointError(
+            f"checkpoint field {name}: expected {type(current).__name__}, got {type(saved).__name__}"
+        )
+    if kind is float:
+        return type(current)(saved)
+    if isinstance(current, tuple):
+        return tuple(saved)
+    return saved
+
+
+@dataclass(frozen=True, slots=True)
+class RcsAxisAllocation:
+    """Precomputed ZTT group for one RCS axis: net force/torque and thrust sum at 100% duty."""
+
+    indices: tuple[int, ...]
+    net_force_n: tuple[float, float, float]
+    net_torque_nm: tuple[float, float, float]
+    thrust_sum_n: float
+    phase_offsets: tuple[float, ...]
+    thruster_meta: tuple[tuple[int, str, float], ...]
+
+
 class WorldModel:
     """
     Represents the simulated state of the bot and its immediate environment.
@@ -1044,6 +1189,11 @@ class WorldModel:
     """
 
     def __init__(self, *, bot_config: dict | None = None):
+        # Versioned state snapshot (see state_snapshot): per-plane cached sections + dirty planes.
+        self._state_version = 0
+        self._state_dirty: set[str] = set(self._STATE_PLANES)
+        self._state_sections: dict[str, Any] = {}
+        self._state_snapshot: FrozenDict | None = None
         self.position = Vector3(x=0.0, y=0.0, z=0.0)  # meters
         self.heading = 0.0  # degrees, 0 is +Y, 90 is +X
         self.roll_rad = 0.0
@@ -1062,6 +1212,7 @@ class WorldModel:
         self._thermal_nodes_order: list[str] = []
         self._thermal_nodes: dict[str, dict[str, float]] = {}
         self._thermal_couplings: dict[str, list[tuple[str, float]]] = {}
+        self._thermal_network: ThermalNetwork | None = None
         self._thermal_trip_state: dict[str, bool] = {}
         # Power/EPS model (virtual hardware, simulation-truth).
         self.power_in_w = 30.0  # watts (e.g., solar)
@@ -1179,6 +1330,7 @@ class WorldModel:
         self._rcs_thrusters: list[ThrusterConfig] = []
         self._rcs_axis_groups: dict[str, list[int]] = {}
         self._rcs_axis_group_max_proj_n: dict[str, float] = {}
+        self._rcs_axis_alloc: dict[str, RcsAxisAllocation] = {}
 
         self._rcs_propellant_kg = 0.0
         self._rcs_propellant_kg_initial = 0.0
@@ -1209,6 +1361,8 @@ class WorldModel:
         self._actuator_id_by_role: dict[str, str] = {}
 
         # Apply runtime profile from bot_config (single SoT).
+        # The fingerprint ties checkpoints to the profile that rebuilds the config-derived fields.
+        self._bot_config_fingerprint = _bot_config_fingerprint(bot_config)
         self._apply_bot_config(bot_config)
 
         # Power Plane breakdown (operator-facing diagnostics; no-mocks).
@@ -1242,6 +1396,7 @@ class WorldModel:
         self._sensor_queue_depth = 0
         self._actuator_queue_depth = 0
         self._transponder_active = False
+        self.invalidate_state()
         logger.info("WorldModel initialized.")
 
     def sim_time_s(self) -> float:
@@ -1598,6 +1753,31 @@ class WorldModel:
             self._thermal_couplings.setdefault(a, []).append((b, k))
             self._thermal_couplings.setdefault(b, []).append((a, k))
 
+        # Solver: "matrix" (default; exponential integrator, stable at large dt) needs NumPy,
+        # "euler" keeps the explicit per-node integration (reference only: unstable at large dt).
+        solver = str(tp.get("solver", "matrix") or "matrix").strip().lower()
+        self._thermal_network = None
+        if self._thermal_enabled and self._thermal_nodes_order and solver != "euler" and np is None:
+            logger.warning(
+                "Thermal solver %r needs NumPy, which is not installed: falling back to explicit Euler "
+                "(unstable at large dt; install requirements.txt)",
+                solver,
+            )
+        elif self._thermal_enabled and self._thermal_nodes_order and solver != "euler":
+            ambient_g = max(0.0, float(self._thermal_ambient_exchange_w_per_c))
+            self._thermal_network = ThermalNetwork(
+                self._thermal_nodes_order,
+                [self._thermal_nodes[nid]["cap_j_per_c"] for nid in self._thermal_nodes_order],
+                [self._thermal_nodes[nid]["cool_w_per_c"] + ambient_g for nid in self._thermal_nodes_order],
+                (
+                    (a, b, k)
+                    for a in self._thermal_nodes_order
+                    for b, k in self._thermal_couplings.get(a, [])
+                    # Each coupling is stored on both ends; feed it once.
+                    if a < b
+                ),
+            )
+
         # Seed derived temps from nodes when available.
         if "core" in self._thermal_nodes:
             self.temp_core_c = float(self._thermal_nodes["core"]["temp_c"])
@@ -1661,6 +1841,7 @@ class WorldModel:
         self._rcs_thrusters = []
         self._rcs_axis_groups = {}
         self._rcs_axis_group_max_proj_n = {}
+        self._rcs_axis_alloc = {}
         if self._rcs_enabled:
             self._rcs_load_thrusters()
             self._rcs_precompute_axis_groups()
@@ -1677,25 +1858,67 @@ class WorldModel:
 
         amb = float(self.temp_external_c)
 
-        # Heat sources (W) derived from simulation state (no mocks).
-        q: dict[str, float] = {nid: 0.0 for nid in self._thermal_nodes_order}
+        # Heat sources (W) derived from simulation state (no mocks); nodes without a source get 0.
+        q: dict[str, float] = {}
+        nodes = self._thermal_nodes
         cpu_frac = max(0.0, min(1.0, float(self.cpu_usage) / 100.0))
         mcqpu_w = cpu_frac * float(self._mcqpu_power_w_at_100pct)
-        if "core" in q:
-            q["core"] += 0.8 * mcqpu_w
-            q["core"] += 0.7 * float(self.nbl_power_w)
-        if "pdu" in q:
-            q["pdu"] += 0.02 * float(self.power_out_w)
-            q["pdu"] += 0.4 * (abs(float(self.power_bus_a)) ** 2)
-        if "supercap" in q:
-            q["supercap"] += 0.03 * (float(self.supercap_charge_w) + float(self.supercap_discharge_w))
-        if "dock_bridge" in q:
-            q["dock_bridge"] += 0.25 * (abs(float(self.dock_a)) ** 2)
-        if "battery" in q:
-            q["battery"] += 0.01 * abs(float(self.power_in_w) - float(self.power_out_w))
-        if "hull" in q and self.rcs_power_w > 0.0:
-            q["hull"] += float(self._rcs_heat_fraction_to_hull) * float(self.rcs_power_w)
+        if "core" in nodes:
+            q["core"] = 0.8 * mcqpu_w + 0.7 * float(self.nbl_power_w)
+        if "pdu" in nodes:
+            q["pdu"] = 0.02 * float(self.power_out_w) + 0.4 * (abs(float(self.power_bus_a)) ** 2)
+        if "supercap" in nodes:
+            q["supercap"] = 0.03 * (float(self.supercap_charge_w) + float(self.supercap_discharge_w))
+        if "dock_bridge" in nodes:
+            q["dock_bridge"] = 0.25 * (abs(float(self.dock_a)) ** 2)
+        if "battery" in nodes:
+            q["battery"] = 0.01 * abs(float(self.power_in_w) - float(self.power_out_w))
+        if "hull" in nodes and self.rcs_power_w > 0.0:
+            q["hull"] = float(self._rcs_heat_fraction_to_hull) * float(self.rcs_power_w)
+
+        if self._thermal_network is not None:
+            self._thermal_integrate_matrix(q, amb, dt)
+        else:
+            self._thermal_integrate_euler(q, amb, dt)
+
+        # Update trip states with hysteresis and surface in faults list (no mocks).
+        for nid in self._thermal_nodes_order:
+            trip = float(self._thermal_nodes[nid].get("trip_c", 0.0))
+            hys = float(self._thermal_nodes[nid].get("hys_c", 0.0))
+            if trip <= 0.0:
+                continue
+            t = float(self._thermal_nodes[nid]["temp_c"])
+            state = bool(self._thermal_trip_state.get(nid, False))
+            if (not state) and t >= trip:
+                state = True
+            if state and t <= (trip - hys):
+                state = False
+            self._thermal_trip_state[nid] = state
+            if state:
+                self.power_faults.append(f"THERMAL_TRIP:{nid}")
+
+        # Keep legacy top-level temps consistent with nodes when present.
+        if "core" in self._thermal_nodes:
+            self.temp_core_c = float(self._thermal_nodes["core"]["temp_c"])
+        if "dock_bridge" in self._thermal_nodes:
+            self.dock_temp_c = float(self._thermal_nodes["dock_bridge"]["temp_c"])
 
+    def _thermal_integrate_matrix(self, q: dict[str, float], amb: float, dt: float) -> None:
+        network = self._thermal_network
+        assert network is not None
+        nodes = self._thermal_nodes
+        order = self._thermal_nodes_order
+        temps = np.fromiter((float(nodes[nid]["temp_c"]) for nid in order), dtype=float, count=len(order))
+        heat = np.zeros(len(order), dtype=float)
+        for nid, watts in q.items():
+            heat[network.index[nid]] += watts
+        next_t = np.clip(network.step(temps, heat, amb, dt), -120.0, 160.0)
+        # Same guard as the Euler path: passive cooling does not carry a node from above ambient to below it.
+        next_t[(temps >= amb) & (next_t < amb)] = max(-120.0, min(160.0, float(amb)))
+        for nid, t2 in zip(order, next_t.tolist()):
+            nodes[nid]["temp_c"] = t2
+
+    def _thermal_integrate_euler(self, q: dict[str, float], amb: float, dt: float) -> None:
         # Integrate temperatures (explicit Euler) on a thermal network.
         prev_t = {nid: float(self._thermal_nodes[nid]["temp_c"]) for nid in self._thermal_nodes_order}
         next_t: dict[str, float] = {}
@@ -1721,28 +1944,6 @@ class WorldModel:
         for nid, t2 in next_t.items():
             self._thermal_nodes[nid]["temp_c"] = float(t2)
 
-        # Update trip states with hysteresis and surface in faults list (no mocks).
-        for nid in self._thermal_nodes_order:
-            trip = float(self._thermal_nodes[nid].get("trip_c", 0.0))
-            hys = float(self._thermal_nodes[nid].get("hys_c", 0.0))
-            if trip <= 0.0:
-                continue
-            t = float(self._thermal_nodes[nid]["temp_c"])
-            state = bool(self._thermal_trip_state.get(nid, False))
-            if (not state) and t >= trip:
-                state = True
-            if state and t <= (trip - hys):
-                state = False
-            self._thermal_trip_state[nid] = state
-            if state:
-                self.power_faults.append(f"THERMAL_TRIP:{nid}")
-
-        # Keep legacy top-level temps consistent with nodes when present.
-        if "core" in self._thermal_nodes:
-            self.temp_core_c = float(self._thermal_nodes["core"]["temp_c"])
-        if "dock_bridge" in self._thermal_nodes:
-            self.dock_temp_c = float(self._thermal_nodes["dock_bridge"]["temp_c"])
-
     def set_runtime_load_inputs(
         self,
         *,
@@ -1772,11 +1973,13 @@ class WorldModel:
             # Restart soft-start ramp on a fresh connect.
             self._dock_since_s = 0.0
             self.dock_soft_start_pct = 0.0
+        self.invalidate_state("power")
 
     def set_docking_connected(self, connected: bool) -> bool:
         if not self._docking_enabled:
             return False
         connected = bool(connected)
+        self.invalidate_state("docking")
         self.docking_connected = connected
         self.docking_state = "docked" if connected else "undocked"
         if connected and self.docking_port is None:
@@ -1789,6 +1992,7 @@ class WorldModel:
         if not self._docking_enabled:
             return False
         token = str(port or "").strip()
+        self.invalidate_state("docking")
         if not token:
             self.docking_port = self._docking_default_port
             return True
@@ -1799,6 +2003,7 @@ class WorldModel:
 
     def set_nbl_active(self, active: bool) -> None:
         self.nbl_active = bool(active)
+        self.invalidate_state("power")
 
     def set_nbl_max_power_w(self, max_power_w: float) -> None:
         try:
@@ -1816,6 +2021,7 @@ class WorldModel:
         """
         if not self._rcs_enabled:
             return False
+        self.invalidate_state("propulsion")
 
         if axis is None:
             self._rcs_cmd_axis = None
@@ -1852,6 +2058,7 @@ class WorldModel:
         Applies an actuator command to the world model, changing its state.
         """
         logger.debug(f"Applying command to WorldModel: {command.command_type} for {command.actuator_id.value}")
+        self.invalidate_state()
 
         actuator_id = getattr(getattr(command, "actuator_id", None), "value", "")
         role = self._actuator_role_by_id.get(str(actuator_id), str(actuator_id))
@@ -1921,6 +2128,7 @@ class WorldModel:
         """
         Advances the simulation by a given delta_time.
         """
+        rcs_was_active = bool(self.rcs_active)
         self._sim_time_s += delta_time
 
         # Sensor Plane: integrate radiation dose (simulation-truth; no OS metrics).
@@ -2251,6 +2459,12 @@ class WorldModel:
         # Thermal plane may append faults; keep stable order.
         self.power_faults = list(dict.fromkeys(self.power_faults))
 
+        # Docking is only changed by set_docking_*; an idle RCS tick leaves the propulsion block as it was.
+        if rcs_was_active or self.rcs_active:
+            self.invalidate_state("core", "thermal", "power", "sensor_plane", "propulsion")
+        else:
+            self.invalidate_state("core", "thermal", "power", "sensor_plane")
+
     def _repo_root(self) -> Path:
         # /.../src/qiki/services/q_sim_service/core/world_model.py -> repo root is 5 parents up.
         return Path(__file__).resolve().parents[5]
@@ -2283,21 +2497,22 @@ class WorldModel:
             return
         self._rcs_thrusters = list(thrusters)
 
+    _RCS_AXES: dict[str, tuple[float, float, float]] = {
+        "forward": (1.0, 0.0, 0.0),
+        "aft": (-1.0, 0.0, 0.0),
+        "port": (0.0, 1.0, 0.0),
+        "starboard": (0.0, -1.0, 0.0),
+        "up": (0.0, 0.0, 1.0),
+        "down": (0.0, 0.0, -1.0),
+    }
+
     def _rcs_precompute_axis_groups(self) -> None:
         self._rcs_axis_groups = {}
         self._rcs_axis_group_max_proj_n = {}
+        self._rcs_axis_alloc = {}
         if not self._rcs_thrusters:
             return
 
-        axes: dict[str, list[float]] = {
-            "forward": [1.0, 0.0, 0.0],
-            "aft": [-1.0, 0.0, 0.0],
-            "port": [0.0, 1.0, 0.0],
-            "starboard": [0.0, -1.0, 0.0],
-            "up": [0.0, 0.0, 1.0],
-            "down": [0.0, 0.0, -1.0],
-        }
-
         forces: list[list[float]] = []
         torques: list[list[float]] = []
         for t in self._rcs_thrusters:
@@ -2311,10 +2526,23 @@ class WorldModel:
             forces.append(f)
             torques.append(self._cross(pos, f))
 
-        idxs = list(range(len(self._rcs_thrusters)))
+        # Search 2- and 4-thruster groups; both searches pick the same (first best) combo.
+        if np is not None:
+            selected = self._rcs_search_axis_groups_np(forces, torques)
+        else:
+            selected = self._rcs_search_axis_groups(forces, torques)
+
+        for axis_name, (combo, proj) in selected.items():
+            self._rcs_axis_groups[axis_name] = list(combo)
+            self._rcs_axis_group_max_proj_n[axis_name] = float(proj)
+            self._rcs_axis_alloc[axis_name] = self._rcs_axis_allocation(combo, forces, torques)
+
+    def _rcs_search_axis_groups(
+        self, forces: list[list[float]], torques: list[list[float]]
+    ) -> dict[str, tuple[tuple[int, ...], float]]:
+        idxs = list(range(len(forces)))
         torque_tol = float(self._rcs_ztt_torque_tol_nm)
-        # Search 2- and 4-thruster groups; deterministic and fast for N=16.
-        candidates: list[tuple[list[int], list[float], list[float]]] = []
+        candidates: list[tuple[tuple[int, ...], list[float], list[float]]] = []
         for k in (2, 4):
             for combo in combinations(idxs, k):
                 net_f = [0.0, 0.0, 0.0]
@@ -2328,10 +2556,11 @@ class WorldModel:
                     net_tau[0] += tau[0]
                     net_tau[1] += tau[1]
                     net_tau[2] += tau[2]
-                candidates.append((list(combo), net_f, net_tau))
+                candidates.append((combo, net_f, net_tau))
 
-        for axis_name, axis_vec in axes.items():
-            best_combo: list[int] | None = None
+        selected: dict[str, tuple[tuple[int, ...], float]] = {}
+        for axis_name, axis_vec in self._RCS_AXES.items():
+            best_combo: tuple[int, ...] | None = None
             best_proj = 0.0
             best_score = -1e18
             for combo, net_f, net_tau in candidates:
@@ -2348,10 +2577,84 @@ class WorldModel:
                     best_score = score
                     best_combo = combo
                     best_proj = float(proj)
-            if best_combo is None:
+            if best_combo is not None:
+                selected[axis_name] = (best_combo, best_proj)
+        return selected
+
+    def _rcs_search_axis_groups_np(
+        self, forces: list[list[float]], torques: list[list[float]]
+    ) -> dict[str, tuple[tuple[int, ...], float]]:
+        # Same scoring as _rcs_search_axis_groups over all candidates at once (C(48,4) ~ 195k);
+        # sums and norms keep the scalar operation order so the chosen groups are identical.
+        n = len(forces)
+        f_arr = np.asarray(forces, dtype=float)
+        tau_arr = np.asarray(torques, dtype=float)
+        combos: list = []
+        net_f_parts: list = []
+        net_tau_parts: list = []
+        for k in (2, 4):
+            if n < k:
                 continue
-            self._rcs_axis_groups[axis_name] = list(best_combo)
-            self._rcs_axis_group_max_proj_n[axis_name] = float(best_proj)
+            count = math.comb(n, k)
+            combo = np.fromiter(
+                (i for c in combinations(range(n), k) for i in c), dtype=np.intp, count=count * k
+            ).reshape(count, k)
+            net_f = f_arr[combo[:, 0]].copy()
+            net_tau = tau_arr[combo[:, 0]].copy()
+            for j in range(1, k):
+                net_f += f_arr[combo[:, j]]
+                net_tau += tau_arr[combo[:, j]]
+            combos.append(combo)
+            net_f_parts.append(net_f)
+            net_tau_parts.append(net_tau)
+        if not combos:
+            return {}
+
+        net_f = np.concatenate(net_f_parts)
+        net_tau = np.concatenate(net_tau_parts)
+        tau_mag = np.sqrt(net_tau[:, 0] * net_tau[:, 0] + net_tau[:, 1] * net_tau[:, 1] + net_tau[:, 2] * net_tau[:, 2])
+        over = np.maximum(0.0, tau_mag - float(self._rcs_ztt_torque_tol_nm))
+        offsets = np.cumsum([0] + [len(c) for c in combos])
+
+        selected: dict[str, tuple[tuple[int, ...], float]] = {}
+        for axis_name, (ax, ay, az) in self._RCS_AXES.items():
+            proj = net_f[:, 0] * ax + net_f[:, 1] * ay + net_f[:, 2] * az
+            lx = net_f[:, 0] - proj * ax
+            ly = net_f[:, 1] - proj * ay
+            lz = net_f[:, 2] - proj * az
+            lateral_mag = np.sqrt(lx * lx + ly * ly + lz * lz)
+            score = np.where(proj > 0.0, proj - 0.05 * lateral_mag - 0.5 * over, -np.inf)
+            best = int(np.argmax(score))
+            if not np.isfinite(score[best]):
+                continue
+            part = int(np.searchsorted(offsets, best, side="right")) - 1
+            combo = tuple(int(i) for i in combos[part][best - int(offsets[part])])
+            selected[axis_name] = (combo, float(proj[best]))
+        return selected
+
+    def _rcs_axis_allocation(
+        self, combo: Sequence[int], forces: list[list[float]], torques: list[list[float]]
+    ) -> RcsAxisAllocation:
+        net_f = [0.0, 0.0, 0.0]
+        net_tau = [0.0, 0.0, 0.0]
+        thrust_sum = 0.0
+        for idx in combo:
+            for axis in range(3):
+                net_f[axis] += forces[idx][axis]
+                net_tau[axis] += torques[idx][axis]
+            thrust_sum += self._norm(forces[idx])
+        meta = tuple(
+            (int(t.index), str(t.cluster_id), float(t.f_max_newton)) for t in (self._rcs_thrusters[i] for i in combo)
+        )
+        return RcsAxisAllocation(
+            indices=tuple(int(i) for i in combo),
+            net_force_n=(float(net_f[0]), float(net_f[1]), float(net_f[2])),
+            net_torque_nm=(float(net_tau[0]), float(net_tau[1]), float(net_tau[2])),
+            thrust_sum_n=float(thrust_sum),
+            # Small deterministic per-index phase offset to avoid all valves in sync.
+            phase_offsets=tuple(float(i) * 0.07 for i in combo),
+            thruster_meta=meta,
+        )
 
     def _rcs_step(self, delta_time: float) -> float:
         # Reset exposed state.
@@ -2365,7 +2668,7 @@ class WorldModel:
 
         if not self._rcs_enabled:
             return 0.0
-        if not self._rcs_thrusters or not self._rcs_axis_groups:
+        if not self._rcs_thrusters or not self._rcs_axis_alloc:
             return 0.0
         if not self._rcs_cmd_axis or self._rcs_cmd_pct <= 0.0:
             return 0.0
@@ -2380,9 +2683,9 @@ class WorldModel:
             dt_eff = min(dt, float(self._rcs_cmd_time_left_s))
 
         axis = str(self._rcs_cmd_axis)
-        group = self._rcs_axis_groups.get(axis)
+        alloc = self._rcs_axis_alloc.get(axis)
         max_proj = float(self._rcs_axis_group_max_proj_n.get(axis, 0.0))
-        if not group or max_proj <= 0.0:
+        if alloc is None or not alloc.indices or max_proj <= 0.0:
             return 0.0
 
         # Convert command percent into duty scaling for the chosen ZTT group.
@@ -2396,36 +2699,13 @@ class WorldModel:
         else:
             phase = (float(self._sim_time_s) % window) / window
 
-        # Per-thruster duty within group is uniform in MVP (scaled by duty_scale).
-        duty_by_idx: dict[int, float] = {i: duty_scale for i in group}
-        open_by_idx: dict[int, bool] = {}
-        for idx in group:
-            # Small deterministic per-index phase offset to avoid all valves in sync.
-            phase_i = (phase + (idx * 0.07)) % 1.0
-            open_by_idx[idx] = phase_i < duty_by_idx[idx]
-
-        # Average forces/torques (use duty as average).
-        net_f_avg = [0.0, 0.0, 0.0]
-        net_tau_avg = [0.0, 0.0, 0.0]
-        f_total_mag = 0.0
-        for idx in group:
-            t = self._rcs_thrusters[idx]
-            d = t.direction.as_list()
-            pos = t.position_m.as_list()
-            duty = duty_by_idx[idx]
-            f = [
-                float(d[0]) * float(t.f_max_newton) * duty,
-                float(d[1]) * float(t.f_max_newton) * duty,
-                float(d[2]) * float(t.f_max_newton) * duty,
-            ]
-            tau = self._cross(pos, f)
-            net_f_avg[0] += f[0]
-            net_f_avg[1] += f[1]
-            net_f_avg[2] += f[2]
-            net_tau_avg[0] += tau[0]
-            net_tau_avg[1] += tau[1]
-            net_tau_avg[2] += tau[2]
-            f_total_mag += float(self._norm(f))
+        # Per-thruster duty within group is uniform in MVP (scaled by duty_scale), so the average
+        # force/torque/thrust are the precomputed 100%-duty sums times duty_scale.
+        duty = duty_scale
+        valve_open = [((phase + offset) % 1.0) < duty for offset in alloc.phase_offsets]
+        fx, fy, fz = alloc.net_force_n
+        tx, ty, tz = alloc.net_torque_nm
+        f_total_mag = alloc.thrust_sum_n * duty_scale
 
         # Propellant consumption (MVP): proportional to total thrust magnitude.
         g0 = 9.80665
@@ -2442,9 +2722,9 @@ class WorldModel:
             if m_used >= self._rcs_propellant_kg:
                 # Scale down last tick so we don't go negative.
                 ratio = max(0.0, min(1.0, self._rcs_propellant_kg / m_used))
-                for k in list(duty_by_idx.keys()):
-                    duty_by_idx[k] *= ratio
-                    open_by_idx[k] = open_by_idx[k] and (ratio > 0.0)
+                duty *= ratio
+                if ratio <= 0.0:
+                    valve_open = [False] * len(valve_open)
                 self._rcs_propellant_kg = 0.0
                 self._rcs_cmd_pct = 0.0
             else:
@@ -2452,26 +2732,22 @@ class WorldModel:
 
         # Electrical power draw (pulse-shaped by valve openness).
         base_w = float(self._rcs_power_w_at_100pct) * (cmd_pct / 100.0)
-        if not group:
-            rcs_w = 0.0
-        else:
-            open_frac = sum(1.0 for idx in group if open_by_idx.get(idx, False)) / float(len(group))
-            rcs_w = base_w * float(open_frac)
+        rcs_w = base_w * (sum(valve_open) / float(len(valve_open)))
 
         self.rcs_active = True
         self._rcs_last_axis = axis
-        self._rcs_net_force_n = [float(net_f_avg[0]), float(net_f_avg[1]), float(net_f_avg[2])]
-        self._rcs_net_torque_nm = [float(net_tau_avg[0]), float(net_tau_avg[1]), float(net_tau_avg[2])]
+        self._rcs_net_force_n = [fx * duty_scale, fy * duty_scale, fz * duty_scale]
+        self._rcs_net_torque_nm = [tx * duty_scale, ty * duty_scale, tz * duty_scale]
         self.rcs_propellant_kg = float(self._rcs_propellant_kg)
 
-        for idx in group:
-            t = self._rcs_thrusters[idx]
+        duty_pct = float(duty * 100.0)
+        for idx, (index, cluster_id, f_max), is_open in zip(alloc.indices, alloc.thruster_meta, valve_open):
             self._rcs_thruster_state[idx] = {
-                "index": int(t.index),
-                "cluster_id": str(t.cluster_id),
-                "duty_pct": float(duty_by_idx[idx] * 100.0),
-                "valve_open": bool(open_by_idx[idx]),
-                "f_max_newton": float(t.f_max_newton),
+                "index": index,
+                "cluster_id": cluster_id,
+                "duty_pct": duty_pct,
+                "valve_open": is_open,
+                "f_max_newton": f_max,
             }
 
         # Decrement remaining duration after applying this tick.
@@ -2501,58 +2777,202 @@ class WorldModel:
             state["reason"] = str(reason)
             self._rcs_thruster_state[idx] = state
 
+    _STATE_PLANES: tuple[str, ...] = ("core", "thermal", "power", "propulsion", "docking", "sensor_plane")
+
+    @property
+    def state_version(self) -> int:
+        """Bumped whenever a state plane is marked dirty (by step/update/set_* or invalidate_state)."""
+        return self._state_version
+
+    def invalidate_state(self, *planes: str) -> None:
+        """
+        Mark state planes (default: all) as changed so the next `state_snapshot()` rebuilds them.
+
+        step/update/set_* do this themselves; call it after writing WorldModel fields directly.
+        """
+        self._state_dirty.update(planes or self._STATE_PLANES)
+        self._state_snapshot = None
+        self._state_version += 1
+
+    def state_snapshot(self) -> Mapping[str, Any]:
+        """
+        Read-only world state shared by every consumer of a tick (do not mutate; get_state() returns
+        a private copy).
+
+        Per-plane sections are cached and rebuilt only for planes marked dirty since the last call;
+        a returned tree is never mutated afterwards, so holding on to an older snapshot is safe.
+        """
+        snapshot = self._state_snapshot
+        if snapshot is not None:
+            return snapshot
+        dirty = self._state_dirty
+        sections = self._state_sections
+        # Power reports battery/supercap temperature states derived from the thermal nodes.
+        if "thermal" in dirty:
+            dirty.add("power")
+        for plane in self._STATE_PLANES:
+            if plane in dirty or plane not in sections:
+                sections[plane] = self._build_state_plane(plane, sections)
+        dirty.clear()
+        snapshot = FrozenDict(self._assemble_state(sections))
+        self._state_snapshot = snapshot
+        return snapshot
+
     def get_state(self) -> Dict[str, Any]:
         """
         Returns the current state of the world model.
+
+        Always rebuilt from the live fields and owned by the caller; per-tick consumers should
+        prefer the cached read-only `state_snapshot()`.
         """
+        sections: dict[str, Any] = {}
+        for plane in self._STATE_PLANES:
+            sections[plane] = self._build_state_plane(plane, sections)
+        return self._assemble_state(sections)
 
-        def _status_from_bool(ok: bool | None, *, enabled: bool, warn_on_false: bool = False) -> tuple[str, str]:
-            if not enabled:
-                return ("na", "disabled")
-            if ok is None:
-                return ("na", "no reading")
-            if ok:
-                return ("ok", "ok")
-            return ("warn" if warn_on_false else "crit", "not ok")
-
-        def _status_from_limits(
-            value: float | None, *, enabled: bool, warn: float | None, crit: float | None
-        ) -> tuple[str, str, dict | None]:
-            if not enabled:
-                return ("na", "disabled", None)
-            if value is None:
-                return ("na", "no reading", None)
-            if warn is None or crit is None:
-                return ("na", "limits not configured", None)
-            if float(value) >= float(crit):
-                return ("crit", f"value>=crit ({value:.3g}>={crit:.3g})", {"warn_usvh": warn, "crit_usvh": crit})
-            if float(value) >= float(warn):
-                return ("warn", f"value>=warn ({value:.3g}>={warn:.3g})", {"warn_usvh": warn, "crit_usvh": crit})
-            return ("ok", "within limits", {"warn_usvh": warn, "crit_usvh": crit})
+    def snapshot(self, *, key: bytes, hardware_profile_hash: str | None = None) -> bytes:
+        """
+        Signed binary checkpoint of the simulation truth (all planes, RCS/thermal runtime, sim clock).
 
-        thermal_nodes: list[dict[str, float | str | bool]] = []
-        if self._thermal_enabled and self._thermal_nodes_order:
-            for nid in self._thermal_nodes_order:
-                node = self._thermal_nodes.get(nid)
-                if not isinstance(node, dict):
-                    continue
-                temp_c = float(node.get("temp_c", self.temp_external_c))
-                tripped = bool(self._thermal_trip_state.get(nid, False))
-                warn_c = float(node.get("warn_c", 0.0))
-                warned = bool((not tripped) and warn_c > 0.0 and temp_c >= warn_c)
-                thermal_nodes.append(
-                    {
-                        "id": nid,
-                        "temp_c": temp_c,
-                        # Operator-facing (derived, no-mocks): explicit trip/warn state and thresholds.
-                        "tripped": tripped,
-                        "warned": warned,
-                        "warn_c": warn_c,
-                        "trip_c": float(node.get("trip_c", 0.0)),
-                        "hys_c": float(node.get("hys_c", 0.0)),
-                    }
+        Only the explicit `_WORLD_CHECKPOINT_FIELDS` are written (as JSON); `restore()` on a
+        WorldModel built from the same bot_config brings it back bit-for-bit.
+        """
+        fields: dict[str, Any] = {}
+        for names in _WORLD_CHECKPOINT_FIELDS.values():
+            for name in names:
+                if name == "position":
+                    fields[name] = [self.position.x, self.position.y, self.position.z]
+                elif name == "_rcs_thruster_state":
+                    fields[name] = [[index, dict(state)] for index, state in self._rcs_thruster_state.items()]
+                elif name == "_mcqpu_state":
+                    fields[name] = asdict(self._mcqpu.state)
+                else:
+                    fields[name] = getattr(self, name)
+        meta = {
+            "kind": _WORLD_CHECKPOINT_KIND,
+            "schema_version": WORLD_CHECKPOINT_SCHEMA_VERSION,
+            "bot_config_fingerprint": self._bot_config_fingerprint,
+            "hardware_profile_hash": hardware_profile_hash,
+            "sim_time_s": float(self._sim_time_s),
+            "created_at_epoch_s": time.time(),
+        }
+        return encode_checkpoint(meta, fields, key=key)
+
+    def restore(self, data: bytes, *, key: bytes, hardware_profile_hash: str | None = None) -> dict[str, Any]:
+        """
+        Replace this model's simulation truth with a `snapshot()` checkpoint; returns its meta.
+
+        Raises WorldCheckpointError for a malformed or unsigned checkpoint, another schema version,
+        another bot_config, (when both hashes are known) another hardware profile, or a field set
+        or field type that does not match this model. The model is left untouched on error.
+        """
+        meta, fields = decode_checkpoint(data, key=key)
+        if meta.get("kind") != _WORLD_CHECKPOINT_KIND:
+            raise WorldCheckpointError(f"unexpected checkpoint kind {meta.get('kind')!r}")
+        if meta.get("schema_version") != WORLD_CHECKPOINT_SCHEMA_VERSION:
+            raise WorldCheckpointError(
+                f"checkpoint schema version {meta.get('schema_version')!r} != {WORLD_CHECKPOINT_SCHEMA_VERSION}"
+            )
+        if meta.get("bot_config_fingerprint") != self._bot_config_fingerprint:
+            raise WorldCheckpointError("checkpoint was taken under another bot_config")
+        saved_hash = meta.get("hardware_profile_hash")
+        if hardware_profile_hash and saved_hash and saved_hash != hardware_profile_hash:
+            raise WorldCheckpointError(
+                f"checkpoint hardware profile {saved_hash} does not match {hardware_profile_hash}"
+            )
+        expected = {name for names in _WORLD_CHECKPOINT_FIELDS.values() for name in names}
+        if set(fields) != expected:
+            missing = sorted(expected - set(fields))
+            unexpected = sorted(set(fields) - expected)
+            raise WorldCheckpointError(f"checkpoint field set mismatch (missing={missing}, unexpected={unexpected})")
+
+        values = self._checkpoint_values(fields)
+        mcqpu_state = values.pop("_mcqpu_state")
+        for name, value in values.items():
+            setattr(self, name, value)
+        self._mcqpu.state = mcqpu_state
+        self._state_dirty = set(self._STATE_PLANES)
+        self._state_sections = {}
+        self.invalidate_state()
+        return meta
+
+    def _checkpoint_values(self, fields: Mapping[str, Any]) -> dict[str, Any]:
+        # Decode and type-check every field before anything is assigned.
+        values: dict[str, Any] = {}
+        for name, saved in fields.items():
+            if name == "position":
+                if not isinstance(saved, list) or len(saved) != 3:
+                    raise WorldCheckpointError("checkpoint field position: expected [x, y, z]")
+                x, y, z = (_checkpoint_value(name, v, 0.0) for v in saved)
+                values[name] = Vector3(x=x, y=y, z=z)
+            elif name == "_rcs_thruster_state":
+                if not isinstance(saved, list):
+                    raise WorldCheckpointError(f"checkpoint field {name}: expected a list of [index, state]")
+                state: dict[int, dict[str, Any]] = {}
+                for item in saved:
+                    if not (isinstance(item, list) and len(item) == 2 and type(item[0]) is int):
+                        raise WorldCheckpointError(f"checkpoint field {name}: expected [index, state] pairs")
+                    index, thruster = item
+                    if not 0 <= index < len(self._rcs_thrusters) or not isinstance(thruster, dict):
+                        raise WorldCheckpointError(f"checkpoint field {name}: unknown thruster {index}")
+                    state[index] = thruster
+                values[name] = state
+            elif name == "_mcqpu_state":
+                current = asdict(self._mcqpu.state)
+                if not isinstance(saved, dict) or set(saved) != set(current):
+                    raise WorldCheckpointError(f"checkpoint field {name}: expected keys {sorted(current)}")
+                values[name] = MCQPUTelemetryState(
+                    **{k: _checkpoint_value(f"{name}.{k}", saved[k], current[k]) for k in current}
                 )
-        battery_temp_state, supercap_temp_state = _power_component_temp_states(thermal_nodes)
+            else:
+                values[name] = _checkpoint_value(name, saved, getattr(self, name))
+        if set(values["_thermal_nodes"]) != set(self._thermal_nodes):
+            raise WorldCheckpointError("checkpoint thermal nodes do not match this model")
+        return values
+
+    def _build_state_plane(self, plane: str, sections: Mapping[str, Any]) -> Dict[str, Any]:
+        if plane == "power":
+            return self._state_power(sections["thermal"]["nodes"])
+        return getattr(self, f"_state_{plane}")()
+
+    @staticmethod
+    def _assemble_state(sections: Mapping[str, Any]) -> Dict[str, Any]:
+        return {
+            **sections["core"],
+            "thermal": sections["thermal"],
+            "power": sections["power"],
+            "propulsion": sections["propulsion"],
+            "docking": sections["docking"],
+            "sensor_plane": sections["sensor_plane"],
+        }
+
+    @staticmethod
+    def _status_from_bool(ok: bool | None, *, enabled: bool, warn_on_false: bool = False) -> tuple[str, str]:
+        if not enabled:
+            return ("na", "disabled")
+        if ok is None:
+            return ("na", "no reading")
+        if ok:
+            return ("ok", "ok")
+        return ("warn" if warn_on_false else "crit", "not ok")
+
+    @staticmethod
+    def _status_from_limits(
+        value: float | None, *, enabled: bool, warn: float | None, crit: float | None
+    ) -> tuple[str, str, dict | None]:
+        if not enabled:
+            return ("na", "disabled", None)
+        if value is None:
+            return ("na", "no reading", None)
+        if warn is None or crit is None:
+            return ("na", "limits not configured", None)
+        if float(value) >= float(crit):
+            return ("crit", f"value>=crit ({value:.3g}>={crit:.3g})", {"warn_usvh": warn, "crit_usvh": crit})
+        if float(value) >= float(warn):
+            return ("warn", f"value>=warn ({value:.3g}>={warn:.3g})", {"warn_usvh": warn, "crit_usvh": crit})
+        return ("ok", "within limits", {"warn_usvh": warn, "crit_usvh": crit})
+
+    def _state_core(self) -> Dict[str, Any]:
         heading_rad = math.radians(float(self.heading))
         vel_x = float(self.speed) * math.sin(heading_rad)
         vel_y = float(self.speed) * math.cos(heading_rad)
@@ -2577,20 +2997,6 @@ class WorldModel:
             orbit_period_min = None
             orbit_eccentricity = None
 
-        bus_v = float(self.power_bus_v)
-        half_delta_v = float(self._battery_channel_delta_v) / 2.0
-        battery_1_voltage_v = max(0.0, bus_v + half_delta_v)
-        battery_2_voltage_v = max(0.0, bus_v - half_delta_v)
-
-        propellant_init = max(0.0, float(self._rcs_propellant_kg_initial))
-        propellant_now = max(0.0, float(self._rcs_propellant_kg))
-        propellant_total_g = propellant_init * 1000.0
-        remaining_fuel_g = propellant_now * 1000.0
-        fuel_pct = 0.0 if propellant_init <= 0.0 else max(0.0, min(100.0, (propellant_now / propellant_init) * 100.0))
-        fill_ratio = 0.0 if propellant_init <= 0.0 else max(0.0, min(1.0, propellant_now / propellant_init))
-        pressure_span = max(0.0, float(self._propellant_tank_pressure_nominal_pa - self._propellant_tank_pressure_min_pa))
-        propellant_tank_pressure_pa = float(self._propellant_tank_pressure_min_pa + pressure_span * fill_ratio)
-        oxidizer_mass_kg = max(0.0, propellant_now * float(self._oxidizer_mass_ratio))
         return {
             "position": {
                 "x": self.position.x,
@@ -2631,137 +3037,172 @@ class WorldModel:
             },
             "cpu_usage": self.cpu_usage,
             "memory_usage": self.memory_usage,
-            "thermal": {
-                "nodes": thermal_nodes,
+        }
+
+    def _state_thermal(self) -> Dict[str, Any]:
+        thermal_nodes: list[dict[str, float | str | bool]] = []
+        if self._thermal_enabled and self._thermal_nodes_order:
+            for nid in self._thermal_nodes_order:
+                node = self._thermal_nodes.get(nid)
+                if not isinstance(node, dict):
+                    continue
+                temp_c = float(node.get("temp_c", self.temp_external_c))
+                tripped = bool(self._thermal_trip_state.get(nid, False))
+                warn_c = float(node.get("warn_c", 0.0))
+                warned = bool((not tripped) and warn_c > 0.0 and temp_c >= warn_c)
+                thermal_nodes.append(
+                    {
+                        "id": nid,
+                        "temp_c": temp_c,
+                        # Operator-facing (derived, no-mocks): explicit trip/warn state and thresholds.
+                        "tripped": tripped,
+                        "warned": warned,
+                        "warn_c": warn_c,
+                        "trip_c": float(node.get("trip_c", 0.0)),
+                        "hys_c": float(node.get("hys_c", 0.0)),
+                    }
+                )
+        return {"nodes": thermal_nodes}
+
+    def _state_power(self, thermal_nodes: Sequence[dict[str, Any]]) -> Dict[str, Any]:
+        battery_temp_state, supercap_temp_state = _power_component_temp_states(thermal_nodes)
+        bus_v = float(self.power_bus_v)
+        half_delta_v = float(self._battery_channel_delta_v) / 2.0
+        battery_1_voltage_v = max(0.0, bus_v + half_delta_v)
+        battery_2_voltage_v = max(0.0, bus_v - half_delta_v)
+        return {
+            "soc_pct": self.battery_level,
+            "sources_w": dict(self.power_sources_w),
+            "loads_w": dict(self.power_loads_w),
+            "power_in_w": self.power_in_w,
+            "power_out_w": self.power_out_w,
+            "battery_capacity_wh": float(self._battery_capacity_wh),
+            "battery_charge_w": float(self.battery_charge_w),
+            "battery_discharge_w": float(self.battery_discharge_w),
+            "battery_temp_state": battery_temp_state,
+            "battery_spill_w": float(self.battery_spill_w),
+            "battery_unserved_w": float(self.battery_unserved_w),
+            "bus_v": self.power_bus_v,
+            "battery_1_voltage_v": battery_1_voltage_v,
+            "battery_2_voltage_v": battery_2_voltage_v,
+            "bus_a": self.power_bus_a,
+            "bus_v_min": float(self._bus_v_min),
+            "max_bus_a": float(self._max_bus_a),
+            "soc_shed_low_pct": float(self._eps_soc_shed_low_pct),
+            "soc_shed_high_pct": float(self._eps_soc_shed_high_pct),
+            "load_shedding": bool(self.power_load_shedding),
+            "shed_loads": list(self.power_shed_loads),
+            "shed_reasons": list(self.power_shed_reasons),
+            "pdu_limit_w": max(0.0, float(self._max_bus_a) * float(self.power_bus_v)),
+            "pdu_throttled": bool(self.power_pdu_throttled),
+            "throttled_loads": list(self.power_throttled_loads),
+            "faults": list(self.power_faults),
+            "supercap_soc_pct": float(self.supercap_soc_pct),
+            "supercap_capacity_wh": float(self._supercap_capacity_wh),
+            "supercap_charge_w": float(self.supercap_charge_w),
+            "supercap_discharge_w": float(self.supercap_discharge_w),
+            "supercap_temp_state": supercap_temp_state,
+            "dock_connected": bool(self.dock_connected),
+            "dock_soft_start_pct": float(self.dock_soft_start_pct),
+            "dock_power_w": float(self.dock_power_w),
+            "dock_v": float(self.dock_v),
+            "dock_a": float(self.dock_a),
+            "dock_temp_c": float(self.dock_temp_c),
+            "nbl_active": bool(self.nbl_active),
+            "nbl_allowed": bool(self.nbl_allowed),
+            "nbl_power_w": float(self.nbl_power_w),
+            "nbl_budget_w": float(self.nbl_budget_w),
+        }
+
+    def _state_propulsion(self) -> Dict[str, Any]:
+        propellant_init = max(0.0, float(self._rcs_propellant_kg_initial))
+        propellant_now = max(0.0, float(self._rcs_propellant_kg))
+        propellant_total_g = propellant_init * 1000.0
+        remaining_fuel_g = propellant_now * 1000.0
+        fuel_pct = 0.0 if propellant_init <= 0.0 else max(0.0, min(100.0, (propellant_now / propellant_init) * 100.0))
+        fill_ratio = 0.0 if propellant_init <= 0.0 else max(0.0, min(1.0, propellant_now / propellant_init))
+        pressure_span = max(0.0, float(self._propellant_tank_pressure_nominal_pa - self._propellant_tank_pressure_min_pa))
+        propellant_tank_pressure_pa = float(self._propellant_tank_pressure_min_pa + pressure_span * fill_ratio)
+        oxidizer_mass_kg = max(0.0, propellant_now * float(self._oxidizer_mass_ratio))
+        return {
+            "fuel_pct": fuel_pct,
+            "fuel_total_g": propellant_total_g,
+            "fuel_rate_gs": float(self._rcs_fuel_rate_gs),
+            "remaining_fuel_g": remaining_fuel_g,
+            "propellant_tank_pressure_pa": propellant_tank_pressure_pa,
+            "oxidizer_mass_kg": oxidizer_mass_kg,
+            "rcs": {
+                "enabled": bool(self._rcs_enabled),
+                "active": bool(self.rcs_active),
+                "throttled": bool(self.rcs_throttled),
+                "axis": self._rcs_last_axis,
+                "command_pct": float(self._rcs_cmd_pct),
+                "time_left_s": float(self._rcs_cmd_time_left_s),
+                "propellant_kg": float(self._rcs_propellant_kg),
+                "power_w": float(self.rcs_power_w),
+                "net_force_n": list(self._rcs_net_force_n),
+                "net_torque_nm": list(self._rcs_net_torque_nm),
+                "thrusters": [dict(self._rcs_thruster_state[i]) for i in sorted(self._rcs_thruster_state.keys())],
+            },
+        }
+
+    def _state_docking(self) -> Dict[str, Any]:
+        return {
+            "enabled": bool(self._docking_enabled),
+            "state": self.docking_state,
+            "connected": bool(self.docking_connected),
+            "port": self.docking_port,
+            "ports": list(self._docking_ports),
+        }
+
+    def _state_sensor_plane(self) -> Dict[str, Any]:
+        imu_status, imu_reason = self._status_from_bool(self._imu_ok, enabled=bool(self._imu_enabled))
+        radiation_status, radiation_reason, radiation_limits = self._status_from_limits(
+            float(self.radiation_usvh) if self._radiation_enabled else None,
+            enabled=bool(self._radiation_enabled),
+            warn=self._radiation_warn_usvh,
+            crit=self._radiation_crit_usvh,
+        )
+        star_status, star_reason = self._status_from_bool(
+            self._star_tracker_locked, enabled=bool(self._star_tracker_enabled), warn_on_false=True
+        )
+        return {
+            "enabled": bool(self._sensor_plane_enabled),
+            "imu": {
+                "enabled": bool(self._imu_enabled),
+                "status": imu_status,
+                "reason": imu_reason,
+                "ok": self._imu_ok,
+                "roll_rate_rps": self._imu_roll_rate_rps,
+                "pitch_rate_rps": self._imu_pitch_rate_rps,
+                "yaw_rate_rps": self._imu_yaw_rate_rps,
             },
-            "power": {
-                "soc_pct": self.battery_level,
-                "sources_w": dict(self.power_sources_w),
-                "loads_w": dict(self.power_loads_w),
-                "power_in_w": self.power_in_w,
-                "power_out_w": self.power_out_w,
-                "battery_capacity_wh": float(self._battery_capacity_wh),
-                "battery_charge_w": float(self.battery_charge_w),
-                "battery_discharge_w": float(self.battery_discharge_w),
-                "battery_temp_state": battery_temp_state,
-                "battery_spill_w": float(self.battery_spill_w),
-                "battery_unserved_w": float(self.battery_unserved_w),
-                "bus_v": self.power_bus_v,
-                "battery_1_voltage_v": battery_1_voltage_v,
-                "battery_2_voltage_v": battery_2_voltage_v,
-                "bus_a": self.power_bus_a,
-                "bus_v_min": float(self._bus_v_min),
-                "max_bus_a": float(self._max_bus_a),
-                "soc_shed_low_pct": float(self._eps_soc_shed_low_pct),
-                "soc_shed_high_pct": float(self._eps_soc_shed_high_pct),
-                "load_shedding": bool(self.power_load_shedding),
-                "shed_loads": list(self.power_shed_loads),
-                "shed_reasons": list(self.power_shed_reasons),
-                "pdu_limit_w": max(0.0, float(self._max_bus_a) * float(self.power_bus_v)),
-                "pdu_throttled": bool(self.power_pdu_throttled),
-                "throttled_loads": list(self.power_throttled_loads),
-                "faults": list(self.power_faults),
-                "supercap_soc_pct": float(self.supercap_soc_pct),
-                "supercap_capacity_wh": float(self._supercap_capacity_wh),
-                "supercap_charge_w": float(self.supercap_charge_w),
-                "supercap_discharge_w": float(self.supercap_discharge_w),
-                "supercap_temp_state": supercap_temp_state,
-                "dock_connected": bool(self.dock_connected),
-                "dock_soft_start_pct": float(self.dock_soft_start_pct),
-                "dock_power_w": float(self.dock_power_w),
-                "dock_v": float(self.dock_v),
-                "dock_a": float(self.dock_a),
-                "dock_temp_c": float(self.dock_temp_c),
-                "nbl_active": bool(self.nbl_active),
-                "nbl_allowed": bool(self.nbl_allowed),
-                "nbl_power_w": float(self.nbl_power_w),
-                "nbl_budget_w": float(self.nbl_budget_w),
+            "radiation": {
+                "enabled": bool(self._radiation_enabled),
+                "background_usvh": float(self.radiation_usvh) if self._radiation_enabled else None,
+                "dose_total_usv": self._radiation_dose_total_usv,
+                "status": radiation_status,
+                "reason": radiation_reason,
+                "limits": radiation_limits,
             },
-            "propulsion": {
-                "fuel_pct": fuel_pct,
-                "fuel_total_g": propellant_total_g,
-                "fuel_rate_gs": float(self._rcs_fuel_rate_gs),
-                "remaining_fuel_g": remaining_fuel_g,
-                "propellant_tank_pressure_pa": propellant_tank_pressure_pa,
-                "oxidizer_mass_kg": oxidizer_mass_kg,
-                "rcs": {
-                    "enabled": bool(self._rcs_enabled),
-                    "active": bool(self.rcs_active),
-                    "throttled": bool(self.rcs_throttled),
-                    "axis": self._rcs_last_axis,
-                    "command_pct": float(self._rcs_cmd_pct),
-                    "time_left_s": float(self._rcs_cmd_time_left_s),
-                    "propellant_kg": float(self._rcs_propellant_kg),
-                    "power_w": float(self.rcs_power_w),
-                    "net_force_n": list(self._rcs_net_force_n),
-                    "net_torque_nm": list(self._rcs_net_torque_nm),
-                    "thrusters": [dict(self._rcs_thruster_state[i]) for i in sorted(self._rcs_thruster_state.keys())],
-                }
+            "proximity": {
+                "enabled": bool(self._proximity_enabled),
+                "min_range_m": self._proximity_min_range_m,
+                "contacts": self._proximity_contacts,
+            },
+            "solar": {
+                "enabled": bool(self._solar_enabled),
+                "illumination_pct": self._solar_illumination_pct,
             },
-            "docking": {
-                "enabled": bool(self._docking_enabled),
-                "state": self.docking_state,
-                "connected": bool(self.docking_connected),
-                "port": self.docking_port,
-                "ports": list(self._docking_ports),
+            "star_tracker": {
+                "enabled": bool(self._star_tracker_enabled),
+                "status": star_status,
+                "reason": star_reason,
+                "locked": self._star_tracker_locked,
+                "attitude_err_deg": self._star_tracker_attitude_err_deg,
             },
-            "sensor_plane": {
-                "enabled": bool(self._sensor_plane_enabled),
-                "imu": {
-                    "enabled": bool(self._imu_enabled),
-                    "status": _status_from_bool(self._imu_ok, enabled=bool(self._imu_enabled))[0],
-                    "reason": _status_from_bool(self._imu_ok, enabled=bool(self._imu_enabled))[1],
-                    "ok": self._imu_ok,
-                    "roll_rate_rps": self._imu_roll_rate_rps,
-                    "pitch_rate_rps": self._imu_pitch_rate_rps,
-                    "yaw_rate_rps": self._imu_yaw_rate_rps,
-                },
-                "radiation": {
-                    "enabled": bool(self._radiation_enabled),
-                    "background_usvh": float(self.radiation_usvh) if self._radiation_enabled else None,
-                    "dose_total_usv": self._radiation_dose_total_usv,
-                    "status": _status_from_limits(
-                        float(self.radiation_usvh) if self._radiation_enabled else None,
-                        enabled=bool(self._radiation_enabled),
-                        warn=self._radiation_warn_usvh,
-                        crit=self._radiation_crit_usvh,
-                    )[0],
-                    "reason": _status_from_limits(
-                        float(self.radiation_usvh) if self._radiation_enabled else None,
-                        enabled=bool(self._radiation_enabled),
-                        warn=self._radiation_warn_usvh,
-                        crit=self._radiation_crit_usvh,
-                    )[1],
-                    "limits": _status_from_limits(
-                        float(self.radiation_usvh) if self._radiation_enabled else None,
-                        enabled=bool(self._radiation_enabled),
-                        warn=self._radiation_warn_usvh,
-                        crit=self._radiation_crit_usvh,
-                    )[2],
-                },
-                "proximity": {
-                    "enabled": bool(self._proximity_enabled),
-                    "min_range_m": self._proximity_min_range_m,
-                    "contacts": self._proximity_contacts,
-                },
-                "solar": {
-                    "enabled": bool(self._solar_enabled),
-                    "illumination_pct": self._solar_illumination_pct,
-                },
-                "star_tracker": {
-                    "enabled": bool(self._star_tracker_enabled),
-                    "status": _status_from_bool(
-                        self._star_tracker_locked, enabled=bool(self._star_tracker_enabled), warn_on_false=True
-                    )[0],
-                    "reason": _status_from_bool(
-                        self._star_tracker_locked, enabled=bool(self._star_tracker_enabled), warn_on_false=True
-                    )[1],
-                    "locked": self._star_tracker_locked,
-                    "attitude_err_deg": self._star_tracker_attitude_err_deg,
-                },
-                "magnetometer": {
-                    "enabled": bool(self._magnetometer_enabled),
-                    "field_ut": self._mag_field_ut,
-                },
+            "magnetometer": {
+                "enabled": bool(self._magnetometer_enabled),
+                "field_ut": self._mag_field_ut,
             },
         }
@@ -0,0 +1,478 @@
+"""Monte Carlo ensemble of headless Q-Sim runs on a process pool.
+
+    python -m qiki.services.q_sim_service.ensemble --runs 64 --duration 600 --dt 0.5 \\
+        --perturb hardware_profile.battery_soc_init_pct=5:40 --scene-jitter-m 30 \\
+        --out artifacts/qsim_ensemble.json
+
+One run: `WorldModel` over a perturbed `bot_config` plus a seeded jitter of the default
+`ObjectiveScene`. Every `radar_every_s` the scene is observed into a radar frame, fed to a
+`RadarTrackStore`, and its tracks go through the guard table (`RadarGuardCadence`, edge-only
+alerts). The SAFE state is derived from the world's power/thermal planes on the same cadence.
+Runs are independent and seeded from `(seed, run index)`, so results do not depend on the
+process they ran in or on the order they finished in.
+
+Result file (JSON, columnar): `{"kind": "qsim_ensemble_result", "schema_version": 1,
+"spec": {...}, "runs": n, "columns": {name: [value per run, by run index]}}`.
+
+Checkpoint (JSON Lines, default `<out>.partial.jsonl`): a header with the spec fingerprint,
+then one finished run per line, flushed as it completes. A rerun with the same spec skips the
+runs already in the checkpoint; a checkpoint for another spec is an error. The checkpoint is
+removed once the result file is written.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator
+from uuid import NAMESPACE_URL, uuid5
+
+ENSEMBLE_SCHEMA_VERSION = 1
+
+# Per-run metric columns, in result-file order (after "run", "seed" and the "p:<path>" columns).
+METRIC_FIELDS: tuple[str, ...] = (
+    "sim_s",
+    "wall_s",
+    "radar_frames",
+    "time_to_safe_mode_s",
+    "safe_reason",
+    "safe_state_final",
+    "guard_alerts",
+    "guard_alerts_critical",
+    "tracks_spawned",
+    "track_breaks",
+    "track_continuity",
+    "max_tracks",
+    "soc_final_pct",
+    "thermal_max_c",
+)
+
+
+class EnsembleError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class EnsembleSpec:
+    runs: int
+    duration_s: float
+    dt: float = 0.5
+    seed: int = 0
+    radar_every_s: float = 1.0
+    # Dotted bot_config path -> (low, high); each run draws a uniform value per path.
+    perturb: dict[str, tuple[float, float]] = field(default_factory=dict)
+    # Uniform jitter of the objective-scene objects (per axis).
+    scene_jitter_m: float = 0.0
+    scene_velocity_jitter_m_s: float = 0.0
+    sr_threshold_m: float = 100.0
+    # Base bot_config; None loads the repository bot_config.json (as QSimService does).
+    bot_config: dict[str, Any] | None = None
+
+    def __post_init__(self) -> None:
+        if int(self.runs) < 1:
+            raise ValueError("runs must be >= 1")
+        if not (float(self.dt) > 0.0 and math.isfinite(float(self.dt))):
+            raise ValueError("dt must be a positive number")
+        for path, bounds in self.perturb.items():
+            low, high = (float(v) for v in bounds)
+            if not (math.isfinite(low) and math.isfinite(high)) or high < low:
+                raise ValueError(f"perturb {path}: expected finite low <= high, got {bounds!r}")
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["perturb"] = {path: [float(low), float(high)] for path, (low, high) in sorted(self.perturb.items())}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EnsembleSpec":
+        values = dict(data)
+        values["perturb"] = {path: (float(low), float(high)) for path, (low, high) in values.get("perturb", {}).items()}
+        return cls(**values)
+
+    def fingerprint(self) -> str:
+        encoded = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+    def result_columns(self) -> tuple[str, ...]:
+        return ("run", "seed", *(f"p:{path}" for path in sorted(self.perturb)), *METRIC_FIELDS)
+
+
+@dataclass(frozen=True)
+class EnsembleReport:
+    runs: int
+    executed: int
+    resumed: int
+    pending: int
+    processes: int
+    wall_s: float
+    result_path: str | None = None
+    checkpoint_path: str | None = None
+
+
+def run_seed(spec: EnsembleSpec, index: int) -> int:
+    """Seed of run `index`: stable across processes and Python versions."""
+    digest = hashlib.sha256(f"{int(spec.seed)}:{int(index)}".encode("ascii")).digest()
+    return int.from_bytes(digest[:8], "big") >> 1
+
+
+def run_parameters(spec: EnsembleSpec, index: int) -> dict[str, float]:
+    rnd = random.Random(run_seed(spec, index))
+    return {path: rnd.uniform(low, high) for path, (low, high) in sorted(spec.perturb.items())}
+
+
+def run_one(spec: EnsembleSpec, index: int) -> dict[str, Any]:
+    """Run `index` of the ensemble in this process; a result-file row (column -> value)."""
+    from qiki.services.faststream_bridge.radar_guard_cadence import RadarGuardCadence
+    from qiki.services.faststream_bridge.radar_track_store import RadarTrackStore
+    from qiki.services.q_core_agent.core.guard_table import load_guard_table
+    from qiki.services.q_sim_service.core.objective_scene import (
+        ObjectiveScene,
+        build_radar_detections_from_objective_world,
+    )
+    from qiki.services.q_sim_service.core.world_model import WorldModel, safe_state_from_runtime_state
+    from qiki.shared.models.radar import RadarFrameModel
+    from qiki.shared.world_snapshot import WorldSnapshotRef
+
+    seed = run_seed(spec, index)
+    params = run_parameters(spec, index)
+    bot_config = copy.deepcopy(spec.bot_config if spec.bot_config is not None else _default_bot_config())
+    for path, value in params.items():
+        _set_path(bot_config, path, value)
+    world = WorldModel(bot_config=bot_config)
+    scene = _jittered_scene(ObjectiveScene.default(sr_threshold_m=spec.sr_threshold_m), spec, random.Random(seed))
+    store = RadarTrackStore()
+    cadence = RadarGuardCadence(load_guard_table())
+    sensor_id = uuid5(NAMESPACE_URL, f"qsim-ensemble/{spec.fingerprint()}/{index}")
+
+    dt = float(spec.dt)
+    steps = max(0, int(math.ceil(float(spec.duration_s) / dt - 1e-9)))
+    # Как в batch.run_batch: последний шаг укорачивается, прогон кончается ровно на duration_s.
+    last_dt = float(spec.duration_s) - (steps - 1) * dt
+    if abs(last_dt - dt) <= 1e-9 * dt:
+        last_dt = dt
+    radar_every = max(1, int(round(float(spec.radar_every_s) / dt)))
+    frames = guard_alerts = guard_critical = track_breaks = carried_over = max_tracks = 0
+    seen_tracks: set[Any] = set()
+    previous_tracks: set[Any] = set()
+    time_to_safe: float | None = None
+    safe_reason: str | None = None
+    safe_state = "safe_unknown"
+    thermal_max: float | None = None
+
+    started = time.perf_counter()
+    for step in range(1, steps + 1):
+        step_dt = dt if step != steps else last_dt
+        world.step(step_dt)
+        scene.step(step_dt)
+        if step % radar_every and step != steps:
+            continue
+        state = world.state_snapshot()
+        for node in state["thermal"]["nodes"]:
+            temp = node.get("temp_c")
+            if isinstance(temp, (int, float)) and (thermal_max is None or temp > thermal_max):
+                thermal_max = float(temp)
+        safe = safe_state_from_runtime_state(power=state["power"], thermal=state["thermal"])
+        safe_state = safe.SAFE_state
+        if time_to_safe is None and safe.reason_codes:
+            time_to_safe = round(world.sim_time_s(), 6)
+            safe_reason = safe.SAFE_reason
+
+        detections = []
+        if getattr(world, "radar_allowed", True):
+            objective = scene.build_state(
+                world_ref=WorldSnapshotRef(source="objective_world", sim_time_s=world.sim_time_s()),
+                observer_position_xyz_m=state["position"],
+                sr_threshold_m=spec.sr_threshold_m,
+            )
+            detections = build_radar_detections_from_objective_world(
+                objective,
+                observer_position_xyz_m=state["position"],
+                observer_velocity_xyz_m_s=state.get("velocity_xyz_m_s"),
+                sr_threshold_m=spec.sr_threshold_m,
+            )
+        frame = RadarFrameModel(
+            sensor_id=sensor_id,
+            timestamp=datetime.fromtimestamp(world.sim_time_epoch_ts(), tz=timezone.utc),
+            detections=detections,
+        )
+        tracks = store.process_frame(frame)
+        frames += 1
+        current = {track.track_id for track in tracks}
+        track_breaks += len(previous_tracks - current)
+        carried_over += len(previous_tracks & current)
+        seen_tracks |= current
+        previous_tracks = current
+        max_tracks = max(max_tracks, len(current))
+        for track in tracks:
+            for alert in cadence.update(track):
+                guard_alerts += 1
+                guard_critical += alert.severity == "critical"
+    wall_s = time.perf_counter() - started
+
+    followed = carried_over + track_breaks
+    state = world.state_snapshot()
+    row: dict[str, Any] = {"run": int(index), "seed": seed}
+    row.update({f"p:{path}": round(value, 9) for path, value in params.items()})
+    row.update(
+        {
+            "sim_s": round((steps - 1) * dt + last_dt if steps else 0.0, 6),
+            "wall_s": round(wall_s, 6),
+            "radar_frames": frames,
+            "time_to_safe_mode_s": time_to_safe,
+            "safe_reason": safe_reason,
+            "safe_state_final": safe_state,
+            "guard_alerts": guard_alerts,
+            "guard_alerts_critical": int(guard_critical),
+            "tracks_spawned": len(seen_tracks),
+            "track_breaks": track_breaks,
+            # Share of (track, frame) continuations where a track present in one frame is still there in the next.
+            "track_continuity": round(carried_over / followed, 6) if followed else None,
+            "max_tracks": max_tracks,
+            "soc_final_pct": round(float(state["power"]["soc_pct"]), 6),
+            "thermal_max_c": None if thermal_max is None else round(thermal_max, 6),
+        }
+    )
+    return row
+
+
+def run_ensemble(
+    spec: EnsembleSpec,
+    result_path: str | Path,
+    *,
+    processes: int | None = None,
+    checkpoint_path: str | Path | None = None,
+    limit: int | None = None,
+    start_method: str | None = None,
+    on_run: Callable[[dict[str, Any]], None] | None = None,
+) -> EnsembleReport:
+    """
+    Run every ensemble member not yet in the checkpoint and write the columnar result file.
+    `processes` <= 1 runs in this process; `limit` stops after that many runs this call (the
+    checkpoint keeps them, a later call resumes), in which case no result file is written yet.
+    """
+    result = Path(result_path)
+    checkpoint = (
+        Path(checkpoint_path) if checkpoint_path is not None else result.with_name(result.name + ".partial.jsonl")
+    )
+    done = load_checkpoint(checkpoint, spec)
+    resumed = len(done)
+    pending = [index for index in range(int(spec.runs)) if index not in done]
+    if limit is not None:
+        pending = pending[: max(0, int(limit))]
+    workers = processes if processes is not None else (os.cpu_count() or 1)
+    workers = max(1, min(int(workers), len(pending) or 1))
+
+    started = time.perf_counter()
+    with _checkpoint_sink(checkpoint, spec) as sink:
+
+        def record(row: dict[str, Any]) -> None:
+            done[int(row["run"])] = row
+            sink.write(json.dumps(row, separators=(",", ":")) + "\n")
+            sink.flush()
+            if on_run is not None:
+                on_run(row)
+
+        if workers == 1:
+            for index in pending:
+                record(run_one(spec, index))
+        else:
+            context = multiprocessing.get_context(start_method)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                futures = {pool.submit(run_one, spec, index) for index in pending}
+                while futures:
+                    finished, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        record(future.result())
+    wall_s = time.perf_counter() - started
+
+    remaining = int(spec.runs) - len(done)
+    written: str | None = None
+    if remaining == 0:
+        write_result(result, spec, [done[index] for index in range(int(spec.runs))])
+        checkpoint.unlink(missing_ok=True)
+        written = str(result)
+    return EnsembleReport(
+        runs=int(spec.runs),
+        executed=len(done) - resumed,
+        resumed=resumed,
+        pending=remaining,
+        processes=workers,
+        wall_s=round(wall_s, 6),
+        result_path=written,
+        checkpoint_path=None if remaining == 0 else str(checkpoint),
+    )
+
+
+def load_checkpoint(path: str | Path, spec: EnsembleSpec) -> dict[int, dict[str, Any]]:
+    """Finished runs of `spec` recorded in a checkpoint (empty if there is none)."""
+    target = Path(path)
+    if not target.exists():
+        return {}
+    rows: dict[int, dict[str, Any]] = {}
+    with target.open("r", encoding="utf-8") as fh:
+        header_line = fh.readline()
+        if not header_line.strip():
+            return {}
+        header = json.loads(header_line)
+        if header.get("kind") != "qsim_ensemble_checkpoint" or header.get("fingerprint") != spec.fingerprint():
+            raise EnsembleError(f"checkpoint {target} belongs to a different ensemble spec")
+        for line in fh:
+            if not line.endswith("\n"):
+                break  # torn last line of an interrupted write; that run is redone
+            row = json.loads(line)
+            index = int(row["run"])
+            if 0 <= index < int(spec.runs):
+                rows[index] = row
+    return rows
+
+
+@contextmanager
+def _checkpoint_sink(path: Path, spec: EnsembleSpec) -> Iterator[IO[str]]:
+    """Append handle on the checkpoint; the header and surviving rows are rewritten first."""
+    rows = load_checkpoint(path, spec)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as fh:
+        header = {
+            "kind": "qsim_ensemble_checkpoint",
+            "schema_version": ENSEMBLE_SCHEMA_VERSION,
+            "fingerprint": spec.fingerprint(),
+        }
+        fh.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for index in sorted(rows):
+            fh.write(json.dumps(rows[index], separators=(",", ":")) + "\n")
+    os.replace(tmp, path)
+    with path.open("a", encoding="utf-8") as fh:
+        yield fh
+
+
+def write_result(path: str | Path, spec: EnsembleSpec, rows: list[dict[str, Any]]) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    names = spec.result_columns()
+    payload = {
+        "kind": "qsim_ensemble_result",
+        "schema_version": ENSEMBLE_SCHEMA_VERSION,
+        "fingerprint": spec.fingerprint(),
+        "spec": spec.to_dict(),
+        "runs": len(rows),
+        "columns": {name: [row.get(name) for row in rows] for name in names},
+    }
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, target)
+
+
+def read_result(path: str | Path) -> dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _default_bot_config() -> dict[str, Any]:
+    path = Path(__file__).resolve().parents[1] / "q_core_agent" / "config" / "bot_config.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _set_path(config: dict[str, Any], dotted: str, value: float) -> None:
+    node = config
+    keys = dotted.split(".")
+    for key in keys[:-1]:
+        child = node.get(key)
+        if not isinstance(child, dict):
+            child = node[key] = {}
+        node = child
+    node[keys[-1]] = value
+
+
+def _jittered_scene(scene: Any, spec: EnsembleSpec, rnd: random.Random) -> Any:
+    jitter = max(0.0, float(spec.scene_jitter_m))
+    vel_jitter = max(0.0, float(spec.scene_velocity_jitter_m_s))
+    if jitter <= 0.0 and vel_jitter <= 0.0:
+        return scene
+    objects = []
+    for obj in scene.objects:
+        p, v = obj.position_xyz_m, obj.velocity_xyz_m_s
+        objects.append(
+            replace(
+                obj,
+                position_xyz_m=[
+                    p.x + rnd.uniform(-jitter, jitter),
+                    p.y + rnd.uniform(-jitter, jitter),
+                    p.z + rnd.uniform(-jitter, jitter),
+                ],
+                velocity_xyz_m_s=[
+                    v.x + rnd.uniform(-vel_jitter, vel_jitter),
+                    v.y + rnd.uniform(-vel_jitter, vel_jitter),
+                    v.z + rnd.uniform(-vel_jitter, vel_jitter),
+                ],
+            )
+        )
+    scene.objects = tuple(objects)
+    return scene
+
+
+def _parse_perturb(items: list[str]) -> dict[str, tuple[float, float]]:
+    perturb: dict[str, tuple[float, float]] = {}
+    for item in items:
+        path, sep, bounds = item.partition("=")
+        low, colon, high = bounds.partition(":")
+        if not sep or not colon or not path.strip():
+            raise argparse.ArgumentTypeError(f"--perturb expects path=low:high, got {item!r}")
+        perturb[path.strip()] = (float(low), float(high))
+    return perturb
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="qsim-ensemble", description="Monte Carlo ensemble of headless Q-Sim runs")
+    parser.add_argument("--runs", type=int, required=True, help="Ensemble size")
+    parser.add_argument("--duration", type=float, required=True, help="Simulated seconds per run")
+    parser.add_argument("--dt", type=float, default=0.5, help="Step, seconds (default: 0.5)")
+    parser.add_argument("--seed", type=int, default=0, help="Ensemble seed (default: 0)")
+    parser.add_argument("--radar-every", type=float, default=1.0, help="Radar/guard/SAFE cadence, sim-seconds")
+    parser.add_argument("--perturb", action="append", default=[], help="bot_config path=low:high (repeatable)")
+    parser.add_argument("--scene-jitter-m", type=float, default=0.0, help="Objective-scene position jitter, m")
+    parser.add_argument("--scene-velocity-jitter", type=float, default=0.0, help="Objective-scene velocity jitter, m/s")
+    parser.add_argument("--sr-threshold", type=float, default=100.0, help="Radar SR threshold, m (default: 100)")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many runs (resume later)")
+    parser.add_argument("--out", required=True, help="Columnar result file (.json)")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint path (default: <out>.partial.jsonl)")
+    args = parser.parse_args(argv)
+
+    spec = EnsembleSpec(
+        runs=args.runs,
+        duration_s=args.duration,
+        dt=args.dt,
+        seed=args.seed,
+        radar_every_s=args.radar_every,
+        perturb=_parse_perturb(args.perturb),
+        scene_jitter_m=args.scene_jitter_m,
+        scene_velocity_jitter_m_s=args.scene_velocity_jitter,
+        sr_threshold_m=args.sr_threshold,
+    )
+    report = run_ensemble(
+        spec,
+        args.out,
+        processes=args.processes,
+        checkpoint_path=args.checkpoint,
+        limit=args.limit,
+    )
+    json.dump(asdict(report), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
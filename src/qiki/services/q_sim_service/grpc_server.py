@@ -6,7 +6,9 @@ import logging
 import os
 from datetime import datetime, timezone
 from concurrent import futures
+from contextlib import aclosing
 from pathlib import Path
+from typing import AsyncIterator
 
 import grpc
 import nats
@@ -20,6 +22,9 @@ from generated.q_sim_api_pb2 import (
     SendActuatorCommandResponse,
     GetRadarFrameRequest,
     GetRadarFrameResponse,
+    RadarFrameUpdate,
+    SensorDataUpdate,
+    StreamRequest,
 )
 from qiki.shared.converters.radar_proto_pydantic import model_frame_to_proto
 from generated.q_sim_api_pb2_grpc import (
@@ -27,6 +32,7 @@ from generated.q_sim_api_pb2_grpc import (
     add_QSimAPIServiceServicer_to_server,
 )
 from qiki.services.q_sim_service.service import QSimService
+from qiki.services.q_sim_service.stream_hub import RADAR_STREAM, SENSOR_STREAM
 from qiki.shared.config_models import QSimServiceConfig, load_config
 from qiki.shared.models.core import CommandMessage
 from qiki.shared.nats_subjects import COMMANDS_CONTROL, RESPONSES_CONTROL
@@ -84,6 +90,33 @@ def _describe_control_command_result(
     return ("rejected", "rejected")
 
 
+class _StreamCredits:
+    """Credit window of one stream; no opening credits = plain server push (unlimited)."""
+
+    def __init__(self, initial: int) -> None:
+        self._budget: int | None = int(initial) if initial > 0 else None
+        self._granted = asyncio.Event()
+
+    def grant(self, credits: int) -> None:
+        if self._budget is None or credits <= 0:
+            return
+        self._budget += int(credits)
+        self._granted.set()
+
+    async def acquire(self) -> None:
+        if self._budget is None:
+            return
+        while self._budget <= 0:
+            self._granted.clear()
+            await self._granted.wait()
+        self._budget -= 1
+
+
+async def _read_grants(request_iterator: AsyncIterator[StreamRequest], credits: _StreamCredits) -> None:
+    async for request in request_iterator:
+        credits.grant(request.credits)
+
+
 class QSimAPIService(QSimAPIServiceServicer):
     def __init__(self, sim_service: QSimService):
         self.sim_service = sim_service
@@ -127,14 +160,46 @@ class QSimAPIService(QSimAPIServiceServicer):
             context.set_details(str(exc))
             return GetRadarFrameResponse()
 
+    async def StreamSensorData(
+        self, request_iterator: AsyncIterator[StreamRequest], context: grpc.aio.ServicerContext
+    ) -> AsyncIterator[SensorDataUpdate]:
+        async with aclosing(self._stream_updates(request_iterator, SENSOR_STREAM)) as updates:
+            async for sequence, reading, conflated in updates:
+                yield SensorDataUpdate(reading=reading, sequence=sequence, conflated=conflated)
+
+    async def StreamRadarFrames(
+        self, request_iterator: AsyncIterator[StreamRequest], context: grpc.aio.ServicerContext
+    ) -> AsyncIterator[RadarFrameUpdate]:
+        # Тот же гейт 0.9, что и у GetRadarFrame: кадры публикуются только из идущего сима
+        # с разрешённым радаром, поэтому на паузе/стопе поток просто молчит.
+        async with aclosing(self._stream_updates(request_iterator, RADAR_STREAM)) as updates:
+            async for sequence, frame, conflated in updates:
+                yield RadarFrameUpdate(frame=frame, sequence=sequence, conflated=conflated)
+
+    async def _stream_updates(
+        self, request_iterator: AsyncIterator[StreamRequest], channel: str
+    ) -> AsyncIterator[tuple[int, object, int]]:
+        try:
+            opening = await request_iterator.__anext__()
+        except StopAsyncIteration:
+            opening = StreamRequest()
+        credits = _StreamCredits(opening.credits)
+        subscription = self.sim_service.stream_hub.subscribe(channel)
+        grants = asyncio.create_task(_read_grants(request_iterator, credits))
+        try:
+            while True:
+                await credits.acquire()
+                yield await subscription.get()
+        finally:
+            subscription.close()
+            grants.cancel()
+
 
 async def sim_service_loop(sim_service: QSimService) -> None:
     """Background task that runs the simulation step loop."""
     logging.info("Starting QSimService background loop")
     try:
-        while True:
-            sim_service.tick()
-            await asyncio.sleep(sim_service.config.sim_tick_interval)
+        await sim_service.run_async()
     except asyncio.CancelledError:
         logging.info("QSimService loop cancelled")
         raise
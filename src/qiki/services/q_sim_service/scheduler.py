@@ -0,0 +1,150 @@
+"""
+Fixed-step real-time scheduler for QSimService.
+
+Every simulation step advances the world by the same fixed dt; wall time only decides *how
+many* steps are due. An accumulator collects elapsed wall time (including the time spent in
+the steps themselves), runs one step per whole `tick_s` it holds and sleeps until the next
+step is due, so the tick period does not drift by the work time.
+
+When the host stalls, the debt is paid back with at most `max_catch_up_steps` steps per
+wakeup; anything beyond that is dropped (counted in `dropped_steps`) instead of spiralling.
+
+Per-output publish cadences are expressed in ticks (`TickDecimator`), not in wall seconds, so
+which steps publish is a pure function of the step index.
+
+The same scheduler drives the blocking `QSimService.run()` loop and, via
+`wait_until_next_step()`, the asyncio loop of the gRPC server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable
+
+
+def ticks_for_interval(interval_s: float, tick_s: float) -> int:
+    """Decimation factor that publishes roughly every `interval_s` at a `tick_s` step (>= 1)."""
+
+    if tick_s <= 0.0 or not math.isfinite(interval_s) or interval_s <= tick_s:
+        return 1
+    return max(1, int(round(interval_s / tick_s)))
+
+
+class TickDecimator:
+    """`due()` is true on the first call and then on every `every`-th call."""
+
+    def __init__(self, every: int = 1) -> None:
+        self.every = max(1, int(every))
+        self._countdown = 0
+
+    def due(self) -> bool:
+        if self._countdown > 0:
+            self._countdown -= 1
+            return False
+        self._countdown = self.every - 1
+        return True
+
+    def reset(self) -> None:
+        self._countdown = 0
+
+
+@dataclass
+class SchedulerStats:
+    steps: int = 0
+    wakeups: int = 0
+    catch_up_steps: int = 0
+    dropped_steps: int = 0
+    overruns: int = 0
+    last_jitter_s: float = 0.0
+    max_jitter_s: float = 0.0
+    mean_jitter_s: float = 0.0
+    last_work_s: float = 0.0
+    max_work_s: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class FixedStepScheduler:
+    """
+    Fixed-timestep loop with an accumulator and bounded catch-up.
+
+    Jitter is the lateness of the oldest due step at wakeup; an overrun is a step whose own
+    work took longer than `tick_s`.
+    """
+
+    def __init__(
+        self,
+        tick_s: float,
+        *,
+        max_catch_up_steps: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if not tick_s > 0.0:
+            raise ValueError("tick_s must be > 0")
+        self.tick_s = float(tick_s)
+        self.max_catch_up_steps = max(1, int(max_catch_up_steps))
+        self.stats = SchedulerStats()
+        self._clock = clock
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._accumulator = 0.0
+        self._last: float | None = None
+
+    def run_once(self, step: Callable[[], None]) -> int:
+        """Run the steps that are due now; returns how many ran."""
+
+        now = self._clock()
+        if self._last is None:
+            # The first step is due immediately.
+            self._accumulator = self.tick_s
+        else:
+            self._accumulator += now - self._last
+        self._last = now
+
+        due = int(self._accumulator // self.tick_s)
+        if due <= 0:
+            return 0
+        stats = self.stats
+        stats.wakeups += 1
+        jitter = self._accumulator - self.tick_s
+        stats.last_jitter_s = jitter
+        stats.max_jitter_s = max(stats.max_jitter_s, jitter)
+        stats.mean_jitter_s += (jitter - stats.mean_jitter_s) / stats.wakeups
+        if due > self.max_catch_up_steps:
+            stats.dropped_steps += due - self.max_catch_up_steps
+            self._accumulator -= (due - self.max_catch_up_steps) * self.tick_s
+            due = self.max_catch_up_steps
+        stats.catch_up_steps += due - 1
+
+        for _ in range(due):
+            started = self._clock()
+            step()
+            work = self._clock() - started
+            stats.steps += 1
+            stats.last_work_s = work
+            stats.max_work_s = max(stats.max_work_s, work)
+            if work > self.tick_s:
+                stats.overruns += 1
+            self._accumulator -= self.tick_s
+        return due
+
+    def time_to_next_step(self) -> float:
+        if self._last is None:
+            return 0.0
+        elapsed = self._clock() - self._last
+        return max(0.0, self.tick_s - self._accumulator - elapsed)
+
+    def sleep_until_next_step(self) -> None:
+        delay = self.time_to_next_step()
+        if delay > 0.0:
+            self._sleep(delay)
+
+    async def wait_until_next_step(self) -> None:
+        """`sleep_until_next_step()` for asyncio loops; always yields to the event loop."""
+        await self._async_sleep(self.time_to_next_step())
@@ -4,9 +4,11 @@ import asyncio
 import json
 import math
 import os
+import re
 import time
 from collections import deque
-from dataclasses import asdict
+from dataclasses import fields, replace
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import NAMESPACE_URL, uuid4, uuid5
@@ -31,10 +33,32 @@ from qiki.services.q_sim_service.core.world_model import (
     EMCON_BLOCK,
     WorldModel,
 )
+from qiki.services.q_sim_service.core.objective_scene import (
+    ObjectiveScene,
+    build_radar_detections_from_objective_world,
+)
+from qiki.services.q_sim_service.core.world_checkpoint import (
+    CHECKPOINT_MIN_KEY_BYTES,
+    CHECKPOINT_SUFFIX,
+    WorldCheckpointError,
+    ensure_private_dir,
+    read_checkpoint_meta,
+)
+from qiki.services.q_sim_service.batch import BatchReport, open_trace, run_batch as run_world_batch
 from qiki.services.q_sim_service.events_publisher import SimEventsNatsPublisher
 from qiki.services.q_sim_service.logger import logger
 from qiki.services.q_sim_service.radar_publisher import RadarNatsPublisher
+from qiki.services.q_sim_service.stream_hub import RADAR_STREAM, SENSOR_STREAM, SimStreamHub
 from qiki.services.q_sim_service.telemetry_publisher import TelemetryNatsPublisher
+from qiki.services.q_sim_service.scheduler import FixedStepScheduler, TickDecimator, ticks_for_interval
+from qiki.services.q_sim_service.telemetry_sections import (
+    TelemetryDeltaEncoder,
+    TelemetrySection,
+    TelemetrySectionCache,
+    encode_sections,
+    model_field_dumper,
+    payload_from_sections,
+)
 from qiki.shared.config.hardware_profile_hash import compute_hardware_profile_hash
 from qiki.shared.config_models import QSimServiceConfig
 from qiki.shared.converters.radar_proto_pydantic import model_frame_to_proto
@@ -50,17 +74,65 @@ from qiki.shared.models.pdu import pdu_permissions_from_power_state
 from qiki.shared.models.rcs import rcs_command_from_runtime_state
 from qiki.shared.models.sensors import sensor_telemetry_from_sensor_plane
 from qiki.shared.models.telemetry import TelemetrySnapshotModel
-from qiki.shared.nats_subjects import SIM_POWER_BUS, SIM_POWER_PDU, SIM_SENSOR_THERMAL, SIM_SENSOR_THERMAL_TRIP
+from qiki.shared.objective_world import ObjectiveWorldState
+from qiki.shared.nats_subjects import (
+    SIM_POWER_BUS,
+    SIM_POWER_PDU,
+    SIM_SENSOR_THERMAL,
+    SIM_SENSOR_THERMAL_TRIP,
+    SYSTEM_TELEMETRY_DELTA,
+)
 
 _QSIM_SENSOR_QUEUE_DEFAULT_MAX = 256
 _QSIM_RADAR_FRAMES_DEFAULT_MAX = 256
 _QSIM_OVERFLOW_LOG_PERIOD_S = 10.0
+_CHECKPOINT_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,63}")
+
+
+def _read_positive_int(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Invalid %s=%r; using %d", name, raw, default)
+        return default
+
+
+@lru_cache(maxsize=None)
+def _record_field_names(record_type: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(record_type))
+
+
+def _record_dict(record) -> dict:
+    # dataclasses.asdict without its recursive deepcopy: IF records hold scalars, tuples and
+    # dicts built fresh by their mapper (never nested dataclasses or shared input blocks).
+    return {name: getattr(record, name) for name in _record_field_names(type(record))}
+
+
+@lru_cache(maxsize=None)
+def _telemetry_dumper(name: str):
+    dump = model_field_dumper(TelemetrySnapshotModel, name)
+    if name != "comms":
+        return dump
+
+    def dump_comms(source: dict) -> dict:
+        comms = dump(source)
+        if isinstance(comms, dict):
+            comms.pop("age_s", None)
+            comms.pop("last_seen_ts", None)
+        return comms
+
+    return dump_comms
 
 
 class QSimService:
     def __init__(self, config: QSimServiceConfig):
         self.config = config
         self._sr_threshold_m = self._read_sr_threshold_m()
+        self._radar_sim_targets = self._read_radar_sim_targets()
+        self._radar_scene = self._build_radar_scene()
         self._bot_config = self._load_bot_config()
         self._comms_enabled = True
         if isinstance(self._bot_config, dict):
@@ -96,6 +168,8 @@ class QSimService:
         # превращал каждый кадр в «новый радар».
         self._radar_sensor_id = uuid5(NAMESPACE_URL, "qiki:q_sim_service:radar:main")
         self.radar_frames: deque[RadarFrameModel] = deque(maxlen=self._radar_frames_max)
+        # Push-потоки gRPC (StreamSensorData/StreamRadarFrames) питаются из step().
+        self.stream_hub = SimStreamHub()
         nats_flag = os.getenv("RADAR_NATS_ENABLED", "0").strip().lower()
         self.radar_nats_enabled = nats_flag not in ("0", "false", "")
         self._radar_publisher: RadarNatsPublisher | None = None
@@ -107,22 +181,50 @@ class QSimService:
         self.telemetry_nats_enabled = telemetry_flag not in ("0", "false", "")
         self._telemetry_publisher: TelemetryNatsPublisher | None = None
         self._telemetry_interval_sec = float(os.getenv("TELEMETRY_INTERVAL_SEC", "1.0"))
-        self._telemetry_last_sent_mono = 0.0
         if self.telemetry_nats_enabled:
             nats_url = os.getenv("NATS_URL", "nats://qiki-nats-phase1:4222")
             subject = os.getenv("SYSTEM_TELEMETRY_SUBJECT", "qiki.telemetry")
             self._telemetry_publisher = TelemetryNatsPublisher(nats_url, subject=subject)
+        # Published telemetry reuses unchanged sections; the optional delta subject carries only
+        # changed sections plus a keyframe every TELEMETRY_DELTA_KEYFRAME_EVERY messages.
+        self._telemetry_cache = TelemetrySectionCache()
+        self._telemetry_delta = TelemetryDeltaEncoder(
+            keyframe_every=_read_positive_int("TELEMETRY_DELTA_KEYFRAME_EVERY", 10)
+        )
+        self._telemetry_delta_publisher: TelemetryNatsPublisher | None = None
+        delta_flag = os.getenv("TELEMETRY_DELTA_NATS_ENABLED", "0").strip().lower()
+        if self.telemetry_nats_enabled and delta_flag not in ("0", "false", ""):
+            nats_url = os.getenv("NATS_URL", "nats://qiki-nats-phase1:4222")
+            self._telemetry_delta_publisher = TelemetryNatsPublisher(
+                nats_url,
+                subject=os.getenv("SYSTEM_TELEMETRY_DELTA_SUBJECT", SYSTEM_TELEMETRY_DELTA),
+                event_type="qiki.telemetry.v1.Delta",
+                event_id_prefix="telemetry-delta",
+            )
 
         events_flag_default = "1" if self.telemetry_nats_enabled else "0"
         events_flag = os.getenv("EVENTS_NATS_ENABLED", events_flag_default).strip().lower()
         self.events_nats_enabled = events_flag not in ("0", "false", "")
         self._events_publisher: SimEventsNatsPublisher | None = None
         self._events_interval_sec = float(os.getenv("EVENTS_INTERVAL_SEC", str(self._telemetry_interval_sec)))
-        self._events_last_sent_mono = 0.0
         if self.events_nats_enabled:
             nats_url = os.getenv("NATS_URL", "nats://qiki-nats-phase1:4222")
             self._events_publisher = SimEventsNatsPublisher(nats_url)
 
+        # Фиксированный шаг: run()/run_async() считают, сколько тиков должно пройти по стенным часам (с учётом
+        # времени самой работы), а каденции выходов заданы в тиках, а не через time.monotonic().
+        tick_s = float(self.config.sim_tick_interval)
+        self.scheduler = FixedStepScheduler(tick_s, max_catch_up_steps=_read_positive_int("QSIM_MAX_CATCH_UP_STEPS", 4))
+        self._scheduler_lag_logged = (0, 0)
+        self._telemetry_decimator = TickDecimator(
+            _read_positive_int("TELEMETRY_EVERY_N_TICKS", ticks_for_interval(self._telemetry_interval_sec, tick_s))
+        )
+        self._events_decimator = TickDecimator(
+            _read_positive_int("EVENTS_EVERY_N_TICKS", ticks_for_interval(self._events_interval_sec, tick_s))
+        )
+        self._sensor_decimator = TickDecimator(_read_positive_int("SENSOR_EVERY_N_TICKS", 1))
+        self._radar_decimator = TickDecimator(_read_positive_int("RADAR_EVERY_N_TICKS", 1))
+
         # Transponder (XPDR) mode: canonical runtime source is bot_config.json (if present),
         # but we keep env overrides for debugging.
         mode_str = os.getenv("RADAR_TRANSPONDER_MODE", "").strip().upper()
@@ -140,6 +242,10 @@ class QSimService:
         self.transponder_mode = self._parse_transponder_mode(mode_str)
         default_transponder_id = f"ALLY-{uuid4().hex[:6].upper()}"
         self.transponder_id = os.getenv("RADAR_TRANSPONDER_ID", default_transponder_id)
+        # sim.checkpoint.* stay disabled until both a private dir and a signing key are configured.
+        checkpoint_dir = os.getenv("QSIM_CHECKPOINT_DIR", "").strip()
+        self._checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self._checkpoint_key = os.getenv("QSIM_CHECKPOINT_KEY", "").encode("utf-8")
         self._spoof_transponder_id: str | None = None
         logger.info("QSimService initialized.")
         primary = int(self.config.sim_sensor_type)
@@ -181,13 +287,64 @@ class QSimService:
     def reset_simulation(self) -> None:
         # Keep publishers and config; reset simulation truth.
         self.world_model = WorldModel(bot_config=self._bot_config)
+        self._radar_scene = self._build_radar_scene()
         self._reset_trip_edge_state()
         self.sensor_data_queue.clear()
         self.actuator_command_queue.clear()
         self.radar_frames.clear()
         self._sensor_index = 0
-        self._telemetry_last_sent_mono = 0.0
-        self._events_last_sent_mono = 0.0
+        self._reset_publish_decimators()
+
+    def _checkpoint_path(self, params: dict) -> Path | None:
+        if self._checkpoint_dir is None:
+            logger.warning("sim.checkpoint.* disabled: QSIM_CHECKPOINT_DIR is not set")
+            return None
+        if len(self._checkpoint_key) < CHECKPOINT_MIN_KEY_BYTES:
+            logger.warning(
+                f"sim.checkpoint.* disabled: QSIM_CHECKPOINT_KEY must be at least {CHECKPOINT_MIN_KEY_BYTES} bytes"
+            )
+            return None
+        # Only bare names inside QSIM_CHECKPOINT_DIR: a control command must never pick an arbitrary file.
+        name = str(params.get("name") or "").strip()
+        if not _CHECKPOINT_NAME_RE.fullmatch(name):
+            return None
+        return self._checkpoint_dir / f"{name}{CHECKPOINT_SUFFIX}"
+
+    def save_checkpoint(self, path: Path) -> dict:
+        data = self.world_model.snapshot(key=self._checkpoint_key, hardware_profile_hash=self._hardware_profile_hash)
+        ensure_private_dir(path.parent)
+        tmp = path.with_name(path.name + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+        return read_checkpoint_meta(data, key=self._checkpoint_key)
+
+    def load_checkpoint(self, path: Path) -> dict:
+        """
+        Restore simulation truth from a WorldModel checkpoint (drill fast-forward).
+
+        Like reset: the sim stays STOPPED and queued outputs of the previous world are dropped.
+        """
+        ensure_private_dir(path.parent)
+        fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+        with os.fdopen(fd, "rb") as fh:
+            data = fh.read()
+        meta = self.world_model.restore(
+            data, key=self._checkpoint_key, hardware_profile_hash=self._hardware_profile_hash
+        )
+        # The synthetic radar scene is not part of WorldModel: replay it to the checkpoint's sim time.
+        self._radar_scene = self._build_radar_scene()
+        if self._radar_scene is not None:
+            self._radar_scene.step(float(meta.get("sim_time_s") or 0.0))
+        self._sim_running = False
+        self._sim_paused = False
+        self._reset_trip_edge_state()
+        self.sensor_data_queue.clear()
+        self.actuator_command_queue.clear()
+        self.radar_frames.clear()
+        self._reset_publish_decimators()
+        return meta
 
     def apply_control_command(self, cmd: CommandMessage) -> bool:
         """
@@ -254,6 +411,21 @@ class QSimService:
             self.reset_simulation()
             return True
 
+        if name in ("sim.checkpoint.save", "sim.checkpoint.load"):
+            path = self._checkpoint_path(cmd.parameters or {})
+            if path is None:
+                return False
+            try:
+                if name == "sim.checkpoint.save":
+                    meta = self.save_checkpoint(path)
+                else:
+                    meta = self.load_checkpoint(path)
+            except (OSError, WorldCheckpointError) as e:
+                logger.warning(f"{name} failed for {path}: {e}")
+                return False
+            logger.info(f"{name}: {path} (sim_time_s={meta.get('sim_time_s')})")
+            return True
+
         # Docking Plane (mechanical) operator control (no new proto).
         # NOTE: power bridge is still controlled via power.dock.on/off.
         if name == "sim.dock.engage":
@@ -346,7 +518,7 @@ class QSimService:
         )
 
     def generate_sensor_data(self) -> SensorReading:
-        world_state = self.world_model.get_state()
+        world_state = self.world_model.state_snapshot()
         sensor_type = self._sensor_cycle[self._sensor_index]
         self._sensor_index = (self._sensor_index + 1) % len(self._sensor_cycle)
 
@@ -421,7 +593,9 @@ class QSimService:
             self.world_model.sim_time_epoch_ts(),
             tz=timezone.utc,
         )
-        state = self.world_model.get_state()
+        state = self.world_model.state_snapshot()
+        if self._radar_scene is not None:
+            return self._generate_objective_radar_frame(frame_ts, state)
         x = float(state["position"]["x"])
         y = float(state["position"]["y"])
         z = float(state["position"]["z"])
@@ -478,6 +652,18 @@ class QSimService:
         )
         return frame
 
+    def _generate_objective_radar_frame(self, frame_ts: datetime, state: dict) -> RadarFrameModel:
+        # Load-test mode (radar.sim_targets > 0): every radar-visible object of the synthetic
+        # objective scene becomes an LR/SR detection, projected in bulk from its ObjectTable.
+        scene = self._radar_scene
+        detections = build_radar_detections_from_objective_world(
+            ObjectiveWorldState(scene_id=scene.scene_id, objects=scene.objects, sim_time_s=scene.sim_time_s),
+            observer_position_xyz_m=state["position"],
+            observer_velocity_xyz_m_s=state.get("velocity_xyz_m_s"),
+            sr_threshold_m=self._sr_threshold_m,
+        )
+        return RadarFrameModel(sensor_id=self._radar_sensor_id, timestamp=frame_ts, detections=detections)
+
     def radar_frame_for_external_read(self) -> RadarFrameModel | None:
         """Гейт 0.9: внешнее чтение радара честно к состоянию сима.
 
@@ -504,6 +690,26 @@ class QSimService:
                 logger.debug("RADAR_SR_THRESHOLD_M invalid: %r", raw, exc_info=True)
         return float(self.config.radar.sr_threshold_m)
 
+    def _read_radar_sim_targets(self) -> int:
+        raw = os.getenv("RADAR_SIM_TARGETS", "").strip()
+        if raw:
+            try:
+                value = int(raw)
+                if value >= 0:
+                    return value
+            except Exception:
+                logger.debug("RADAR_SIM_TARGETS invalid: %r", raw, exc_info=True)
+        return int(self.config.radar.sim_targets)
+
+    def _build_radar_scene(self) -> ObjectiveScene | None:
+        if self._radar_sim_targets <= 0:
+            return None
+        return ObjectiveScene.synthetic(
+            self._radar_sim_targets,
+            seed=self.config.radar.sim_target_seed,
+            sr_threshold_m=self._sr_threshold_m,
+        )
+
     def _read_queue_max(self, env_name: str, default: int) -> int:
         raw = os.getenv(env_name, "").strip()
         if not raw:
@@ -546,11 +752,59 @@ class QSimService:
         logger.info("QSimService started.")
         try:
             while True:
-                self.tick()
-                time.sleep(self.config.sim_tick_interval)
+                self.scheduler.run_once(self.tick)
+                self._log_scheduler_lag_throttled()
+                self.scheduler.sleep_until_next_step()
         except KeyboardInterrupt:
             logger.info("QSimService stopped by user.")
 
+    async def run_async(self) -> None:
+        """`run()` for an asyncio event loop (gRPC server): same scheduler, awaits between wakeups."""
+        while True:
+            self.scheduler.run_once(self.tick)
+            self._log_scheduler_lag_throttled()
+            await self.scheduler.wait_until_next_step()
+
+    def get_scheduler_stats(self) -> dict:
+        return {
+            "tick_s": self.scheduler.tick_s,
+            "max_catch_up_steps": self.scheduler.max_catch_up_steps,
+            **self.scheduler.stats.as_dict(),
+            "every_n_ticks": {
+                "telemetry": self._telemetry_decimator.every,
+                "events": self._events_decimator.every,
+                "sensor": self._sensor_decimator.every,
+                "radar": self._radar_decimator.every,
+            },
+        }
+
+    def _log_scheduler_lag_throttled(self) -> None:
+        stats = self.scheduler.stats
+        lag = (stats.overruns, stats.dropped_steps)
+        if lag == self._scheduler_lag_logged:
+            return
+        now = time.monotonic()
+        if now - self._overflow_log_last_mono.get("scheduler", 0.0) < _QSIM_OVERFLOW_LOG_PERIOD_S:
+            return
+        self._overflow_log_last_mono["scheduler"] = now
+        self._scheduler_lag_logged = lag
+        logger.warning(
+            "QSIM scheduler lagging: overruns=%d dropped_steps=%d max_jitter_s=%.3f max_work_s=%.3f",
+            stats.overruns,
+            stats.dropped_steps,
+            stats.max_jitter_s,
+            stats.max_work_s,
+        )
+
+    def _reset_publish_decimators(self) -> None:
+        for decimator in (
+            self._telemetry_decimator,
+            self._events_decimator,
+            self._sensor_decimator,
+            self._radar_decimator,
+        ):
+            decimator.reset()
+
     def tick(self) -> None:
         if self._sim_running and not self._sim_paused:
             delta_time = self.config.sim_tick_interval * float(self._sim_speed)
@@ -559,6 +813,33 @@ class QSimService:
         # Paused/stopped: keep telemetry + sensor data alive, but freeze world and do not publish radar frames.
         self.step(delta_time=0.0, advance_world=False, publish_radar=False)
 
+    def run_batch(
+        self,
+        duration_s: float,
+        dt: float | None = None,
+        *,
+        sample_every_s: float = 1.0,
+        trace_path: str | Path | None = None,
+    ) -> BatchReport:
+        """
+        Headless прогон мира быстрее реального времени: только WorldModel.step подряд, без сенсоров,
+        радара и публикаций; состояние сэмплируется раз в `sample_every_s` сим-секунд в компактный
+        трейс (см. qiki.services.q_sim_service.batch).
+        """
+        if dt is None:
+            dt = float(self.config.sim_tick_interval)
+        self.world_model.set_runtime_load_inputs(
+            radar_enabled=self.radar_enabled,
+            sensor_queue_depth=0,
+            actuator_queue_depth=0,
+            transponder_active=self._is_transponder_active(),
+        )
+        if trace_path is None:
+            return run_world_batch(self.world_model, duration_s, dt, sample_every_s=sample_every_s)
+        with open_trace(trace_path) as trace:
+            report = run_world_batch(self.world_model, duration_s, dt, sample_every_s=sample_every_s, trace=trace)
+        return replace(report, trace_path=str(trace_path), trace_bytes=Path(trace_path).stat().st_size)
+
     def step(
         self,
         delta_time: float | None = None,
@@ -577,38 +858,49 @@ class QSimService:
         )
         if advance_world:
             self.world_model.step(delta_time)
+            if self._radar_scene is not None:
+                self._radar_scene.step(delta_time)
 
         # Commands are applied immediately on receipt, so treat the queue as a per-tick backlog/activity counter.
         # Clear it each tick to avoid unbounded growth impacting load simulation.
         self.actuator_command_queue.clear()
 
-        self._maybe_publish_telemetry()
-        self._maybe_publish_events()
+        if self._telemetry_decimator.due():
+            self._maybe_publish_telemetry()
+        if self._events_decimator.due():
+            self._maybe_publish_events()
 
-        sensor_data = self.generate_sensor_data()
-        self._append_sensor_data(sensor_data)
-        logger.debug(f"Generated sensor data: {MessageToDict(sensor_data)}")
+        if self._sensor_decimator.due():
+            sensor_data = self.generate_sensor_data()
+            self._append_sensor_data(sensor_data)
+            self.stream_hub.publish(SENSOR_STREAM, sensor_data, key=int(sensor_data.sensor_type))
+            logger.debug(f"Generated sensor data: {MessageToDict(sensor_data)}")
 
-        if publish_radar and self.radar_enabled and getattr(self.world_model, "radar_allowed", True):
+        if (
+            publish_radar
+            and self.radar_enabled
+            and getattr(self.world_model, "radar_allowed", True)
+            and self._radar_decimator.due()
+        ):
             rf = self.generate_radar_frame()
             self._append_radar_frame(rf)
+            if self.stream_hub.has_subscribers(RADAR_STREAM):
+                self.stream_hub.publish(RADAR_STREAM, model_frame_to_proto(rf))
             if self.radar_nats_enabled and self._radar_publisher is not None:
                 self._radar_publisher.publish_frame(rf)
 
     def _maybe_publish_telemetry(self) -> None:
         if not self.telemetry_nats_enabled:
             return
-        if self._telemetry_publisher is None:
+        if self._telemetry_publisher is None and self._telemetry_delta_publisher is None:
             return
 
-        now_mono = time.monotonic()
-        if now_mono - self._telemetry_last_sent_mono < self._telemetry_interval_sec:
-            return
-        self._telemetry_last_sent_mono = now_mono
-
-        state = self.world_model.get_state()
-        payload = self._build_telemetry_payload(state)
-        self._telemetry_publisher.publish_snapshot(payload)
+        state = self.world_model.state_snapshot()
+        sections = self._telemetry_sections(state, self._telemetry_cache)
+        if self._telemetry_publisher is not None:
+            self._telemetry_publisher.publish_encoded(encode_sections(sections))
+        if self._telemetry_delta_publisher is not None:
+            self._telemetry_delta_publisher.publish_encoded(self._telemetry_delta.encode(sections))
 
     def _maybe_publish_events(self) -> None:
         if not self.events_nats_enabled:
@@ -616,11 +908,6 @@ class QSimService:
         if self._events_publisher is None:
             return
 
-        now_mono = time.monotonic()
-        if now_mono - self._events_last_sent_mono < self._events_interval_sec:
-            return
-        self._events_last_sent_mono = now_mono
-
         ts_epoch = time.time()
         # Minimal no-mocks sim events used by IncidentStore rules:
         # - TEMP_CORE_SPIKE: type=sensor, source=thermal, subject=core, payload.temp
@@ -729,34 +1016,83 @@ class QSimService:
             self._thermal_trip_last[nid] = cur
 
     def _build_telemetry_payload(self, state: dict) -> dict:
+        """Telemetry snapshot as a JSON-ready dict (fresh objects, no section reuse)."""
+        return payload_from_sections(self._telemetry_sections(state, TelemetrySectionCache()))
+
+    def _telemetry_sections(self, state: dict, cache: TelemetrySectionCache) -> list[TelemetrySection]:
+        """
+        Telemetry snapshot sections in payload order.
+
+        Every top-level key is built by its own section builder; `cache` skips re-validation and
+        re-encoding of sections whose source did not change (see telemetry_sections).
+        """
         ts_dt = datetime.now(timezone.utc)
-        ts = ts_dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
         ts_unix_ms = int(ts_dt.timestamp() * 1000)
-        pos = state.get("position") if isinstance(state, dict) else None
-        pos = pos if isinstance(pos, dict) else {}
-        att = state.get("attitude") if isinstance(state, dict) else None
-        att = att if isinstance(att, dict) else {}
+        soc_pct = self._telemetry_soc_pct(state)
+        sources = {
+            "schema_version": 1,
+            "source": "q_sim_service",
+            "timestamp": ts_dt.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            "ts_unix_ms": ts_unix_ms,
+            **self._telemetry_kinematics(state),
+            # Canonical: SoC lives under power.soc_pct. Keep top-level `battery` as legacy alias
+            # to avoid breaking old consumers, but ensure it matches the canonical field.
+            "battery": float(soc_pct),
+            "hull": {"integrity": float(state.get("hull_integrity", 100.0))},
+            "power": state.get("power", {}),
+            "thermal": state.get("thermal", {"nodes": []}),
+            "orbit": state.get("orbit", {}),
+            "comms": self._telemetry_comms(state, soc_pct),
+            "propulsion": state.get("propulsion", {}),
+            "radiation_usvh": float(state.get("radiation_usvh", 0.0)),
+            "temp_external_c": float(state.get("temp_external_c", -60.0)),
+            "temp_core_c": float(state.get("temp_core_c", 25.0)),
+            "cpu_usage": None if state.get("cpu_usage") is None else float(state.get("cpu_usage")),
+            "memory_usage": None if state.get("memory_usage") is None else float(state.get("memory_usage")),
+            # Extras (TelemetrySnapshot v1 allows them), dumped as-is.
+            "docking": state.get("docking", {}),
+            "sensor_plane": state.get("sensor_plane", {}),
+        }
+        sections = [cache.section(name, source, _telemetry_dumper(name)) for name, source in sources.items()]
+        # Top-level extra key (TelemetrySnapshot v1 allows extras): trace which hardware profile is active.
+        # No-mocks: if we cannot compute it (missing/bad config) -> omit.
+        if self._hardware_profile_hash:
+            sections.append(cache.section("hardware_profile_hash", self._hardware_profile_hash))
+        sections.append(cache.section("sim_state", self.get_sim_state()))
+        sections.append(self._telemetry_body_if_records(cache, {s.name: s for s in sections}, ts_unix_ms))
+        return sections
 
-        # Contract: position is always 3D, z must be present.
-        x = float(pos.get("x", 0.0))
-        y = float(pos.get("y", 0.0))
-        z = float(pos.get("z", 0.0))
-        roll = float(att.get("roll_rad", 0.0))
-        pitch = float(att.get("pitch_rad", 0.0))
-        yaw = float(att.get("yaw_rad", math.radians(state.get("heading", 0.0))))
-
-        # Canonical: SoC lives under power.soc_pct. Keep top-level `battery` as legacy alias
-        # to avoid breaking old consumers, but ensure it matches the canonical field.
-        soc_pct: float | None = None
+    @staticmethod
+    def _telemetry_soc_pct(state: dict) -> float:
         try:
             power_block = state.get("power") if isinstance(state, dict) else None
             if isinstance(power_block, dict) and power_block.get("soc_pct") is not None:
-                soc_pct = float(power_block.get("soc_pct"))
+                return float(power_block.get("soc_pct"))
         except Exception:
-            soc_pct = None
-        if soc_pct is None:
-            soc_pct = float(state.get("battery_level", 0.0))
+            pass
+        return float(state.get("battery_level", 0.0))
 
+    @staticmethod
+    def _telemetry_kinematics(state: dict) -> dict:
+        pos = state.get("position") if isinstance(state, dict) else None
+        pos = pos if isinstance(pos, dict) else {}
+        att = state.get("attitude") if isinstance(state, dict) else None
+        att = att if isinstance(att, dict) else {}
+        # Contract: position is always 3D, z must be present.
+        return {
+            "position": {"x": float(pos.get("x", 0.0)), "y": float(pos.get("y", 0.0)), "z": float(pos.get("z", 0.0))},
+            "velocity": float(state.get("speed", 0.0)),
+            "speed_m_s": float(state.get("speed_m_s", state.get("speed", 0.0))),
+            "velocity_xyz_m_s": state.get("velocity_xyz_m_s"),
+            "heading": float(state.get("heading", 0.0)),
+            "attitude": {
+                "roll_rad": float(att.get("roll_rad", 0.0)),
+                "pitch_rad": float(att.get("pitch_rad", 0.0)),
+                "yaw_rad": float(att.get("yaw_rad", math.radians(state.get("heading", 0.0)))),
+            },
+        }
+
+    def _telemetry_comms(self, state: dict, soc_pct: float) -> dict:
         comms_plane = {}
         try:
             hp = (self._bot_config or {}).get("hardware_profile") if isinstance(self._bot_config, dict) else {}
@@ -866,73 +1202,78 @@ class QSimService:
             }
         )
 
-        payload = TelemetrySnapshotModel(
-            source="q_sim_service",
-            timestamp=ts,
-            ts_unix_ms=ts_unix_ms,
-            position={"x": x, "y": y, "z": z},
-            velocity=float(state.get("speed", 0.0)),
-            speed_m_s=float(state.get("speed_m_s", state.get("speed", 0.0))),
-            velocity_xyz_m_s=state.get("velocity_xyz_m_s"),
-            heading=float(state.get("heading", 0.0)),
-            attitude={"roll_rad": roll, "pitch_rad": pitch, "yaw_rad": yaw},
-            battery=float(soc_pct),
-            cpu_usage=None if state.get("cpu_usage") is None else float(state.get("cpu_usage")),
-            memory_usage=None if state.get("memory_usage") is None else float(state.get("memory_usage")),
-            hull={"integrity": float(state.get("hull_integrity", 100.0))},
-            power=state.get("power", {}),
-            docking=state.get("docking", {}),
-            sensor_plane=state.get("sensor_plane", {}),
-            comms=comms,
-            orbit=state.get("orbit", {}),
-            thermal=state.get("thermal", {"nodes": []}),
-            propulsion=state.get("propulsion", {}),
-            radiation_usvh=float(state.get("radiation_usvh", 0.0)),
-            temp_external_c=float(state.get("temp_external_c", -60.0)),
-            temp_core_c=float(state.get("temp_core_c", 25.0)),
-        )
-        out = payload.model_dump(mode="json")
-        # Top-level extra key (TelemetrySnapshot v1 allows extras): trace which hardware profile is active.
-        # No-mocks: if we cannot compute it (missing/bad config) -> omit.
-        if self._hardware_profile_hash:
-            out["hardware_profile_hash"] = self._hardware_profile_hash
-        if isinstance(out.get("comms"), dict):
-            out["comms"].pop("age_s", None)
-            out["comms"].pop("last_seen_ts", None)
-        out["sim_state"] = self.get_sim_state()
+        return comms
+
+    def _telemetry_body_if_records(
+        self,
+        cache: TelemetrySectionCache,
+        sections: dict[str, TelemetrySection],
+        ts_unix_ms: int,
+    ) -> TelemetrySection:
         # Slice A — IF-SENSOR-TELEM §15: the producer EMITS per-sensor evidence records so
         # ORION CONSUMES them (it must not re-derive §15 evidence from raw sensor_plane).
-        # Separate domain-IF block (NOT §19 OrionEvidenceClaim); raw sensor_plane/thermal in
-        # `out` above are kept untouched. TelemetrySnapshot v1 allows extras.
-        _sensor_plane = out.get("sensor_plane") if isinstance(out.get("sensor_plane"), dict) else {}
-        _thermal = out.get("thermal") if isinstance(out.get("thermal"), dict) else {"nodes": []}
-        _sensor_records = sensor_telemetry_from_sensor_plane(
-            _sensor_plane, thermal=_thermal, timestamp=ts_unix_ms / 1000.0
+        # Separate domain-IF block (NOT §19 OrionEvidenceClaim); raw sensor_plane/thermal
+        # sections are kept untouched. TelemetrySnapshot v1 allows extras.
+        # Records are derived from the dumped sections and rebuilt only when their inputs change.
+        sensor_plane = sections["sensor_plane"]
+        thermal = sections["thermal"]
+        power = sections["power"]
+        propulsion = sections["propulsion"]
+        docking = sections["docking"]
+        _sensor_plane = sensor_plane.value if isinstance(sensor_plane.value, dict) else {}
+        _thermal = thermal.value if isinstance(thermal.value, dict) else {"nodes": []}
+        _power_block = power.value if isinstance(power.value, dict) else {}
+        _propulsion = propulsion.value if isinstance(propulsion.value, dict) else {}
+        _docking = docking.value if isinstance(docking.value, dict) else {}
+        # The record timestamp is a pass-through field: records are cached without it and stamped per publish.
+        sensor_base = cache.section(
+            "body_if_records.sensor_telemetry.unstamped",
+            (sensor_plane.version, thermal.version),
+            lambda _: [
+                _record_dict(record)
+                for record in sensor_telemetry_from_sensor_plane(_sensor_plane, thermal=_thermal, timestamp=None)
+            ],
+        )
+        sensor_records = cache.section(
+            "body_if_records.sensor_telemetry",
+            (ts_unix_ms, sensor_base.version),
+            lambda _: [{**record, "timestamp": ts_unix_ms / 1000.0} for record in sensor_base.value],
         )
         # IF-PDU-POWER §11: per-load permission records emitted alongside sensor telemetry in
-        # the same domain-IF block. Raw `power`/`thermal` in `out` are kept untouched. The
+        # the same domain-IF block. Raw `power`/`thermal` sections are kept untouched. The
         # payload has no authoritative SAFE_state owner and no per-load command duration here,
         # so emit safe_state="unknown" / duration_s=None (honest, not invented — SAFE->PDU
         # wiring is a separate concern).
-        _power_block = out.get("power") if isinstance(out.get("power"), dict) else {}
-        _pdu_records = pdu_permissions_from_power_state(_power_block, thermal=_thermal, safe_state="unknown")
+        pdu_records = cache.section(
+            "body_if_records.pdu_permissions",
+            (power.version, thermal.version),
+            lambda _: [
+                _record_dict(record)
+                for record in pdu_permissions_from_power_state(_power_block, thermal=_thermal, safe_state="unknown")
+            ],
+        )
         # IF-RCS-CMD §14: command-validation projection. The mapper returns ONE record; it is
         # emitted as a one-item list for uniform ORION consume. RCS runtime lives under
-        # `out["propulsion"]["rcs"]`, docking in `out`. No authoritative command/SAFE owner here
+        # `propulsion.rcs`, docking in its own section. No authoritative command/SAFE owner here
         # -> command-context defaults and safe_state="unknown" (honest, not invented). Raw
         # propulsion/power/thermal/docking are kept untouched.
-        _propulsion = out.get("propulsion") if isinstance(out.get("propulsion"), dict) else {}
         _rcs = _propulsion.get("rcs") if isinstance(_propulsion.get("rcs"), dict) else {}
-        _docking = out.get("docking") if isinstance(out.get("docking"), dict) else {}
-        _rcs_record = rcs_command_from_runtime_state(
-            _rcs, power=_power_block, thermal=_thermal, docking=_docking, safe_state="unknown"
+        rcs_records = cache.section(
+            "body_if_records.rcs_commands",
+            (propulsion.version, power.version, thermal.version, docking.version),
+            lambda _: [
+                _record_dict(
+                    rcs_command_from_runtime_state(
+                        _rcs, power=_power_block, thermal=_thermal, docking=_docking, safe_state="unknown"
+                    )
+                )
+            ],
+        )
+        return cache.composite(
+            "body_if_records",
+            (sensor_records, pdu_records, rcs_records),
+            ("sensor_telemetry", "pdu_permissions", "rcs_commands"),
         )
-        out["body_if_records"] = {
-            "sensor_telemetry": [asdict(record) for record in _sensor_records],
-            "pdu_permissions": [asdict(record) for record in _pdu_records],
-            "rcs_commands": [asdict(_rcs_record)],
-        }
-        return out
 
     def _parse_transponder_mode(self, raw: str) -> TransponderModeEnum:
         mapping = {
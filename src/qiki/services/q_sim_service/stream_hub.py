@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+SENSOR_STREAM = "sensor"
+RADAR_STREAM = "radar"
+
+
+class StreamSubscription:
+    """
+    Conflating mailbox of one stream subscriber.
+
+    Keeps at most one pending value per conflation key (sensor type for the sensor stream,
+    a single key for radar frames): a slow consumer never builds a backlog, it receives the
+    latest value plus the count of values it skipped. `publish` may run on any thread; the
+    waiter is woken on the subscriber's event loop.
+    """
+
+    def __init__(self, hub: "SimStreamHub", channel: str, loop: asyncio.AbstractEventLoop) -> None:
+        self._hub = hub
+        self.channel = channel
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._pending: OrderedDict[Hashable, tuple[int, Any, int]] = OrderedDict()
+        self._ready = asyncio.Event()
+        self.conflated_total = 0
+
+    def _put(self, key: Hashable, sequence: int, value: Any) -> None:
+        with self._lock:
+            previous = self._pending.get(key)
+            skipped = 0
+            if previous is not None:
+                skipped = previous[2] + 1
+                self.conflated_total += 1
+            self._pending[key] = (sequence, value, skipped)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._ready.set()
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    async def get(self) -> tuple[int, Any, int]:
+        """Oldest pending key first: `(sequence, value, conflated)`."""
+        while True:
+            with self._lock:
+                if self._pending:
+                    _, item = self._pending.popitem(last=False)
+                    if not self._pending:
+                        self._ready.clear()
+                    return item
+                self._ready.clear()
+            await self._ready.wait()
+
+    def close(self) -> None:
+        self._hub._unsubscribe(self)
+
+
+class SimStreamHub:
+    """Fan-out of per-step sim outputs to gRPC stream subscribers (StreamSensorData/StreamRadarFrames)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, list[StreamSubscription]] = {}
+        self._sequence = 0
+
+    def subscribe(self, channel: str) -> StreamSubscription:
+        sub = StreamSubscription(self, channel, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(channel, []).append(sub)
+        return sub
+
+    def _unsubscribe(self, sub: StreamSubscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.channel)
+            if subs and sub in subs:
+                subs.remove(sub)
+
+    def has_subscribers(self, channel: str) -> bool:
+        return bool(self._subscribers.get(channel))
+
+    def publish(self, channel: str, value: Any, *, key: Hashable = None) -> None:
+        with self._lock:
+            subs = list(self._subscribers.get(channel, ()))
+            if not subs:
+                return
+            self._sequence += 1
+            sequence = self._sequence
+        for sub in subs:
+            sub._put(key, sequence, value)
@@ -26,9 +26,18 @@ def _rfc3339_utc_now() -> datetime:
 class TelemetryNatsPublisher:
     """Best-effort NATS publisher for telemetry snapshots (core NATS, not JetStream)."""
 
-    def __init__(self, nats_url: str, *, subject: str = SYSTEM_TELEMETRY) -> None:
+    def __init__(
+        self,
+        nats_url: str,
+        *,
+        subject: str = SYSTEM_TELEMETRY,
+        event_type: str = "qiki.telemetry.v1.Snapshot",
+        event_id_prefix: str = "telemetry",
+    ) -> None:
         self._nats_url = nats_url
         self._subject = subject
+        self._event_type = event_type
+        self._event_id_prefix = event_id_prefix
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._nc: Optional[nats.NATS] = None
         self._thread: Optional[threading.Thread] = None
@@ -69,19 +78,22 @@ class TelemetryNatsPublisher:
 
     def publish_snapshot(self, payload: dict) -> None:
         """Publish a single telemetry snapshot (best-effort; drops if not connected)."""
+        self.publish_encoded(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    def publish_encoded(self, data: bytes) -> None:
+        """Publish an already JSON-encoded telemetry message (best-effort; drops if not connected)."""
         self._ensure_connection()
         if self._loop is None or self._nc is None:
             return
 
         ts = _rfc3339_utc_now()
-        event_id = f"telemetry-{int(ts.timestamp() * 1000)}"
+        event_id = f"{self._event_id_prefix}-{int(ts.timestamp() * 1000)}"
         headers = build_cloudevent_headers(
             event_id=event_id,
-            event_type="qiki.telemetry.v1.Snapshot",
+            event_type=self._event_type,
             source="urn:qiki:q-sim-service:telemetry",
             event_time=ts,
         )
         headers["Nats-Msg-Id"] = event_id
 
-        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
         asyncio.run_coroutine_threadsafe(self._async_publish(data, headers), self._loop)
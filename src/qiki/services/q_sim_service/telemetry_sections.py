@@ -0,0 +1,192 @@
+"""
+Sectioned telemetry encoding
+============================
+The telemetry snapshot is a flat JSON object; every top-level key is a *section*
+(`position`, `power`, `thermal`, `comms`, `body_if_records`, ...).
+
+`TelemetrySectionCache` remembers, per section, the source it was last built from, the
+JSON-ready value and the encoded bytes. A section whose new source compares equal to the
+previous one is neither re-validated nor re-encoded, and the snapshot bytes are joined from
+the per-section bytes exactly as `json.dumps(payload, ensure_ascii=False)` lays them out.
+Sources must not be mutated after they are handed in (WorldModel state snapshot blocks and
+freshly built dicts qualify).
+
+Each section carries a `version` that bumps only when its encoded bytes change. The delta
+stream (`TelemetryDeltaEncoder`) sends just the sections whose version moved since the last
+message, plus a full keyframe every N messages so late joiners can start from it.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Annotated, Any, Callable, Iterable, Sequence
+
+from pydantic import BaseModel, TypeAdapter
+
+DELTA_KIND_KEYFRAME = "keyframe"
+DELTA_KIND_DELTA = "delta"
+
+
+def encode_json(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def encode_object(members: Iterable[tuple[str, bytes]]) -> bytes:
+    """JSON object from pre-encoded member values (same separators as `json.dumps`)."""
+
+    return b"{" + b", ".join(encode_json(name) + b": " + data for name, data in members) + b"}"
+
+
+def model_field_dumper(model: type[BaseModel], name: str) -> Callable[[Any], Any]:
+    """Validate + JSON-dump one field of `model` the way `model.model_dump(mode="json")` would.
+
+    Declared fields go through the model's own validator (`validate_assignment`), so the
+    model's `field_validator`s for that field run too, not just its annotation.
+    Names that are not declared fields are treated as extras (dumped as-is, JSON mode).
+    """
+
+    field = model.model_fields.get(name)
+    if field is None:
+        extra: TypeAdapter[Any] = TypeAdapter(Any)
+        return lambda source: extra.dump_python(source, mode="json")
+
+    if field.metadata:
+        adapter: TypeAdapter[Any] = TypeAdapter(Annotated[(field.annotation, *field.metadata)])
+    else:
+        adapter = TypeAdapter(field.annotation)
+    validator = model.__pydantic_validator__
+
+    def dump(source: Any) -> Any:
+        validated = validator.validate_assignment(model.model_construct(), name, source)
+        return adapter.dump_python(getattr(validated, name), mode="json")
+
+    return dump
+
+
+@dataclass(slots=True)
+class TelemetrySection:
+    name: str
+    source: Any
+    value: Any
+    data: bytes
+    version: int = 1
+
+
+def _same_source(previous: Any, current: Any) -> bool:
+    if previous is current:
+        return True
+    try:
+        return bool(previous == current)
+    except Exception:
+        return False
+
+
+class TelemetrySectionCache:
+    """Per-section change detection and encoded-bytes reuse (see module docstring)."""
+
+    def __init__(self) -> None:
+        self._sections: dict[str, TelemetrySection] = {}
+
+    def section(
+        self,
+        name: str,
+        source: Any,
+        build: Callable[[Any], Any] | None = None,
+        *,
+        encode: Callable[[Any], bytes] = encode_json,
+    ) -> TelemetrySection:
+        cached = self._sections.get(name)
+        if cached is not None and _same_source(cached.source, source):
+            return cached
+        value = source if build is None else build(source)
+        data = encode(value)
+        if cached is None:
+            cached = self._sections[name] = TelemetrySection(name=name, source=source, value=value, data=data)
+            return cached
+        cached.source = source
+        if data != cached.data:
+            cached.value = value
+            cached.data = data
+            cached.version += 1
+        return cached
+
+    def composite(self, name: str, parts: Sequence[TelemetrySection], keys: Sequence[str]) -> TelemetrySection:
+        """A JSON-object section `{key: part}` rebuilt (and re-joined from part bytes) only when a part changed."""
+
+        return self.section(
+            name,
+            tuple(part.version for part in parts),
+            lambda _versions: {key: part.value for key, part in zip(keys, parts)},
+            encode=lambda _value: encode_object((key, part.data) for key, part in zip(keys, parts)),
+        )
+
+
+def encode_sections(sections: Iterable[TelemetrySection]) -> bytes:
+    return encode_object((section.name, section.data) for section in sections)
+
+
+def payload_from_sections(sections: Iterable[TelemetrySection]) -> dict[str, Any]:
+    return {section.name: section.value for section in sections}
+
+
+class TelemetryDeltaEncoder:
+    """
+    Delta telemetry stream state.
+
+    Message: `{"schema_version": 1, "kind": "keyframe"|"delta", "seq": n, "keyframe_seq": k,
+    "sections": {...}, "removed": [...]}`. A keyframe carries every section; a delta carries the
+    sections whose bytes changed since the previous message and the names that disappeared.
+    `seq` is contiguous, so a consumer that sees a gap waits for the next keyframe.
+    """
+
+    def __init__(self, *, keyframe_every: int = 10) -> None:
+        self.keyframe_every = max(1, int(keyframe_every))
+        self._sent: dict[str, int] = {}
+        self._seq = 0
+        self._keyframe_seq = 0
+
+    def encode(self, sections: Sequence[TelemetrySection]) -> bytes:
+        self._seq += 1
+        keyframe = self._seq == 1 or self._seq - self._keyframe_seq >= self.keyframe_every
+        if keyframe:
+            self._keyframe_seq = self._seq
+            changed = list(sections)
+            removed: list[str] = []
+        else:
+            changed = [section for section in sections if self._sent.get(section.name) != section.version]
+            present = {section.name for section in sections}
+            removed = [name for name in self._sent if name not in present]
+        self._sent = {section.name: section.version for section in sections}
+        return encode_object(
+            (
+                ("schema_version", b"1"),
+                ("kind", encode_json(DELTA_KIND_KEYFRAME if keyframe else DELTA_KIND_DELTA)),
+                ("seq", encode_json(self._seq)),
+                ("keyframe_seq", encode_json(self._keyframe_seq)),
+                ("sections", encode_sections(changed)),
+                ("removed", encode_json(removed)),
+            )
+        )
+
+
+class TelemetryDeltaDecoder:
+    """Consumer side: rebuilds full snapshots from a delta stream (None until a keyframe arrives)."""
+
+    def __init__(self) -> None:
+        self._snapshot: dict[str, Any] | None = None
+        self._seq = 0
+
+    def apply(self, message: dict[str, Any]) -> dict[str, Any] | None:
+        seq = int(message.get("seq") or 0)
+        sections = message.get("sections") if isinstance(message.get("sections"), dict) else {}
+        if message.get("kind") == DELTA_KIND_KEYFRAME:
+            self._snapshot = dict(sections)
+        elif self._snapshot is None or seq != self._seq + 1:
+            self._snapshot = None
+        else:
+            self._snapshot.update(sections)
+            for name in message.get("removed") or ():
+                self._snapshot.pop(name, None)
+        self._seq = seq
+        return None if self._snapshot is None else dict(self._snapshot)
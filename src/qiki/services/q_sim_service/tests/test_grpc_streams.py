@@ -0,0 +1,100 @@
+import asyncio
+
+import grpc
+import pytest
+
+from generated.q_sim_api_pb2 import StreamRequest
+from generated.q_sim_api_pb2_grpc import add_QSimAPIServiceServicer_to_server
+from qiki.services.q_core_agent.core.async_grpc_data_provider import AsyncGrpcDataProvider
+from qiki.services.q_sim_service.grpc_server import QSimAPIService
+from qiki.services.q_sim_service.service import QSimService
+from qiki.shared.config_models import QSimServiceConfig
+from qiki.shared.models.core import SensorTypeEnum
+
+
+def _qsim() -> QSimService:
+    return QSimService(QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO"))
+
+
+class _Requests:
+    """Client half of a bidi stream: opening request, then credit grants pushed by the test."""
+
+    def __init__(self, credits: int) -> None:
+        self._queue: asyncio.Queue[StreamRequest] = asyncio.Queue()
+        self._queue.put_nowait(StreamRequest(credits=credits))
+
+    def grant(self, credits: int) -> None:
+        self._queue.put_nowait(StreamRequest(credits=credits))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> StreamRequest:
+        return await self._queue.get()
+
+
+@pytest.mark.asyncio
+async def test_stream_conflates_to_latest_while_out_of_credits() -> None:
+    qsim = _qsim()
+    reading = qsim.generate_sensor_data()
+    requests = _Requests(credits=1)
+    stream = QSimAPIService(qsim).StreamSensorData(requests, context=None)
+    first = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)  # let the handler subscribe
+
+    qsim.stream_hub.publish("sensor", reading, key="imu")
+    update = await asyncio.wait_for(first, timeout=1.0)
+    assert (update.sequence, update.conflated) == (1, 0)
+
+    for _ in range(3):
+        qsim.stream_hub.publish("sensor", reading, key="imu")
+    pending = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0.05)
+    assert not pending.done()  # window exhausted: nothing is pushed
+
+    requests.grant(1)
+    update = await asyncio.wait_for(pending, timeout=1.0)
+    # Three updates of the same key collapsed into the latest one.
+    assert (update.sequence, update.conflated) == (4, 2)
+    await stream.aclose()
+    assert not qsim.stream_hub.has_subscribers("sensor")
+
+
+@pytest.mark.asyncio
+async def test_provider_consumes_pushed_sensor_and_radar_updates(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RADAR_ENABLED", "1")
+    monkeypatch.setenv("BIOS_CACHE_TTL_SEC", "60")
+    qsim = _qsim()
+    server = grpc.aio.server()
+    add_QSimAPIServiceServicer_to_server(QSimAPIService(qsim), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+
+    async def _sim_loop() -> None:
+        while True:
+            qsim.step()
+            await asyncio.sleep(0.02)
+
+    provider = AsyncGrpcDataProvider(f"127.0.0.1:{port}", streaming=True, stream_credits=4, sensor_deadline_s=2.0)
+    sim_task = asyncio.create_task(_sim_loop())
+    try:
+        await provider.connect()
+        radar_frames = 0
+        for _ in range(5):
+            await provider.prefetch()
+            samples = []
+            while (sample := provider.get_sensor_data()) is not None:
+                samples.append(sample)
+            assert samples
+            types = [sample.sensor_type for sample in samples]
+            # The agent stops reading at RADAR, so a pushed radar sample always comes last.
+            assert SensorTypeEnum.RADAR not in types[:-1]
+            radar_frames += sum(sample.radar_frame is not None for sample in samples)
+            await asyncio.sleep(0.05)
+        assert radar_frames > 0
+        # The pull queue was never touched: all samples arrived over the push streams.
+        assert len(qsim.sensor_data_queue) == 1
+    finally:
+        sim_task.cancel()
+        await provider.close()
+        await server.stop(None)
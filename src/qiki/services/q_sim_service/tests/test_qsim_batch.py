@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from qiki.services.q_sim_service.batch import TRACE_FIELDS, main, read_trace
+from qiki.services.q_sim_service.service import QSimService
+from qiki.shared.config_models import QSimServiceConfig
+
+
+def _qsim() -> QSimService:
+    return QSimService(QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO"))
+
+
+def test_run_batch_advances_world_only_and_decimates_samples(tmp_path: Path) -> None:
+    qsim = _qsim()
+    trace_path = tmp_path / "batch.jsonl.gz"
+
+    report = qsim.run_batch(60.0, 0.1, sample_every_s=5.0, trace_path=trace_path)
+
+    assert report.steps == 600
+    assert report.samples == 12
+    assert report.sim_s == pytest.approx(60.0)
+    assert report.sim_s_per_wall_s > 0
+    assert report.trace_bytes == trace_path.stat().st_size
+    assert qsim.world_model.sim_time_s() == pytest.approx(60.0)
+    # Headless: no sensor readings or radar frames were produced.
+    assert len(qsim.sensor_data_queue) == 0
+    assert len(qsim.radar_frames) == 0
+
+    header, rows = read_trace(trace_path)
+    assert header["fields"] == list(TRACE_FIELDS)
+    assert header["sample_every_s"] == pytest.approx(5.0)
+    assert [row["sim_time_s"] for row in rows] == pytest.approx([5.0 * (i + 1) for i in range(12)])
+    assert rows[-1]["soc_pct"] == pytest.approx(qsim.world_model.get_state()["power"]["soc_pct"])
+
+
+def test_run_batch_matches_stepping_the_world_directly() -> None:
+    batched = _qsim()
+    stepped = _qsim()
+    batched.run_batch(20.0, 0.5, sample_every_s=0.0)
+    stepped.world_model.set_runtime_load_inputs(
+        radar_enabled=stepped.radar_enabled,
+        sensor_queue_depth=0,
+        actuator_queue_depth=0,
+        transponder_active=stepped._is_transponder_active(),
+    )
+    for _ in range(40):
+        stepped.world_model.step(0.5)
+    for key in ("battery_level", "temp_core_c", "power_bus_v"):
+        assert getattr(batched.world_model, key) == pytest.approx(getattr(stepped.world_model, key))
+
+
+def test_run_batch_last_partial_interval_is_sampled() -> None:
+    qsim = _qsim()
+    report = qsim.run_batch(2.5, 1.0, sample_every_s=2.0)
+    assert (report.steps, report.samples) == (3, 2)
+    # The last step is shortened to 0.5 s: the run ends exactly at duration_s.
+    assert report.sim_s == pytest.approx(2.5)
+    assert qsim.world_model.sim_time_s() == pytest.approx(2.5)
+    with pytest.raises(ValueError):
+        _qsim().run_batch(1.0, 0.0)
+
+
+def test_batch_cli_writes_trace_and_report(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    trace_path = tmp_path / "cli.jsonl"
+    assert main(["--duration", "10", "--dt", "0.5", "--sample-every", "2", "--trace", str(trace_path)]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["samples"] == 5
+    assert report["trace_path"] == str(trace_path)
+    assert len(trace_path.read_text(encoding="utf-8").splitlines()) == 6
+
+
+def test_qsim_batch_benchmark_reports_both_paths() -> None:
+    from tools.qsim_batch_bench import run_benchmark
+
+    report = run_benchmark(duration_s=5.0, dt=0.5, sample_every_s=1.0)
+    assert report["batch"]["steps"] == 10
+    assert report["step_path_sim_s_per_wall_s"] > 0
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from qiki.services.q_sim_service.ensemble import (
+    METRIC_FIELDS,
+    EnsembleError,
+    EnsembleSpec,
+    load_checkpoint,
+    main,
+    read_result,
+    run_ensemble,
+    run_one,
+)
+
+_SOC = "hardware_profile.battery_soc_init_pct"
+
+
+def _spec(**overrides) -> EnsembleSpec:
+    values = dict(
+        runs=4,
+        duration_s=30.0,
+        dt=0.5,
+        seed=11,
+        perturb={_SOC: (5.0, 60.0)},
+        scene_jitter_m=20.0,
+        scene_velocity_jitter_m_s=0.2,
+    )
+    values.update(overrides)
+    return EnsembleSpec(**values)
+
+
+def _without_wall_time(columns: dict[str, list]) -> dict[str, list]:
+    return {name: values for name, values in columns.items() if name != "wall_s"}
+
+
+def test_run_one_is_seeded_and_reports_safe_mode_and_tracks() -> None:
+    spec = _spec()
+    first = run_one(spec, 2)
+    again = run_one(spec, 2)
+
+    assert {k: v for k, v in first.items() if k != "wall_s"} == {k: v for k, v in again.items() if k != "wall_s"}
+    assert set(spec.result_columns()) == set(first)
+    assert 5.0 <= first[f"p:{_SOC}"] <= 60.0
+    assert first["radar_frames"] == 30
+
+    low_soc = run_one(_spec(perturb={_SOC: (5.0, 5.0)}), 0)
+    assert low_soc["time_to_safe_mode_s"] == pytest.approx(1.0)
+    assert low_soc["safe_reason"] == "SAFE_POWER_LOW"
+
+    nominal = run_one(_spec(perturb={_SOC: (80.0, 80.0)}), 0)
+    assert nominal["time_to_safe_mode_s"] is None
+    assert nominal["tracks_spawned"] >= 1
+    assert nominal["track_continuity"] == pytest.approx(1.0)
+
+
+def test_interrupted_ensemble_resumes_from_checkpoint(tmp_path: Path) -> None:
+    spec = _spec()
+    out = tmp_path / "ensemble.json"
+    checkpoint = tmp_path / "ensemble.json.partial.jsonl"
+
+    partial = run_ensemble(spec, out, processes=1, limit=3)
+    assert (partial.executed, partial.pending, partial.result_path) == (3, 1, None)
+    assert not out.exists()
+    assert sorted(load_checkpoint(checkpoint, spec)) == [0, 1, 2]
+
+    # An interrupted append leaves a torn last line: that run is simply redone.
+    with checkpoint.open("a", encoding="utf-8") as fh:
+        fh.write('{"run": 3, "seed"')
+    resumed = run_ensemble(spec, out, processes=1)
+    assert (resumed.resumed, resumed.executed, resumed.pending) == (3, 1, 0)
+    assert not checkpoint.exists()
+
+    result = read_result(out)
+    assert result["kind"] == "qsim_ensemble_result"
+    assert result["runs"] == 4
+    assert list(result["columns"]) == list(spec.result_columns())
+    assert result["columns"]["run"] == [0, 1, 2, 3]
+
+    fresh = run_ensemble(spec, tmp_path / "fresh.json", processes=1)
+    assert fresh.executed == 4
+    assert _without_wall_time(read_result(tmp_path / "fresh.json")["columns"]) == _without_wall_time(result["columns"])
+
+
+def test_process_pool_matches_in_process_results(tmp_path: Path) -> None:
+    spec = _spec(runs=3, duration_s=10.0)
+    pooled = run_ensemble(spec, tmp_path / "pooled.json", processes=2)
+    serial = run_ensemble(spec, tmp_path / "serial.json", processes=1)
+
+    assert pooled.processes == 2
+    assert serial.processes == 1
+    assert _without_wall_time(read_result(tmp_path / "pooled.json")["columns"]) == _without_wall_time(
+        read_result(tmp_path / "serial.json")["columns"]
+    )
+
+
+def test_checkpoint_of_another_spec_is_rejected(tmp_path: Path) -> None:
+    out = tmp_path / "ensemble.json"
+    run_ensemble(_spec(), out, processes=1, limit=1)
+
+    with pytest.raises(EnsembleError):
+        run_ensemble(_spec(seed=12), out, processes=1)
+    with pytest.raises(ValueError):
+        _spec(perturb={_SOC: (60.0, 5.0)})
+
+
+def test_cli_writes_columnar_result(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    out = tmp_path / "cli.json"
+    code = main(
+        [
+            "--runs",
+            "2",
+            "--duration",
+            "5",
+            "--dt",
+            "0.5",
+            "--perturb",
+            f"{_SOC}=10:20",
+            "--processes",
+            "1",
+            "--out",
+            str(out),
+        ]
+    )
+
+    assert code == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["executed"] == 2
+    columns = read_result(out)["columns"]
+    assert set(METRIC_FIELDS) <= set(columns)
+    assert all(10.0 <= value <= 20.0 for value in columns[f"p:{_SOC}"])
+
+
+def test_run_one_ends_exactly_at_duration() -> None:
+    row = run_one(_spec(duration_s=2.25, dt=1.0), 0)
+    assert row["sim_s"] == pytest.approx(2.25)
+    assert row["radar_frames"] >= 1
@@ -0,0 +1,144 @@
+"""Fixed-step scheduler (accumulator, bounded catch-up, metrics) and per-output tick decimation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from qiki.services.q_sim_service.grpc_server import sim_service_loop
+from qiki.services.q_sim_service.scheduler import FixedStepScheduler, TickDecimator, ticks_for_interval
+from qiki.services.q_sim_service.service import QSimService
+from qiki.shared.config_models import QSimServiceConfig
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def _scheduler(clock: _FakeClock, tick_s: float = 1.0, **kwargs) -> FixedStepScheduler:
+    return FixedStepScheduler(tick_s, clock=clock, sleep=clock.sleep, async_sleep=clock.async_sleep, **kwargs)
+
+
+def test_work_time_does_not_stretch_the_tick_period() -> None:
+    clock = _FakeClock()
+    scheduler = _scheduler(clock)
+    started: list[float] = []
+
+    def step() -> None:
+        started.append(clock.now)
+        clock.now += 0.3
+
+    for _ in range(50):
+        scheduler.run_once(step)
+        scheduler.sleep_until_next_step()
+
+    assert started == pytest.approx([100.0 + i for i in range(50)])
+    assert scheduler.stats.steps == 50
+    assert scheduler.stats.overruns == scheduler.stats.dropped_steps == scheduler.stats.catch_up_steps == 0
+    assert scheduler.stats.max_jitter_s == pytest.approx(0.0)
+    assert scheduler.stats.max_work_s == pytest.approx(0.3)
+
+
+def test_stalls_are_caught_up_within_the_bound_and_measured() -> None:
+    clock = _FakeClock()
+    scheduler = _scheduler(clock, max_catch_up_steps=4)
+    steps: list[float] = []
+
+    def step() -> None:
+        steps.append(clock.now)
+
+    scheduler.run_once(step)
+    clock.now += 2.5
+    assert scheduler.run_once(step) == 2
+    assert scheduler.stats.catch_up_steps == 1
+    assert scheduler.stats.last_jitter_s == pytest.approx(1.5)
+    assert scheduler.time_to_next_step() == pytest.approx(0.5)
+
+    clock.now += 10.5
+    assert scheduler.run_once(step) == 4
+    assert scheduler.stats.dropped_steps == 7
+    assert scheduler.time_to_next_step() == pytest.approx(1.0)
+    assert len(steps) == scheduler.stats.steps == 7
+
+    def slow_step() -> None:
+        clock.now += 1.5
+
+    clock.now += 1.0
+    scheduler.run_once(slow_step)
+    assert scheduler.stats.overruns == 1
+    assert scheduler.stats.max_work_s == pytest.approx(1.5)
+
+
+def test_decimation_is_counted_in_ticks() -> None:
+    assert ticks_for_interval(1.0, 1.0) == 1
+    assert ticks_for_interval(0.0, 1.0) == 1
+    assert ticks_for_interval(5.0, 1.0) == 5
+    assert ticks_for_interval(1.0, 0.1) == 10
+
+    decimator = TickDecimator(3)
+    assert [decimator.due() for _ in range(7)] == [True, False, False, True, False, False, True]
+    decimator.reset()
+    assert decimator.due()
+
+
+def test_service_outputs_follow_their_decimation(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SENSOR_EVERY_N_TICKS", "3")
+    monkeypatch.setenv("EVENTS_EVERY_N_TICKS", "2")
+    qsim = QSimService(QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO"))
+    published: list[int] = []
+    monkeypatch.setattr(qsim, "_maybe_publish_events", lambda: published.append(qsim.scheduler.stats.steps))
+    generate_sensor_data = qsim.generate_sensor_data
+    sensed: list[int] = []
+
+    def counting_generate_sensor_data():
+        sensed.append(qsim.scheduler.stats.steps)
+        return generate_sensor_data()
+
+    monkeypatch.setattr(qsim, "generate_sensor_data", counting_generate_sensor_data)
+    stats = qsim.get_scheduler_stats()
+    assert stats["every_n_ticks"] == {"telemetry": 1, "events": 2, "sensor": 3, "radar": 1}
+
+    clock = _FakeClock()
+    qsim.scheduler = _scheduler(clock)
+    for _ in range(6):
+        qsim.scheduler.run_once(qsim.tick)
+        qsim.scheduler.sleep_until_next_step()
+
+    assert published == [0, 2, 4]
+    assert sensed == [0, 3]
+    assert qsim.get_scheduler_stats()["steps"] == 6
+
+
+def test_grpc_sim_loop_is_driven_by_the_scheduler(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("QSIM_MAX_CATCH_UP_STEPS", "lots")
+    qsim = QSimService(QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO"))
+    assert qsim.scheduler.max_catch_up_steps == 4
+
+    clock = _FakeClock()
+    qsim.scheduler = _scheduler(clock)
+    started: list[float] = []
+
+    def tick() -> None:
+        started.append(clock.now)
+        clock.now += 0.3
+        if len(started) == 5:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(qsim, "tick", tick)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(sim_service_loop(qsim))
+
+    assert started == pytest.approx([100.0, 101.0, 102.0, 103.0, 104.0])
+    assert qsim.get_scheduler_stats()["steps"] == 4
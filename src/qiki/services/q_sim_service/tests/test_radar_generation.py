@@ -8,10 +8,11 @@ except Exception:
     pytest.skip("pydantic not installed; skipping radar tests", allow_module_level=True)
 
 from qiki.services.q_sim_service.service import QSimService
-from qiki.shared.config_models import QSimServiceConfig
+from qiki.shared.config_models import QSimServiceConfig, RadarSettings
 from qiki.shared.models.radar import (
     RadarFrameModel,
     RadarDetectionModel,
+    RangeBand,
     TransponderModeEnum,
 )
 from generated.common_types_pb2 import SensorType as ProtoSensorType
@@ -22,6 +23,7 @@ def enable_radar(monkeypatch):
     monkeypatch.setenv("RADAR_ENABLED", "1")
     monkeypatch.delenv("RADAR_TRANSPONDER_MODE", raising=False)
     monkeypatch.delenv("RADAR_TRANSPONDER_ID", raising=False)
+    monkeypatch.delenv("RADAR_SIM_TARGETS", raising=False)
 
 
 def test_generate_radar_frame_basic():
@@ -129,3 +131,42 @@ def test_transponder_modes(monkeypatch, mode, expected_on, expected_id):
     else:
         assert sr_det.transponder_id is not None
         assert sr_det.transponder_id.startswith(expected_id)
+
+
+def test_objective_world_targets_drive_multi_target_frames(monkeypatch):
+    monkeypatch.setenv("RADAR_SIM_TARGETS", "1200")
+    cfg = QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO")
+    sim = QSimService(cfg)
+
+    sim.step()
+    first = sim.radar_frames[-1]
+    assert len(first.detections) == 1200
+    lr = [det for det in first.detections if det.range_band == RangeBand.RR_LR]
+    sr = [det for det in first.detections if det.range_band == RangeBand.RR_SR]
+    assert lr and sr
+    assert first.detections == lr + sr
+    assert [det.range_m for det in lr] == sorted(det.range_m for det in lr)
+    assert all(det.range_m <= 5000.0 for det in sr)
+    assert all(det.transponder_id is None and det.id_present is None for det in lr)
+    assert any(det.transponder_on and det.transponder_id.startswith("XPDR-") for det in sr)
+
+    sim.step()
+    assert [det.range_m for det in sim.radar_frames[-1].detections] != [det.range_m for det in first.detections]
+
+    sim.reset_simulation()
+    sim.step()
+    assert sim.radar_frames[-1].detections == first.detections
+
+
+def test_radar_sim_targets_from_config():
+    cfg = QSimServiceConfig(
+        sim_tick_interval=1,
+        sim_sensor_type=1,
+        log_level="INFO",
+        radar=RadarSettings(sim_targets=7, sim_target_seed=3),
+    )
+    frame = QSimService(cfg).generate_radar_frame()
+    baseline = QSimService(cfg.model_copy(update={"radar": RadarSettings()})).generate_radar_frame()
+
+    assert len(frame.detections) == 7
+    assert len(baseline.detections) == 2
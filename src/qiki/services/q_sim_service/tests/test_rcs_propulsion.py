@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from generated.actuator_raw_out_pb2 import ActuatorCommand
 from generated.common_types_pb2 import Unit
 from qiki.services.q_sim_service.service import QSimService
@@ -216,3 +218,49 @@ def test_if_rcs_command_emitted_in_payload_body_if_block() -> None:
     json.dumps(payload)
     normalized = TelemetrySnapshotModel.normalize_payload(payload)
     assert normalized["body_if_records"]["rcs_commands"]
+
+
+def test_vectorized_axis_group_search_matches_scalar_search() -> None:
+    from tools.rcs_allocation_bench import make_thrusters
+
+    from qiki.shared.config.loaders import ThrusterConfig
+
+    qsim = QSimService(QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO"))
+    wm = qsim.world_model
+    for count in (16, 24):
+        wm._rcs_thrusters = [ThrusterConfig.model_validate(item) for item in make_thrusters(count)]
+        wm._rcs_precompute_axis_groups()
+        forces = [[c * t.f_max_newton for c in t.direction.as_list()] for t in wm._rcs_thrusters]
+        torques = [wm._cross(t.position_m.as_list(), f) for t, f in zip(wm._rcs_thrusters, forces)]
+        scalar = wm._rcs_search_axis_groups(forces, torques)
+        assert {axis: list(combo) for axis, (combo, _) in scalar.items()} == wm._rcs_axis_groups
+        assert set(wm._rcs_axis_alloc) == set(wm._rcs_axis_groups)
+
+
+def test_rcs_allocation_table_gives_duty_scaled_net_force() -> None:
+    qsim = QSimService(QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO"))
+    wm = qsim.world_model
+    assert wm.set_rcs_command("forward", 40.0, 5.0) is True
+    wm._rcs_step(0.1)
+
+    expected_f = [0.0, 0.0, 0.0]
+    expected_tau = [0.0, 0.0, 0.0]
+    for idx in wm._rcs_axis_groups["forward"]:
+        t = wm._rcs_thrusters[idx]
+        f = [c * t.f_max_newton * 0.4 for c in t.direction.as_list()]
+        tau = wm._cross(t.position_m.as_list(), f)
+        expected_f = [a + b for a, b in zip(expected_f, f)]
+        expected_tau = [a + b for a, b in zip(expected_tau, tau)]
+
+    assert wm._rcs_net_force_n == pytest.approx(expected_f, abs=1e-9)
+    assert wm._rcs_net_torque_nm == pytest.approx(expected_tau, abs=1e-9)
+    assert expected_f[0] > 0.0
+    assert [s["duty_pct"] for s in wm._rcs_thruster_state.values()] == pytest.approx([40.0] * len(wm._rcs_thruster_state))
+
+
+def test_rcs_allocation_benchmark_reports_cases() -> None:
+    from tools.rcs_allocation_bench import run_benchmark
+
+    report = run_benchmark(counts=(16, 24), steps=50)
+    assert [case["thrusters"] for case in report["cases"]] == [16, 24]
+    assert all(case["axis_groups"] for case in report["cases"])
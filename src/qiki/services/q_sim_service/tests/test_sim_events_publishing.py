@@ -18,8 +18,6 @@ def test_qsim_publishes_minimal_sim_events() -> None:
     fake = _FakeEventsPublisher()
     qsim.events_nats_enabled = True
     qsim._events_publisher = fake  # type: ignore[assignment]
-    qsim._events_interval_sec = 0.0
-    qsim._events_last_sent_mono = 0.0
 
     qsim._maybe_publish_events()
 
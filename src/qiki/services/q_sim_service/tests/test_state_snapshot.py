@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import copy
+import json
+
+import pytest
+
+from qiki.services.q_sim_service.core.sensor_frame import build_truthful_sensor_frame
+from qiki.services.q_sim_service.core.world_model import WorldModel
+from qiki.services.q_sim_service.service import QSimService
+from qiki.shared.config_models import QSimServiceConfig
+
+
+def _qsim() -> QSimService:
+    return QSimService(QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO"))
+
+
+def test_state_snapshot_matches_get_state_and_is_cached_per_version() -> None:
+    wm = _qsim().world_model
+    wm.step(0.5)
+    snapshot = wm.state_snapshot()
+
+    assert snapshot == wm.get_state()
+    assert list(snapshot) == list(wm.get_state())
+    assert wm.state_snapshot() is snapshot
+    assert json.loads(json.dumps(snapshot)) == json.loads(json.dumps(wm.get_state()))
+
+    version = wm.state_version
+    wm.step(0.5)
+    assert wm.state_version > version
+    assert wm.state_snapshot() is not snapshot
+    assert wm.state_snapshot() == wm.get_state()
+
+
+def test_state_snapshot_is_read_only_and_stays_valid_after_step() -> None:
+    wm = _qsim().world_model
+    snapshot = wm.state_snapshot()
+    sim_y = snapshot["position"]["y"]
+
+    with pytest.raises(TypeError):
+        snapshot["speed"] = 1.0
+    with pytest.raises(TypeError):
+        snapshot.update(power={})
+    assert copy.deepcopy(snapshot) == snapshot
+
+    wm.speed = 1.0
+    wm.invalidate_state("core")
+    wm.step(10.0)
+    assert snapshot["position"]["y"] == sim_y
+    assert wm.state_snapshot()["position"]["y"] != sim_y
+    mutable = wm.get_state()
+    mutable["power"]["faults"].append("X")
+    assert "X" not in wm.state_snapshot()["power"]["faults"]
+
+
+def test_tick_consumers_do_not_mutate_the_shared_snapshot() -> None:
+    qsim = _qsim()
+    qsim.radar_enabled = True
+    qsim.step(delta_time=1.0)
+    snapshot = qsim.world_model.state_snapshot()
+    before = copy.deepcopy(snapshot)
+
+    qsim.generate_sensor_data()
+    qsim.generate_radar_frame()
+    qsim._build_telemetry_payload(snapshot)
+    build_truthful_sensor_frame(qsim.world_model)
+    assert snapshot == before
+
+
+def test_state_snapshot_rebuilds_only_changed_planes() -> None:
+    wm = _qsim().world_model
+    wm.step(0.5)
+    before = wm.state_snapshot()
+
+    wm.step(0.5)
+    after_step = wm.state_snapshot()
+    assert after_step["docking"] is before["docking"]
+    assert after_step["propulsion"] is before["propulsion"]  # RCS idle
+    assert after_step["power"] is not before["power"]
+
+    assert wm.set_docking_port(None) is True
+    after_dock = wm.state_snapshot()
+    assert after_dock["docking"] is not after_step["docking"]
+    assert after_dock["power"] is after_step["power"]
+
+    assert wm.set_rcs_command("forward", 50.0, 2.0) is True
+    wm.step(0.5)
+    assert wm.state_snapshot()["propulsion"]["rcs"]["active"] is True
+
+
+def test_service_tick_builds_state_once_for_all_consumers(monkeypatch: pytest.MonkeyPatch) -> None:
+    qsim = _qsim()
+    wm = qsim.world_model
+    builds = []
+    original = WorldModel._state_core
+    monkeypatch.setattr(WorldModel, "_state_core", lambda self: builds.append(1) or original(self))
+
+    qsim.radar_enabled = True
+    qsim.step(delta_time=1.0)
+    qsim._build_telemetry_payload(wm.state_snapshot())
+    assert len(builds) == 1
@@ -0,0 +1,139 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from qiki.services.q_sim_service.service import QSimService
+from qiki.services.q_sim_service.telemetry_sections import (
+    TelemetryDeltaDecoder,
+    TelemetryDeltaEncoder,
+    TelemetrySectionCache,
+    encode_sections,
+    model_field_dumper,
+    payload_from_sections,
+)
+from qiki.shared.config_models import QSimServiceConfig
+from qiki.shared.models.core import CommandMessage, MessageMetadata
+from qiki.shared.models.telemetry import TelemetrySnapshotModel
+
+
+class _FakeTelemetryPublisher:
+    def __init__(self) -> None:
+        self.messages: list[bytes] = []
+
+    def publish_encoded(self, data: bytes) -> None:
+        self.messages.append(data)
+
+
+def _qsim() -> QSimService:
+    qsim = QSimService(QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO"))
+    meta = MessageMetadata(message_type="control_command", source="test", destination="q_sim_service")
+    qsim.apply_control_command(
+        CommandMessage(
+            command_name="sim.rcs.fire", parameters={"axis": "port", "pct": 40.0, "duration_s": 3.0}, metadata=meta
+        )
+    )
+    return qsim
+
+
+def test_sectioned_payload_matches_the_snapshot_model_and_json_dumps() -> None:
+    qsim = _qsim()
+    qsim.step()
+    sections = qsim._telemetry_sections(qsim.world_model.state_snapshot(), TelemetrySectionCache())
+    payload = payload_from_sections(sections)
+
+    names = list(payload)
+    assert names[-3:] == ["hardware_profile_hash", "sim_state", "body_if_records"]
+    model_part = {name: payload[name] for name in names[:-3]}
+    validated = TelemetrySnapshotModel.model_validate(model_part).model_dump(mode="json")
+    validated["comms"].pop("age_s")
+    validated["comms"].pop("last_seen_ts")
+    assert list(validated) == names[:-3]
+    assert validated == model_part
+    assert encode_sections(sections) == json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def test_section_dumpers_apply_the_snapshot_model_field_validators() -> None:
+    for name, bad in (("source", " "), ("timestamp", ""), ("schema_version", 2), ("ts_unix_ms", -1)):
+        with pytest.raises(ValidationError):
+            model_field_dumper(TelemetrySnapshotModel, name)(bad)
+    assert model_field_dumper(TelemetrySnapshotModel, "schema_version")(1) == 1
+    assert model_field_dumper(TelemetrySnapshotModel, "position")({"x": 1, "y": 2, "z": 3}) == {
+        "x": 1.0,
+        "y": 2.0,
+        "z": 3.0,
+    }
+    assert model_field_dumper(TelemetrySnapshotModel, "docking")({"state": "docked"}) == {"state": "docked"}
+
+
+def test_unchanged_sections_reuse_their_encoded_bytes() -> None:
+    qsim = _qsim()
+    qsim.step()
+    cache = TelemetrySectionCache()
+    state = qsim.world_model.state_snapshot()
+    first = {section.name: (section.version, section.data) for section in qsim._telemetry_sections(state, cache)}
+
+    qsim.sensor_data_queue.clear()
+    second = qsim._telemetry_sections(qsim.world_model.state_snapshot(), cache)
+    reused = {section.name for section in second if first[section.name] == (section.version, section.data)}
+    assert {"power", "thermal", "propulsion", "docking", "sensor_plane", "sim_state"} <= reused
+    assert "ts_unix_ms" not in reused
+
+    qsim.step()
+    third = {section.name: section for section in qsim._telemetry_sections(qsim.world_model.state_snapshot(), cache)}
+    assert third["power"].version > first["power"][0]
+    assert json.loads(third["power"].data) == third["power"].value
+
+
+def test_delta_stream_rebuilds_full_snapshots_and_keyframes_late_joiners(monkeypatch) -> None:
+    monkeypatch.setenv("TELEMETRY_NATS_ENABLED", "1")
+    monkeypatch.setenv("TELEMETRY_DELTA_NATS_ENABLED", "1")
+    monkeypatch.setenv("TELEMETRY_DELTA_KEYFRAME_EVERY", "3")
+    monkeypatch.setenv("EVENTS_NATS_ENABLED", "0")
+    monkeypatch.setenv("TELEMETRY_INTERVAL_SEC", "0")
+    qsim = _qsim()
+    full, delta = _FakeTelemetryPublisher(), _FakeTelemetryPublisher()
+    qsim._telemetry_publisher = full  # type: ignore[assignment]
+    qsim._telemetry_delta_publisher = delta  # type: ignore[assignment]
+
+    for _ in range(7):
+        qsim.step()
+    assert len(full.messages) == len(delta.messages) == 7
+
+    messages = [json.loads(data) for data in delta.messages]
+    assert [message["kind"] for message in messages] == ["keyframe", "delta", "delta"] * 2 + ["keyframe"]
+    assert [message["seq"] for message in messages] == list(range(1, 8))
+    assert "orbit" in messages[0]["sections"]
+    assert "orbit" not in messages[1]["sections"]
+    assert len(delta.messages[1]) < len(full.messages[1])
+
+    decoder = TelemetryDeltaDecoder()
+    for message, snapshot in zip(messages, full.messages):
+        assert decoder.apply(message) == json.loads(snapshot)
+
+    late = TelemetryDeltaDecoder()
+    assert [late.apply(message) is not None for message in messages[1:]] == [False, False, True, True, True, True]
+    gap = TelemetryDeltaDecoder()
+    gap.apply(messages[0])
+    assert gap.apply(messages[2]) is None
+
+
+def test_invalid_keyframe_interval_falls_back_to_the_default(monkeypatch) -> None:
+    monkeypatch.setenv("TELEMETRY_DELTA_KEYFRAME_EVERY", "ten")
+    assert _qsim()._telemetry_delta.keyframe_every == 10
+
+
+def test_delta_encoder_reports_removed_sections() -> None:
+    cache = TelemetrySectionCache()
+    encoder = TelemetryDeltaEncoder(keyframe_every=100)
+    encoder.encode([cache.section("a", 1), cache.section("b", 2)])
+    message = json.loads(encoder.encode([cache.section("a", 3)]))
+
+    assert message == {
+        "schema_version": 1,
+        "kind": "delta",
+        "seq": 2,
+        "keyframe_seq": 1,
+        "sections": {"a": 3},
+        "removed": ["b"],
+    }
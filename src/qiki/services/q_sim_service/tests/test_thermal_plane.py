@@ -1,5 +1,6 @@
 from dataclasses import fields
 
+from qiki.services.q_sim_service.core import world_model as world_model_module
 from qiki.services.q_sim_service.core.world_model import (
     ThermalTelemetryRecord,
     WorldModel,
@@ -714,3 +715,89 @@ def test_thermal_config_warns_and_persists_when_hysteresis_is_zero() -> None:
     faults = wm.get_state().get("power", {}).get("faults", [])
     assert isinstance(faults, list)
     assert "THERMAL_PLANE_PARAM_INVALID:core:hys_zero" in faults
+
+
+def _stiff_network_config(solver: str | None) -> dict:
+    # Strong couplings on small capacities: explicit Euler needs dt < ~0.33 s here.
+    # solver=None leaves the key out (default solver).
+    config = {
+        "hardware_profile": {
+            "power_capacity_wh": 500,
+            "power_plane": {"mcqpu_power_w_at_100pct": 40.0},
+            "thermal_plane": {
+                "enabled": True,
+                "ambient_exchange_w_per_c": 0.1,
+                "nodes": [
+                    {
+                        "id": "core",
+                        "heat_capacity_j_per_c": 200.0,
+                        "cooling_w_per_c": 1.0,
+                        "t_init_c": 20.0,
+                        "t_max_c": 150.0,
+                        "t_hysteresis_c": 5.0,
+                    },
+                    {"id": "pdu", "heat_capacity_j_per_c": 50.0, "cooling_w_per_c": 0.5, "t_init_c": 20.0},
+                    {"id": "battery", "heat_capacity_j_per_c": 50.0, "cooling_w_per_c": 0.5, "t_init_c": 0.0},
+                ],
+                "couplings": [
+                    {"a": "core", "b": "pdu", "k_w_per_c": 150.0},
+                    {"a": "pdu", "b": "battery", "k_w_per_c": 150.0},
+                ],
+            },
+        }
+    }
+    if solver is not None:
+        config["hardware_profile"]["thermal_plane"]["solver"] = solver
+    return config
+
+
+def _thermal_trajectory(solver: str, dt: float, *, total_s: float, every_s: float) -> list[dict[str, float]]:
+    wm = WorldModel(bot_config=_stiff_network_config(solver))
+    samples: list[dict[str, float]] = []
+    steps_per_sample = int(round(every_s / dt))
+    for index in range(1, int(round(total_s / dt)) + 1):
+        # Fixed heat sources: 20 W into core, 2 W into pdu.
+        wm.cpu_usage = 50.0
+        wm.power_out_w = 100.0
+        wm.power_in_w = 100.0
+        wm._thermal_step(dt)
+        if index % steps_per_sample == 0:
+            samples.append({nid: float(node["temp_c"]) for nid, node in wm._thermal_nodes.items()})
+    return samples
+
+
+def test_matrix_thermal_solver_matches_fine_euler_at_10x_step() -> None:
+    pytest.importorskip("numpy")
+    reference = _thermal_trajectory("euler", 0.05, total_s=300.0, every_s=10.0)
+    for dt in (0.5, 5.0):
+        matrix = _thermal_trajectory("matrix", dt, total_s=300.0, every_s=10.0)
+        for expected, actual in zip(reference, matrix):
+            for nid, temp in expected.items():
+                assert actual[nid] == pytest.approx(temp, abs=0.05)
+
+
+def test_explicit_euler_is_unstable_where_matrix_solver_is_not() -> None:
+    pytest.importorskip("numpy")
+    euler = _thermal_trajectory("euler", 0.5, total_s=60.0, every_s=60.0)[-1]
+    matrix = _thermal_trajectory("matrix", 0.5, total_s=60.0, every_s=60.0)[-1]
+    assert max(euler.values()) == pytest.approx(160.0)  # oscillates into the clamp
+    assert all(-60.0 <= temp <= 20.0 for temp in matrix.values())
+
+
+def test_thermal_solver_defaults_to_matrix_and_euler_is_selectable() -> None:
+    pytest.importorskip("numpy")
+    assert WorldModel(bot_config=_stiff_network_config(None))._thermal_network is not None
+    assert WorldModel(bot_config=_stiff_network_config("euler"))._thermal_network is None
+
+
+def test_matrix_solver_without_numpy_warns_and_falls_back_to_euler(monkeypatch: pytest.MonkeyPatch) -> None:
+    warnings: list[str] = []
+    monkeypatch.setattr(world_model_module, "np", None)
+    monkeypatch.setattr(world_model_module.logger, "warning", lambda msg, *args: warnings.append(msg % args))
+    wm = WorldModel(bot_config=_stiff_network_config(None))
+    assert wm._thermal_network is None
+    assert len(warnings) == 1 and "falling back to explicit Euler" in warnings[0]
+
+    warnings.clear()
+    WorldModel(bot_config=_stiff_network_config("euler"))
+    assert warnings == []
@@ -0,0 +1,152 @@
+"""WorldModel signed checkpoint/restore and the sim.checkpoint.* control commands."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from qiki.services.q_sim_service.core.world_checkpoint import (
+    WorldCheckpointError,
+    decode_checkpoint,
+    encode_checkpoint,
+    read_checkpoint_meta,
+)
+from qiki.services.q_sim_service.core.world_model import WorldModel
+from qiki.services.q_sim_service.ensemble import _default_bot_config
+from qiki.services.q_sim_service.service import QSimService
+from qiki.shared.config_models import QSimServiceConfig
+from qiki.shared.models.core import CommandMessage, MessageMetadata
+
+KEY = b"test-checkpoint-key-0123456789"
+
+
+def _busy_world() -> WorldModel:
+    world = WorldModel(bot_config=_default_bot_config())
+    world.set_dock_connected(True)
+    world.set_rcs_command("forward", 70.0, 30.0)
+    for _ in range(40):
+        world.step(0.5)
+    return world
+
+
+def test_restore_continues_bit_for_bit() -> None:
+    world = _busy_world()
+    data = world.snapshot(key=KEY, hardware_profile_hash="sha256:abc")
+    meta = read_checkpoint_meta(data, key=KEY)
+    assert meta["hardware_profile_hash"] == "sha256:abc"
+    assert meta["sim_time_s"] == pytest.approx(20.0)
+    _, fields = decode_checkpoint(data, key=KEY)
+    assert fields["_sim_time_s"] == world._sim_time_s
+    assert fields["position"] == [world.position.x, world.position.y, world.position.z]
+
+    restored = WorldModel(bot_config=_default_bot_config())
+    version = restored.state_version
+    assert restored.restore(data, key=KEY, hardware_profile_hash="sha256:abc")["sim_time_s"] == meta["sim_time_s"]
+    assert restored.state_version > version
+    assert restored.get_state() == world.get_state()
+    assert restored.state_snapshot() == world.get_state()
+
+    for _ in range(40):
+        world.step(0.5)
+        restored.step(0.5)
+    assert restored.get_state() == world.get_state()
+    assert restored.state_snapshot() == world.state_snapshot()
+
+
+def test_restore_rejects_bad_checkpoints_and_keeps_the_model() -> None:
+    data = _busy_world().snapshot(key=KEY, hardware_profile_hash="sha256:abc")
+    meta, fields = decode_checkpoint(data, key=KEY)
+    world = WorldModel(bot_config=_default_bot_config())
+    before = world.get_state()
+
+    corrupted = bytearray(data)
+    corrupted[30] ^= 0xFF
+    for bad in (b"", b"NOTACKPT" + data[8:], data[:40], data[:-1], bytes(corrupted)):
+        with pytest.raises(WorldCheckpointError):
+            world.restore(bad, key=KEY)
+    with pytest.raises(WorldCheckpointError, match="signature"):
+        world.restore(data, key=b"another-key-0123456789")
+    with pytest.raises(WorldCheckpointError, match="key"):
+        world.restore(data, key=b"short")
+    with pytest.raises(WorldCheckpointError, match="hardware profile"):
+        world.restore(data, key=KEY, hardware_profile_hash="sha256:other")
+    with pytest.raises(WorldCheckpointError, match="bot_config"):
+        WorldModel().restore(data, key=KEY)
+
+    # Correctly signed, but not what this model version expects.
+    forged = [
+        ("schema version", {**meta, "schema_version": 99}, fields),
+        ("field set", meta, {**fields, "_state_version": 0}),
+        ("field set", meta, {k: v for k, v in fields.items() if k != "_sim_time_s"}),
+        ("battery_level", meta, {**fields, "battery_level": "full"}),
+        ("position", meta, {**fields, "position": [0.0, 1.0]}),
+        ("_rcs_thruster_state", meta, {**fields, "_rcs_thruster_state": [[999, {}]]}),
+        ("thermal nodes", meta, {**fields, "_thermal_nodes": {"core": {}}}),
+    ]
+    for match, bad_meta, bad_fields in forged:
+        with pytest.raises(WorldCheckpointError, match=match):
+            world.restore(encode_checkpoint(bad_meta, bad_fields, key=KEY), key=KEY)
+    assert world.get_state() == before
+
+
+def _qsim(monkeypatch: pytest.MonkeyPatch, checkpoint_dir: Path | None, key: str | None) -> QSimService:
+    if checkpoint_dir is None:
+        monkeypatch.delenv("QSIM_CHECKPOINT_DIR", raising=False)
+    else:
+        monkeypatch.setenv("QSIM_CHECKPOINT_DIR", str(checkpoint_dir))
+    if key is None:
+        monkeypatch.delenv("QSIM_CHECKPOINT_KEY", raising=False)
+    else:
+        monkeypatch.setenv("QSIM_CHECKPOINT_KEY", key)
+    return QSimService(QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO"))
+
+
+def _command(qsim: QSimService, command_name: str, **parameters) -> bool:
+    meta = MessageMetadata(message_type="control_command", source="test", destination="q_sim_service")
+    return qsim.apply_control_command(CommandMessage(command_name=command_name, parameters=parameters, metadata=meta))
+
+
+def test_checkpoint_control_commands(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    checkpoint_dir = tmp_path / "checkpoints"
+    qsim = _qsim(monkeypatch, checkpoint_dir, KEY.decode())
+
+    assert _command(qsim, "sim.start")
+    assert _command(qsim, "sim.rcs.fire", axis="port", pct=50.0, duration_s=5.0)
+    for _ in range(5):
+        qsim.step()
+    saved = qsim.world_model.get_state()
+    assert _command(qsim, "sim.checkpoint.save", name="drill-1")
+    assert (checkpoint_dir / "drill-1.qsimckpt").exists()
+    assert os.stat(checkpoint_dir).st_mode & 0o777 == 0o700
+    assert os.stat(checkpoint_dir / "drill-1.qsimckpt").st_mode & 0o777 == 0o600
+
+    assert _command(qsim, "sim.reset")
+    assert qsim.world_model.get_state() != saved
+    assert _command(qsim, "sim.start")
+    qsim.step()
+    assert _command(qsim, "sim.checkpoint.load", name="drill-1")
+    assert qsim.world_model.get_state() == saved
+    assert qsim.get_sim_state()["fsm_state"] == "STOPPED"
+    assert not qsim.sensor_data_queue and not qsim.radar_frames
+
+    assert not _command(qsim, "sim.checkpoint.load", name="missing")
+    assert not _command(qsim, "sim.checkpoint.load", name="../drill-1")
+    assert not _command(qsim, "sim.checkpoint.save")
+
+    other_key = _qsim(monkeypatch, checkpoint_dir, "another-key-0123456789")
+    assert not _command(other_key, "sim.checkpoint.load", name="drill-1")
+
+
+def test_checkpoint_commands_require_a_key_and_a_private_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert not _command(_qsim(monkeypatch, None, KEY.decode()), "sim.checkpoint.save", name="drill-1")
+    assert not _command(_qsim(monkeypatch, tmp_path / "a", None), "sim.checkpoint.save", name="drill-1")
+    assert not _command(_qsim(monkeypatch, tmp_path / "a", "short"), "sim.checkpoint.save", name="drill-1")
+    assert not (tmp_path / "a").exists()
+
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    assert not _command(_qsim(monkeypatch, shared, KEY.decode()), "sim.checkpoint.save", name="drill-1")
+    assert not list(shared.iterdir())
@@ -32,6 +32,11 @@ class SecurityConfig(BaseModel):
 
 class RadarSettings(BaseModel):
     sr_threshold_m: PositiveFloat = Field(default=5000.0, description="Порог между SR/LR диапазонами, метры")
+    sim_targets: Annotated[int, Field(ge=0)] = Field(
+        default=0,
+        description="Число синтетических целей объективного мира в кадре радара (0 — базовый кадр из двух детекций)",
+    )
+    sim_target_seed: int = Field(default=0, description="Seed синтетической сцены целей радара")
 
 
 class QSimServiceConfig(BaseModel):
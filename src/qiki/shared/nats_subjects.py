@@ -24,6 +24,7 @@ RADAR_TRACKS_SR = "qiki.radar.v1.tracks.sr"
 
 # Telemetry subjects
 SYSTEM_TELEMETRY = "qiki.telemetry"
+SYSTEM_TELEMETRY_DELTA = "qiki.telemetry.delta"
 
 # Control subjects
 COMMANDS_CONTROL = "qiki.commands.control"
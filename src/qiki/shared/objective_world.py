@@ -11,7 +11,9 @@ for it.
 
 from dataclasses import dataclass, field, replace
 from enum import StrEnum
-from typing import Any, Mapping, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
 
 
 OBJECTIVE_WORLD_SCHEMA_VERSION = 1
@@ -218,10 +220,196 @@ class ObjectiveWorldField:
         }
 
 
+_OBSERVABLE_STATUSES = frozenset({WorldObjectStatus.ACTIVE, WorldObjectStatus.DORMANT})
+
+
+class ObjectTable(Sequence):
+    """Struct-of-arrays view over the objects of one scene.
+
+    Positions and velocities live in `(n, 3)` float arrays,
+    `index` maps world_object_id to its row (first occurrence, as the old linear scan).
+    Static per-object data (type, status, profiles, signatures) is shared by every table
+    derived through `advance()`, which only moves the position array. The table is a
+    read-only sequence of `WorldObjectState`; rows are materialised on first access.
+
+    Range queries go through a sweep index: rows sorted by x, built lazily per table,
+    so `query_radius()` inspects only the slab `|x - cx| <= r` instead of every object.
+    """
+
+    __slots__ = (
+        "ids",
+        "index",
+        "object_types",
+        "status",
+        "collision_radius_m",
+        "positions",
+        "velocities",
+        "_templates",
+        "_observable_rows",
+        "_rows",
+        "_x_order",
+        "_x_sorted",
+    )
+
+    def __init__(self, objects: Iterable[WorldObjectState] = ()) -> None:
+        templates = tuple(objects)
+        index: dict[str, int] = {}
+        for row, obj in enumerate(templates):
+            index.setdefault(obj.world_object_id, row)
+        self.ids = tuple(obj.world_object_id for obj in templates)
+        self.index = index
+        self.object_types = tuple(obj.object_type for obj in templates)
+        self.status = tuple(obj.status for obj in templates)
+        self.collision_radius_m = tuple(float(obj.collision_radius_m) for obj in templates)
+        self.positions = _vector_rows(obj.position_xyz_m for obj in templates)
+        self.velocities = _vector_rows(obj.velocity_xyz_m_s for obj in templates)
+        self._templates = templates
+        self._observable_rows: dict[str, tuple[int, ...]] = {}
+        # The templates are exact for the positions they were built with.
+        self._rows: list[WorldObjectState | None] = list(templates)
+        self._x_order = None
+        self._x_sorted = None
+
+    @classmethod
+    def of(cls, objects: Iterable[WorldObjectState]) -> "ObjectTable":
+        return objects if isinstance(objects, cls) else cls(objects)
+
+    def advance(self, delta_time_s: float) -> "ObjectTable":
+        """A new table with every position moved by `velocity * dt` (same rounding as `WorldObjectState.advance`)."""
+
+        dt = max(0.0, _finite_float(delta_time_s))
+        table = ObjectTable.__new__(ObjectTable)
+        table.ids = self.ids
+        table.index = self.index
+        table.object_types = self.object_types
+        table.status = self.status
+        table.collision_radius_m = self.collision_radius_m
+        table.velocities = self.velocities
+        table._templates = self._templates
+        table._observable_rows = self._observable_rows
+        table.positions = self.positions + self.velocities * dt
+        table._rows = [None] * len(self._templates)
+        table._x_order = None
+        table._x_sorted = None
+        return table
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return tuple(self._object(row) for row in range(len(self._templates))[item])
+        row = range(len(self._templates))[item]
+        return self._object(row)
+
+    def __iter__(self) -> Iterator[WorldObjectState]:
+        for row in range(len(self._templates)):
+            yield self._object(row)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ObjectTable, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ObjectTable({len(self)} objects)"
+
+    def _object(self, row: int) -> WorldObjectState:
+        obj = self._rows[row]
+        if obj is None:
+            x, y, z = self.positions[row]
+            obj = replace(self._templates[row], position_xyz_m=WorldVector3(float(x), float(y), float(z)))
+            self._rows[row] = obj
+        return obj
+
+    def object_by_id(self, world_object_id: str) -> WorldObjectState | None:
+        row = self.index.get(str(world_object_id))
+        return None if row is None else self._object(row)
+
+    def observable_profile(self, row: int) -> Mapping[str, Any]:
+        return self._templates[row].observable_profile
+
+    def template(self, row: int) -> WorldObjectState:
+        """The row's object as the table was built: every static field is current, the position is not."""
+
+        return self._templates[row]
+
+    def observable_rows(self, sensor: str) -> tuple[int, ...]:
+        """Rows a `sensor` ("proximity", "radar", ...) may observe: active/dormant, not `<sensor>_visible: false`."""
+
+        rows = self._observable_rows.get(sensor)
+        if rows is None:
+            key = f"{sensor}_visible"
+            rows = tuple(
+                row
+                for row, obj in enumerate(self._templates)
+                if obj.status in _OBSERVABLE_STATUSES
+                and obj.observable_profile.get(key) is not False
+                and obj.world_object_id.strip()
+            )
+            self._observable_rows[sensor] = rows
+        return rows
+
+    def relative_to(
+        self,
+        rows: Sequence[int],
+        position_xyz_m: Sequence[float] | Mapping[str, Any] | WorldVector3 | None,
+        velocity_xyz_m_s: Sequence[float] | Mapping[str, Any] | WorldVector3 | None = None,
+    ) -> list[tuple[tuple[float, float, float], tuple[float, float, float], float]]:
+        """`(relative position, relative velocity, range)` of `rows` to an observer, in row order."""
+
+        origin = WorldVector3.from_value(position_xyz_m)
+        motion = WorldVector3.from_value(velocity_xyz_m_s)
+        picked = np.asarray(rows, dtype=np.intp)
+        rel_pos = self.positions[picked] - np.array([origin.x, origin.y, origin.z])
+        rel_vel = self.velocities[picked] - np.array([motion.x, motion.y, motion.z])
+        # Range via float pow, bit-identical to `vector3_norm` (np.sqrt can differ in the last ulp).
+        return [
+            ((x, y, z), tuple(vel), (x * x + y * y + z * z) ** 0.5)
+            for (x, y, z), vel in zip(rel_pos.tolist(), rel_vel.tolist())
+        ]
+
+    def query_radius(
+        self,
+        center_xyz_m: Sequence[float] | Mapping[str, Any] | WorldVector3 | None,
+        radius_m: float,
+    ) -> list[int]:
+        """Rows whose position lies within `radius_m` of `center_xyz_m` (ascending row order).
+
+        Distances are measured on the position array; callers that compare against ranges from
+        `relative_to()`/`vector3_norm` at the exact boundary should re-check those.
+        """
+
+        center = WorldVector3.from_value(center_xyz_m)
+        radius = max(0.0, _finite_float(radius_m))
+        order, xs = self._sweep_index()
+        lo = int(np.searchsorted(xs, center.x - radius, side="left"))
+        hi = int(np.searchsorted(xs, center.x + radius, side="right"))
+        candidates = np.sort(order[lo:hi])
+        rel = self.positions[candidates] - np.array([center.x, center.y, center.z])
+        dx, dy, dz = rel[:, 0], rel[:, 1], rel[:, 2]
+        inside = (dx * dx + dy * dy + dz * dz) ** 0.5 <= radius
+        return candidates[inside].tolist()
+
+    def _sweep_index(self):
+        if self._x_order is None:
+            xs = self.positions[:, 0]
+            order = np.argsort(xs, kind="stable")
+            self._x_order, self._x_sorted = order, xs[order]
+        return self._x_order, self._x_sorted
+
+
+def _vector_rows(vectors: Iterable[WorldVector3]):
+    rows = [(v.x, v.y, v.z) for v in vectors]
+    return np.array(rows, dtype=float).reshape(len(rows), 3)
+
+
 @dataclass(frozen=True, slots=True)
 class ObjectiveWorldState:
     scene_id: str
-    objects: tuple[WorldObjectState, ...] = field(default_factory=tuple)
+    objects: tuple[WorldObjectState, ...] | ObjectTable = field(default_factory=tuple)
     zones: tuple[ObjectiveWorldZone, ...] = field(default_factory=tuple)
     fields: tuple[ObjectiveWorldField, ...] = field(default_factory=tuple)
     world_tick_id: str | None = None
@@ -232,10 +420,14 @@ class ObjectiveWorldState:
     evidence: tuple[str, ...] = field(default_factory=tuple)
     metadata: Mapping[str, Any] = field(default_factory=dict)
     schema_version: int = OBJECTIVE_WORLD_SCHEMA_VERSION
+    _object_table: ObjectTable | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "scene_id", str(self.scene_id or "SCENE-UNKNOWN"))
-        object.__setattr__(self, "objects", tuple(self.objects or ()))
+        if isinstance(self.objects, ObjectTable):
+            object.__setattr__(self, "_object_table", self.objects)
+        else:
+            object.__setattr__(self, "objects", tuple(self.objects or ()))
         object.__setattr__(self, "zones", tuple(self.zones or ()))
         object.__setattr__(self, "fields", tuple(self.fields or ()))
         object.__setattr__(self, "source_world_snapshot_id", self.source_world_snapshot_id or self.world_snapshot_id)
@@ -260,18 +452,23 @@ class ObjectiveWorldState:
             sim_time_s=sim_time_s,
         )
 
+    def object_table(self) -> ObjectTable:
+        """Struct-of-arrays view of `objects` (built once per state)."""
+
+        table = self._object_table
+        if table is None:
+            table = ObjectTable(self.objects)
+            object.__setattr__(self, "_object_table", table)
+        return table
+
     def object_by_id(self, world_object_id: str) -> WorldObjectState | None:
-        wanted = str(world_object_id)
-        for obj in self.objects:
-            if obj.world_object_id == wanted:
-                return obj
-        return None
+        return self.object_table().object_by_id(world_object_id)
 
     def radar_visible_objects(self) -> tuple[WorldObjectState, ...]:
         return tuple(obj for obj in self.objects if obj.radar_visible and obj.status is WorldObjectStatus.ACTIVE)
 
     def advance(self, delta_time_s: float) -> "ObjectiveWorldState":
-        return replace(self, objects=tuple(obj.advance(delta_time_s) for obj in self.objects))
+        return replace(self, objects=self.object_table().advance(delta_time_s))
 
     def to_mapping(self, *, include_hidden_truth: bool = False, include_hidden: bool = False) -> dict[str, Any]:
         include_hidden_truth = bool(include_hidden_truth or include_hidden)
@@ -368,6 +565,7 @@ def vector3_norm(value: Sequence[float] | Mapping[str, Any] | WorldVector3 | Non
 
 __all__ = [
     "OBJECTIVE_WORLD_SCHEMA_VERSION",
+    "ObjectTable",
     "ObjectiveWorldField",
     "ObjectiveWorldState",
     "ObjectiveWorldZone",
@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any, Mapping, Sequence
 
-from qiki.shared.objective_world import ObjectiveWorldState, vector3_mapping, vector3_norm, vector3_sub
+from qiki.shared.objective_world import ObjectiveWorldState, ObjectTable, vector3_mapping, vector3_norm, vector3_sub
 
 
 SENSOR_OBSERVATION_SCHEMA_VERSION = 1
@@ -318,21 +318,25 @@ def build_sensor_observation_frame_from_objective_world(
     generated_at_epoch_s: float | None = None,
     proximity_sensor_id: str = "sensor_proximity",
     collision_threshold_m: float = 50.0,
+    max_range_m: float | None = None,
 ) -> SensorObservationFrame:
     """Build one Layer-07 observation frame over a public ObjectiveWorldState."""
 
-    scene_map = _scene_to_public_mapping(scene)
-    scene_id = _str_or_none(scene_map.get("scene_id"))
-    world_tick_id = _str_or_none(scene_map.get("world_tick_id"))
-    world_snapshot_id = _str_or_none(scene_map.get("world_snapshot_id"))
-    source_world_snapshot_id = _str_or_none(scene_map.get("source_world_snapshot_id")) or world_snapshot_id
-    sim_time_s = _finite_float_or_none(scene_map.get("sim_time_s"))
+    if isinstance(scene, ObjectiveWorldState):
+        # Read the object table directly; the scene is never serialised.
+        scene_id, world_tick_id, world_snapshot_id, source_world_snapshot_id, sim_time_s = _scene_lineage(scene)
+        source_object_count = len(scene.objects)
+    else:
+        scene = _scene_to_public_mapping(scene)
+        scene_id, world_tick_id, world_snapshot_id, source_world_snapshot_id, sim_time_s = _scene_lineage(scene)
+        source_object_count = len(_iter_public_objects(scene))
     observation = build_proximity_observation_from_objective_world(
-        scene_map,
+        scene,
         observer_position_xyz_m=observer_position_xyz_m,
         observer_velocity_xyz_m_s=observer_velocity_xyz_m_s,
         sensor_id=proximity_sensor_id,
         collision_threshold_m=collision_threshold_m,
+        max_range_m=max_range_m,
     )
     frame_id = f"SOF-{world_snapshot_id}" if world_snapshot_id else _format_observation_id(
         sensor_id="sensor_observation_frame",
@@ -356,7 +360,7 @@ def build_sensor_observation_frame_from_objective_world(
         ),
         metadata={
             "observation_count": 1,
-            "source_object_count": len(_iter_public_objects(scene_map)),
+            "source_object_count": source_object_count,
         },
     )
 
@@ -368,61 +372,47 @@ def build_proximity_observation_from_objective_world(
     observer_velocity_xyz_m_s: Mapping[str, Any] | Sequence[float] | None = None,
     sensor_id: str = "sensor_proximity",
     collision_threshold_m: float = 50.0,
+    max_range_m: float | None = None,
 ) -> SensorObservationSnapshot:
     """Build a truthful proximity observation over ObjectiveWorldState.
 
     This function does not distort or invent readings. It creates the explicit
     intermediate observation that sensor_runtime can package as a sensor reading.
     Hidden objective-world truth is intentionally ignored.
+
+    An ObjectiveWorldState is read through its ObjectTable (no per-object
+    serialisation); `max_range_m` limits the observation to a range query on the
+    table's spatial index. Mappings take the dict path with the same results.
     """
 
-    scene_map = _scene_to_public_mapping(scene)
-    scene_id = _str_or_none(scene_map.get("scene_id"))
-    world_tick_id = _str_or_none(scene_map.get("world_tick_id"))
-    world_snapshot_id = _str_or_none(scene_map.get("world_snapshot_id"))
-    source_world_snapshot_id = _str_or_none(scene_map.get("source_world_snapshot_id")) or world_snapshot_id
-    sim_time_s = _finite_float_or_none(scene_map.get("sim_time_s"))
     observer_position = vector3_mapping(observer_position_xyz_m)
     observer_velocity = vector3_mapping(observer_velocity_xyz_m_s or {})
     collision_threshold = max(0.0, _finite_float(collision_threshold_m, 50.0))
+    max_range = None if max_range_m is None else max(0.0, _finite_float(max_range_m, 0.0))
 
-    public_objects = _iter_public_objects(scene_map)
-    objects: list[ObservedObjectSnapshot] = []
-    for obj in public_objects:
-        profile = obj.get("observable_profile") if isinstance(obj.get("observable_profile"), Mapping) else {}
-        if profile.get("proximity_visible") is False:
-            continue
-        obj_status = str(obj.get("status") or "unknown").strip().lower()
-        if obj_status not in {"active", "dormant"}:
-            continue
-        world_object_id = str(obj.get("world_object_id") or "").strip()
-        if not world_object_id:
-            continue
-        pos = obj.get("position_xyz_m") if isinstance(obj.get("position_xyz_m"), Mapping) else {}
-        vel = obj.get("velocity_xyz_m_s") if isinstance(obj.get("velocity_xyz_m_s"), Mapping) else {}
-        rel_pos = vector3_sub(pos, observer_position)
-        rel_vel = vector3_sub(vel, observer_velocity)
-        range_m = vector3_norm(rel_pos)
-        confidence = _object_observation_confidence(range_m=range_m, profile=profile)
-        objects.append(
-            ObservedObjectSnapshot(
-                world_object_id=world_object_id,
-                object_type=str(obj.get("object_type") or "unknown"),
-                object_status=obj_status,
-                range_m=range_m,
-                relative_position_xyz_m=rel_pos,
-                relative_velocity_xyz_m_s=rel_vel,
-                collision_radius_m=obj.get("collision_radius_m"),
-                observable=True,
-                confidence=confidence,
-                source_path=f"ObjectiveWorldState.objects[{world_object_id}]",
-                evidence=(
-                    "source=objective_world",
-                    "private_truth_redacted=true",
-                    f"world_snapshot_id={world_snapshot_id}" if world_snapshot_id else "world_snapshot_id=missing",
-                ),
-                metadata={"objective_scene_id": scene_id},
-            )
+    if isinstance(scene, ObjectiveWorldState):
+        scene_id, world_tick_id, world_snapshot_id, source_world_snapshot_id, sim_time_s = _scene_lineage(scene)
+        source_object_count = len(scene.objects)
+        objects = _observed_objects_from_table(
+            scene.object_table(),
+            observer_position=observer_position,
+            observer_velocity=observer_velocity,
+            max_range_m=max_range,
+            scene_id=scene_id,
+            world_snapshot_id=world_snapshot_id,
+        )
+    else:
+        scene_map = _scene_to_public_mapping(scene)
+        scene_id, world_tick_id, world_snapshot_id, source_world_snapshot_id, sim_time_s = _scene_lineage(scene_map)
+        public_objects = _iter_public_objects(scene_map)
+        source_object_count = len(public_objects)
+        objects = _observed_objects_from_mappings(
+            public_objects,
+            observer_position=observer_position,
+            observer_velocity=observer_velocity,
+            max_range_m=max_range,
+            scene_id=scene_id,
+            world_snapshot_id=world_snapshot_id,
         )
     objects.sort(key=lambda item: (float("inf") if item.range_m is None else float(item.range_m), item.world_object_id))
 
@@ -459,12 +449,124 @@ def build_proximity_observation_from_objective_world(
             "private_truth_redacted=true",
         ),
         metadata={
-            "source_object_count": len(public_objects),
+            "source_object_count": source_object_count,
             "collision_threshold_m": collision_threshold,
         },
     )
 
 
+def _observed_objects_from_table(
+    table: ObjectTable,
+    *,
+    observer_position: Mapping[str, float],
+    observer_velocity: Mapping[str, float],
+    max_range_m: float | None,
+    scene_id: str | None,
+    world_snapshot_id: str | None,
+) -> list[ObservedObjectSnapshot]:
+    rows = table.observable_rows("proximity")
+    if max_range_m is not None:
+        # Spatial-index candidates (1 ppb margin); the reported range below decides.
+        near = set(table.query_radius(observer_position, max_range_m * (1.0 + 1e-9)))
+        rows = tuple(row for row in rows if row in near)
+    evidence = _observed_object_evidence(world_snapshot_id)
+    objects: list[ObservedObjectSnapshot] = []
+    for row, (rel_pos, rel_vel, range_m) in zip(rows, table.relative_to(rows, observer_position, observer_velocity)):
+        if max_range_m is not None and range_m > max_range_m:
+            continue
+        world_object_id = table.ids[row].strip()
+        objects.append(
+            ObservedObjectSnapshot(
+                world_object_id=world_object_id,
+                object_type=table.object_types[row].value,
+                object_status=table.status[row].value,
+                range_m=range_m,
+                relative_position_xyz_m=rel_pos,
+                relative_velocity_xyz_m_s=rel_vel,
+                collision_radius_m=table.collision_radius_m[row],
+                observable=True,
+                confidence=_object_observation_confidence(range_m=range_m, profile=table.observable_profile(row)),
+                source_path=f"ObjectiveWorldState.objects[{world_object_id}]",
+                evidence=evidence,
+                metadata={"objective_scene_id": scene_id},
+            )
+        )
+    return objects
+
+
+def _observed_objects_from_mappings(
+    public_objects: Sequence[Mapping[str, Any]],
+    *,
+    observer_position: Mapping[str, float],
+    observer_velocity: Mapping[str, float],
+    max_range_m: float | None,
+    scene_id: str | None,
+    world_snapshot_id: str | None,
+) -> list[ObservedObjectSnapshot]:
+    evidence = _observed_object_evidence(world_snapshot_id)
+    objects: list[ObservedObjectSnapshot] = []
+    for obj in public_objects:
+        profile = obj.get("observable_profile") if isinstance(obj.get("observable_profile"), Mapping) else {}
+        if profile.get("proximity_visible") is False:
+            continue
+        obj_status = str(obj.get("status") or "unknown").strip().lower()
+        if obj_status not in {"active", "dormant"}:
+            continue
+        world_object_id = str(obj.get("world_object_id") or "").strip()
+        if not world_object_id:
+            continue
+        pos = obj.get("position_xyz_m") if isinstance(obj.get("position_xyz_m"), Mapping) else {}
+        vel = obj.get("velocity_xyz_m_s") if isinstance(obj.get("velocity_xyz_m_s"), Mapping) else {}
+        rel_pos = vector3_sub(pos, observer_position)
+        rel_vel = vector3_sub(vel, observer_velocity)
+        range_m = vector3_norm(rel_pos)
+        if max_range_m is not None and range_m > max_range_m:
+            continue
+        confidence = _object_observation_confidence(range_m=range_m, profile=profile)
+        objects.append(
+            ObservedObjectSnapshot(
+                world_object_id=world_object_id,
+                object_type=str(obj.get("object_type") or "unknown"),
+                object_status=obj_status,
+                range_m=range_m,
+                relative_position_xyz_m=rel_pos,
+                relative_velocity_xyz_m_s=rel_vel,
+                collision_radius_m=obj.get("collision_radius_m"),
+                observable=True,
+                confidence=confidence,
+                source_path=f"ObjectiveWorldState.objects[{world_object_id}]",
+                evidence=evidence,
+                metadata={"objective_scene_id": scene_id},
+            )
+        )
+    return objects
+
+
+def _observed_object_evidence(world_snapshot_id: str | None) -> tuple[str, ...]:
+    return (
+        "source=objective_world",
+        "private_truth_redacted=true",
+        f"world_snapshot_id={world_snapshot_id}" if world_snapshot_id else "world_snapshot_id=missing",
+    )
+
+
+def _scene_lineage(
+    scene: ObjectiveWorldState | Mapping[str, Any],
+) -> tuple[str | None, str | None, str | None, str | None, float | None]:
+    """`(scene_id, world_tick_id, world_snapshot_id, source_world_snapshot_id, sim_time_s)` of a scene."""
+
+    keys = ("scene_id", "world_tick_id", "world_snapshot_id", "source_world_snapshot_id", "sim_time_s")
+    data = scene if isinstance(scene, Mapping) else {key: getattr(scene, key) for key in keys}
+    world_snapshot_id = _str_or_none(data.get("world_snapshot_id"))
+    return (
+        _str_or_none(data.get("scene_id")),
+        _str_or_none(data.get("world_tick_id")),
+        world_snapshot_id,
+        _str_or_none(data.get("source_world_snapshot_id")) or world_snapshot_id,
+        _finite_float_or_none(data.get("sim_time_s")),
+    )
+
+
 def _scene_to_public_mapping(scene: ObjectiveWorldState | Mapping[str, Any]) -> dict[str, Any]:
     if isinstance(scene, ObjectiveWorldState):
         return scene.to_mapping(include_hidden_truth=False)
@@ -0,0 +1,50 @@
+import pytest
+
+from qiki.services.q_core_agent.core.intent_classifier import PhraseMatcher
+from qiki.services.q_core_agent.qiki_orion_intents_service import _classify_intent
+from tools.intent_classifier_bench import classify_by_chain, make_corpus, run_benchmark
+
+
+def test_phrase_matcher_reports_overlapping_and_prefix_phrases() -> None:
+    matcher = PhraseMatcher({"short": ("dock",), "long": ("docking corridor",), "other": ("king",)})
+    assert matcher.labels("enter docking corridor") == {"short", "long", "other"}
+    assert matcher.labels("dock") == {"short"}
+    assert matcher.labels("nothing here") == frozenset()
+
+
+@pytest.mark.parametrize(
+    ("text", "intent"),
+    [
+        ("  Slow   SCAN  TGT-42 ", "slow_observation"),
+        ("safe observation for slow scan", "slow_observation"),
+        ("установи модуль сенсор", "attach_module"),
+        ("не надо, установи модуль", None),
+        ("undock", "release_dock"),
+        ("запросить коридор стыковки", "docking_corridor"),
+        ("docking corridor", "protocol_blocked"),
+        ("dock now", "protocol_blocked"),
+        ("как работает стыковка", None),
+        ("пожалуйста выполни стыковку", "protocol_blocked"),
+        ("атакуй цель ALPHA7", "hostile_attack"),
+        ("как дела", None),
+    ],
+)
+def test_classify_intent_follows_dispatch_order(text: str, intent: str | None) -> None:
+    assert _classify_intent(text).intent == intent
+    assert _classify_intent(text) == classify_by_chain(text)
+
+
+def test_classify_intent_extracts_designator_only_for_commands() -> None:
+    assert _classify_intent("slow scan target TGT-42").designator == "TGT-42"
+    assert _classify_intent("просто TGT-42").designator is None
+
+
+def test_classify_intent_matches_predicate_chain_on_synthetic_corpus() -> None:
+    for text in make_corpus(2000, seed=5):
+        assert _classify_intent(text) == classify_by_chain(text), text
+
+
+def test_intent_classifier_benchmark_reports_both_paths() -> None:
+    report = run_benchmark(phrases=50, rounds=1)
+    assert report["mismatches"] == 0
+    assert report["chain"]["mean_us"] > 0.0 and report["compiled"]["mean_us"] > 0.0
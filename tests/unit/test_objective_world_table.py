@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from qiki.services.q_sim_service.core.objective_scene import (
+    ObjectiveScene,
+    build_radar_detections_from_objective_world,
+)
+from qiki.shared.objective_world import (
+    ObjectiveWorldState,
+    ObjectTable,
+    WorldObjectState,
+    vector3_norm,
+    vector3_sub,
+)
+from qiki.shared.sensor_observation import (
+    build_proximity_observation_from_objective_world,
+    build_sensor_observation_frame_from_objective_world,
+)
+from qiki.shared.world_snapshot import WorldSnapshotRef
+
+
+def _random_objects(count: int, *, seed: int = 7) -> list[WorldObjectState]:
+    rnd = random.Random(seed)
+    return [
+        WorldObjectState(
+            world_object_id=f"OBJ-{i:05d}",
+            object_type=rnd.choice(["debris", "ship", "station"]),
+            status=rnd.choice(["active", "dormant", "lost"]),
+            position_xyz_m={"x": rnd.uniform(-2e4, 2e4), "y": rnd.uniform(-2e4, 2e4), "z": rnd.uniform(-500, 500)},
+            velocity_xyz_m_s=[rnd.uniform(-5.0, 5.0) for _ in range(3)],
+            collision_radius_m=rnd.uniform(1.0, 30.0),
+            observable_profile={"proximity_visible": rnd.random() > 0.1, "proximity_confidence": rnd.uniform(0.3, 0.9)},
+            true_transponder_id="HIDDEN",
+            hidden_truth={"intent": "hidden"},
+        )
+        for i in range(count)
+    ]
+
+
+def test_object_table_advance_matches_per_object_advance() -> None:
+    objects = _random_objects(200)
+    state = ObjectiveWorldState(scene_id="SCENE-T", objects=objects, world_snapshot_id="WS-1")
+    stepped = state.advance(0.25).advance(0.5)
+
+    expected = tuple(obj.advance(0.25).advance(0.5) for obj in objects)
+    assert isinstance(stepped.objects, ObjectTable)
+    assert tuple(stepped.objects) == expected
+    assert stepped.objects == expected
+    assert stepped.object_by_id("OBJ-00042") == expected[42]
+    assert stepped.object_by_id("OBJ-MISSING") is None
+    assert stepped.to_mapping(include_hidden_truth=True)["objects"] == [
+        obj.to_mapping(include_hidden_truth=True) for obj in expected
+    ]
+
+
+def test_object_by_id_returns_first_duplicate_like_the_linear_scan() -> None:
+    first = WorldObjectState(world_object_id="OBJ-DUP", object_type="ship")
+    second = WorldObjectState(world_object_id="OBJ-DUP", object_type="debris")
+    state = ObjectiveWorldState(scene_id="SCENE-T", objects=(first, second))
+
+    assert state.object_by_id("OBJ-DUP") is first
+    assert state.advance(1.0).object_by_id("OBJ-DUP").object_type == first.object_type
+
+
+def test_query_radius_matches_brute_force() -> None:
+    table = ObjectTable(_random_objects(500)).advance(2.0)
+    center = {"x": 1500.0, "y": -800.0, "z": 20.0}
+
+    for radius in (0.0, 250.0, 4000.0, 1e6):
+        expected = [
+            row for row, obj in enumerate(table) if vector3_norm(vector3_sub(obj.position_xyz_m, center)) <= radius
+        ]
+        assert table.query_radius(center, radius) == expected
+
+
+def test_proximity_observation_from_table_matches_mapping_path() -> None:
+    state = ObjectiveWorldState(
+        scene_id="SCENE-T",
+        objects=_random_objects(400),
+        world_tick_id="TICK-1",
+        world_snapshot_id="WS-1",
+        sim_time_s=12.5,
+    ).advance(1.5)
+    kwargs = {
+        "observer_position_xyz_m": {"x": 120.0, "y": -40.0, "z": 3.0},
+        "observer_velocity_xyz_m_s": [1.0, 2.0, 0.5],
+    }
+
+    for max_range_m in (None, 6000.0):
+        from_table = build_proximity_observation_from_objective_world(state, max_range_m=max_range_m, **kwargs)
+        from_mapping = build_proximity_observation_from_objective_world(
+            state.to_mapping(), max_range_m=max_range_m, **kwargs
+        )
+        assert from_table.to_mapping() == from_mapping.to_mapping()
+    assert (
+        0
+        < len(from_table.observed_objects)
+        < len(build_proximity_observation_from_objective_world(state, **kwargs).observed_objects)
+    )
+    assert all(item.range_m <= 6000.0 for item in from_table.observed_objects)
+
+    frame_from_table = build_sensor_observation_frame_from_objective_world(state, generated_at_epoch_s=1.0, **kwargs)
+    frame_from_mapping = build_sensor_observation_frame_from_objective_world(
+        state.to_mapping(), generated_at_epoch_s=1.0, **kwargs
+    )
+    assert frame_from_table.to_mapping() == frame_from_mapping.to_mapping()
+    assert "HIDDEN" not in str(frame_from_table.to_mapping())
+
+
+def test_objective_scene_step_keeps_objects_in_a_table() -> None:
+    scene = ObjectiveScene.default(sr_threshold_m=100.0)
+    expected = tuple(obj.advance(0.5).advance(0.5) for obj in scene.objects)
+
+    scene.step(0.5)
+    scene.step(0.5)
+
+    assert isinstance(scene.objects, ObjectTable)
+    assert scene.objects == expected
+    state = scene.build_state(
+        world_ref=WorldSnapshotRef(source="objective_world"), observer_position_xyz_m={"x": 0.0, "y": 0.0, "z": 0.0}
+    )
+    assert state.objects == expected
+    assert state.metadata["proximity"]["contacts_count"] == sum(1 for obj in expected if obj.status.value == "active")
+
+
+def test_radar_detections_from_table_match_mapping_path() -> None:
+    scene = ObjectiveScene.synthetic(600, seed=5, sr_threshold_m=2000.0)
+    scene.step(3.0)
+    objects = list(scene.objects)
+    objects[10] = WorldObjectState(world_object_id="OBJ-HIDDEN", observable_profile={"radar_visible": False})
+    objects[11] = WorldObjectState(world_object_id="OBJ-LOST", status="lost")
+    state = ObjectiveWorldState(scene_id=scene.scene_id, objects=objects).advance(0.5)
+    kwargs = {
+        "observer_position_xyz_m": {"x": 150.0, "y": -75.0, "z": 10.0},
+        "observer_velocity_xyz_m_s": {"x": 2.0, "y": 1.0, "z": 0.0},
+        "sr_threshold_m": 2000.0,
+    }
+
+    from_table = build_radar_detections_from_objective_world(state, **kwargs)
+    from_mapping = build_radar_detections_from_objective_world(state.to_mapping(), **kwargs)
+
+    assert len(from_table) == len(from_mapping) == 598
+    for got, expected in zip(from_table, from_mapping):
+        got_fields, expected_fields = got.model_dump(), expected.model_dump()
+        for name in ("range_m", "bearing_deg", "elev_deg", "vr_mps", "snr_db"):
+            assert got_fields.pop(name) == pytest.approx(expected_fields.pop(name), rel=1e-12, abs=1e-9)
+        assert got_fields == expected_fields
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from qiki.services.operator_console.clients.ingest_pipeline import (
+    CONFLATE_BY_SUBJECT,
+    IngestPipeline,
+    track_conflation_key,
+)
+from qiki.services.operator_console.clients.nats_client import NATSClient
+
+
+class _MsgStub:
+    def __init__(self, *, data: bytes, subject: str) -> None:
+        self.data = data
+        self.subject = subject
+        self.acked = False
+
+    async def ack(self) -> None:
+        self.acked = True
+
+
+class _SubStub:
+    async def unsubscribe(self) -> None:
+        return
+
+
+def _raw(payload: Any) -> bytes:
+    return json.dumps(payload).encode("utf-8")
+
+
+def test_ingest_conflates_telemetry_by_subject_and_tracks_by_id() -> None:
+    async def run() -> None:
+        pipeline = IngestPipeline(max_batches_per_s=1000.0)
+        telemetry: list[dict[str, Any]] = []
+        tracks: list[dict[str, Any]] = []
+
+        async def on_telemetry(env: dict[str, Any]) -> None:
+            telemetry.append(env)
+
+        async def on_track(env: dict[str, Any]) -> None:
+            tracks.append(env)
+
+        pipeline.register("SYSTEM_TELEMETRY", on_telemetry, conflate=CONFLATE_BY_SUBJECT)
+        pipeline.register("TRACKS", on_track, conflate=track_conflation_key)
+
+        for seq in range(50):
+            pipeline.submit("SYSTEM_TELEMETRY", _raw({"seq": seq}), subject="qiki.telemetry")
+        for seq in range(30):
+            pipeline.submit("TRACKS", _raw({"track_id": f"T{seq % 3}", "seq": seq}), subject="radar.tracks")
+        pipeline.submit("TRACKS", _raw({"seq": -1}), subject="radar.tracks")
+
+        delivered = await pipeline.flush()
+        await pipeline.stop()
+
+        assert [env["data"]["seq"] for env in telemetry] == [49]
+        assert telemetry[0]["stream"] == "SYSTEM_TELEMETRY"
+        # Latest per track id, in order of the latest arrival; id-less payloads pass through.
+        assert [env["data"].get("track_id") for env in tracks] == ["T0", "T1", "T2", None]
+        assert [env["data"]["seq"] for env in tracks] == [27, 28, 29, -1]
+        assert delivered == 5
+
+        stats = pipeline.stats()
+        assert stats["SYSTEM_TELEMETRY"]["received"] == 50
+        assert stats["SYSTEM_TELEMETRY"]["conflated"] == 49
+        assert stats["TRACKS"]["conflated"] == 27
+        assert pipeline.totals()["delivered"] == 5
+
+    asyncio.run(run())
+
+
+def test_ingest_event_lane_is_fifo_bounded_and_counts_errors() -> None:
+    async def run() -> None:
+        pipeline = IngestPipeline(max_batches_per_s=1000.0, max_pending_per_lane=4)
+        events: list[dict[str, Any]] = []
+
+        async def on_event(env: dict[str, Any]) -> None:
+            events.append(env)
+
+        pipeline.register("EVENTS", on_event, validate=None, include_subject=True)
+        for seq in range(6):
+            pipeline.submit("EVENTS", _raw({"seq": seq}), subject=f"qiki.events.v1.e{seq}")
+        pipeline.submit("EVENTS", b"{broken", subject="qiki.events.v1.bad")
+
+        await pipeline.flush()
+        await pipeline.stop()
+
+        assert [env["data"]["seq"] for env in events] == [3, 4, 5]
+        assert events[0]["subject"] == "qiki.events.v1.e3"
+        stats = pipeline.stats()["EVENTS"]
+        assert stats["dropped"] == 3
+        assert stats["decode_errors"] == 1
+        assert stats["conflated"] == 0
+
+    asyncio.run(run())
+
+
+def test_ingest_pump_delivers_without_explicit_flush() -> None:
+    async def run() -> None:
+        pipeline = IngestPipeline(max_batches_per_s=200.0)
+        got = asyncio.Event()
+
+        async def on_telemetry(_env: dict[str, Any]) -> None:
+            got.set()
+
+        pipeline.register("SYSTEM_TELEMETRY", on_telemetry, conflate=CONFLATE_BY_SUBJECT)
+        pipeline.submit("SYSTEM_TELEMETRY", _raw({"ok": True}), subject="qiki.telemetry")
+        await asyncio.wait_for(got.wait(), timeout=2.0)
+        await pipeline.stop()
+        assert pipeline.batches_delivered >= 1
+
+    asyncio.run(run())
+
+
+def test_nats_client_routes_tracks_through_ingest_and_acks() -> None:
+    async def run() -> None:
+        client = NATSClient(url="nats://test:4222")
+        pipeline = IngestPipeline(max_batches_per_s=1000.0)
+        client.enable_ingest_pipeline(pipeline)
+        handlers: dict[str, Any] = {}
+
+        class _JsStub:
+            async def subscribe(self, subject: str, **kwargs: Any) -> _SubStub:
+                handlers[subject] = kwargs["cb"]
+                return _SubStub()
+
+        client.js = _JsStub()  # type: ignore[assignment]
+        received: list[dict[str, Any]] = []
+
+        async def on_track(env: dict[str, Any]) -> None:
+            received.append(env)
+
+        await client.subscribe_tracks(on_track)
+        handler = next(iter(handlers.values()))
+        msgs = [_MsgStub(data=_raw({"track_id": "A", "seq": seq}), subject="radar.tracks") for seq in range(3)]
+        for msg in msgs:
+            await handler(msg)
+
+        assert received == []  # nothing decoded on the callback path
+        assert all(msg.acked for msg in msgs)
+        await pipeline.flush()
+        await pipeline.stop()
+        assert [env["data"]["seq"] for env in received] == [2]
+
+    asyncio.run(run())
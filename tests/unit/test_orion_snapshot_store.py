@@ -0,0 +1,88 @@
+import pytest
+
+pytest.importorskip("textual")
+
+from qiki.services.operator_console.main_orion import EventEnvelope, SnapshotStore  # noqa: E402
+
+
+def _env(type_name: str, ts: float, event_id: str = "") -> EventEnvelope:
+    return EventEnvelope(
+        event_id=event_id or f"{type_name}-{ts}",
+        type=type_name,
+        source="test",
+        ts_epoch=ts,
+        level="info",
+        payload={},
+    )
+
+
+def test_snapshot_store_maintains_newest_event_on_put() -> None:
+    store = SnapshotStore()
+    assert store.get_last_event() is None
+    assert store.last_ts_epoch() is None
+
+    store.put(_env("telemetry", 100.0))
+    store.put(_env("bios", 105.0))
+    store.put(_env("mission", 90.0))
+    assert store.get_last_event() is not None
+    assert store.get_last_event().type == "bios"
+    assert store.last_ts_epoch() == 105.0
+    assert store.last_event_age_s(now_epoch=110.0) == pytest.approx(5.0)
+
+    # Out-of-order replacement of the newest type falls back to the next newest.
+    store.put(_env("bios", 95.0))
+    assert store.get_last_event().type == "telemetry"
+    assert store.last_ts_epoch() == 100.0
+
+
+def test_snapshot_store_versions_are_per_type() -> None:
+    store = SnapshotStore()
+    assert store.version == 0
+    store.put(_env("telemetry", 1.0))
+    store.put(_env("mission", 2.0))
+    assert store.version == 2
+    assert store.version_of("telemetry") == 1
+    assert store.version_of("MISSION") == 2
+    assert store.version_of("bios") == 0
+
+
+def test_snapshot_store_consume_change_is_noop_without_new_data() -> None:
+    store = SnapshotStore()
+    store.subscribe("thermal", ("telemetry",))
+    assert store.consume_change("unknown-panel", now_epoch=0.0) is True
+
+    store.put(_env("telemetry", 1000.0))
+    # Age > 1h renders at 0.1 h resolution, so a few seconds later nothing visible changes.
+    assert store.consume_change("thermal", now_epoch=5000.0) is True
+    assert store.consume_change("thermal", now_epoch=5001.0) is False
+
+    # Data in an unrelated type does not wake the panel.
+    store.put(_env("mission", 5001.0))
+    assert store.consume_change("thermal", now_epoch=5002.0) is False
+
+    # New data in a subscribed type does.
+    store.put(_env("telemetry", 1000.0))
+    assert store.consume_change("thermal", now_epoch=5002.0) is True
+
+    # So does a change in caller-provided UI state.
+    assert store.consume_change("thermal", now_epoch=5002.0, extra=("narrow",)) is True
+    assert store.consume_change("thermal", now_epoch=5002.0, extra=("narrow",)) is False
+
+
+def test_snapshot_store_consume_change_tracks_visible_age() -> None:
+    store = SnapshotStore()
+    store.subscribe("summary", ("telemetry",))
+    store.put(_env("telemetry", 100.0))
+    assert store.consume_change("summary", now_epoch=101.0) is True
+    # Sub-minute ages are shown with 0.1 s precision: every tick moves the age cell.
+    assert store.consume_change("summary", now_epoch=102.0) is True
+    assert store.consume_change("summary", now_epoch=102.0) is False
+
+
+def test_snapshot_store_thresholds_table() -> None:
+    assert SnapshotStore.freshness_for_age("telemetry", 29.0) == "fresh"
+    assert SnapshotStore.freshness_for_age("telemetry", 31.0) == "stale"
+    assert SnapshotStore.freshness_for_age("task", 3000.0) == "stale"
+    assert SnapshotStore.freshness_for_age("power", 901.0) == "dead"
+    assert SnapshotStore.freshness_for_age("other", 61.0) == "stale"
+    assert SnapshotStore.freshness_for_age("other", None) is None
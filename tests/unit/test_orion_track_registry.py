@@ -0,0 +1,121 @@
+import random
+import time
+
+import pytest
+
+from qiki.services.operator_console.core.track_registry import TrackRegistry, track_sort_key
+
+
+def _reference_order(tracks: dict[str, tuple[dict, float]]) -> list[str]:
+    return [tid for tid, (payload, seen) in sorted(tracks.items(), key=lambda kv: track_sort_key(kv[0], *kv[1]))]
+
+
+def test_track_registry_keeps_range_order_under_updates() -> None:
+    rng = random.Random(7)
+    reg = TrackRegistry()
+    mirror: dict[str, tuple[dict, float]] = {}
+    for step in range(2000):
+        tid = f"T{rng.randrange(300):03d}"
+        payload = {"range_m": rng.uniform(0.0, 5000.0)} if rng.random() > 0.1 else {}
+        reg.upsert(tid, payload, float(step))
+        mirror[tid] = (payload, float(step))
+
+    expected = _reference_order(mirror)
+    assert [tid for tid, _p, _s in reg.top()] == expected
+    assert [tid for tid, _p, _s in reg.top(25)] == expected[:25]
+    assert all(reg.rank(tid) == idx for idx, tid in enumerate(expected))
+    assert len(reg) == len(mirror)
+
+
+def test_track_registry_tracks_without_range_sort_last_freshest_first() -> None:
+    reg = TrackRegistry()
+    reg.upsert("NO-RANGE-OLD", {}, 1.0)
+    reg.upsert("NO-RANGE-NEW", {}, 2.0)
+    reg.upsert("FAR", {"range_m": 900.0}, 1.0)
+    reg.upsert("NEAR", {"range_m": 10.0}, 1.0)
+    assert [tid for tid, _p, _s in reg.top()] == ["NEAR", "FAR", "NO-RANGE-NEW", "NO-RANGE-OLD"]
+
+
+def test_track_registry_expire_is_opt_in() -> None:
+    now = time.time()
+    keep = TrackRegistry()
+    keep.upsert("A", {"range_m": 1.0}, now - 3600.0)
+    assert keep.expire(now_epoch=now) == []
+    assert "A" in keep
+
+    reg = TrackRegistry(expire_s=30.0)
+    reg.upsert("OLD", {"range_m": 1.0}, now - 31.0)
+    reg.upsert("NEW", {"range_m": 2.0}, now)
+    version = reg.version
+    assert reg.expire(now_epoch=now) == ["OLD"]
+    assert reg.version > version
+    assert [tid for tid, _p, _s in reg.top()] == ["NEW"]
+    assert reg.rank("OLD") is None
+
+
+def test_track_registry_replace_accepts_legacy_mapping() -> None:
+    reg = TrackRegistry()
+    reg.replace({"B": ({"range_m": 200.0}, 1.0), "A": ({"range_m": 100.0}, 1.0)})
+    assert [tid for tid, _p, _s in reg.top(1)] == ["A"]
+    assert reg["B"][0]["range_m"] == 200.0
+    assert reg.remove("A") is True
+    assert reg.remove("A") is False
+
+
+def test_orion_sync_datatable_rows_emits_row_level_diff() -> None:
+    pytest.importorskip("textual")
+
+    from qiki.services.operator_console.main_orion import OrionApp
+
+    calls: list[tuple] = []
+
+    class _FakeDataTable:
+        id = "radar-table"
+        cursor_row = 0
+
+        def __init__(self) -> None:
+            self.keys: list[str] = []
+
+        @property
+        def row_count(self) -> int:
+            return len(self.keys)
+
+        def clear(self) -> None:
+            calls.append(("clear",))
+            self.keys = []
+
+        def add_row(self, *cells, key: str | None = None) -> None:  # noqa: ANN001
+            calls.append(("add", key))
+            self.keys.append(str(key))
+
+        def remove_row(self, key: str) -> None:
+            calls.append(("remove", key))
+            self.keys.remove(key)
+
+        def get_row_index(self, key: str) -> int:
+            return self.keys.index(key)
+
+        def update_cell_at(self, coord, value) -> None:  # noqa: ANN001
+            calls.append(("update", self.keys[coord.row], coord.column, value))
+
+        def move_cursor(self, **_kwargs) -> None:  # noqa: ANN003
+            return
+
+    app = OrionApp()
+    table = _FakeDataTable()
+    app._sync_datatable_rows(table, rows=[("A", "A", "1"), ("B", "B", "2"), ("C", "C", "3")])
+    assert calls[0] == ("clear",)
+
+    calls.clear()
+    app._sync_datatable_rows(table, rows=[("A", "A", "1"), ("C", "C", "30"), ("D", "D", "4")])
+    assert calls == [("remove", "B"), ("update", "C", 1, "30"), ("add", "D")]
+    assert table.keys == ["A", "C", "D"]
+
+    calls.clear()
+    app._sync_datatable_rows(table, rows=[("A", "A", "1"), ("C", "C", "30"), ("D", "D", "4")])
+    assert calls == []
+
+    # Reordering surviving rows is not expressible as a diff: full rebuild.
+    app._sync_datatable_rows(table, rows=[("D", "D", "4"), ("A", "A", "1")])
+    assert ("clear",) in calls
+    assert table.keys == ["D", "A"]
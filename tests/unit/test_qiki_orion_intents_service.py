@@ -1745,6 +1745,18 @@ def test_update_sensor_snapshot_records_imu_timestamp_metadata() -> None:
     assert "age_s" not in snapshot["sensor_plane"]
 
 
+async def _wait_for(predicate, timeout_s: float = 2.0) -> None:
+    # Intent requests are answered from their own task, after the subscription callback returns.
+    deadline = time.monotonic() + timeout_s
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.005)
+
+
+def _responses(fake_nc) -> list[dict[str, object]]:
+    return [payload for subject, payload in fake_nc.published if subject == QIKI_RESPONSES]
+
+
 def test_run_orion_intents_loop_station_hail_changes_after_fresh_telemetry(monkeypatch) -> None:
     class _FakeMsg:
         def __init__(self, payload: dict[str, object]) -> None:
@@ -1831,10 +1843,12 @@ def test_run_orion_intents_loop_station_hail_changes_after_fresh_telemetry(monke
 
             await fake_nc.callbacks[SYSTEM_TELEMETRY](_FakeMsg(old_frame_telemetry))
             await fake_nc.callbacks[QIKI_INTENTS](SimpleNamespace(data=old_frame_req.model_dump_json().encode("utf-8")))
+            await _wait_for(lambda: len(_responses(fake_nc)) == 1)
             old_frame_resp = fake_nc.published[-1][1]
 
             await fake_nc.callbacks[SYSTEM_TELEMETRY](_FakeMsg(fresh_telemetry))
             await fake_nc.callbacks[QIKI_INTENTS](SimpleNamespace(data=fresh_req.model_dump_json().encode("utf-8")))
+            await _wait_for(lambda: len(_responses(fake_nc)) == 2)
             fresh_resp = fake_nc.published[-1][1]
 
             assert fake_nc.published[-2][0] == QIKI_RESPONSES
@@ -2139,3 +2153,211 @@ def test_build_release_dock_response_blocks_when_already_undocked() -> None:
     assert response.legality.reason_code == "DOCK_ALREADY_RELEASED"
     assert response.consequence is not None
     assert response.consequence.status == "not_sent"
+
+
+def test_agent_snapshot_cache_single_flight_and_staleness_budget(monkeypatch) -> None:
+    calls: list[float] = []
+
+    def _slow_refresh(*, agent, data_provider) -> None:
+        del agent, data_provider
+        calls.append(time.monotonic())
+        time.sleep(0.1)
+
+    monkeypatch.setattr(intents_service, "_refresh_agent_snapshot", _slow_refresh)
+
+    async def _exercise() -> None:
+        cache = intents_service._AgentSnapshotCache(
+            agent=SimpleNamespace(),
+            data_provider=SimpleNamespace(),
+            lock=asyncio.Lock(),
+            max_age_s=5.0,
+        )
+        started = time.perf_counter()
+        await asyncio.gather(*(cache.refresh() for _ in range(4)))
+        # Four concurrent operators share one refresh instead of queueing behind the lock.
+        assert len(calls) == 1
+        assert time.perf_counter() - started < 0.3
+
+        await cache.refresh()
+        assert len(calls) == 1  # within the staleness budget
+        await cache.refresh(max_age_s=0.0)
+        assert len(calls) == 2  # forced (warmup loops need a new read)
+
+    asyncio.run(_exercise())
+
+
+def test_agent_snapshot_cache_propagates_refresh_errors_to_joined_waiters(monkeypatch) -> None:
+    def _boom_refresh(*, agent, data_provider) -> None:
+        del agent, data_provider
+        time.sleep(0.05)
+        raise RuntimeError("grpc down")
+
+    monkeypatch.setattr(intents_service, "_refresh_agent_snapshot", _boom_refresh)
+
+    async def _exercise() -> list[object]:
+        cache = intents_service._AgentSnapshotCache(agent=SimpleNamespace(), data_provider=SimpleNamespace())
+        return await asyncio.gather(cache.refresh(), cache.refresh(), return_exceptions=True)
+
+    results = asyncio.run(_exercise())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_run_orion_intents_loop_observes_intent_latency(monkeypatch) -> None:
+    observed: list[tuple[str, float, float]] = []
+
+    def _observe(intent: str, *, refresh_s: float, build_s: float) -> None:
+        observed.append((intent, refresh_s, build_s))
+
+    class _FakeNatsClient:
+        def __init__(self) -> None:
+            self.callbacks: dict[str, object] = {}
+            self.ready = asyncio.Event()
+
+        async def subscribe(self, subject: str, cb):
+            self.callbacks[subject] = cb
+            if subject == QIKI_INTENTS:
+                self.ready.set()
+            return SimpleNamespace()
+
+        async def publish(self, subject: str, data: bytes, headers=None) -> None:
+            del subject, data, headers
+
+    def _refresh(*, agent, data_provider) -> None:
+        del agent, data_provider
+        time.sleep(0.02)
+
+    async def _exercise() -> None:
+        fake_nc = _FakeNatsClient()
+
+        async def _fake_connect(*args, **kwargs):
+            del args, kwargs
+            return fake_nc
+
+        monkeypatch.setitem(sys.modules, "nats", types.SimpleNamespace(connect=_fake_connect))
+        monkeypatch.setattr(intents_service, "_refresh_agent_snapshot", _refresh)
+        monkeypatch.setattr(intents_service, "observe_intent_latency", _observe)
+        monkeypatch.setattr(intents_service, "llm_dialog_enabled", lambda: False)
+
+        agent = SimpleNamespace(
+            context=SimpleNamespace(
+                world_snapshot={"radar_tracks": [{"object_type": 3, "range_m": 640.0, "quality": 0.93, "age_s": 0.2}]},
+                sensor_snapshot={},
+                proposals=[],
+                qiki_repeat_state={},
+            )
+        )
+        loop_task = asyncio.create_task(_run_orion_intents_loop(agent=agent, data_provider=SimpleNamespace()))
+        try:
+            await asyncio.wait_for(fake_nc.ready.wait(), timeout=1.0)
+            for i, text in enumerate(("hail station", "ping")):
+                req = QikiChatRequestV1(
+                    request_id=UUID(int=300 + i),
+                    ts_epoch_ms=1,
+                    mode_hint=QikiMode.FACTORY,
+                    input=QikiChatInput(text=text, lang_hint="auto"),
+                )
+                await fake_nc.callbacks[QIKI_INTENTS](SimpleNamespace(data=req.model_dump_json().encode("utf-8")))
+                await _wait_for(lambda: len(observed) == i + 1)
+        finally:
+            loop_task.cancel()
+            try:
+                await loop_task
+            except asyncio.CancelledError:
+                pass
+
+    monkeypatch.setenv("QIKI_INTENTS_SNAPSHOT_MAX_AGE_SEC", "10")
+    asyncio.run(_exercise())
+
+    assert [intent for intent, _, _ in observed] == ["station_hail", "free_reply"]
+    # First request paid for the refresh; the second one was served from the cached snapshot.
+    assert observed[0][1] >= 0.02
+    assert observed[1][1] < 0.01
+    assert all(build_s >= 0.0 for _, _, build_s in observed)
+
+
+def test_serial_intents_subscription_shares_one_snapshot_refresh(monkeypatch) -> None:
+    refreshes: list[float] = []
+
+    def _slow_refresh(*, agent, data_provider) -> None:
+        del agent, data_provider
+        refreshes.append(time.monotonic())
+        time.sleep(0.2)
+
+    class _SerialFakeNatsClient:
+        """Delivers each subscription's messages one at a time, awaiting the callback (as nats-py does)."""
+
+        def __init__(self) -> None:
+            self.queues: dict[str, asyncio.Queue] = {}
+            self.consumers: list[asyncio.Task[None]] = []
+            self.published: list[tuple[str, dict[str, object]]] = []
+            self.ready = asyncio.Event()
+
+        async def subscribe(self, subject: str, cb):
+            queue: asyncio.Queue = asyncio.Queue()
+            self.queues[subject] = queue
+
+            async def consume() -> None:
+                while True:
+                    await cb(await queue.get())
+
+            self.consumers.append(asyncio.create_task(consume()))
+            if subject == QIKI_INTENTS:
+                self.ready.set()
+            return SimpleNamespace()
+
+        async def publish(self, subject: str, data: bytes, headers=None) -> None:
+            del headers
+            self.published.append((subject, json.loads(data.decode("utf-8"))))
+
+    async def _exercise() -> float:
+        fake_nc = _SerialFakeNatsClient()
+
+        async def _fake_connect(*args, **kwargs):
+            del args, kwargs
+            return fake_nc
+
+        monkeypatch.setitem(sys.modules, "nats", types.SimpleNamespace(connect=_fake_connect))
+        monkeypatch.setattr(intents_service, "_refresh_agent_snapshot", _slow_refresh)
+        monkeypatch.setattr(intents_service, "llm_dialog_enabled", lambda: False)
+
+        agent = SimpleNamespace(
+            context=SimpleNamespace(
+                world_snapshot={"radar_tracks": [{"object_type": 3, "range_m": 640.0, "quality": 0.93, "age_s": 0.2}]},
+                sensor_snapshot={},
+                proposals=[],
+                qiki_repeat_state={},
+            )
+        )
+        loop_task = asyncio.create_task(_run_orion_intents_loop(agent=agent, data_provider=SimpleNamespace()))
+        try:
+            await asyncio.wait_for(fake_nc.ready.wait(), timeout=1.0)
+            started = time.monotonic()
+            for i in range(2):
+                req = QikiChatRequestV1(
+                    request_id=UUID(int=400 + i),
+                    ts_epoch_ms=1,
+                    mode_hint=QikiMode.FACTORY,
+                    input=QikiChatInput(text="hail station", lang_hint="auto"),
+                )
+                fake_nc.queues[QIKI_INTENTS].put_nowait(SimpleNamespace(data=req.model_dump_json().encode("utf-8")))
+            await _wait_for(lambda: len(_responses(fake_nc)) == 2)
+            elapsed = time.monotonic() - started
+            assert sorted(response["request_id"] for response in _responses(fake_nc)) == [
+                str(UUID(int=400)),
+                str(UUID(int=401)),
+            ]
+        finally:
+            loop_task.cancel()
+            for consumer in fake_nc.consumers:
+                consumer.cancel()
+            try:
+                await loop_task
+            except asyncio.CancelledError:
+                pass
+        return elapsed
+
+    # No staleness budget: had the subscription awaited each request, the second would pay its own refresh.
+    monkeypatch.setenv("QIKI_INTENTS_SNAPSHOT_MAX_AGE_SEC", "0")
+    elapsed = asyncio.run(_exercise())
+    assert len(refreshes) == 1
+    assert elapsed < 0.35
@@ -92,3 +92,37 @@ def test_braille_ppi_rich_mode_selected_track_is_highlighted() -> None:
     )
     assert isinstance(out, Text)
     assert any(span.style == Style(color="#ffffff", bold=True) for span in out.spans)
+
+
+def _scene() -> list[tuple[str, dict]]:
+    return [
+        (
+            "T1",
+            {"position": {"x": 300.0, "y": -120.0, "z": 40.0}, "velocity": {"x": -20.0, "y": 5.0, "z": 1.0}, "iff": 1},
+        ),
+        ("T2", {"range_m": 250.0, "bearing_deg": 200.0, "iff": "FOE"}),
+        ("T3", {"position": {"x": -410.0, "y": 380.0, "z": 0.0}, "vx": 12.0, "vy": -30.0}),
+        ("T4", {"position": {"x": 0.0, "y": 0.0}}),
+        ("T5", {"position": {"x": float("nan"), "y": 0.0, "z": 0.0}}),
+    ]
+
+
+def test_braille_ppi_background_is_cached_per_size_and_not_mutated() -> None:
+    r = BraillePpiRenderer(width_cells=30, height_cells=12, max_range_m=500.0)
+    empty = r.render_tracks([])
+    r.render_tracks([("T1", {"position": {"x": 250.0, "y": 250.0, "z": 0.0}})])
+    assert len(r._backgrounds) == 1
+    # Track dots are drawn on a copy: the cached rings stay clean.
+    assert r.render_tracks([]) == empty
+
+    r.width_cells = 40
+    r.render_tracks([])
+    assert len(r._backgrounds) == 2
+
+
+def test_braille_ppi_render_benchmark_reports_each_track_count() -> None:
+    from tools.radar_ppi_render_bench import run_benchmark
+
+    report = run_benchmark(track_counts=(10, 100), width_cells=40, height_cells=12, iterations=2)
+    assert [row["tracks"] for row in report["results"]] == [10, 100]
+    assert all(row["render"]["mean_ms"] > 0.0 for row in report["results"])
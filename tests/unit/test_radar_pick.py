@@ -54,3 +54,38 @@ def test_pick_returns_none_when_far() -> None:
         pick_radius_cells=1.0,
     )
     assert picked is None
+
+
+def test_pick_reuses_render_index_only_for_same_viewport() -> None:
+    from qiki.services.operator_console.radar.unicode_ppi import BraillePpiRenderer
+
+    rendered = [("t-right", {"position": {"x": 100.0, "y": 0.0, "z": 0.0}})]
+    renderer = BraillePpiRenderer(width_cells=12, height_cells=7, max_range_m=100.0)
+    renderer.render_tracks(rendered, view="top")
+    assert renderer.pick_index is not None
+    assert len(renderer.pick_index) == 1
+
+    # Same viewport: the on-screen projection answers, even if the caller's list moved on.
+    moved = [("t-left", {"position": {"x": -100.0, "y": 0.0, "z": 0.0}})]
+    args = dict(click_cell_x=11, click_cell_y=3, width_cells=12, height_cells=7, max_range_m=100.0)
+    assert pick_nearest_track_id(moved, view="top", index=renderer.pick_index, **args) == "t-right"
+
+    # Different viewport: the stale index is ignored and tracks are projected afresh.
+    assert pick_nearest_track_id(moved, view="top", zoom=2.0, index=renderer.pick_index, **args) is None
+    assert pick_nearest_track_id(moved, view="front", index=renderer.pick_index, **args) is None
+
+
+def test_pick_ties_go_to_first_track() -> None:
+    tracks = [
+        ("first", {"position": {"x": 50.0, "y": 0.0, "z": 0.0}}),
+        ("second", {"position": {"x": 50.0, "y": 0.0, "z": 0.0}}),
+    ]
+    picked = pick_nearest_track_id(
+        tracks,
+        click_cell_x=9,
+        click_cell_y=3,
+        width_cells=12,
+        height_cells=7,
+        max_range_m=100.0,
+    )
+    assert picked == "first"
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import random
+import time
+from argparse import ArgumentParser
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from qiki.services.faststream_bridge.radar_guard_cadence import RadarGuardCadence
+from qiki.services.q_core_agent.core.guard_table import GuardEvaluationResult, GuardRule, GuardTable
+from qiki.shared.models.radar import FriendFoeEnum, RadarTrackModel, RadarTrackStatusEnum, TransponderModeEnum
+
+
+def make_rules(count: int, *, max_range_m: float, seed: int = 3) -> list[GuardRule]:
+    """Range-band rules with a mix of IFF/transponder constraints, anti-flap settings included."""
+    rng = random.Random(seed)
+    rules: list[GuardRule] = []
+    for i in range(int(count)):
+        lo = rng.uniform(0.0, max_range_m * 0.9)
+        raw: dict[str, Any] = {
+            "id": f"RULE_{i:04d}",
+            "description": f"bench rule {i}",
+            "severity": rng.choice(["info", "warning", "critical"]),
+            "fsm_event": "RADAR_ALERT_BENCH",
+            "min_range_m": lo,
+            "max_range_m": lo + rng.uniform(50.0, max_range_m * 0.1),
+            "min_quality": rng.uniform(0.0, 0.5),
+            "hysteresis_m": rng.choice([0.0, 5.0, 25.0]),
+            "cooldown_s": rng.choice([0.0, 2.0, 10.0]),
+        }
+        if rng.random() < 0.7:
+            raw["iff"] = int(rng.choice(list(FriendFoeEnum)))
+        if rng.random() < 0.4:
+            raw["require_transponder_on"] = rng.random() < 0.5
+        if rng.random() < 0.3:
+            raw["allowed_transponder_modes"] = [int(m) for m in rng.sample(list(TransponderModeEnum), 2)]
+        rules.append(GuardRule.model_validate(raw))
+    return rules
+
+
+def make_tracks(count: int, *, max_range_m: float, seed: int = 5) -> list[RadarTrackModel]:
+    rng = random.Random(seed)
+    ts = datetime(2026, 1, 1, tzinfo=UTC)
+    tracks: list[RadarTrackModel] = []
+    for _ in range(int(count)):
+        mode = rng.choice(list(TransponderModeEnum))
+        tracks.append(
+            RadarTrackModel(
+                track_id=uuid4(),
+                status=rng.choice([RadarTrackStatusEnum.TRACKED] * 4 + [RadarTrackStatusEnum.NEW]),
+                range_m=rng.uniform(0.0, max_range_m),
+                bearing_deg=rng.uniform(0.0, 359.0),
+                elev_deg=0.0,
+                vr_mps=rng.uniform(-50.0, 50.0),
+                snr_db=10.0,
+                rcs_dbsm=1.0,
+                quality=rng.uniform(0.0, 1.0),
+                iff=rng.choice(list(FriendFoeEnum)),
+                transponder_on=mode != TransponderModeEnum.OFF,
+                transponder_mode=mode,
+                timestamp=ts,
+                ts_event=ts,
+            )
+        )
+    return tracks
+
+
+def evaluate_unindexed(table: GuardTable, tracks: list[RadarTrackModel]) -> list[GuardEvaluationResult]:
+    """Reference path: every rule against every track."""
+    return [result for track in tracks for rule in table.rules if (result := rule.evaluate(track))]
+
+
+def _rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+
+def run_benchmark(
+    *,
+    rules: int = 200,
+    tracks: int = 2000,
+    seconds: int = 5,
+    churn: float = 0.2,
+    track_ttl_s: float = 3.0,
+    max_range_m: float = 20_000.0,
+) -> dict[str, Any]:
+    """
+    Throughput of guard evaluation (`rules` × `tracks` per simulated second) and cadence state size.
+
+    Each simulated second replaces a `churn` share of the tracks with fresh IDs, so dead tracks
+    accumulate unless the cadence evicts them after `track_ttl_s`.
+    """
+    table = GuardTable(schema_version=1, rules=make_rules(rules, max_range_m=max_range_m))
+    population = make_tracks(tracks, max_range_m=max_range_m)
+
+    started = time.perf_counter()
+    reference = evaluate_unindexed(table, population)
+    unindexed_s = time.perf_counter() - started
+    started = time.perf_counter()
+    indexed = table.evaluate_tracks(population)
+    indexed_s = time.perf_counter() - started
+    mismatches = len({(r.rule_id, r.track_id) for r in reference} ^ {(r.rule_id, r.track_id) for r in indexed})
+
+    cadence = RadarGuardCadence(table, default_cooldown_s=2.0, track_ttl_s=track_ttl_s)
+    rng = random.Random(11)
+    base = population[0].ts_event if population else datetime(2026, 1, 1, tzinfo=UTC)
+    cadence_s = 0.0
+    updates = 0
+    alerts = 0
+    peak_tracked = 0
+    for second in range(max(1, int(seconds))):
+        ts = base + timedelta(seconds=second)
+        population = [
+            track.model_copy(
+                update={
+                    "track_id": uuid4() if rng.random() < churn else track.track_id,
+                    "range_m": max(0.0, track.range_m + rng.uniform(-30.0, 30.0)),
+                    "timestamp": ts,
+                    "ts_event": ts,
+                }
+            )
+            for track in population
+        ]
+        t0 = time.perf_counter()
+        for track in population:
+            alerts += len(cadence.update(track))
+        cadence_s += time.perf_counter() - t0
+        updates += len(population)
+        peak_tracked = max(peak_tracked, cadence.tracked_count)
+
+    return {
+        "rules": len(table.rules),
+        "tracks": len(population),
+        "evaluate": {
+            "unindexed_tracks_per_s": _rate(len(population), unindexed_s),
+            "indexed_tracks_per_s": _rate(len(population), indexed_s),
+            "speedup": round(unindexed_s / indexed_s, 2) if indexed_s > 0 else None,
+            "matches": len(indexed),
+            "mismatches": mismatches,
+        },
+        "cadence": {
+            "seconds": int(seconds),
+            "updates_per_s": _rate(updates, cadence_s),
+            "alerts": alerts,
+            "peak_tracked": peak_tracked,
+            "tracked_after": cadence.tracked_count,
+            "states_after": cadence.state_count,
+        },
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(description="Benchmark GuardTable evaluation and RadarGuardCadence state bounds")
+    parser.add_argument("--rules", type=int, default=200, help="Guard rules (default: 200)")
+    parser.add_argument("--tracks", type=int, default=2000, help="Tracks per simulated second (default: 2000)")
+    parser.add_argument("--seconds", type=int, default=5, help="Simulated seconds of cadence updates (default: 5)")
+    parser.add_argument(
+        "--churn", type=float, default=0.2, help="Share of track IDs replaced per second (default: 0.2)"
+    )
+    parser.add_argument("--ttl", type=float, default=3.0, help="Cadence track TTL, seconds (default: 3)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        rules=int(args.rules),
+        tracks=int(args.tracks),
+        seconds=int(args.seconds),
+        churn=float(args.churn),
+        track_ttl_s=float(args.ttl),
+    )
+    print(json.dumps(report, indent=2))
+    return 0 if report["evaluate"]["mismatches"] == 0 else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
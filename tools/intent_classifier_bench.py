@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import random
+import time
+from argparse import ArgumentParser
+from statistics import mean, quantiles
+from typing import Any
+
+from qiki.services.q_core_agent import qiki_orion_intents_service as svc
+
+# Dispatch order of `_run_orion_intents_loop` before the compiled classifier.
+_PREDICATE_CHAIN = (
+    ("slow_observation", svc._is_slow_observation_command),
+    ("safe_observation", svc._is_safe_observation_command),
+    ("release_dock", svc._is_release_dock_command),
+    ("cargo_list", svc._is_cargo_list_command),
+    ("attach_module", svc._is_attach_module_command),
+    ("hostile_attack", svc._is_hostile_attack_command),
+    ("protocol_blocked", svc._is_protocol_blocked_command),
+    ("station_hail", svc._is_station_hail_command),
+    ("docking_corridor", svc._is_docking_corridor_command),
+    ("attitude_stabilize", svc._is_attitude_stabilize_command),
+    ("station_approach", svc._is_station_approach_command),
+)
+
+_FILLER = (
+    "qiki",
+    "please",
+    "now",
+    "status",
+    "report",
+    "сейчас",
+    "пожалуйста",
+    "борт",
+    "цель",
+    "объект",
+    "станция",
+    "как",
+    "дела",
+    "и",
+    "потом",
+    "TGT-42",
+    "ALPHA7",
+    "не",
+    "надо",
+)
+
+
+def classify_by_chain(text: str) -> svc._IntentMatch:
+    """The original predicate chain: every predicate re-normalises and re-scans the text."""
+    for intent, predicate in _PREDICATE_CHAIN:
+        if predicate(text):
+            return svc._IntentMatch(intent=intent, designator=svc._extract_target_designator(text))
+    return svc._IntentMatch(intent=None)
+
+
+def make_corpus(count: int, *, seed: int = 11) -> list[str]:
+    """Operator-like phrases: trigger phrases embedded in filler, questions, negations and free chatter."""
+    rng = random.Random(seed)
+    phrases = [
+        *svc._SLOW_OBSERVATION_TRIGGERS,
+        *svc._SAFE_OBSERVATION_TRIGGERS,
+        *svc._RELEASE_DOCK_TRIGGERS,
+        *svc._CARGO_LIST_TRIGGERS,
+        *svc._ATTACH_VERBS,
+        *svc._ATTACH_OBJECTS,
+        *svc._HOSTILE_ATTACK_TRIGGERS,
+        *svc._PROTOCOL_TRIGGERS,
+        *svc._PROTOCOL_PREFIXES,
+        *svc._STATION_HAIL_TRIGGERS,
+        *svc._DOCKING_CORRIDOR_TRIGGERS,
+        *svc._ATTITUDE_STABILIZE_TRIGGERS,
+        *svc._STATION_APPROACH_TRIGGERS,
+        "выполни стыковку",
+        "почему",
+        "можно ли",
+    ]
+    corpus: list[str] = []
+    for _ in range(int(count)):
+        words = [rng.choice(_FILLER) for _ in range(rng.randint(0, 6))]
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randint(0, len(words)), rng.choice(phrases))
+        text = "  ".join(words) if rng.random() < 0.2 else " ".join(words)
+        if rng.random() < 0.3:
+            text = text.upper()
+        if rng.random() < 0.1:
+            text += "?"
+        corpus.append(text)
+    return corpus
+
+
+def _us_stats(samples_s: list[float]) -> dict[str, float]:
+    us = [s * 1_000_000.0 for s in samples_s]
+    p95 = us[0] if len(us) < 2 else quantiles(us, n=100, method="inclusive")[94]
+    return {"mean_us": round(mean(us), 3), "p95_us": round(p95, 3), "max_us": round(max(us), 3)}
+
+
+def run_benchmark(*, phrases: int = 2000, rounds: int = 5, seed: int = 11) -> dict[str, Any]:
+    """Per-phrase latency of the predicate chain vs `_classify_intent`; also checks they agree."""
+    corpus = make_corpus(phrases, seed=seed)
+    mismatches = sum(classify_by_chain(text) != svc._classify_intent(text) for text in corpus)
+    timings: dict[str, list[float]] = {"chain": [], "compiled": []}
+    for _ in range(max(1, int(rounds))):
+        for name, classify in (("chain", classify_by_chain), ("compiled", svc._classify_intent)):
+            for text in corpus:
+                started = time.perf_counter()
+                classify(text)
+                timings[name].append(time.perf_counter() - started)
+    chain = _us_stats(timings["chain"])
+    compiled = _us_stats(timings["compiled"])
+    return {
+        "phrases": len(corpus),
+        "rounds": int(rounds),
+        "mismatches": int(mismatches),
+        "chain": chain,
+        "compiled": compiled,
+        "speedup_mean": round(chain["mean_us"] / compiled["mean_us"], 2) if compiled["mean_us"] else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(description="Benchmark ORION intent classification: predicate chain vs compiled matcher")
+    parser.add_argument("--phrases", type=int, default=2000, help="Synthetic operator phrases (default: 2000)")
+    parser.add_argument("--rounds", type=int, default=5, help="Passes over the corpus per classifier (default: 5)")
+    parser.add_argument("--seed", type=int, default=11, help="Corpus RNG seed (default: 11)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(phrases=int(args.phrases), rounds=int(args.rounds), seed=int(args.seed))
+    print(json.dumps(report, indent=2))
+    return 0 if report["mismatches"] == 0 else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
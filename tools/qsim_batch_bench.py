@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+import time
+from argparse import ArgumentParser
+from dataclasses import asdict
+from typing import Any
+
+from qiki.services.q_sim_service.service import QSimService
+from qiki.shared.config_models import QSimServiceConfig
+
+
+def _service() -> QSimService:
+    return QSimService(QSimServiceConfig(sim_tick_interval=1, sim_sensor_type=1, log_level="INFO"))
+
+
+def run_benchmark(*, duration_s: float = 600.0, dt: float = 0.1, sample_every_s: float = 1.0) -> dict[str, Any]:
+    """Sim-seconds per wall-second: headless `run_batch` vs the service `step()` path (sensors included)."""
+    batch = _service().run_batch(duration_s, dt, sample_every_s=sample_every_s)
+
+    service = _service()
+    steps = batch.steps
+    started = time.perf_counter()
+    for _ in range(steps):
+        service.step(dt)
+    step_wall_s = time.perf_counter() - started
+    step_rate = round(steps * dt / step_wall_s, 2) if step_wall_s > 0 else 0.0
+    return {
+        "batch": asdict(batch),
+        "step_path_sim_s_per_wall_s": step_rate,
+        "speedup": round(batch.sim_s_per_wall_s / step_rate, 2) if step_rate > 0 else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(description="Benchmark headless QSimService.run_batch (sim-s per wall-s)")
+    parser.add_argument("--duration", type=float, default=600.0, help="Simulated seconds (default: 600)")
+    parser.add_argument("--dt", type=float, default=0.1, help="Step, seconds (default: 0.1)")
+    parser.add_argument("--sample-every", type=float, default=1.0, help="Sample cadence, sim-seconds (default: 1)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(duration_s=float(args.duration), dt=float(args.dt), sample_every_s=float(args.sample_every))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
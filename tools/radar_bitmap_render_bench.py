@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+from argparse import ArgumentParser
+from dataclasses import asdict
+from statistics import mean, quantiles
+from typing import Any
+
+from qiki.services.q_core_agent.core.radar_backends.base import RadarPoint, RadarScene
+from qiki.services.q_core_agent.core.radar_pipeline import RadarPipeline, RadarRenderConfig
+
+_FORCE_ENV = {"kitty": "QIKI_FORCE_KITTY_SUPPORTED", "sixel": "QIKI_FORCE_SIXEL_SUPPORTED"}
+
+
+def make_scene(targets: int, frame: int, *, moving: bool = True) -> RadarScene:
+    """Targets on concentric orbits; `moving=False` freezes them at frame 0 (unchanged frames)."""
+    t = float(frame if moving else 0) * 0.1
+    points = []
+    for i in range(int(targets)):
+        radius = 50.0 + (i % 20) * 40.0
+        angle = (i * 0.61803398875 * 2.0 * math.pi) + t * (0.2 + (i % 7) * 0.05)
+        points.append(
+            RadarPoint(
+                x=radius * math.cos(angle),
+                y=radius * math.sin(angle),
+                z=((i % 9) - 4) * 5.0,
+                vr_mps=1.0 if i % 3 else -1.0,
+                metadata={"target_id": f"T{i:04d}"},
+            )
+        )
+    return RadarScene(ok=True, reason="OK", truth_state="OK", is_fallback=False, points=points)
+
+
+def _ms_stats(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"mean_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    p95 = values[0] if len(values) < 2 else quantiles(values, n=100, method="inclusive")[94]
+    return {"mean_ms": round(mean(values), 3), "p95_ms": round(p95, 3), "max_ms": round(max(values), 3)}
+
+
+def run_backend(
+    backend: str,
+    *,
+    targets: int,
+    frames: int,
+    static_every: int = 2,
+    skip_unchanged: bool = True,
+) -> dict[str, Any]:
+    """
+    Drive `RadarPipeline.render_scene` with a forced bitmap backend.
+
+    Every frame's render time goes through `_update_adaptive_state`, so the report also shows
+    where the adaptive degradation level settles for this machine. Every `static_every`-th frame
+    repeats the previous scene (0 disables repeats).
+    """
+    previous = {name: os.environ.get(name) for name in (_FORCE_ENV[backend], "RADAR_BITMAP_SKIP_UNCHANGED")}
+    os.environ[_FORCE_ENV[backend]] = "1"
+    os.environ["RADAR_BITMAP_SKIP_UNCHANGED"] = "1" if skip_unchanged else "0"
+    try:
+        pipeline = RadarPipeline(RadarRenderConfig(renderer=backend, view="top", fps_max=10, color=True))
+        frame_ms: list[float] = []
+        levels: list[int] = []
+        fallbacks = 0
+        moving_frame = 0
+        for i in range(max(1, int(frames))):
+            if not (static_every and i % int(static_every) == int(static_every) - 1):
+                moving_frame += 1
+            output = pipeline.render_scene(make_scene(targets, moving_frame))
+            fallbacks += int(output.used_runtime_fallback)
+            frame_ms.append(float(pipeline._last_frame_time_ms))
+            levels.append(int(pipeline._adaptive_state.level))
+            if output.used_runtime_fallback:
+                break
+        cache = getattr(pipeline._active_backend, "render_cache", None)
+        return {
+            "backend": backend,
+            "active_backend": pipeline.active_backend_name,
+            "targets": int(targets),
+            "frames": len(frame_ms),
+            "skip_unchanged": bool(skip_unchanged),
+            "frame": _ms_stats(frame_ms),
+            "adaptive_level_final": levels[-1] if levels else 0,
+            "adaptive_level_max": max(levels) if levels else 0,
+            "ema_frame_ms": round(float(pipeline._adaptive_state.ema_frame_ms or 0.0), 3),
+            "runtime_fallbacks": fallbacks,
+            "cache": asdict(cache.stats) if cache is not None else None,
+        }
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def run_benchmark(
+    *,
+    backends: tuple[str, ...] = ("kitty", "sixel"),
+    target_counts: tuple[int, ...] = (10, 100, 500),
+    frames: int = 60,
+    static_every: int = 2,
+) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    for backend in backends:
+        for targets in target_counts:
+            for skip in (False, True):
+                results.append(
+                    run_backend(backend, targets=targets, frames=frames, static_every=static_every, skip_unchanged=skip)
+                )
+    return {"frames": int(frames), "static_every": int(static_every), "results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(description="Benchmark Kitty/SIXEL radar frames through RadarPipeline (adaptive policy)")
+    parser.add_argument("--backends", default="kitty,sixel", help="Comma-separated backends (default: kitty,sixel)")
+    parser.add_argument("--targets", default="10,100,500", help="Comma-separated target counts (default: 10,100,500)")
+    parser.add_argument("--frames", type=int, default=60, help="Frames per run (default: 60)")
+    parser.add_argument(
+        "--static-every",
+        type=int,
+        default=2,
+        help="Repeat the previous scene every N-th frame; 0 = always moving (default: 2)",
+    )
+    args = parser.parse_args(argv)
+
+    backends = tuple(token.strip() for token in str(args.backends).split(",") if token.strip() in _FORCE_ENV)
+    counts = tuple(int(token) for token in str(args.targets).split(",") if token.strip())
+    report = run_benchmark(
+        backends=backends,
+        target_counts=counts,
+        frames=int(args.frames),
+        static_every=int(args.static_every),
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
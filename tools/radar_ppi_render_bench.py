@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import random
+import time
+from argparse import ArgumentParser
+from statistics import mean, quantiles
+from typing import Any
+
+from qiki.services.operator_console.radar.unicode_ppi import BraillePpiRenderer, pick_nearest_track_id
+
+
+def make_tracks(count: int, *, max_range_m: float, seed: int = 7) -> list[tuple[str, dict[str, Any]]]:
+    rng = random.Random(seed)
+    tracks: list[tuple[str, dict[str, Any]]] = []
+    for i in range(int(count)):
+        tracks.append(
+            (
+                f"T{i:04d}",
+                {
+                    "position": {
+                        "x": rng.uniform(-max_range_m, max_range_m),
+                        "y": rng.uniform(-max_range_m, max_range_m),
+                        "z": rng.uniform(-0.2 * max_range_m, 0.2 * max_range_m),
+                    },
+                    "velocity": {"x": rng.uniform(-40.0, 40.0), "y": rng.uniform(-40.0, 40.0), "z": 0.0},
+                    "iff": rng.choice([0, 1, 2, 3]),
+                },
+            )
+        )
+    return tracks
+
+
+def _ms_stats(samples_s: list[float]) -> dict[str, float]:
+    ms = [s * 1000.0 for s in samples_s]
+    p95 = ms[0] if len(ms) < 2 else quantiles(ms, n=100, method="inclusive")[94]
+    return {"mean_ms": round(mean(ms), 3), "p95_ms": round(p95, 3), "max_ms": round(max(ms), 3)}
+
+
+def run_benchmark(
+    *,
+    track_counts: tuple[int, ...] = (10, 100, 1000),
+    width_cells: int = 200,
+    height_cells: int = 60,
+    iterations: int = 50,
+    max_range_m: float = 5000.0,
+) -> dict[str, Any]:
+    """Time `render_tracks` (rich, overlays + vectors) and click picking for several track counts."""
+    results: list[dict[str, Any]] = []
+    for count in track_counts:
+        tracks = make_tracks(count, max_range_m=max_range_m)
+        renderer = BraillePpiRenderer(width_cells=width_cells, height_cells=height_cells, max_range_m=max_range_m)
+        render_s: list[float] = []
+        for i in range(max(1, int(iterations))):
+            started = time.perf_counter()
+            renderer.render_tracks(
+                tracks,
+                rich=True,
+                draw_vectors=True,
+                selected_track_id=tracks[i % len(tracks)][0] if tracks else None,
+            )
+            render_s.append(time.perf_counter() - started)
+
+        rng = random.Random(count)
+        pick_s: list[float] = []
+        for _ in range(max(1, int(iterations))):
+            started = time.perf_counter()
+            pick_nearest_track_id(
+                tracks,
+                click_cell_x=rng.randrange(width_cells),
+                click_cell_y=rng.randrange(height_cells),
+                width_cells=width_cells,
+                height_cells=height_cells,
+                max_range_m=max_range_m,
+                index=renderer.pick_index,
+            )
+            pick_s.append(time.perf_counter() - started)
+
+        results.append(
+            {
+                "tracks": int(count),
+                "render": _ms_stats(render_s),
+                "pick_indexed": _ms_stats(pick_s),
+            }
+        )
+    return {
+        "width_cells": int(width_cells),
+        "height_cells": int(height_cells),
+        "iterations": int(iterations),
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(description="Benchmark the ORION Braille PPI renderer (no NATS, no terminal)")
+    parser.add_argument("--tracks", default="10,100,1000", help="Comma-separated track counts (default: 10,100,1000)")
+    parser.add_argument("--width", type=int, default=200, help="PPI width in cells (default: 200)")
+    parser.add_argument("--height", type=int, default=60, help="PPI height in cells (default: 60)")
+    parser.add_argument("--iterations", type=int, default=50, help="Renders per track count (default: 50)")
+    args = parser.parse_args(argv)
+
+    counts = tuple(int(token) for token in str(args.tracks).split(",") if token.strip())
+    report = run_benchmark(
+        track_counts=counts,
+        width_cells=int(args.width),
+        height_cells=int(args.height),
+        iterations=int(args.iterations),
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
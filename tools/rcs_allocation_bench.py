@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any
+
+from qiki.services.q_sim_service.core.world_model import WorldModel
+from qiki.shared.config.loaders import load_thrusters_config
+
+_AXES = ("forward", "aft", "port", "starboard", "up", "down")
+
+
+def make_thrusters(count: int) -> list[dict[str, Any]]:
+    """`count` thrusters: the stock 16-thruster layout repeated on larger shells (x1.0, x1.2, ...)."""
+    base = load_thrusters_config()
+    result: list[dict[str, Any]] = []
+    for i in range(int(count)):
+        t = base[i % len(base)]
+        scale = 1.0 + 0.2 * (i // len(base))
+        result.append(
+            {
+                "index": i,
+                "cluster_id": f"{t.cluster_id}{i // len(base)}",
+                "position_m": [round(v * scale, 6) for v in t.position_m.as_list()],
+                "direction": t.direction.as_list(),
+                "f_max_newton": float(t.f_max_newton),
+            }
+        )
+    return result
+
+
+def make_world(thrusters_path: Path) -> WorldModel:
+    return WorldModel(
+        bot_config={
+            "hardware_profile": {
+                "power_capacity_wh": 500,
+                "propulsion_plane": {
+                    "enabled": True,
+                    "thrusters_path": str(thrusters_path),
+                    "propellant_kg_init": 1e6,
+                    "isp_s": 60.0,
+                    "rcs_power_w_at_100pct": 80.0,
+                    "pulse_window_s": 0.25,
+                    "ztt_torque_tol_nm": 25.0,
+                },
+            }
+        }
+    )
+
+
+def run_case(count: int, *, steps: int, dt: float = 0.05) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"thrusters_{count}.json"
+        path.write_text(json.dumps(make_thrusters(count)), encoding="utf-8")
+        started = time.perf_counter()
+        wm = make_world(path)
+        build_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    wm._rcs_precompute_axis_groups()
+    precompute_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for step in range(int(steps)):
+        if step % 50 == 0:
+            wm.set_rcs_command(_AXES[(step // 50) % len(_AXES)], 60.0, 10.0)
+        wm._sim_time_s += dt
+        wm._rcs_step(dt)
+    step_s = time.perf_counter() - started
+    return {
+        "thrusters": int(count),
+        "axis_groups": {axis: list(group) for axis, group in sorted(wm._rcs_axis_groups.items())},
+        "world_build_ms": round(build_s * 1000.0, 2),
+        "precompute_ms": round(precompute_s * 1000.0, 2),
+        "step_avg_us": round(step_s / max(1, int(steps)) * 1e6, 2),
+    }
+
+
+def run_benchmark(*, counts: tuple[int, ...] = (16, 24, 48), steps: int = 20000) -> dict[str, Any]:
+    return {"steps": int(steps), "cases": [run_case(count, steps=steps) for count in counts]}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(description="Benchmark RCS axis-group precompute and per-tick allocation")
+    parser.add_argument("--thrusters", type=int, nargs="+", default=[16, 24, 48], help="Thruster counts")
+    parser.add_argument("--steps", type=int, default=20000, help="RCS ticks per case (default: 20000)")
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run_benchmark(counts=tuple(args.thrusters), steps=int(args.steps)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())